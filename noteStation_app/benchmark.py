@@ -0,0 +1,83 @@
+"""
+Módulo de Execução dos Benchmarks do NoteStation
+================================================
+
+Este módulo executa os benchmarks do núcleo (organizador, comandos e persistência JSON) sem interface gráfica e
+grava os resultados em JSON, para que o desempenho de dois commits possa ser comparado
+(ex.: "python benchmark.py --saida base.json" e, depois da alteração, "python benchmark.py --comparar base.json").
+Também mede a partida do comando "list" da linha de comando com "-X importtime" e verifica o seu orçamento.
+
+Módulos importados:
+    - sys: Módulo do sistema Python, usado para o código de saída e para as mensagens de progresso.
+    - json: Módulo que permite trabalhar com dados JSON, usado para gravar e ler os resultados.
+    - argparse: Módulo da biblioteca padrão usado para ler os argumentos da linha de comando.
+
+Funções:
+    - main(): Lê os argumentos, executa os benchmarks, grava os resultados e, opcionalmente, compara-os com um resultado anterior.
+"""
+
+import sys
+import json
+import argparse
+
+from notestation_benchmark import *
+from notestation_benchmark.benchmark_nucleo import TAMANHOS, REPETICOES, OPERACOES, TOLERANCIA
+from notestation_benchmark.partida import ORCAMENTO_IMPORTACAO, verificar_partida
+
+
+def main():
+    """
+    Lê os argumentos da linha de comando e executa os benchmarks. O processo termina com código 1 se a partida da
+    linha de comando violar o seu orçamento ou, com "--comparar", se alguma medida ficar mais lenta do que a
+    tolerância permite.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo do noteStation (resultados em JSON).")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS, help="Quantidades de tarefas das listas geradas.")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES, help="Quantidade de amostras de cada medida.")
+    parser.add_argument("--operacoes", type=int, default=OPERACOES, help="Operações por amostra nas medidas por operação (get_tarefa, editar, desfazer).")
+    parser.add_argument("--semente", type=int, default=0, help="Semente do gerador de tarefas.")
+    parser.add_argument("--saida", help="Arquivo em que os resultados são gravados (padrão: saída padrão).")
+    parser.add_argument("--comparar", help="Arquivo de resultados anterior com o qual os novos resultados são comparados.")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="Aumento relativo tolerado da mediana (0.2 = 20%%).")
+    parser.add_argument("--orcamento-partida", type=float, default=ORCAMENTO_IMPORTACAO, help="Tempo máximo, em segundos, de importação do comando \"list\" da linha de comando.")
+    parser.add_argument("--sem-partida", action="store_true", help="Não mede a partida da linha de comando.")
+    argumentos = parser.parse_args()
+
+    resultados = executar_benchmarks(argumentos.tamanhos, argumentos.repeticoes, argumentos.operacoes, argumentos.semente, progresso=lambda mensagem: print(mensagem, file=sys.stderr), partida=not argumentos.sem_partida)
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding='UTF-8') as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
+
+    falhou = False
+
+    if resultados["partida"] is not None:
+        partida = resultados["partida"]
+        print(f'partida: importação {partida["importacao"]["mediana"] * 1000:.1f} ms, processo {partida["processo"]["mediana"] * 1000:.1f} ms', file=sys.stderr)
+
+        for violacao in verificar_partida(partida, argumentos.orcamento_partida):
+            print(f'  PARTIDA: {violacao}', file=sys.stderr)
+            falhou = True
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding='UTF-8') as arquivo:
+            anterior = json.load(arquivo)
+
+        regressoes = 0
+
+        for quantidade, nome, mediana_anterior, mediana, regressao in comparar(anterior, resultados, argumentos.tolerancia):
+            regressoes += regressao
+            marca = "  REGRESSÃO" if regressao else ""
+            print(f'{quantidade:>8} {nome:<28} {mediana_anterior * 1000:10.3f} ms -> {mediana * 1000:10.3f} ms ({mediana / mediana_anterior:5.2f}x){marca}', file=sys.stderr)
+
+        falhou = falhou or regressoes > 0
+
+    if falhou:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
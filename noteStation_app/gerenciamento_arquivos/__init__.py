@@ -1,13 +1,55 @@
 """
-Módulo contendo a classe TarefaEncoder para codificação personalizada de tarefas em formato JSON.
+Módulo contendo as classes de codificação, decodificação e persistência de tarefas.
 
 Módulos importados:
     - Nenhum módulo é importado.
 
-Classe:
+Classes:
     - TarefaEncoder: Classe que herda de json.JSONEncoder e fornece a funcionalidade de codificação personalizada para tarefas em formato JSON.
+    - TarefaDecoder: Classe que reconstrói as tarefas a partir de sua representação em JSON.
+    - Persistencia: Classe abstrata que define a interface comum dos mecanismos de armazenamento.
+    - PersistenciaJson: Persistência que reescreve o arquivo JSON completo a cada operação.
+    - PersistenciaDiario: Persistência que anexa cada operação a um diário e compacta o arquivo JSON periodicamente.
+    - PersistenciaSQLite: Persistência que guarda uma linha por tarefa em um banco de dados SQLite indexado.
+    - PersistenciaBinaria: Persistência em modo diário cujo snapshot usa o formato binário mapeado na memória.
+    - PersistenciaFragmentada: Persistência que divide as tarefas em fragmentos JSON, lidos em paralelo e regravados apenas quando alterados.
+    - ResultadoImportacao: Quantidades de tarefas importadas e ignoradas em uma importação em massa.
+
+Funções:
+    - converter_json_para_binario, converter_binario_para_json: Convertem a lista de tarefas entre o formato JSON e o binário.
+    - importar_tarefas, exportar_tarefas: Importam e exportam as tarefas em NDJSON ou CSV, um registro por vez.
 """
 
 from gerenciamento_arquivos.json_tarefa_encoder import (
     TarefaEncoder
-)
\ No newline at end of file
+)
+
+from gerenciamento_arquivos.json_tarefa_decoder import (
+    TarefaDecoder
+)
+
+from gerenciamento_arquivos.persistencia_tarefas import (
+    Persistencia,
+    PersistenciaJson,
+    PersistenciaDiario
+)
+
+from gerenciamento_arquivos.persistencia_sqlite import (
+    PersistenciaSQLite
+)
+
+from gerenciamento_arquivos.persistencia_binaria import (
+    PersistenciaBinaria,
+    converter_json_para_binario,
+    converter_binario_para_json
+)
+
+from gerenciamento_arquivos.persistencia_fragmentada import (
+    PersistenciaFragmentada
+)
+
+from gerenciamento_arquivos.importacao_tarefas import (
+    ResultadoImportacao,
+    importar_tarefas,
+    exportar_tarefas
+)
@@ -0,0 +1,222 @@
+"""
+Módulo contendo o gravador em segundo plano usado pela persistência das tarefas.
+
+Módulos importados:
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - threading: Módulo que fornece threads e primitivas de sincronização.
+    - atexit: Módulo que permite registrar funções executadas no encerramento do interpretador.
+    - time: Módulo que fornece funções de medição de tempo.
+
+Funções:
+    - gravar_atomico(dir, escrever, binario, troca): Grava um arquivo de forma atômica (arquivo temporário, fsync e rename).
+    - sincronizar_diretorio(dir): Garante que a renomeação de um arquivo foi gravada em disco.
+
+Classes:
+    - GravadorSegundoPlano: Thread que agrupa as alterações feitas em uma janela curta (debounce) e executa uma única
+      gravação para todas elas, sem bloquear a thread da interface gráfica.
+"""
+
+import os
+import threading
+import atexit
+import time
+
+
+def sincronizar_diretorio(dir: str):
+    """
+    Sincroniza o diretório que contém o arquivo, para que uma renomeação sobreviva a uma queda de energia.
+    Em sistemas que não permitem abrir diretórios (ex.: Windows) nada é feito.
+
+    Parâmetros:
+        - dir (str): O caminho do arquivo cujo diretório será sincronizado.
+    """
+    try:
+        descritor = os.open(os.path.dirname(os.path.abspath(dir)), os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(descritor)
+    except OSError:
+        pass
+    finally:
+        os.close(descritor)
+
+
+def gravar_atomico(dir: str, escrever, binario: bool = False, troca=None):
+    """
+    Grava um arquivo de forma atômica: o conteúdo é escrito em um arquivo temporário, sincronizado com o disco
+    (fsync) e só então renomeado sobre o arquivo final. Uma interrupção no meio da gravação nunca deixa o arquivo
+    final truncado.
+
+    Parâmetros:
+        - dir (str): O caminho do arquivo final.
+        - escrever (Callable[[TextIO], None]): Função que recebe o arquivo temporário aberto e escreve o conteúdo.
+        - binario (bool): Se True, o arquivo temporário é aberto em modo binário (a função recebe um BinaryIO).
+        - troca (Callable[[], ContextManager] or None): Se informada, apenas a renomeação é feita dentro do contexto
+          devolvido por ela (ex.: para fechar e reabrir um mapeamento do arquivo final); a escrita fica fora dele.
+    """
+    temporario = dir + ".tmp"
+
+    with (open(temporario, "wb") if binario else open(temporario, "w", encoding='UTF-8')) as arquivo:
+        escrever(arquivo)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+
+    if troca is None:
+        os.replace(temporario, dir)
+    else:
+        with troca():
+            os.replace(temporario, dir)
+
+    sincronizar_diretorio(dir)
+
+
+class GravadorSegundoPlano:
+    """
+    Thread de gravação que agrupa alterações próximas em uma única gravação.
+
+    Cada chamada a "marcar_sujo()" apenas sinaliza que há dados a gravar e retorna imediatamente. A thread espera a
+    janela de agrupamento ("intervalo") terminar e então chama a função de gravação uma única vez, não importa
+    quantas alterações tenham ocorrido nesse período.
+
+    Se a gravação falhar (ex.: disco cheio ou sem permissão), as alterações continuam pendentes: a função de gravação
+    deve manter o que não foi gravado, e o gravador tenta novamente a cada ESPERA_NOVA_TENTATIVA segundos. O erro é
+    entregue a "ao_falhar" e lançado por "descarregar()" (e, portanto, por "fechar()").
+
+    Atributos:
+        - gravar (Callable[[], None]): Função que efetivamente grava os dados, executada na thread do gravador.
+        - intervalo (float): Janela de agrupamento, em segundos.
+        - ao_falhar (Callable[[Exception], Any] or None): Chamada, na thread do gravador, a cada gravação que falha.
+        - solicitadas (int): Quantidade de alterações sinalizadas.
+        - concluidas (int): Quantidade de alterações já cobertas por uma gravação finalizada.
+        - tentativas (int): Quantidade de gravações já tentadas (com sucesso ou não).
+        - erro (Exception or None): O erro da última gravação, ou None se ela foi bem-sucedida.
+        - encerrado (bool): Indica se o gravador foi encerrado.
+
+    Métodos:
+        - marcar_sujo()
+        - descarregar()
+        - fechar()
+    """
+    INTERVALO = 0.25
+    ESPERA_NOVA_TENTATIVA = 2.0
+
+    def __init__(self, gravar, intervalo: float = INTERVALO, ao_falhar=None):
+        """
+        Construtor da classe GravadorSegundoPlano. Inicia a thread de gravação e registra a descarga no encerramento do programa.
+
+        Parâmetros:
+            - gravar (Callable[[], None]): Função que efetivamente grava os dados.
+            - intervalo (float): Janela de agrupamento, em segundos.
+            - ao_falhar (Callable[[Exception], Any] or None): Chamada a cada gravação que falha.
+        """
+        self.gravar = gravar
+        self.intervalo = intervalo
+        self.ao_falhar = ao_falhar
+        self.solicitadas = 0
+        self.concluidas = 0
+        self.tentativas = 0
+        self.erro = None
+        self.urgente = False
+        self.encerrado = False
+        self.condicao = threading.Condition()
+
+        self.thread = threading.Thread(target=self.executar, name="GravadorSegundoPlano", daemon=True)
+        self.thread.start()
+
+        atexit.register(self.fechar)
+
+    def marcar_sujo(self):
+        """
+        Sinaliza que há alterações a gravar. Nunca bloqueia em operações de disco.
+        """
+        with self.condicao:
+            self.solicitadas += 1
+            self.condicao.notify_all()
+
+    def descarregar(self):
+        """
+        Grava imediatamente as alterações pendentes, aguardando o fim da gravação. Se a gravação falhar, o erro é
+        lançado (as alterações continuam pendentes).
+        """
+        with self.condicao:
+            alvo = self.solicitadas
+            tentativa = self.tentativas
+
+            if self.concluidas < alvo:
+                self.urgente = True
+                self.condicao.notify_all()
+
+            while self.concluidas < alvo and self.thread.is_alive():
+                # Uma tentativa iniciada depois deste pedido falhou: esperar mais só repetiria o erro
+                if self.erro is not None and self.tentativas > tentativa:
+                    raise self.erro
+
+                self.condicao.wait()
+
+    def fechar(self):
+        """
+        Descarrega as alterações pendentes e encerra a thread de gravação. Pode ser chamado mais de uma vez.
+        """
+        if self.encerrado:
+            return
+
+        try:
+            self.descarregar()
+        finally:
+            with self.condicao:
+                self.encerrado = True
+                self.condicao.notify_all()
+
+            self.thread.join()
+            atexit.unregister(self.fechar)
+
+    def executar(self):
+        """
+        Laço principal da thread: aguarda alterações, espera a janela de agrupamento (ou, após uma falha, a espera
+        da nova tentativa) e grava. Depois de encerrado, uma gravação que falha não é repetida.
+        """
+        while True:
+            with self.condicao:
+                while self.concluidas == self.solicitadas and not self.encerrado:
+                    self.condicao.wait()
+
+                if self.concluidas == self.solicitadas:
+                    return
+
+                limite = time.monotonic() + (self.intervalo if self.erro is None else self.ESPERA_NOVA_TENTATIVA)
+
+                while not self.urgente and not self.encerrado:
+                    restante = limite - time.monotonic()
+
+                    if restante <= 0:
+                        break
+
+                    self.condicao.wait(restante)
+
+                self.urgente = False
+                alvo = self.solicitadas
+
+            try:
+                self.gravar()
+            except Exception as erro:
+                with self.condicao:
+                    self.erro = erro
+                    self.tentativas += 1
+                    self.condicao.notify_all()
+                    encerrado = self.encerrado
+
+                if self.ao_falhar is not None:
+                    self.ao_falhar(erro)
+
+                if encerrado:
+                    return
+
+                continue
+
+            with self.condicao:
+                self.erro = None
+                self.tentativas += 1
+                self.concluidas = alvo
+                self.condicao.notify_all()
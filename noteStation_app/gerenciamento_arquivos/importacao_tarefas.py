@@ -0,0 +1,340 @@
+"""
+Módulo contendo a importação e a exportação em massa das tarefas, em NDJSON (um objeto JSON por linha) e em CSV.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo que permite trabalhar com dados JSON, usado na leitura e na escrita de cada registro.
+    - NamedTuple: Classe do módulo typing usada para o resultado da importação.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+    - gerenciamento_arquivos.json_tarefa_encoder: Módulo contendo o TarefaEncoder, que define os campos exportados.
+
+Classes:
+    - ResultadoImportacao: Quantidade de tarefas importadas e de registros ignorados por título duplicado.
+
+Funções:
+    - registro_exportacao(codificador, tarefa): Converte uma tarefa no registro exportado.
+    - exportar_tarefas(organizador, saida, formato, tamanho_lote, progresso): Escreve as tarefas do organizador
+      registro a registro.
+    - iterar_registros(entrada, formato): Lê os registros de um arquivo NDJSON ou CSV, um por vez.
+    - ler_booleano(valor): Converte um campo booleano de um registro.
+    - ler_texto(registro, campo): Obtém um campo de texto de um registro.
+    - criar_tarefa_importada(registro, tPrioridade, tTrabalho): Cria uma tarefa (com seus decorators) a partir de um registro.
+    - importar_tarefas(organizador, entrada, formato, tamanho_lote, progresso): Acrescenta ao organizador as tarefas
+      de um arquivo, em lotes.
+
+Formatos:
+    - Os registros têm os campos do TarefaEncoder e o ID ("id"), como no comando "export". Na importação, apenas o
+      "titulo" é obrigatório; o ID do registro é ignorado (as tarefas recebem IDs novos) e, no CSV, os campos
+      "prioridade" e "concluida" aceitam "true"/"false", "1"/"0" ou "sim"/"não".
+    - O módulo csv só é importado quando o formato CSV é usado, para não pesar na partida da linha de comando.
+
+Memória e desempenho:
+    - A exportação escreve um registro por vez e a importação lê um registro por vez, de modo que apenas o lote em
+      andamento fica na memória, além das próprias tarefas do organizador.
+    - Os títulos duplicados são verificados no índice de títulos do organizador (TarefaOrganizador.existe_titulo) e,
+      dentro do lote em andamento, em um conjunto: cada registro custa tempo constante, e não uma busca na lista.
+    - Cada lote é adicionado em uma única transação (TarefaOrganizador.transacao): um único LoteCommand no histórico
+      e uma única notificação aos observadores, de modo que a persistência grava uma vez por lote, e não uma vez por
+      tarefa.
+"""
+
+import sys
+import os
+import json
+from typing import NamedTuple
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa
+from gerenciamento_arquivos.json_tarefa_encoder import TarefaEncoder
+
+FORMATOS_IMPORTACAO = ["ndjson", "csv"]
+FORMATOS_EXPORTACAO = ["json", "ndjson", "csv"]
+CAMPOS_CSV = ["id", "titulo", "descricao", "prioridade", "concluida", "data_criacao", "data_exata", "lembrete", "prazo"]
+LOTE_IMPORTACAO = 10000
+VERDADEIROS = {"true", "1", "sim", "s", "yes", "y", "x"}
+FALSOS = {"false", "0", "não", "nao", "n", "no", ""}
+
+
+class ResultadoImportacao(NamedTuple):
+    """
+    Resultado de uma importação.
+
+    Atributos:
+        - importadas (int): Quantidade de tarefas adicionadas ao organizador.
+        - ignoradas (int): Quantidade de registros ignorados porque o título já existia (no organizador ou no arquivo).
+    """
+    importadas: int
+    ignoradas: int
+
+
+def registro_exportacao(codificador: TarefaEncoder, tarefa: Tarefa) -> dict:
+    """
+    Converte uma tarefa no registro exportado: os campos do TarefaEncoder e o ID.
+
+    Parâmetros:
+        - codificador (TarefaEncoder): O codificador das tarefas.
+        - tarefa (Tarefa): A tarefa.
+
+    Retorna:
+        - dict: O registro.
+    """
+    registro = codificador.default(tarefa)
+    registro["id"] = tarefa.base.id
+    return registro
+
+
+def exportar_tarefas(organizador: TarefaOrganizador, saida, formato: str = "ndjson", tamanho_lote: int = LOTE_IMPORTACAO, progresso=None) -> int:
+    """
+    Escreve as tarefas do organizador, na ordem de exibição, sem montar a lista de registros na memória. As tarefas
+    de cada lote são lidas com a trava do organizador, de modo que a exportação pode acontecer enquanto a interface
+    é usada.
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+        - saida (TextIO): O arquivo de saída, aberto em modo texto (com newline="" para o CSV).
+        - formato (str): "ndjson", "csv" ou "json" (uma lista JSON com um registro por linha).
+        - tamanho_lote (int): A quantidade de tarefas lidas do organizador por vez.
+        - progresso (Callable[[int], Any] or None): Chamada após cada lote com a quantidade de tarefas já exportadas.
+
+    Retorna:
+        - int: A quantidade de tarefas exportadas.
+    """
+    if formato not in FORMATOS_EXPORTACAO:
+        raise ValueError(f'Formato de exportação desconhecido: {formato}')
+
+    codificador = TarefaEncoder()
+    escritor = None
+
+    if formato == "csv":
+        import csv
+
+        escritor = csv.DictWriter(saida, fieldnames=CAMPOS_CSV, extrasaction="ignore")
+        escritor.writeheader()
+    elif formato == "json":
+        saida.write("[")
+
+    with organizador.trava:
+        ids = organizador.ids_exibicao()
+
+    exportadas = 0
+
+    for inicio in range(0, len(ids), tamanho_lote):
+        with organizador.trava:
+            tarefas_por_id = organizador.tarefas_por_id
+            # Tarefas excluídas depois da leitura dos IDs são puladas
+            registros = [registro_exportacao(codificador, tarefas_por_id[tarefa_id]) for tarefa_id in ids[inicio:inicio + tamanho_lote] if tarefa_id in tarefas_por_id]
+
+        if escritor is not None:
+            escritor.writerows(registros)
+        elif formato == "json":
+            for posicao, registro in enumerate(registros, exportadas):
+                saida.write(f'{"," if posicao else ""}\n  {json.dumps(registro, ensure_ascii=False)}')
+        else:
+            saida.writelines(f'{json.dumps(registro, ensure_ascii=False)}\n' for registro in registros)
+
+        exportadas += len(registros)
+
+        if progresso is not None:
+            progresso(exportadas)
+
+    if formato == "json":
+        saida.write("\n]\n" if exportadas else "]\n")
+
+    return exportadas
+
+
+def iterar_registros(entrada, formato: str = "ndjson"):
+    """
+    Lê os registros de um arquivo NDJSON (linhas em branco são ignoradas) ou CSV (com cabeçalho), um por vez.
+
+    Parâmetros:
+        - entrada (TextIO): O arquivo de entrada, aberto em modo texto (com newline="" para o CSV).
+        - formato (str): "ndjson" ou "csv".
+
+    Retorna:
+        - Iterator[Tuple[int, dict]]: O número da linha de cada registro no arquivo e o registro.
+    """
+    if formato == "csv":
+        import csv
+
+        leitor = csv.DictReader(entrada)
+
+        for registro in leitor:
+            yield leitor.line_num, registro
+
+        return
+
+    if formato != "ndjson":
+        raise ValueError(f'Formato de importação desconhecido: {formato}')
+
+    for numero, linha in enumerate(entrada, 1):
+        if not linha.strip():
+            continue
+
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            raise ValueError(f'linha {numero}: JSON inválido ({erro.msg})') from None
+
+        if not isinstance(registro, dict):
+            raise ValueError(f'linha {numero}: cada linha deve conter um objeto JSON')
+
+        yield numero, registro
+
+
+def ler_booleano(valor) -> bool:
+    """
+    Converte um campo booleano de um registro, que no CSV chega como texto.
+
+    Parâmetros:
+        - valor (bool or str or None): O valor do campo.
+
+    Retorna:
+        - bool: O valor convertido (False se o campo estiver ausente).
+    """
+    if valor is None or isinstance(valor, bool):
+        return bool(valor)
+
+    texto = str(valor).strip().lower()
+
+    if texto in VERDADEIROS:
+        return True
+
+    if texto in FALSOS:
+        return False
+
+    raise ValueError(f'valor booleano inválido: {valor}')
+
+
+def ler_texto(registro: dict, campo: str) -> str:
+    """
+    Obtém um campo de texto de um registro. No NDJSON, o campo pode chegar com outro tipo (ex.: um número), que
+    é recusado em vez de ser gravado na tarefa.
+
+    Parâmetros:
+        - registro (dict): O registro.
+        - campo (str): O nome do campo.
+
+    Retorna:
+        - str: O valor do campo ("" se o campo estiver ausente ou nulo).
+    """
+    valor = registro.get(campo)
+
+    if valor is None:
+        return ""
+
+    if not isinstance(valor, str):
+        raise ValueError(f'o campo "{campo}" deve ser um texto')
+
+    return valor
+
+
+def criar_tarefa_importada(registro: dict, tPrioridade: TarefaComPrioridadeFactory, tTrabalho: TarefaTrabalhoFactory) -> Tarefa:
+    """
+    Cria uma tarefa a partir de um registro importado, pelas fábricas e com os decorators de lembrete e prazo, como
+    a janela de criação da interface. A conclusão e a data exata do registro são preservadas quando presentes.
+
+    Parâmetros:
+        - registro (dict): O registro, com os campos do TarefaEncoder.
+        - tPrioridade (TarefaComPrioridadeFactory): Fábrica das tarefas com prioridade.
+        - tTrabalho (TarefaTrabalhoFactory): Fábrica das tarefas de trabalho.
+
+    Retorna:
+        - Tarefa: A tarefa, ainda sem ID.
+    """
+    titulo = ler_texto(registro, "titulo")
+
+    if not titulo.strip():
+        raise ValueError("o título é obrigatório")
+
+    descricao = ler_texto(registro, "descricao")
+    data_exata = ler_texto(registro, "data_exata")
+    lembrete = ler_texto(registro, "lembrete")
+    prazo = ler_texto(registro, "prazo")
+
+    if ler_booleano(registro.get("prioridade")):
+        tarefa = tPrioridade.criar_tarefa(titulo, descricao)
+    else:
+        tarefa = tTrabalho.criar_tarefa(titulo, descricao)
+
+    if data_exata:
+        tarefa.data_exata = data_exata
+
+    tarefa.concluida = ler_booleano(registro.get("concluida"))
+
+    if lembrete:
+        tarefa = TarefaComLembrete(tarefa, lembrete)
+
+    if prazo:
+        tarefa = TarefaComPrazo(tarefa, prazo)
+
+    return tarefa
+
+
+def importar_tarefas(organizador: TarefaOrganizador, entrada, formato: str = "ndjson", tamanho_lote: int = LOTE_IMPORTACAO, progresso=None) -> ResultadoImportacao:
+    """
+    Acrescenta ao organizador as tarefas de um arquivo NDJSON ou CSV, lendo um registro por vez. Os registros cujo
+    título já existe (no organizador ou em um registro anterior do arquivo) são ignorados, como na janela de criação.
+    Cada lote é adicionado em uma transação, com uma única gravação da persistência.
+
+    Um registro inválido interrompe a importação com um ValueError que indica a sua linha; os lotes anteriores já
+    foram adicionados (e gravados).
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+        - entrada (TextIO): O arquivo de entrada, aberto em modo texto (com newline="" para o CSV).
+        - formato (str): "ndjson" ou "csv".
+        - tamanho_lote (int): A quantidade máxima de tarefas por transação.
+        - progresso (Callable[[ResultadoImportacao], Any] or None): Chamada após cada lote com as quantidades até então.
+
+    Retorna:
+        - ResultadoImportacao: As quantidades de tarefas importadas e de registros ignorados.
+    """
+    tPrioridade = TarefaComPrioridadeFactory()
+    tTrabalho = TarefaTrabalhoFactory()
+    importadas = 0
+    ignoradas = 0
+    lote = []
+    titulos_lote = set()
+
+    def adicionar_lote():
+        nonlocal importadas
+
+        with organizador.transacao():
+            for tarefa in lote:
+                organizador.add_tarefa(tarefa)
+
+        importadas += len(lote)
+        lote.clear()
+        titulos_lote.clear()
+
+        if progresso is not None:
+            progresso(ResultadoImportacao(importadas, ignoradas))
+
+    for numero, registro in iterar_registros(entrada, formato):
+        try:
+            tarefa = criar_tarefa_importada(registro, tPrioridade, tTrabalho)
+        except (ValueError, TypeError, AttributeError) as erro:
+            raise ValueError(f'linha {numero}: {erro}') from None
+
+        titulo = tarefa.base.titulo
+
+        if titulo in titulos_lote or organizador.existe_titulo(titulo):
+            ignoradas += 1
+            continue
+
+        titulos_lote.add(titulo)
+        lote.append(tarefa)
+
+        if len(lote) >= tamanho_lote:
+            adicionar_lote()
+
+    if lote:
+        adicionar_lote()
+
+    return ResultadoImportacao(importadas, ignoradas)
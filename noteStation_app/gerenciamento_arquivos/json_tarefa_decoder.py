@@ -0,0 +1,221 @@
+"""
+Módulo contendo a classe responsável por reconstruir tarefas a partir de sua representação em JSON.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo que permite trabalhar com dados JSON (JavaScript Object Notation).
+    - re: Módulo de expressões regulares, usado para pular espaços em branco durante a leitura incremental.
+
+Funções:
+    - iterar_objeto_json(arquivo, tamanho_bloco): Lê um objeto JSON de nível superior em blocos, produzindo um par
+      (chave, valor) por vez, sem carregar o arquivo inteiro na memória.
+
+Classes:
+    - TarefaDecoder: Classe que converte os dicionários produzidos pelo TarefaEncoder de volta em tarefas (com seus decorators).
+"""
+
+import sys
+import os
+import json
+import re
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa
+
+ESPACOS = re.compile(r'[ \t\n\r]*')
+TAMANHO_BLOCO = 64 * 1024
+
+
+def iterar_objeto_json(arquivo, tamanho_bloco: int = TAMANHO_BLOCO):
+    """
+    Lê incrementalmente um objeto JSON de nível superior (ex.: o dicionário posição -> tarefa), produzindo um par
+    (chave, valor) por vez. Apenas um bloco do arquivo e o registro em leitura ficam na memória.
+
+    Parâmetros:
+        - arquivo (TextIO): O arquivo aberto para leitura.
+        - tamanho_bloco (int): Quantidade de caracteres lidos do arquivo por vez.
+
+    Retorna:
+        - Iterator[Tuple[str, Any]]: Os pares (chave, valor) do objeto, na ordem do arquivo. Um arquivo vazio não produz nenhum par.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+
+    def ler_mais() -> bool:
+        nonlocal buffer, pos
+        bloco = arquivo.read(tamanho_bloco)
+
+        if not bloco:
+            return False
+
+        buffer = buffer[pos:] + bloco
+        pos = 0
+        return True
+
+    def proximo_caractere() -> str:
+        nonlocal pos
+
+        while True:
+            pos = ESPACOS.match(buffer, pos).end()
+
+            if pos < len(buffer):
+                return buffer[pos]
+
+            if not ler_mais():
+                return ""
+
+    def decodificar_valor():
+        nonlocal pos
+        proximo_caractere()
+
+        while True:
+            try:
+                valor, fim = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # O valor pode estar apenas incompleto no buffer; o erro só é definitivo no fim do arquivo
+                if not ler_mais():
+                    raise
+
+                continue
+
+            # Um número que termina junto com o buffer pode continuar no próximo bloco
+            if fim == len(buffer) and ler_mais():
+                continue
+
+            pos = fim
+            return valor
+
+    def esperar(caractere: str):
+        nonlocal pos
+
+        if proximo_caractere() != caractere:
+            raise json.JSONDecodeError(f'Esperado "{caractere}"', buffer, pos)
+
+        pos += 1
+
+    if proximo_caractere() == "":
+        return
+
+    esperar("{")
+
+    if proximo_caractere() == "}":
+        return
+
+    while True:
+        chave = decodificar_valor()
+        esperar(":")
+        yield chave, decodificar_valor()
+
+        if proximo_caractere() == "}":
+            return
+
+        esperar(",")
+
+
+class TarefaDecoder:
+    """
+    Classe que reconstrói tarefas a partir dos dicionários gerados pelo TarefaEncoder.
+
+    Atributos:
+        - tPrioridade (TarefaComPrioridadeFactory): Fábrica utilizada para criar tarefas com prioridade.
+        - tTrabalho (TarefaTrabalhoFactory): Fábrica utilizada para criar tarefas de trabalho.
+
+    Métodos:
+        - decodificar(tarefa_obj, tarefa_id)
+        - iterar(dir)
+        - iterar_lotes(dir, tamanho_lote)
+        - carregar(dir)
+    """
+    def __init__(self):
+        """
+        Construtor da classe TarefaDecoder.
+        """
+        self.tPrioridade = TarefaComPrioridadeFactory()
+        self.tTrabalho = TarefaTrabalhoFactory()
+
+    def decodificar(self, tarefa_obj: dict, tarefa_id=None) -> Tarefa:
+        """
+        Cria uma tarefa, com seus decorators de lembrete e prazo, a partir de um dicionário.
+
+        Parâmetros:
+            - tarefa_obj (dict): O dicionário no formato produzido pelo TarefaEncoder.
+            - tarefa_id (int or None): O ID estável da tarefa, caso seja conhecido.
+
+        Retorna:
+            - Tarefa: A tarefa reconstruída.
+        """
+        tarefa = None
+        if tarefa_obj['prioridade'] == True:
+            tarefa = self.tPrioridade.criar_tarefa(tarefa_obj['titulo'], tarefa_obj['descricao'])
+        else:
+            tarefa = self.tTrabalho.criar_tarefa(tarefa_obj['titulo'], tarefa_obj['descricao'])
+
+        # A data de criação com precisão de minuto é derivada da data exata
+        tarefa.data_exata = tarefa_obj['data_exata']
+        tarefa.concluida = tarefa_obj['concluida']
+        tarefa._tarefa = tarefa_obj['_tarefa']
+        tarefa.id = tarefa_id
+
+        if tarefa_obj['lembrete']:
+            tarefa = TarefaComLembrete(tarefa, tarefa_obj['lembrete'])
+
+        if tarefa_obj['prazo']:
+            tarefa = TarefaComPrazo(tarefa, tarefa_obj['prazo'])
+
+        return tarefa
+
+    def iterar(self, dir: str):
+        """
+        Lê um arquivo JSON de tarefas (dicionário posição -> tarefa) de forma incremental, reconstruindo uma tarefa por vez.
+        A chave de cada tarefa (a sua posição no arquivo) é usada como o seu ID.
+
+        Parâmetros:
+            - dir (str): O caminho do arquivo JSON.
+
+        Retorna:
+            - Iterator[Tarefa]: As tarefas na ordem em que aparecem no arquivo.
+        """
+        with open(dir, "r", encoding='UTF-8') as arquivo:
+            for tarefa_id, tarefa_obj in iterar_objeto_json(arquivo):
+                chave_id = int(tarefa_id) if tarefa_id.isdigit() else None
+                yield self.decodificar(tarefa_obj, chave_id)
+
+    def iterar_lotes(self, dir: str, tamanho_lote: int):
+        """
+        Lê um arquivo JSON de tarefas de forma incremental, agrupando as tarefas em lotes.
+
+        Parâmetros:
+            - dir (str): O caminho do arquivo JSON.
+            - tamanho_lote (int): A quantidade máxima de tarefas por lote.
+
+        Retorna:
+            - Iterator[List[Tarefa]]: Os lotes de tarefas, na ordem do arquivo.
+        """
+        lote = []
+
+        for tarefa in self.iterar(dir):
+            lote.append(tarefa)
+
+            if len(lote) >= tamanho_lote:
+                yield lote
+                lote = []
+
+        if lote:
+            yield lote
+
+    def carregar(self, dir: str) -> list:
+        """
+        Lê um arquivo JSON de tarefas (dicionário posição -> tarefa) e reconstrói todas as tarefas.
+
+        Parâmetros:
+            - dir (str): O caminho do arquivo JSON.
+
+        Retorna:
+            - List[Tarefa]: As tarefas na ordem em que aparecem no arquivo (lista vazia se o arquivo estiver vazio).
+        """
+        return list(self.iterar(dir))
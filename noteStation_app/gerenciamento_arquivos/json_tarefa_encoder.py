@@ -15,20 +15,34 @@ Métodos:
 
 Detalhes dos atributos e métodos:
     - TarefaEncoder.default(obj): Método sobrescrito da classe JSONEncoder que é chamado para objetos não serializáveis padrão.
+        - A tarefa base e os recursos (lembrete e prazo) são obtidos em tempo constante através do atributo "base" da tarefa.
         - O método verifica o tipo da tarefa passada como argumento e cria um dicionário contendo as informações da tarefa para serem codificadas em JSON.
         - A prioridade da tarefa é verificada e definida como True caso seja uma TarefaComPrioridade, caso contrário, é definida como False.
         - As informações de título, descrição, data de criação, data exata, conclusão, tarefa base (_tarefa), lembrete e prazo são armazenadas no dicionário.
         - O dicionário é retornado como a representação serializável da tarefa em formato JSON.
+
+Serialização direta:
+    - codificar_registro(registro): Gera diretamente o texto JSON de um RegistroTarefa, sem montar o dicionário
+      intermediário, com exatamente os mesmos bytes que json.dumps(tarefa, cls=TarefaEncoder, ensure_ascii=False).
+    - codificar_tarefa(tarefa): O mesmo, a partir da própria tarefa.
+    - codificar_tarefas(itens, processos): Codifica uma sequência de pares (ID, registro) em trechos do dicionário JSON,
+      opcionalmente dividindo as partes entre os processos de um multiprocessing.Pool.
+    - escrever_tarefas(arquivo, partes): Escreve o dicionário posição -> tarefa em um arquivo em uma única passada, no
+      mesmo formato (byte a byte) que json.dump({0: ..., 1: ...}, ensure_ascii=False) produziria.
+    - As chaves do dicionário são as posições das tarefas na ordem de exibição ("0" a "n-1"), como no formato original
+      do arquivo, e não os IDs das tarefas: depois de exclusões, os IDs deixam de ser contínuos.
 """
 
 import sys
 import os
 import json
+from json.encoder import encode_basestring
 
 diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(diretorio_pai)
 
 from tarefa_classes import *
+from tarefa_classes.tarefa import RegistroTarefa, formatar_prazo
 
 
 class TarefaEncoder(json.JSONEncoder):
@@ -51,25 +65,15 @@ class TarefaEncoder(json.JSONEncoder):
                 - As informações de título, descrição, data de criação, data exata, conclusão, tarefa base (_tarefa), lembrete e prazo são armazenadas no dicionário.
                 - O dicionário é retornado como a representação serializável da tarefa em formato JSON.
         """
-        organizador = TarefaOrganizador()
-        obj_base = organizador.checkTarefaDecorator(obj)
-        
-        lembrete = ""
-        prazo = ""
+        obj_base = obj.base
         prioridade = False
 
         if obj_base.__class__.__name__ == "TarefaComPrioridade":
             prioridade = True
 
-        if hasattr(obj, "lembrete"):
-            lembrete = obj.lembrete
-        elif hasattr(obj._tarefa, "lembrete"):
-            lembrete = obj._tarefa.lembrete
-        
-        if hasattr(obj, "prazo"):
-            prazo = obj.prazo
-        elif hasattr(obj._tarefa, "prazo"):
-            prazo = obj._tarefa.prazo
+        # O lembrete e o prazo são obtidos do mapa de recursos da tarefa base, qualquer que seja a profundidade dos decorators
+        lembrete = obj_base.get_lembrete()
+        prazo = obj_base.get_prazo()
 
         return {
             "prioridade": prioridade,
@@ -81,4 +85,152 @@ class TarefaEncoder(json.JSONEncoder):
             "_tarefa": obj_base._tarefa,
             "lembrete": lembrete,
             "prazo": prazo
-        }
\ No newline at end of file
+        }
+
+
+TAMANHO_PARTE = 50000
+
+
+def codificar_valor(valor) -> str:
+    """
+    Codifica um valor simples de uma tarefa em JSON, como o json.dumps(..., ensure_ascii=False) faria.
+
+    Parâmetros:
+        - valor: O valor a ser codificado.
+
+    Retorna:
+        - str: O texto JSON do valor.
+    """
+    if valor.__class__ is str:
+        return encode_basestring(valor)
+
+    if valor is True:
+        return "true"
+
+    if valor is False:
+        return "false"
+
+    if valor is None:
+        return "null"
+
+    return json.dumps(valor, ensure_ascii=False)
+
+
+def codificar_registro(registro: RegistroTarefa) -> str:
+    """
+    Gera diretamente o texto JSON de uma tarefa a partir do seu registro imutável (ex.: de um RetratoOrganizador).
+
+    Parâmetros:
+        - registro (RegistroTarefa): O registro da tarefa a ser codificada.
+
+    Retorna:
+        - str: O mesmo texto que json.dumps(tarefa, cls=TarefaEncoder, ensure_ascii=False) produziria.
+    """
+    data_exata = registro.data_exata
+
+    return (
+        '{"prioridade": ' + ("true" if registro.tipo == "TarefaComPrioridade" else "false")
+        + ', "titulo": ' + codificar_valor(registro.titulo)
+        + ', "descricao": ' + codificar_valor(registro.descricao)
+        + ', "data_criacao": ' + encode_basestring(data_exata[:16])
+        + ', "data_exata": ' + encode_basestring(data_exata)
+        + ', "concluida": ' + codificar_valor(registro.concluida)
+        + ', "_tarefa": null'
+        + ', "lembrete": ' + codificar_valor(registro.lembrete)
+        + ', "prazo": ' + encode_basestring(formatar_prazo(registro.prazo))
+        + '}'
+    )
+
+
+def codificar_tarefa(tarefa) -> str:
+    """
+    Gera diretamente o texto JSON de uma tarefa (com seus decorators).
+
+    Parâmetros:
+        - tarefa (Tarefa): A tarefa a ser codificada.
+
+    Retorna:
+        - str: O mesmo texto que json.dumps(tarefa, cls=TarefaEncoder, ensure_ascii=False) produziria.
+    """
+    return codificar_registro(RegistroTarefa.de_tarefa(tarefa))
+
+
+def codificar_parte(itens, inicio: int = 0) -> str:
+    """
+    Codifica uma parte da lista de tarefas como um trecho do dicionário JSON ("posição": tarefa, ...).
+
+    Parâmetros:
+        - itens (Iterable[Tuple[int, RegistroTarefa]]): Os pares (ID, registro) da parte.
+        - inicio (int): A posição, na lista inteira, da primeira tarefa da parte.
+
+    Retorna:
+        - str: O trecho JSON da parte, sem as chaves de abertura e fechamento do dicionário.
+    """
+    return ", ".join([f'"{posicao}": {codificar_registro(registro)}' for posicao, (_, registro) in enumerate(itens, inicio)])
+
+
+def _codificar_campos(itens, inicio: int) -> str:
+    """
+    Codifica uma parte recebida como pares (ID, campos do registro). Executado nos processos filhos: tuplas simples
+    são enviadas (por pickle) mais rapidamente que os registros.
+
+    Parâmetros:
+        - itens (List[Tuple[int, tuple]]): Os pares (ID, campos do RegistroTarefa) da parte.
+        - inicio (int): A posição, na lista inteira, da primeira tarefa da parte.
+
+    Retorna:
+        - str: O trecho JSON da parte.
+    """
+    return codificar_parte(((tarefa_id, RegistroTarefa._make(campos)) for tarefa_id, campos in itens), inicio)
+
+
+def codificar_tarefas(itens, processos: int = None) -> list:
+    """
+    Codifica uma sequência de pares (ID, registro) em trechos do dicionário JSON, de até TAMANHO_PARTE tarefas cada.
+
+    Com "processos" maior que 1, as partes são codificadas por um multiprocessing.Pool: cada filho recebe os campos
+    dos registros de uma parte (por pickle, como tuplas simples) e devolve um único texto; em listas com uma só
+    parte, a codificação é sequencial. O Pool usa "forkserver" (ou "spawn", ex.: no Windows): a codificação roda na
+    thread do gravador em segundo plano, e um filho criado por "fork" copiaria o estado das travas das demais threads
+    (ex.: a da interface) no instante da cópia.
+
+    Parâmetros:
+        - itens (Iterable[Tuple[int, RegistroTarefa]]): Os pares (ID, registro), na ordem de exibição.
+        - processos (int or None): Quantidade de processos a utilizar.
+
+    Retorna:
+        - List[str]: Os trechos JSON, na mesma ordem, com as posições "0" a "n-1" como chaves.
+    """
+    itens = list(itens)
+    intervalos = [(inicio, inicio + TAMANHO_PARTE) for inicio in range(0, len(itens), TAMANHO_PARTE)]
+
+    if not processos or processos < 2 or len(intervalos) < 2:
+        return [codificar_parte(itens[inicio:fim], inicio) for inicio, fim in intervalos]
+
+    # Importado apenas aqui: o multiprocessing é caro de importar e só é usado nas gravações paralelas
+    import multiprocessing
+
+    metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+    with multiprocessing.get_context(metodo).Pool(min(processos, len(intervalos))) as pool:
+        partes = [([(tarefa_id, tuple(registro)) for tarefa_id, registro in itens[inicio:fim]], inicio) for inicio, fim in intervalos]
+        return pool.starmap(_codificar_campos, partes)
+
+
+def escrever_tarefas(arquivo, partes):
+    """
+    Escreve o dicionário posição -> tarefa em um arquivo, em uma única passada e sem objetos intermediários.
+
+    Parâmetros:
+        - arquivo (TextIO): O arquivo aberto para escrita.
+        - partes (Iterable[str]): Os trechos JSON produzidos por "codificar_tarefas", na ordem de exibição.
+    """
+    arquivo.write("{")
+    separador = ""
+
+    for parte in partes:
+        arquivo.write(separador)
+        arquivo.write(parte)
+        separador = ", "
+
+    arquivo.write("}")
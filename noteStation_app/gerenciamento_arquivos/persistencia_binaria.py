@@ -0,0 +1,672 @@
+"""
+Módulo contendo o formato binário de snapshot da lista de tarefas e a persistência que o utiliza.
+
+Módulos importados:
+    - sys: Módulo do sistema Python, usado para verificar a ordem dos bytes da máquina.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - mmap: Módulo que mapeia o arquivo na memória, para que as colunas sejam lidas sem cópia nem análise de texto.
+    - threading: Módulo que fornece a trava da FonteTextos (os textos podem ser lidos pela thread da interface
+      enquanto o gravador substitui o snapshot).
+    - struct: Módulo usado para gravar e ler o cabeçalho do arquivo.
+    - zlib: Módulo usado para calcular o checksum (CRC-32) do conteúdo.
+    - array: Módulo que fornece os vetores de números gravados nas colunas.
+    - date: Classe do módulo datetime usada para converter os prazos (guardados como números ordinais).
+    - accumulate: Função do módulo itertools usada para calcular as posições dos textos.
+    - bisect_left: Função do módulo bisect usada para encontrar uma tarefa da FonteTextos pelo ID.
+    - OrderedDict: Dicionário ordenado do módulo collections, usado no cache LRU da FonteTextos.
+    - contextmanager: Decorador do módulo contextlib usado na troca do snapshot mapeado pela FonteTextos.
+
+Classes:
+    - FonteTextos: Fonte das descrições e lembretes adiados, lidos do snapshot binário mapeado na memória.
+    - PersistenciaBinaria: Persistência em modo diário cujo snapshot é gravado no formato binário.
+
+Funções:
+    - escrever_snapshot(arquivo, itens): Escreve as tarefas no formato binário.
+    - gravar_snapshot(dir, itens, troca): Grava o snapshot binário de forma atômica.
+    - mapear_snapshot(dir, verificar): Mapeia um snapshot binário na memória e obtém as suas colunas.
+    - liberar_snapshot(mapa, visao, colunas): Libera as colunas e fecha o mapa de um snapshot.
+    - iterar_lotes_snapshot(dir, tamanho_lote, fonte): Lê o snapshot binário com mmap, reconstruindo as tarefas em lotes.
+    - converter_json_para_binario(dir_json, dir_binario): Converte um arquivo JSON (com o seu diário) em snapshot binário.
+    - converter_binario_para_json(dir_binario, dir_json): Converte um snapshot binário (com o seu diário) em arquivo JSON.
+
+Formato (todos os números em little-endian):
+    - Cabeçalho (CABECALHO): assinatura ASSINATURA, versão do formato, quantidade de tarefas, tamanho da área de
+      textos, e o CRC-32 de todo o conteúdo após o cabeçalho.
+    - Colunas de largura fixa, na ordem de exibição, cada uma alinhada em 8 bytes: IDs (int64), datas de criação em
+      microssegundos desde 01/01/1970 (int64), posições dos textos (uint64, 3 por tarefa mais a posição final),
+      prazos como números ordinais (int32, 0 para sem prazo) e indicadores (uint8: prioridade e conclusão).
+    - Área de textos: o título, a descrição e o lembrete de cada tarefa em UTF-8, concatenados; o texto "k" ocupa os
+      bytes entre as posições "k" e "k + 1".
+    - Como as colunas são números de largura fixa, a leitura mapeia o arquivo na memória e acessa cada coluna por
+      índice (memoryview.cast): as datas não são analisadas e nenhum texto JSON é decodificado, apenas os textos de
+      cada tarefa são copiados da área de textos.
+
+Detalhes:
+    - A PersistenciaBinaria usa o mesmo diário da PersistenciaDiario; apenas o snapshot (lido ao carregar e reescrito
+      na compactação) está no formato binário. Um arquivo com assinatura, versão, tamanho ou checksum incorretos não é
+      carregado (ValueError).
+
+Textos sob demanda:
+    - Com "textos_sob_demanda", a PersistenciaBinaria carrega apenas o que a lista exibe (ID, título, tipo, conclusão,
+      datas e a presença do lembrete e do prazo); a descrição e o lembrete ficam adiados (TEXTO_ADIADO) e são lidos da
+      área de textos, através de uma FonteTextos que mantém o snapshot mapeado, na primeira vez em que são acessados
+      (ex.: ao visualizar ou editar a tarefa). Os textos lidos ficam em um cache LRU limitado, e não nas tarefas.
+    - O snapshot mapeado não pode ser substituído em todos os sistemas (ex.: Windows). Na compactação, o novo
+      snapshot é escrito em um arquivo temporário sem a trava da fonte (os textos continuam sendo lidos do snapshot
+      anterior); a trava é mantida apenas para fechar a fonte, renomear o arquivo temporário e reabrir a fonte.
+    - Os registros do retrato capturado para a compactação são descartados do organizador logo após a captura, para
+      que os textos lidos para a gravação não continuem na memória.
+"""
+
+import sys
+import os
+import mmap
+import threading
+import struct
+import zlib
+from array import array
+from datetime import date
+from itertools import accumulate
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import RetratoOrganizador, TEXTO_ADIADO
+from tarefa_classes.metricas import METRICAS
+from gerenciamento_arquivos.persistencia_tarefas import PersistenciaJson, PersistenciaDiario, TAMANHO_LOTE
+from gerenciamento_arquivos.gravador_tarefas import gravar_atomico
+
+ASSINATURA = b"NSTBIN\r\n"
+VERSAO_FORMATO = 1
+
+# Assinatura, versão, reservado, quantidade de tarefas, tamanho da área de textos, CRC-32 e preenchimento até 40 bytes
+CABECALHO = struct.Struct("<8sHHQQI4x")
+
+PRIORIDADE = 1
+CONCLUIDA = 2
+
+# Textos guardados para cada tarefa, em ordem, na área de textos
+TEXTOS_POR_TAREFA = 3
+
+MAQUINA_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def alinhar(tamanho: int) -> int:
+    """
+    Calcula a quantidade de bytes de preenchimento após uma seção, para que a seguinte comece alinhada em 8 bytes.
+
+    Parâmetros:
+        - tamanho (int): O tamanho da seção, em bytes.
+
+    Retorna:
+        - int: A quantidade de bytes de preenchimento.
+    """
+    return -tamanho % 8
+
+
+def escrever_snapshot(arquivo, itens: list):
+    """
+    Escreve as tarefas no formato binário.
+
+    Parâmetros:
+        - arquivo (BinaryIO): O arquivo aberto para escrita binária.
+        - itens (List[Tuple[int, RegistroTarefa]]): Os pares (ID, registro), na ordem de exibição (RetratoOrganizador.itens()).
+    """
+    quantidade = len(itens)
+    ids = array("q")
+    criados = array("q")
+    prazos = array("i")
+    indicadores = array("B")
+    textos = []
+
+    for tarefa_id, registro in itens:
+        ids.append(tarefa_id)
+        criados.append(registro.criado_em)
+        prazos.append(registro.prazo.toordinal() if registro.prazo is not None else 0)
+        indicadores.append((PRIORIDADE if registro.tipo == "TarefaComPrioridade" else 0) | (CONCLUIDA if registro.concluida else 0))
+        textos.append(registro.titulo.encode('UTF-8'))
+        textos.append(registro.descricao.encode('UTF-8'))
+        textos.append(registro.lembrete.encode('UTF-8'))
+
+    posicoes = array("Q", accumulate(map(len, textos), initial=0))
+    area_textos = b"".join(textos)
+    colunas = [ids, criados, posicoes, prazos, indicadores]
+
+    if not MAQUINA_LITTLE_ENDIAN:
+        for coluna in colunas:
+            coluna.byteswap()
+
+    secoes = []
+
+    for coluna in colunas:
+        secoes.append(coluna)
+        secoes.append(bytes(alinhar(len(coluna) * coluna.itemsize)))
+
+    secoes.append(area_textos)
+    checksum = 0
+
+    for secao in secoes:
+        checksum = zlib.crc32(secao, checksum)
+
+    arquivo.write(CABECALHO.pack(ASSINATURA, VERSAO_FORMATO, 0, quantidade, len(area_textos), checksum))
+
+    for secao in secoes:
+        arquivo.write(secao)
+
+
+def gravar_snapshot(dir: str, itens: list, troca=None):
+    """
+    Grava o snapshot binário de forma atômica (arquivo temporário, fsync e rename).
+
+    Parâmetros:
+        - dir (str): O caminho do arquivo.
+        - itens (List[Tuple[int, RegistroTarefa]]): Os pares (ID, registro), na ordem de exibição.
+        - troca (Callable[[], ContextManager] or None): Contexto mantido apenas durante a renomeação (ver gravar_atomico).
+    """
+    gravar_atomico(dir, lambda arquivo: escrever_snapshot(arquivo, itens), binario=True, troca=troca)
+
+
+def ler_coluna(visao: memoryview, inicio: int, tipo: str, quantidade: int):
+    """
+    Obtém uma coluna de números do arquivo mapeado, sem cópia (em máquinas little-endian).
+
+    Parâmetros:
+        - visao (memoryview): O conteúdo do arquivo.
+        - inicio (int): A posição da coluna no arquivo.
+        - tipo (str): O código do tipo dos números (como no módulo array).
+        - quantidade (int): A quantidade de números da coluna.
+
+    Retorna:
+        - memoryview or array: A coluna, indexável.
+    """
+    fim = inicio + quantidade * array(tipo).itemsize
+
+    if MAQUINA_LITTLE_ENDIAN:
+        return visao[inicio:fim].cast(tipo)
+
+    coluna = array(tipo, visao[inicio:fim].tobytes())
+    coluna.byteswap()
+    return coluna
+
+
+def mapear_snapshot(dir: str, verificar: bool = True):
+    """
+    Mapeia um snapshot binário na memória e obtém as suas colunas, sem copiá-las.
+
+    Parâmetros:
+        - dir (str): O caminho do arquivo.
+        - verificar (bool): Se True, o checksum de todo o conteúdo também é verificado (além da assinatura, da versão
+          e do tamanho).
+
+    Retorna:
+        - Tuple[mmap, memoryview, int, list]: O mapa, a visão do arquivo, a quantidade de tarefas e as colunas (IDs,
+          datas de criação, posições dos textos, prazos, indicadores e a área de textos), que devem ser liberados com
+          "liberar_snapshot".
+    """
+    with open(dir, "rb") as arquivo:
+        if os.fstat(arquivo.fileno()).st_size < CABECALHO.size:
+            raise ValueError(f'Snapshot binário inválido (arquivo truncado): {dir}')
+
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    visao = memoryview(mapa)
+    colunas = []
+
+    try:
+        assinatura, versao, _, quantidade, tamanho_textos, checksum = CABECALHO.unpack_from(visao)
+
+        if assinatura != ASSINATURA or versao != VERSAO_FORMATO:
+            raise ValueError(f'Snapshot binário inválido (assinatura ou versão desconhecida): {dir}')
+
+        tamanhos = [8 * quantidade, 8 * quantidade, 8 * (TEXTOS_POR_TAREFA * quantidade + 1), 4 * quantidade, quantidade]
+        inicios = list(accumulate((tamanho + alinhar(tamanho) for tamanho in tamanhos), initial=CABECALHO.size))
+
+        if len(visao) != inicios[-1] + tamanho_textos:
+            raise ValueError(f'Snapshot binário inválido (tamanho incorreto): {dir}')
+
+        if verificar and zlib.crc32(visao[CABECALHO.size:]) != checksum:
+            raise ValueError(f'Snapshot binário inválido (checksum incorreto): {dir}')
+
+        colunas = [ler_coluna(visao, inicio, tipo, tamanho) for inicio, tipo, tamanho in
+                   zip(inicios, ("q", "q", "Q", "i", "B"), (quantidade, quantidade, TEXTOS_POR_TAREFA * quantidade + 1, quantidade, quantidade))]
+        colunas.append(visao[inicios[-1]:])
+    except BaseException:
+        liberar_snapshot(mapa, visao, colunas)
+        raise
+
+    return mapa, visao, quantidade, colunas
+
+
+def liberar_snapshot(mapa: mmap.mmap, visao: memoryview, colunas: list):
+    """
+    Libera as colunas e a visão de um snapshot obtidos por "mapear_snapshot" e fecha o mapa.
+
+    Parâmetros:
+        - mapa (mmap): O mapa do arquivo.
+        - visao (memoryview): A visão do arquivo.
+        - colunas (list): As colunas do snapshot.
+    """
+    # As visões precisam ser liberadas antes do mapa
+    for coluna in colunas:
+        if isinstance(coluna, memoryview):
+            coluna.release()
+
+    visao.release()
+    mapa.close()
+
+
+def iterar_lotes_snapshot(dir: str, tamanho_lote: int = TAMANHO_LOTE, fonte=None):
+    """
+    Lê um snapshot binário, mapeado na memória, e reconstrói as tarefas (com seus decorators) em lotes.
+
+    Parâmetros:
+        - dir (str): O caminho do arquivo.
+        - tamanho_lote (int): A quantidade máxima de tarefas por lote.
+        - fonte (FonteTextos or None): Se informada, a descrição e o lembrete das tarefas não são lidos: ficam
+          adiados (TEXTO_ADIADO) e são obtidos da fonte quando acessados.
+
+    Retorna:
+        - Iterator[List[Tarefa]]: Os lotes de tarefas, na ordem de exibição.
+    """
+    mapa, visao, quantidade, colunas = mapear_snapshot(dir)
+
+    try:
+        ids, criados, posicoes, prazos, indicadores, textos = colunas
+
+        tPrioridade = TarefaComPrioridadeFactory()
+        tTrabalho = TarefaTrabalhoFactory()
+
+        for inicio_lote in range(0, quantidade, tamanho_lote):
+            lote = []
+
+            for indice in range(inicio_lote, min(inicio_lote + tamanho_lote, quantidade)):
+                posicao = TEXTOS_POR_TAREFA * indice
+                titulo = str(textos[posicoes[posicao]:posicoes[posicao + 1]], 'UTF-8')
+                descricao = TEXTO_ADIADO if fonte is not None else str(textos[posicoes[posicao + 1]:posicoes[posicao + 2]], 'UTF-8')
+                indicador = indicadores[indice]
+
+                tarefa = (tPrioridade if indicador & PRIORIDADE else tTrabalho).criar_tarefa(titulo, descricao)
+                tarefa.criado_em = criados[indice]
+                tarefa.concluida = bool(indicador & CONCLUIDA)
+                tarefa.id = ids[indice]
+                tarefa.fonte_textos = fonte
+
+                if posicoes[posicao + 2] != posicoes[posicao + 3]:
+                    lembrete = TEXTO_ADIADO if fonte is not None else str(textos[posicoes[posicao + 2]:posicoes[posicao + 3]], 'UTF-8')
+                    tarefa = TarefaComLembrete(tarefa, lembrete)
+
+                if prazos[indice]:
+                    tarefa = TarefaComPrazo(tarefa, date.fromordinal(prazos[indice]))
+
+                lote.append(tarefa)
+
+            yield lote
+    finally:
+        # O mapa é fechado mesmo se a leitura for interrompida
+        liberar_snapshot(mapa, visao, colunas)
+
+
+class FonteTextos:
+    """
+    Fonte das descrições e lembretes adiados das tarefas carregadas de um snapshot binário. O snapshot fica mapeado
+    na memória e os textos de uma tarefa são lidos da área de textos apenas quando acessados; os últimos textos lidos
+    ficam em um cache LRU limitado a "capacidade" tarefas.
+
+    Atributos:
+        - capacidade (int): Quantidade máxima de tarefas com os textos no cache.
+        - cache (OrderedDict[int, Tuple[str, str]]): ID -> (descrição, lembrete), do menos ao mais recentemente usado.
+        - trava (threading.RLock): Protege o cache e a troca do snapshot mapeado.
+        - mapa (mmap or None): O snapshot mapeado, ou None com a fonte fechada.
+        - visao (memoryview or None): A visão do snapshot.
+        - colunas (list): As colunas do snapshot (ver "mapear_snapshot").
+        - ids (Sequence[int] or None): Os IDs das tarefas do snapshot, em ordem crescente (None até a primeira leitura).
+        - indices (array or None): A posição, no snapshot, de cada ID de "ids" (None se os IDs já estão em ordem
+          crescente no snapshot, caso em que a posição é o próprio índice).
+        - seguinte (int): A posição seguinte à última lida por "ler_varios", testada antes da busca binária.
+
+    Métodos:
+        - abrir(dir)
+        - fechar()
+        - ordenar_ids()
+        - posicao(tarefa_id)
+        - textos_posicao(posicao)
+        - ler(tarefa_id)
+        - ler_varios(tarefa_ids)
+    """
+    CAPACIDADE = 1024
+
+    def __init__(self, dir: str, capacidade: int = CAPACIDADE):
+        """
+        Construtor da classe FonteTextos.
+
+        Parâmetros:
+            - dir (str): O caminho do snapshot binário.
+            - capacidade (int): Quantidade máxima de tarefas com os textos no cache.
+        """
+        self.capacidade = capacidade
+        self.cache = OrderedDict()
+        self.trava = threading.RLock()
+        self.mapa = None
+        self.visao = None
+        self.colunas = []
+        self.ids = None
+        self.indices = None
+        self.seguinte = 0
+        self.abrir(dir)
+
+    def abrir(self, dir: str):
+        """
+        Mapeia um snapshot binário (o checksum já foi verificado pelo carregamento ou pela gravação) e esvazia o cache.
+
+        Parâmetros:
+            - dir (str): O caminho do snapshot binário.
+        """
+        with self.trava:
+            self.mapa, self.visao, _, self.colunas = mapear_snapshot(dir, verificar=False)
+            self.ids = None
+            self.indices = None
+            self.seguinte = 0
+            self.cache.clear()
+
+    def fechar(self):
+        """
+        Libera o snapshot mapeado. Os textos não podem ser lidos até a fonte ser reaberta.
+        """
+        with self.trava:
+            if self.mapa is None:
+                return
+
+            self.ids = None
+            self.indices = None
+            liberar_snapshot(self.mapa, self.visao, self.colunas)
+            self.mapa = None
+            self.visao = None
+            self.colunas = []
+            self.cache.clear()
+
+    def ordenar_ids(self):
+        """
+        Ordena os IDs do snapshot, em vetores de números, para a busca binária sem um dicionário por tarefa. Feito
+        apenas na primeira leitura, e não ao abrir, para não atrasar o carregamento.
+        """
+        ids = self.colunas[0]
+
+        if all(ids[indice] < ids[indice + 1] for indice in range(len(ids) - 1)):
+            self.ids = ids
+            self.indices = None
+        else:
+            ordem = sorted(range(len(ids)), key=ids.__getitem__)
+            self.ids = array("q", (ids[indice] for indice in ordem))
+            self.indices = array("q", ordem)
+
+    def posicao(self, tarefa_id: int) -> int:
+        """
+        Encontra, por busca binária nos IDs ordenados, a posição de uma tarefa no snapshot. Deve ser chamado com a
+        trava da fonte.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - int: A posição da tarefa nas colunas do snapshot. Se a tarefa não estiver no snapshot, um KeyError é
+              lançado.
+        """
+        if self.ids is None:
+            self.ordenar_ids()
+
+        posicao = bisect_left(self.ids, tarefa_id)
+
+        if posicao == len(self.ids) or self.ids[posicao] != tarefa_id:
+            raise KeyError(f'Tarefa {tarefa_id} não encontrada no snapshot')
+
+        return posicao if self.indices is None else self.indices[posicao]
+
+    def textos_posicao(self, posicao: int) -> tuple:
+        """
+        Copia da área de textos a descrição e o lembrete da tarefa em uma posição do snapshot, sem passar pelo cache.
+        Deve ser chamado com a trava da fonte.
+
+        Parâmetros:
+            - posicao (int): A posição da tarefa nas colunas do snapshot.
+
+        Retorna:
+            - Tuple[str, str]: A descrição e o lembrete.
+        """
+        indice = TEXTOS_POR_TAREFA * posicao
+        _, _, posicoes, _, _, area_textos = self.colunas
+
+        return str(area_textos[posicoes[indice + 1]:posicoes[indice + 2]], 'UTF-8'), str(area_textos[posicoes[indice + 2]:posicoes[indice + 3]], 'UTF-8')
+
+    def ler(self, tarefa_id: int) -> tuple:
+        """
+        Obtém a descrição e o lembrete de uma tarefa do snapshot, do cache ou da área de textos.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - Tuple[str, str]: A descrição e o lembrete (uma string vazia se a tarefa não possuir lembrete).
+        """
+        with self.trava:
+            textos = self.cache.get(tarefa_id)
+
+            if textos is not None:
+                self.cache.move_to_end(tarefa_id)
+
+                if METRICAS.ativo:
+                    METRICAS.contar("notestation_textos_lidos_total", origem="cache")
+
+                return textos
+
+            textos = self.textos_posicao(self.posicao(tarefa_id))
+
+            self.cache[tarefa_id] = textos
+
+            if len(self.cache) > self.capacidade:
+                self.cache.popitem(last=False)
+
+            if METRICAS.ativo:
+                METRICAS.contar("notestation_textos_lidos_total", origem="snapshot")
+
+            return textos
+
+
+    def ler_varios(self, tarefa_ids: list) -> list:
+        """
+        Obtém os textos de várias tarefas de uma vez (ex.: para construir o índice de busca), sem passar pelo cache:
+        os textos lidos para uma construção não são reaproveitados e apenas expulsariam os textos das tarefas
+        visualizadas. Como as tarefas costumam ser pedidas na ordem do snapshot, a posição seguinte à última lida é
+        testada antes da busca binária, e a área de textos é percorrida em sequência.
+
+        Parâmetros:
+            - tarefa_ids (List[int]): Os IDs das tarefas.
+
+        Retorna:
+            - List[Tuple[str, str]]: A descrição e o lembrete de cada tarefa, na ordem dos IDs. Se alguma tarefa não
+              estiver no snapshot, um KeyError é lançado.
+        """
+        with self.trava:
+            ids = self.colunas[0]
+            quantidade = len(ids)
+            seguinte = self.seguinte
+            resultado = []
+
+            for tarefa_id in tarefa_ids:
+                posicao = seguinte if seguinte < quantidade and ids[seguinte] == tarefa_id else self.posicao(tarefa_id)
+                resultado.append(self.textos_posicao(posicao))
+                seguinte = posicao + 1
+
+            self.seguinte = seguinte
+
+            if METRICAS.ativo:
+                METRICAS.contar("notestation_textos_lidos_total", len(resultado), origem="sequencial")
+
+            return resultado
+
+
+def converter_json_para_binario(dir_json: str, dir_binario: str) -> int:
+    """
+    Converte um arquivo JSON de tarefas (aplicando o seu diário, se houver) em um snapshot binário. O arquivo JSON
+    não é alterado.
+
+    Parâmetros:
+        - dir_json (str): O caminho do arquivo JSON.
+        - dir_binario (str): O caminho do snapshot binário a ser gravado.
+
+    Retorna:
+        - int: A quantidade de tarefas convertidas.
+    """
+    organizador = TarefaOrganizador()
+    persistencia = PersistenciaDiario(dir_json, assincrono=False)
+    persistencia.carregar(organizador)
+    persistencia.fechar()
+
+    gravar_snapshot(dir_binario, organizador.retrato().itens())
+    return len(organizador.tarefas_por_id)
+
+
+def converter_binario_para_json(dir_binario: str, dir_json: str) -> int:
+    """
+    Converte um snapshot binário (aplicando o seu diário, se houver) em um arquivo JSON no formato da
+    PersistenciaJson. O snapshot binário não é alterado.
+
+    Parâmetros:
+        - dir_binario (str): O caminho do snapshot binário.
+        - dir_json (str): O caminho do arquivo JSON a ser gravado.
+
+    Retorna:
+        - int: A quantidade de tarefas convertidas.
+    """
+    organizador = TarefaOrganizador()
+    persistencia = PersistenciaBinaria(dir_binario, assincrono=False)
+    persistencia.carregar(organizador)
+    persistencia.fechar()
+
+    persistencia_json = PersistenciaJson(dir_json, assincrono=False)
+    persistencia_json.organizador = organizador
+    persistencia_json.salvar()
+    return len(organizador.tarefas_por_id)
+
+
+class PersistenciaBinaria(PersistenciaDiario):
+    """
+    Persistência em modo diário cujo snapshot é gravado no formato binário descrito no módulo. Os registros do
+    diário, a compactação e a gravação em segundo plano são os mesmos da PersistenciaDiario.
+
+    Atributos:
+        - dir_json (str or None): Caminho do arquivo JSON migrado no primeiro carregamento, se o snapshot binário
+          ainda não existir.
+        - textos_sob_demanda (bool): Se True, a descrição e o lembrete das tarefas são lidos apenas quando acessados.
+        - textos (FonteTextos or None): Fonte dos textos adiados, aberta ao carregar no modo de textos sob demanda.
+
+    Métodos:
+        - carregar_snapshot(organizador, tamanho_lote, ids)
+        - ids_snapshot(estado)
+        - capturar_estado()
+        - trocar_snapshot()
+        - salvar(estado)
+    """
+    def __init__(self, dir: str, dir_json: str = None, limite_compactacao: int = PersistenciaDiario.LIMITE_COMPACTACAO, assincrono: bool = True, textos_sob_demanda: bool = False):
+        """
+        Construtor da classe PersistenciaBinaria.
+
+        Parâmetros:
+            - dir (str): Caminho do snapshot binário.
+            - dir_json (str or None): Caminho de um arquivo JSON a ser migrado se o snapshot binário não existir.
+            - limite_compactacao (int): Tamanho mínimo do diário, em bytes, a partir do qual a compactação é feita.
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano.
+            - textos_sob_demanda (bool): Se True, a descrição e o lembrete das tarefas ficam no snapshot mapeado e
+              são lidos apenas quando acessados (ver "Textos sob demanda" no módulo).
+        """
+        self.dir_json = dir_json
+        self.textos_sob_demanda = textos_sob_demanda
+        self.textos = None
+        super().__init__(dir, limite_compactacao, assincrono)
+
+    def carregar_snapshot(self, organizador: TarefaOrganizador, tamanho_lote: int, ids: list = None):
+        """
+        Lê o snapshot binário em lotes e os entrega ao organizador. Se o snapshot não existir, ele é criado a partir
+        do arquivo JSON informado em "dir_json" (se existir) ou vazio.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+            - ids (List[int] or None): Ignorado: o snapshot binário já guarda os IDs das tarefas.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        self.organizador = organizador
+        organizador.tarefas = []
+
+        if not os.path.exists(self.dir):
+            if self.dir_json and os.path.exists(self.dir_json):
+                converter_json_para_binario(self.dir_json, self.dir)
+            else:
+                gravar_snapshot(self.dir, [])
+
+        if self.textos_sob_demanda:
+            self.textos = FonteTextos(self.dir)
+
+        for lote in iterar_lotes_snapshot(self.dir, tamanho_lote, self.textos):
+            organizador.carregar_lote(lote)
+            yield len(lote)
+
+    def ids_snapshot(self, estado: RetratoOrganizador) -> list:
+        """
+        O snapshot binário guarda os IDs das tarefas, que não precisam ser repetidos no cabeçalho do diário.
+
+        Parâmetros:
+            - estado (RetratoOrganizador): O estado gravado no snapshot.
+
+        Retorna:
+            - None: Sempre.
+        """
+        return None
+
+    def capturar_estado(self) -> RetratoOrganizador:
+        """
+        Captura o estado atual do organizador para a gravação do snapshot.
+
+        Retorna:
+            - RetratoOrganizador: O retrato imutável da versão atual.
+        """
+        estado = self.organizador.retrato()
+
+        # Com os textos sob demanda, os registros em cache no organizador manteriam todos os textos na memória
+        if self.textos is not None:
+            self.organizador.descartar_retratos()
+
+        return estado
+
+    @contextmanager
+    def trocar_snapshot(self):
+        """
+        Fecha a fonte dos textos, com a sua trava, durante a substituição do snapshot, e a reabre sobre o novo arquivo
+        (ou sobre o anterior, se a substituição falhar).
+        """
+        with self.textos.trava:
+            self.textos.fechar()
+
+            try:
+                yield
+            finally:
+                self.textos.abrir(self.dir)
+
+    def salvar(self, estado: RetratoOrganizador = None):
+        """
+        Reescreve, de forma atômica, o snapshot binário com todas as tarefas.
+
+        Parâmetros:
+            - estado (RetratoOrganizador or None): O estado já capturado; se None, o estado atual do organizador é capturado.
+        """
+        if estado is None:
+            estado = self.capturar_estado()
+
+        # O snapshot mapeado pela fonte dos textos é substituído pelo novo, que contém os mesmos textos para todas as
+        # tarefas com textos adiados; as leituras esperam apenas pela renomeação
+        gravar_snapshot(self.dir, estado.itens(), troca=self.trocar_snapshot if self.textos is not None else None)
@@ -0,0 +1,512 @@
+"""
+Módulo contendo a persistência das tarefas em fragmentos (shards) JSON descritos por um manifesto.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo que permite trabalhar com dados JSON, usado nos fragmentos e no manifesto.
+    - threading: Módulo que fornece primitivas de sincronização entre threads.
+    - date: Classe do módulo datetime usada para converter os prazos (lidos como números ordinais).
+
+Classes:
+    - PersistenciaFragmentada: Persistência que divide as tarefas em fragmentos pelo ID e regrava apenas os
+      fragmentos alterados.
+
+Funções:
+    - ler_fragmento(caminho): Lê um fragmento e converte as suas tarefas em tuplas simples. Executada nos processos
+      filhos durante o carregamento em paralelo.
+
+Formato:
+    - As tarefas ficam em um diretório (ex.: "lista_tarefas.fragmentos"). O manifesto ("manifesto.json") guarda a
+      versão do formato, a geração atual, o nome do arquivo de cada fragmento (null para um fragmento vazio) e o
+      filtro da visão ordenada exibida.
+    - A tarefa de ID "i" pertence ao fragmento "i % quantidade de fragmentos". Cada fragmento é um dicionário JSON
+      ID -> {"posicao": posição da tarefa na ordem original, "tarefa": tarefa no formato do TarefaEncoder}.
+
+Gravação:
+    - Assim como na PersistenciaSQLite, cada comando (executado ou desfeito) captura, na thread que o executou, apenas
+      as tarefas afetadas (TarefaCommand.tarefas_afetadas), e o GravadorSegundoPlano aplica as alterações pendentes de
+      uma vez. Apenas os fragmentos dessas tarefas são lidos, alterados e regravados: editar uma tarefa custa o
+      tamanho de um fragmento, e não o da lista inteira.
+    - Os fragmentos alterados são gravados em arquivos novos, com o número da nova geração no nome, e só passam a
+      valer quando o manifesto (gravado por último, de forma atômica) aponta para eles. Uma gravação interrompida
+      deixa o manifesto anterior intacto, com todos os fragmentos de um lote ou de nenhum; os arquivos que não
+      pertencem ao manifesto são removidos no carregamento seguinte.
+    - Uma tarefa nova (ou restaurada por desfazer) recebe a próxima posição, ficando no fim da lista, como no organizador.
+
+Carregamento:
+    - Os fragmentos são lidos em paralelo por um multiprocessing.Pool (a análise do JSON, das datas e dos prazos é
+      feita nos processos filhos), enquanto o processo principal monta as tarefas de cada fragmento já lido e as
+      entrega ao organizador em lotes. Ao final, as tarefas são colocadas na ordem original (pelas posições) e a
+      visão ordenada do manifesto é reaplicada. Com um único processo, os fragmentos são lidos sequencialmente.
+    - Os processos filhos são criados por "forkserver" (ou "spawn", onde ele não existe, ex.: Windows), e não por
+      "fork": o carregamento pode acontecer com outras threads em execução (ex.: a interface, o agendador ou o
+      gravador em segundo plano), e um filho criado por fork herdaria as travas ocupadas por elas sem as threads que
+      as liberariam.
+    - Se o diretório ainda não existir e um arquivo "lista_tarefas.json" (com ou sem diário) for informado, as
+      tarefas são migradas para os fragmentos no primeiro carregamento. O arquivo JSON não é alterado.
+"""
+
+import sys
+import os
+import json
+import threading
+from datetime import date
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa, ler_data_exata, converter_prazo
+from gerenciamento_arquivos.json_tarefa_encoder import TarefaEncoder
+from gerenciamento_arquivos.persistencia_tarefas import Persistencia, PersistenciaDiario, TAMANHO_LOTE
+from gerenciamento_arquivos.gravador_tarefas import gravar_atomico
+
+VERSAO_FORMATO = 1
+MANIFESTO = "manifesto.json"
+QUANTIDADE_FRAGMENTOS = 16
+
+
+def ler_fragmento(caminho: str) -> list:
+    """
+    Lê um fragmento e converte as suas tarefas em tuplas simples, que são enviadas ao processo principal sem os
+    objetos das tarefas.
+
+    Parâmetros:
+        - caminho (str): O caminho do arquivo do fragmento.
+
+    Retorna:
+        - List[tuple]: (posição, ID, prioridade, título, descrição, data de criação em microssegundos, concluída,
+          lembrete, prazo como número ordinal ou 0) de cada tarefa do fragmento.
+    """
+    with open(caminho, "r", encoding='UTF-8') as arquivo:
+        fragmento = json.load(arquivo)
+
+    tuplas = []
+
+    for tarefa_id, entrada in fragmento.items():
+        tarefa_obj = entrada["tarefa"]
+        prazo = converter_prazo(tarefa_obj["prazo"])
+
+        tuplas.append((
+            entrada["posicao"],
+            int(tarefa_id),
+            tarefa_obj["prioridade"],
+            tarefa_obj["titulo"],
+            tarefa_obj["descricao"],
+            ler_data_exata(tarefa_obj["data_exata"]),
+            tarefa_obj["concluida"],
+            tarefa_obj["lembrete"],
+            prazo.toordinal() if prazo is not None else 0
+        ))
+
+    return tuplas
+
+
+class PersistenciaFragmentada(Persistencia):
+    """
+    Persistência que divide as tarefas em fragmentos JSON, descritos por um manifesto (ver o formato no módulo).
+
+    Atributos:
+        - dir (str): Caminho do diretório dos fragmentos.
+        - dir_json (str or None): Caminho de um arquivo JSON legado a ser migrado caso o diretório ainda não exista.
+        - quantidade_fragmentos (int): Quantidade de fragmentos (lida do manifesto, se ele existir).
+        - processos (int or None): Quantidade de processos usados para ler os fragmentos (None: um por núcleo).
+        - geracao (int): A geração do manifesto gravado.
+        - arquivos (List[str or None]): O arquivo de cada fragmento na geração atual (None para um fragmento vazio).
+        - posicoes (Dict[int, int]): Posição de cada tarefa (ID -> posição) na ordem original.
+        - proxima_posicao (int): Posição atribuída à próxima tarefa inserida no fim da lista.
+        - alteracoes (Dict[int, Dict[int, dict or None]]): Fragmento -> ID -> entrada a gravar (None para excluir),
+          capturadas e ainda não gravadas.
+        - completo (Dict[int, dict] or None): Todas as entradas (ID -> entrada), capturadas quando qualquer tarefa
+          pode ter sido alterada, ou None.
+        - ordem (str or None): O filtro da visão exibida, gravado no manifesto.
+        - encoder (TarefaEncoder): Codificador usado para capturar as tarefas.
+        - tPrioridade (TarefaComPrioridadeFactory): Fábrica utilizada para montar as tarefas com prioridade.
+        - tTrabalho (TarefaTrabalhoFactory): Fábrica utilizada para montar as tarefas de trabalho.
+        - trava (threading.Lock): Protege as alterações pendentes entre a thread da interface e a do gravador.
+
+    Métodos:
+        - carregar_em_lotes(organizador, tamanho_lote)
+        - caminho(nome)
+        - ler_manifesto()
+        - gravar_manifesto(geracao, arquivos)
+        - remover_arquivos_antigos()
+        - migrar_json()
+        - ler_em_paralelo(nomes)
+        - montar_tarefa(tupla)
+        - fragmento(tarefa_id)
+        - entrada_tarefa(tarefa)
+        - capturar(tarefas)
+        - capturar_tudo()
+        - gravar_pendencias()
+        - gravar_fragmentos(alteracoes, completo)
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+    """
+    def __init__(self, dir: str, dir_json: str = None, quantidade_fragmentos: int = QUANTIDADE_FRAGMENTOS, assincrono: bool = True, processos: int = None):
+        """
+        Construtor da classe PersistenciaFragmentada.
+
+        Parâmetros:
+            - dir (str): Caminho do diretório dos fragmentos.
+            - dir_json (str or None): Caminho de um arquivo JSON legado a ser migrado caso o diretório ainda não exista.
+            - quantidade_fragmentos (int): Quantidade de fragmentos de um diretório novo.
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano.
+            - processos (int or None): Quantidade de processos usados para ler os fragmentos (None: um por núcleo).
+        """
+        self.dir = dir
+        self.dir_json = dir_json
+        self.quantidade_fragmentos = quantidade_fragmentos
+        self.processos = processos
+        self.geracao = 0
+        self.arquivos = [None] * quantidade_fragmentos
+        self.posicoes = {}
+        self.proxima_posicao = 0
+        self.alteracoes = {}
+        self.completo = None
+        self.ordem = None
+        self.encoder = TarefaEncoder()
+        self.tPrioridade = TarefaComPrioridadeFactory()
+        self.tTrabalho = TarefaTrabalhoFactory()
+        self.trava = threading.Lock()
+        super().__init__(assincrono)
+
+    def carregar_em_lotes(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Lê o manifesto (criando o diretório ou migrando o arquivo JSON legado, se necessário) e carrega os fragmentos
+        em paralelo, entregando as tarefas ao organizador em lotes. Depois do último lote, coloca as tarefas na ordem
+        original, reaplica a visão ordenada e passa a observar o organizador.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas entregues por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        self.organizador = organizador
+        organizador.tarefas = []
+
+        if not os.path.exists(self.caminho(MANIFESTO)):
+            os.makedirs(self.dir, exist_ok=True)
+
+            if self.dir_json and os.path.exists(self.dir_json):
+                self.migrar_json()
+            else:
+                self.gravar_manifesto()
+
+        self.ler_manifesto()
+        self.remover_arquivos_antigos()
+
+        tarefas = []
+
+        for tuplas in self.ler_em_paralelo([nome for nome in self.arquivos if nome is not None]):
+            for inicio in range(0, len(tuplas), tamanho_lote):
+                lote = [self.montar_tarefa(tupla) for tupla in tuplas[inicio:inicio + tamanho_lote]]
+                organizador.carregar_lote(lote)
+                tarefas.extend(lote)
+                yield len(lote)
+
+        posicoes = self.posicoes
+        tarefas.sort(key=lambda tarefa: posicoes[tarefa.base.id])
+        organizador.reordenar_tarefas(tarefas)
+        self.proxima_posicao = max(posicoes.values(), default=-1) + 1
+
+        if self.ordem is not None:
+            organizador.definir_ordem(self.ordem)
+
+        organizador.observadores.append(self)
+
+    def caminho(self, nome: str) -> str:
+        """
+        Obtém o caminho de um arquivo do diretório dos fragmentos.
+
+        Parâmetros:
+            - nome (str): O nome do arquivo.
+
+        Retorna:
+            - str: O caminho do arquivo.
+        """
+        return os.path.join(self.dir, nome)
+
+    def ler_manifesto(self):
+        """
+        Lê o manifesto: a geração, os arquivos dos fragmentos e a visão ordenada.
+        """
+        with open(self.caminho(MANIFESTO), "r", encoding='UTF-8') as arquivo:
+            manifesto = json.load(arquivo)
+
+        if manifesto.get("formato") != VERSAO_FORMATO:
+            raise ValueError(f'Manifesto com formato desconhecido: {self.caminho(MANIFESTO)}')
+
+        self.geracao = manifesto["geracao"]
+        self.arquivos = manifesto["arquivos"]
+        self.quantidade_fragmentos = len(self.arquivos)
+        self.ordem = manifesto["ordem"]
+
+    def gravar_manifesto(self, geracao: int = None, arquivos: list = None):
+        """
+        Grava o manifesto de forma atômica. É a última escrita de cada gravação: só então os novos fragmentos valem.
+
+        Parâmetros:
+            - geracao (int or None): A geração gravada (por padrão, a atual).
+            - arquivos (List[str] or None): Os arquivos dos fragmentos (por padrão, os atuais).
+        """
+        geracao = self.geracao if geracao is None else geracao
+        arquivos = self.arquivos if arquivos is None else arquivos
+        manifesto = {"formato": VERSAO_FORMATO, "geracao": geracao, "arquivos": arquivos, "ordem": self.ordem}
+        gravar_atomico(self.caminho(MANIFESTO), lambda arquivo: json.dump(manifesto, arquivo, ensure_ascii=False))
+
+    def remover_arquivos_antigos(self):
+        """
+        Remove os fragmentos que não pertencem ao manifesto (substituídos, ou deixados por uma gravação interrompida).
+        """
+        atuais = set(self.arquivos)
+
+        for nome in os.listdir(self.dir):
+            if nome.startswith("fragmento_") and nome not in atuais:
+                os.remove(self.caminho(nome))
+
+    def migrar_json(self):
+        """
+        Grava nos fragmentos as tarefas do arquivo JSON legado (aplicando o diário, se houver), na mesma ordem.
+        """
+        legado = TarefaOrganizador()
+        persistencia_json = PersistenciaDiario(self.dir_json, assincrono=False)
+        persistencia_json.carregar(legado)
+        persistencia_json.fechar()
+
+        # As entradas são capturadas do organizador legado; as posições são lidas novamente dos fragmentos ao carregar
+        organizador, self.organizador = self.organizador, legado
+        self.ordem = legado.ordem
+        self.completo = self.capturar_tudo()
+        self.gravar_pendencias()
+
+        self.organizador = organizador
+        self.posicoes = {}
+        self.proxima_posicao = 0
+
+    def ler_em_paralelo(self, nomes: list):
+        """
+        Lê os fragmentos com "ler_fragmento", em paralelo quando possível.
+
+        Com mais de um processo e mais de um fragmento, a leitura é feita por um multiprocessing.Pool com
+        "forkserver" ou "spawn" (os filhos recebem apenas o caminho de cada fragmento).
+
+        Parâmetros:
+            - nomes (List[str]): Os nomes dos arquivos dos fragmentos.
+
+        Retorna:
+            - Iterator[List[tuple]]: As tuplas de cada fragmento, na ordem dos nomes.
+        """
+        caminhos = [self.caminho(nome) for nome in nomes]
+        processos = self.processos if self.processos is not None else os.cpu_count() or 1
+
+        if processos < 2 or len(caminhos) < 2:
+            yield from map(ler_fragmento, caminhos)
+            return
+
+        # Importado apenas aqui: o multiprocessing é caro de importar e só é usado na leitura em paralelo
+        import multiprocessing
+
+        metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+        with multiprocessing.get_context(metodo).Pool(min(processos, len(caminhos))) as pool:
+            # Cada fragmento é montado assim que lido, enquanto os filhos continuam lendo os seguintes
+            yield from pool.imap(ler_fragmento, caminhos)
+
+    def montar_tarefa(self, tupla: tuple) -> Tarefa:
+        """
+        Monta uma tarefa (com seus decorators) a partir de uma tupla de "ler_fragmento" e guarda a sua posição.
+
+        Parâmetros:
+            - tupla (tuple): A tupla da tarefa.
+
+        Retorna:
+            - Tarefa: A tarefa montada.
+        """
+        posicao, tarefa_id, prioridade, titulo, descricao, criado_em, concluida, lembrete, prazo = tupla
+        tarefa = (self.tPrioridade if prioridade else self.tTrabalho).criar_tarefa(titulo, descricao)
+        tarefa.criado_em = criado_em
+        tarefa.concluida = concluida
+        tarefa.id = tarefa_id
+        self.posicoes[tarefa_id] = posicao
+
+        if lembrete:
+            tarefa = TarefaComLembrete(tarefa, lembrete)
+
+        if prazo:
+            tarefa = TarefaComPrazo(tarefa, date.fromordinal(prazo))
+
+        return tarefa
+
+    def fragmento(self, tarefa_id: int) -> int:
+        """
+        Obtém o fragmento ao qual uma tarefa pertence.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - int: O índice do fragmento.
+        """
+        return tarefa_id % self.quantidade_fragmentos
+
+    def entrada_tarefa(self, tarefa: Tarefa):
+        """
+        Gera a entrada de uma tarefa no seu fragmento, atribuindo a próxima posição a uma tarefa nova. Executado na
+        thread que realizou a operação.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa.
+
+        Retorna:
+            - dict or None: {"posicao": ..., "tarefa": ...}, ou None se a tarefa não pertence mais ao organizador.
+        """
+        tarefa_id = tarefa.base.id
+
+        if tarefa_id not in self.organizador.tarefas_por_id:
+            self.posicoes.pop(tarefa_id, None)
+            return None
+
+        posicao = self.posicoes.get(tarefa_id)
+
+        if posicao is None:
+            posicao = self.posicoes[tarefa_id] = self.proxima_posicao
+            self.proxima_posicao += 1
+
+        return {"posicao": posicao, "tarefa": self.encoder.default(tarefa)}
+
+    def capturar(self, tarefas):
+        """
+        Captura as entradas das tarefas alteradas por uma operação e agenda a gravação dos seus fragmentos.
+
+        Parâmetros:
+            - tarefas (Iterable[Tarefa] or None): As tarefas afetadas, ou None se qualquer tarefa pode ter sido alterada.
+        """
+        if tarefas is None:
+            completo = self.capturar_tudo()
+
+            with self.trava:
+                self.completo = completo
+                self.alteracoes = {}
+                self.ordem = self.organizador.ordem
+        else:
+            entradas = [(tarefa.base.id, self.entrada_tarefa(tarefa)) for tarefa in tarefas]
+
+            with self.trava:
+                for tarefa_id, entrada in entradas:
+                    self.alteracoes.setdefault(self.fragmento(tarefa_id), {})[tarefa_id] = entrada
+
+                self.ordem = self.organizador.ordem
+
+        self.alterado()
+
+    def capturar_tudo(self) -> dict:
+        """
+        Captura as entradas de todas as tarefas do organizador, na ordem original.
+
+        Retorna:
+            - Dict[int, dict]: ID -> entrada.
+        """
+        posicoes = {tarefa_id: posicao for tarefa_id, posicao in self.posicoes.items() if tarefa_id in self.organizador.tarefas_por_id}
+        self.posicoes = posicoes
+        return {tarefa_id: self.entrada_tarefa(tarefa) for tarefa_id, tarefa in self.organizador.tarefas_por_id.items()}
+
+    def gravar_pendencias(self):
+        """
+        Grava os fragmentos alterados em arquivos da nova geração e, por último, o manifesto que aponta para eles.
+        Executado na thread do gravador (ou diretamente no modo síncrono). Se a gravação falhar, as alterações
+        voltam para as pendências (sob as capturadas durante a gravação) e o manifesto anterior continua valendo.
+        """
+        with self.trava:
+            alteracoes, self.alteracoes = self.alteracoes, {}
+            completo, self.completo = self.completo, None
+
+        try:
+            self.gravar_fragmentos(alteracoes, completo)
+        except Exception:
+            with self.trava:
+                # Uma captura completa posterior já contém tudo o que não foi gravado
+                if self.completo is None:
+                    self.completo = completo
+
+                    for indice, entradas in alteracoes.items():
+                        self.alteracoes[indice] = {**entradas, **self.alteracoes.get(indice, {})}
+
+            raise
+
+    def gravar_fragmentos(self, alteracoes: dict, completo: dict):
+        """
+        Aplica as alterações capturadas aos fragmentos, grava-os com o número da nova geração e grava o manifesto.
+
+        Parâmetros:
+            - alteracoes (Dict[int, Dict[int, dict or None]]): Fragmento -> ID -> entrada (None para uma exclusão).
+            - completo (Dict[int, dict] or None): Todas as entradas, se uma captura completa estiver pendente.
+        """
+        fragmentos = {}
+
+        if completo is not None:
+            fragmentos = {indice: {} for indice in range(self.quantidade_fragmentos)}
+
+            for tarefa_id, entrada in completo.items():
+                fragmentos[self.fragmento(tarefa_id)][str(tarefa_id)] = entrada
+
+        for indice, entradas in alteracoes.items():
+            fragmento = fragmentos.get(indice)
+
+            if fragmento is None:
+                nome = self.arquivos[indice]
+                fragmento = fragmentos[indice] = {}
+
+                if nome is not None:
+                    with open(self.caminho(nome), "r", encoding='UTF-8') as arquivo:
+                        fragmento = fragmentos[indice] = json.load(arquivo)
+
+            for tarefa_id, entrada in entradas.items():
+                if entrada is None:
+                    fragmento.pop(str(tarefa_id), None)
+                else:
+                    fragmento[str(tarefa_id)] = entrada
+
+        geracao = self.geracao + 1
+        arquivos = list(self.arquivos)
+
+        for indice, fragmento in fragmentos.items():
+            if not fragmento:
+                arquivos[indice] = None
+                continue
+
+            arquivos[indice] = f'fragmento_{indice:03d}_{geracao}.json'
+            gravar_atomico(self.caminho(arquivos[indice]), lambda arquivo: json.dump(fragmento, arquivo, ensure_ascii=False, separators=(',', ':')))
+
+        antigos = [nome for indice, nome in enumerate(self.arquivos) if nome is not None and nome != arquivos[indice]]
+        self.gravar_manifesto(geracao, arquivos)
+        self.geracao = geracao
+        self.arquivos = arquivos
+
+        # Um arquivo antigo que não puder ser removido agora é removido no próximo carregamento
+        for nome in antigos:
+            try:
+                os.remove(self.caminho(nome))
+            except OSError:
+                pass
+
+    def comando_executado(self, comando: TarefaCommand):
+        """
+        Captura as tarefas alteradas por um comando executado.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        self.capturar(comando.tarefas_afetadas())
+
+    def comando_desfeito(self, comando: TarefaCommand):
+        """
+        Captura as tarefas alteradas por um comando desfeito.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        self.capturar(comando.tarefas_afetadas())
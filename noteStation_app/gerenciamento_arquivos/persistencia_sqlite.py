@@ -0,0 +1,484 @@
+"""
+Módulo contendo a persistência das tarefas em um banco de dados SQLite.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - sqlite3: Módulo da biblioteca padrão que fornece acesso a bancos de dados SQLite.
+    - threading: Módulo que fornece primitivas de sincronização entre threads.
+
+Classes:
+    - PersistenciaSQLite: Persistência que guarda uma linha por tarefa em uma tabela SQLite indexada.
+
+Detalhes:
+    - A tabela "tarefas" possui colunas para o tipo, título, descrição, datas de criação, conclusão, lembrete e prazo,
+      além da posição da tarefa na ordem original (de inclusão) do organizador. Como as datas do formato JSON ("dd/mm/aaaa") não podem ser
+      comparadas, a criação e o prazo também são guardados em colunas ISO ("criado_em" e "prazo_data"), geradas
+      diretamente das datas nativas das tarefas e indexadas junto com o título.
+    - A ordenação por título usa a coluna "titulo_chave", com a mesma chave do organizador (o título em minúsculas do
+      Python, e não o COLLATE NOCASE do SQLite, que só converte letras ASCII). Com o ID como desempate, as consultas de
+      "consultar_ids" devolvem as tarefas na mesma ordem das visões ordenadas do organizador. Bancos criados antes
+      dessa coluna são atualizados ao abrir.
+    - Cada operação altera apenas as linhas das tarefas envolvidas. A ordenação não altera nenhuma linha: apenas o
+      filtro da visão ordenada exibida é guardado na tabela "configuracoes" e reaplicado ao carregar.
+      As alterações são capturadas na thread que executou o comando e aplicadas pelo GravadorSegundoPlano em uma
+      única transação.
+    - Se o banco ainda não existir e um arquivo "lista_tarefas.json" (com ou sem diário) for informado, as tarefas
+      são migradas para o banco no primeiro carregamento. O arquivo JSON não é alterado.
+"""
+
+import sys
+import os
+import sqlite3
+import threading
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa, de_epoca
+from gerenciamento_arquivos.json_tarefa_encoder import TarefaEncoder
+from gerenciamento_arquivos.json_tarefa_decoder import TarefaDecoder
+from gerenciamento_arquivos.persistencia_tarefas import Persistencia, PersistenciaDiario, TAMANHO_LOTE
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INTEGER PRIMARY KEY,
+    posicao INTEGER NOT NULL,
+    tipo TEXT NOT NULL,
+    titulo TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    data_criacao TEXT NOT NULL,
+    data_exata TEXT NOT NULL,
+    criado_em TEXT,
+    concluida INTEGER NOT NULL,
+    lembrete TEXT,
+    prazo TEXT,
+    prazo_data TEXT,
+    titulo_chave TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tarefas_titulo ON tarefas (titulo);
+CREATE INDEX IF NOT EXISTS idx_tarefas_criado_em ON tarefas (criado_em);
+CREATE INDEX IF NOT EXISTS idx_tarefas_prazo_data ON tarefas (prazo_data);
+CREATE INDEX IF NOT EXISTS idx_tarefas_posicao ON tarefas (posicao);
+CREATE TABLE IF NOT EXISTS configuracoes (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+COLUNAS = "id, posicao, tipo, titulo, descricao, data_criacao, data_exata, criado_em, concluida, lembrete, prazo, prazo_data, titulo_chave"
+
+# Ordenações equivalentes às visões do organizador (CHAVES_ORDENACAO, com o ID como desempate), executadas pelo SQLite
+ORDENACOES = {
+    "Título": "titulo_chave, id",
+    "Data de criação": "criado_em, id",
+    "Tipo de tarefa": "tipo, id",
+}
+
+# Quantidade máxima de IDs por consulta "IN (...)", abaixo do limite de parâmetros das versões antigas do SQLite
+LOTE_CONSULTA = 500
+
+
+class PersistenciaSQLite(Persistencia):
+    """
+    Persistência que guarda uma linha por tarefa em um banco de dados SQLite.
+
+    Atributos:
+        - dir (str): Caminho do arquivo do banco de dados.
+        - dir_json (str or None): Caminho de um arquivo JSON legado a ser migrado caso o banco ainda não exista.
+        - conexao (sqlite3.Connection or None): Conexão com o banco, aberta ao carregar.
+        - posicoes (Dict[int, int]): Posição de cada tarefa (ID -> posição) na ordem original gravada no banco.
+        - proxima_posicao (int): Posição atribuída à próxima tarefa inserida no fim da lista.
+        - pendentes (list): Operações capturadas e ainda não aplicadas ao banco, em ordem.
+        - trava (threading.Lock): Protege a lista de pendentes entre a thread da interface e a do gravador.
+        - trava_conexao (threading.Lock): Impede que a conexão seja usada por duas threads ao mesmo tempo.
+
+    Métodos:
+        - abrir()
+        - atualizar_esquema()
+        - ordem_salva()
+        - carregar_em_lotes(organizador, tamanho_lote)
+        - migrar_json()
+        - linha_tarefa(tarefa, posicao)
+        - tarefa_linha(linha)
+        - consultar_ids(ordem, concluida, prazo_inicio, prazo_fim, titulo_prefixo, limite)
+        - ler_tarefas(ids)
+        - gravar_pendencias()
+        - aplicar_pendencias(pendentes)
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+        - fechar()
+    """
+    def __init__(self, dir: str, dir_json: str = None, assincrono: bool = True):
+        """
+        Construtor da classe PersistenciaSQLite.
+
+        Parâmetros:
+            - dir (str): Caminho do arquivo do banco de dados.
+            - dir_json (str or None): Caminho de um arquivo JSON legado a ser migrado caso o banco ainda não exista.
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano.
+        """
+        self.dir = dir
+        self.dir_json = dir_json
+        self.conexao = None
+        self.encoder = TarefaEncoder()
+        self.decoder = TarefaDecoder()
+        self.posicoes = {}
+        self.proxima_posicao = 0
+        self.pendentes = []
+        self.trava = threading.Lock()
+        self.trava_conexao = threading.Lock()
+        super().__init__(assincrono)
+
+    def abrir(self):
+        """
+        Abre (ou cria) o banco, atualiza o seu esquema e migra o arquivo JSON legado se necessário. Não carrega as
+        tarefas: depois de aberto, o banco já pode ser consultado com "consultar_ids" e "ler_tarefas".
+        """
+        novo_banco = not os.path.exists(self.dir)
+
+        # A conexão é usada pela thread do gravador depois do carregamento, nunca por duas threads ao mesmo tempo
+        self.conexao = sqlite3.connect(self.dir, check_same_thread=False)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.executescript(ESQUEMA)
+        self.atualizar_esquema()
+
+        if novo_banco and self.dir_json and os.path.exists(self.dir_json):
+            self.migrar_json()
+
+    def atualizar_esquema(self):
+        """
+        Acrescenta a coluna "titulo_chave" aos bancos criados antes dela, preenchendo-a com a chave de título do
+        organizador, e cria o seu índice.
+        """
+        colunas = {linha[1] for linha in self.conexao.execute("PRAGMA table_info(tarefas)")}
+
+        if "titulo_chave" not in colunas:
+            # A função é registrada apenas nesta conexão: o SQLite não tem um equivalente ao str.lower do Python
+            self.conexao.create_function("chave_titulo", 1, str.lower, deterministic=True)
+
+            with self.conexao:
+                self.conexao.execute("ALTER TABLE tarefas ADD COLUMN titulo_chave TEXT")
+                self.conexao.execute("UPDATE tarefas SET titulo_chave = chave_titulo(titulo)")
+
+        self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_tarefas_titulo_chave ON tarefas (titulo_chave)")
+
+    def ordem_salva(self) -> str:
+        """
+        Obtém o filtro da visão ordenada gravado no banco.
+
+        Retorna:
+            - str or None: O filtro, ou None se a lista é exibida na ordem original.
+        """
+        ordem = self.conexao.execute("SELECT valor FROM configuracoes WHERE chave = 'ordem'").fetchone()
+        return ordem[0] if ordem is not None else None
+
+    def carregar_em_lotes(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Abre (ou cria) o banco, migra o arquivo JSON legado se necessário e carrega as tarefas em lotes, na ordem
+        de exibição. Depois do último lote, passa a observar o organizador.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        self.organizador = organizador
+        organizador.tarefas = []
+        self.abrir()
+
+        cursor = self.conexao.execute(f"SELECT {COLUNAS} FROM tarefas ORDER BY posicao")
+
+        while True:
+            linhas = cursor.fetchmany(tamanho_lote)
+
+            if not linhas:
+                break
+
+            organizador.carregar_lote([self.tarefa_linha(linha) for linha in linhas])
+
+            for linha in linhas:
+                self.posicoes[linha[0]] = linha[1]
+
+            self.proxima_posicao = linhas[-1][1] + 1
+            yield len(linhas)
+
+        ordem = self.ordem_salva()
+
+        if ordem is not None:
+            organizador.definir_ordem(ordem)
+
+        organizador.observadores.append(self)
+
+    def migrar_json(self):
+        """
+        Importa para o banco, em uma única transação, as tarefas do arquivo JSON legado (aplicando o diário, se houver).
+        """
+        legado = TarefaOrganizador()
+        persistencia_json = PersistenciaDiario(self.dir_json, assincrono=False)
+        persistencia_json.carregar(legado)
+        persistencia_json.fechar()
+
+        with self.conexao:
+            self.conexao.executemany(
+                f"INSERT INTO tarefas ({COLUNAS}) VALUES ({', '.join('?' * 13)})",
+                (self.linha_tarefa(tarefa, posicao) for posicao, tarefa in enumerate(legado.tarefas_por_id.values()))
+            )
+
+            if legado.ordem is not None:
+                self.conexao.execute("INSERT INTO configuracoes (chave, valor) VALUES ('ordem', ?)", (legado.ordem,))
+
+    def linha_tarefa(self, tarefa: Tarefa, posicao: int) -> tuple:
+        """
+        Converte uma tarefa (com seus decorators) em uma linha da tabela.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser convertida.
+            - posicao (int): A posição da tarefa na ordem original.
+
+        Retorna:
+            - tuple: Os valores das colunas, na ordem de COLUNAS.
+        """
+        tarefa_obj = self.encoder.default(tarefa)
+        tarefa_base = tarefa.base
+        prazo = tarefa_base.get_data_prazo()
+
+        return (
+            tarefa_base.id,
+            posicao,
+            tarefa_base.__class__.__name__,
+            tarefa_obj["titulo"],
+            tarefa_obj["descricao"],
+            tarefa_obj["data_criacao"],
+            tarefa_obj["data_exata"],
+            de_epoca(tarefa_base.criado_em).isoformat(sep=" "),
+            int(tarefa_obj["concluida"]),
+            tarefa_obj["lembrete"] or None,
+            tarefa_obj["prazo"] or None,
+            f'{prazo.isoformat()} 00:00:00' if prazo is not None else None,
+            tarefa_base.chave_titulo
+        )
+
+    def tarefa_linha(self, linha: tuple) -> Tarefa:
+        """
+        Reconstrói uma tarefa a partir de uma linha da tabela.
+
+        Parâmetros:
+            - linha (tuple): Os valores das colunas, na ordem de COLUNAS.
+
+        Retorna:
+            - Tarefa: A tarefa reconstruída, com seus decorators.
+        """
+        tarefa_id, _, tipo, titulo, descricao, data_criacao, data_exata, _, concluida, lembrete, prazo, _, _ = linha
+
+        return self.decoder.decodificar({
+            "prioridade": tipo == "TarefaComPrioridade",
+            "titulo": titulo,
+            "descricao": descricao,
+            "data_criacao": data_criacao,
+            "data_exata": data_exata,
+            "concluida": bool(concluida),
+            "_tarefa": None,
+            "lembrete": lembrete or "",
+            "prazo": prazo or ""
+        }, tarefa_id)
+
+    def consultar_ids(self, ordem: str = None, concluida: bool = None, prazo_inicio: str = None, prazo_fim: str = None, titulo_prefixo: str = None, limite: int = None) -> list:
+        """
+        Consulta os IDs das tarefas diretamente no banco, aplicando filtros, ordenação e limite em SQL, na mesma
+        ordem das visões do organizador. Apenas as alterações já gravadas no banco são consideradas: a consulta não
+        espera pelo gravador, e deve ser usada sem um organizador carregado (como no comando "list" do terminal).
+
+        Parâmetros:
+            - ordem (str or None): Um dos filtros de ordenação ("Título", "Data de criação" ou "Tipo de tarefa"); se None, a ordem original.
+            - concluida (bool or None): Filtra pelas tarefas concluídas (True) ou pendentes (False).
+            - prazo_inicio (str or None): Data ISO ("aaaa-mm-dd") mínima do prazo.
+            - prazo_fim (str or None): Data ISO ("aaaa-mm-dd") máxima do prazo.
+            - titulo_prefixo (str or None): Prefixo do título.
+            - limite (int or None): A quantidade máxima de IDs.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas encontradas.
+        """
+        condicoes = []
+        parametros = []
+
+        if concluida is not None:
+            condicoes.append("concluida = ?")
+            parametros.append(int(concluida))
+
+        if prazo_inicio is not None:
+            condicoes.append("prazo_data >= ?")
+            parametros.append(prazo_inicio)
+
+        if prazo_fim is not None:
+            condicoes.append("prazo_data < date(?, '+1 day')")
+            parametros.append(prazo_fim)
+
+        if titulo_prefixo:
+            condicoes.append("titulo >= ? AND titulo < ?")
+            parametros.extend([titulo_prefixo, titulo_prefixo + "\U0010ffff"])
+
+        sql = "SELECT id FROM tarefas"
+
+        if condicoes:
+            sql += " WHERE " + " AND ".join(condicoes)
+
+        sql += " ORDER BY " + ORDENACOES.get(ordem, "posicao")
+
+        if limite is not None:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+
+        with self.trava_conexao:
+            return [linha[0] for linha in self.conexao.execute(sql, parametros)]
+
+    def ler_tarefas(self, ids: list) -> list:
+        """
+        Lê e reconstrói apenas as tarefas indicadas, como as devolvidas por "consultar_ids".
+
+        Parâmetros:
+            - ids (List[int]): Os IDs das tarefas.
+
+        Retorna:
+            - List[Tarefa]: As tarefas encontradas, na ordem dos IDs.
+        """
+        linhas = {}
+
+        with self.trava_conexao:
+            for inicio in range(0, len(ids), LOTE_CONSULTA):
+                lote = ids[inicio:inicio + LOTE_CONSULTA]
+                cursor = self.conexao.execute(f"SELECT {COLUNAS} FROM tarefas WHERE id IN ({', '.join('?' * len(lote))})", lote)
+                linhas.update((linha[0], linha) for linha in cursor)
+
+        return [self.tarefa_linha(linhas[tarefa_id]) for tarefa_id in ids if tarefa_id in linhas]
+
+    def enfileirar(self, operacao: tuple):
+        """
+        Enfileira uma operação no banco e agenda sua gravação.
+
+        Parâmetros:
+            - operacao (tuple): ("gravar", linha), ("excluir", id) ou ("ordem", filtro).
+        """
+        with self.trava:
+            self.pendentes.append(operacao)
+
+        self.alterado()
+
+    def sincronizar_tarefa(self, tarefa: Tarefa, nova: bool = False):
+        """
+        Enfileira a gravação da linha de uma tarefa, ou a sua exclusão se ela não pertencer mais ao organizador.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser sincronizada.
+            - nova (bool): Se True, a tarefa acabou de entrar no fim da lista e recebe uma nova posição.
+        """
+        tarefa_id = self.organizador.get_id(tarefa)
+
+        if tarefa_id not in self.organizador.tarefas_por_id:
+            # Desfazer a exclusão devolve a tarefa ao fim da lista, com uma nova posição
+            self.posicoes.pop(tarefa_id, None)
+            self.enfileirar(("excluir", tarefa_id))
+            return
+
+        if nova:
+            posicao = self.proxima_posicao
+            self.proxima_posicao += 1
+            self.posicoes[tarefa_id] = posicao
+        else:
+            posicao = self.posicoes[tarefa_id]
+
+        self.enfileirar(("gravar", self.linha_tarefa(tarefa, posicao)))
+
+    def sincronizar_ordem(self):
+        """
+        Enfileira a gravação do filtro da visão exibida, após uma ordenação ou o seu desfazer.
+        """
+        self.enfileirar(("ordem", self.organizador.ordem))
+
+    def comando_executado(self, comando: TarefaCommand):
+        """
+        Enfileira as alterações de linha causadas por um comando executado.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        if isinstance(comando, LoteCommand):
+            # As alterações do lote inteiro são gravadas pelo gravador em uma única transação do banco
+            for subcomando in comando.comandos:
+                self.comando_executado(subcomando)
+        elif isinstance(comando, OrdenarListaTarefasCommand):
+            self.sincronizar_ordem()
+        else:
+            self.sincronizar_tarefa(comando.tarefa, nova=isinstance(comando, CriarTarefaCommand))
+
+    def comando_desfeito(self, comando: TarefaCommand):
+        """
+        Enfileira as alterações de linha causadas por um comando desfeito.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in reversed(comando.comandos):
+                self.comando_desfeito(subcomando)
+        elif isinstance(comando, OrdenarListaTarefasCommand):
+            self.sincronizar_ordem()
+        else:
+            # Desfazer uma exclusão devolve a tarefa ao fim da lista, como no organizador
+            self.sincronizar_tarefa(comando.tarefa, nova=isinstance(comando, ExcluirTarefaCommand))
+
+    def gravar_pendencias(self):
+        """
+        Aplica as operações pendentes ao banco em uma única transação. Executado na thread do gravador. Se a
+        transação falhar, ela é desfeita pelo banco e as operações voltam para o início das pendências.
+        """
+        with self.trava:
+            pendentes, self.pendentes = self.pendentes, []
+
+        if not pendentes:
+            return
+
+        try:
+            self.aplicar_pendencias(pendentes)
+        except Exception:
+            with self.trava:
+                self.pendentes[:0] = pendentes
+
+            raise
+
+    def aplicar_pendencias(self, pendentes: list):
+        """
+        Aplica uma lista de operações ao banco em uma única transação.
+
+        Parâmetros:
+            - pendentes (List[Tuple[str, Any]]): As operações ("gravar", "excluir" ou "ordem") e os seus dados.
+        """
+        with self.trava_conexao:
+            with self.conexao:
+                for operacao, dados in pendentes:
+                    if operacao == "gravar":
+                        self.conexao.execute(f"INSERT OR REPLACE INTO tarefas ({COLUNAS}) VALUES ({', '.join('?' * 13)})", dados)
+
+                    elif operacao == "excluir":
+                        self.conexao.execute("DELETE FROM tarefas WHERE id = ?", (dados,))
+
+                    elif operacao == "ordem" and dados is None:
+                        self.conexao.execute("DELETE FROM configuracoes WHERE chave = 'ordem'")
+
+                    elif operacao == "ordem":
+                        self.conexao.execute("INSERT OR REPLACE INTO configuracoes (chave, valor) VALUES ('ordem', ?)", (dados,))
+
+    def fechar(self):
+        """
+        Descarrega as gravações pendentes, encerra a thread de gravação e fecha a conexão com o banco.
+        """
+        super().fechar()
+
+        if self.conexao is not None:
+            self.conexao.close()
+            self.conexao = None
@@ -0,0 +1,784 @@
+"""
+Módulo contendo as estratégias de persistência da lista de tarefas.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo que permite trabalhar com dados JSON (JavaScript Object Notation).
+    - threading: Módulo que fornece primitivas de sincronização entre threads.
+    - ABC, abstractmethod: Classes e decoradores para a definição de classes abstratas.
+
+Classes:
+    - Persistencia: Classe abstrata que define a interface comum dos mecanismos de armazenamento das tarefas.
+    - PersistenciaJson: Persistência que reescreve o arquivo JSON completo a cada operação realizada no organizador.
+    - PersistenciaDiario: Persistência que anexa cada operação a um diário (journal) e só reescreve o arquivo JSON
+      completo (snapshot) quando o diário ultrapassa um tamanho limite.
+
+Detalhes:
+    - As persistências são observadores do TarefaOrganizador: após "carregar(organizador)" elas passam a receber
+      "comando_executado(comando)" e "comando_desfeito(comando)" a cada operação.
+    - O diário é um arquivo de texto ao lado do snapshot (ex.: "lista_tarefas.json.diario") com um registro JSON
+      compacto por linha. A primeira linha identifica o snapshot (tamanho e data de modificação) ao qual o diário se
+      aplica; um diário cujo cabeçalho não corresponde ao snapshot atual é descartado, o que torna a compactação
+      segura mesmo se o programa for interrompido entre a escrita do snapshot e a do novo diário.
+    - O snapshot JSON usa as posições das tarefas ("0" a "n-1") como chaves, como o arquivo original, e as tarefas lidas
+      dele recebem as posições como IDs. Os registros do diário, porém, usam os IDs da sessão que os gravou; por isso,
+      quando os IDs do snapshot compactado não são contínuos (ex.: depois de exclusões), o cabeçalho do novo diário
+      guarda também os IDs das tarefas do snapshot, na ordem do arquivo, reatribuídos a elas ao carregar.
+    - Uma transação do organizador (LoteCommand) é gravada como um único registro "lote" com os registros dos seus
+      comandos, reaplicados dentro de uma transação ao carregar.
+    - Por padrão a gravação é feita por um GravadorSegundoPlano: os observadores apenas registram a alteração e a
+      thread de gravação agrupa as alterações próximas em uma única escrita atômica (arquivo temporário, fsync e
+      rename), de modo que a thread da interface nunca espera pelo disco. "fechar()" descarrega o que estiver pendente.
+    - Uma gravação que falha (ex.: disco cheio) não descarta nada: o que não foi gravado volta para as pendências e
+      o gravador tenta novamente. O erro fica em "erro_gravacao", é entregue a "ao_falhar" (ex.: para a interface
+      avisar o usuário), contado em "notestation_falhas_gravacao_total" e lançado por "fechar()". No modo síncrono,
+      o erro é lançado pela própria operação.
+    - Com as métricas ativadas (tarefa_classes.metricas), cada carregamento e cada gravação são medidos nos
+      histogramas "notestation_carregamento_segundos" e "notestation_gravacao_segundos".
+"""
+
+import sys
+import os
+import json
+import threading
+from abc import ABC, abstractmethod
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa, RetratoOrganizador, formatar_prazo
+from tarefa_classes.metricas import METRICAS
+from gerenciamento_arquivos.json_tarefa_encoder import TarefaEncoder, codificar_tarefas, escrever_tarefas
+from gerenciamento_arquivos.json_tarefa_decoder import TarefaDecoder
+from gerenciamento_arquivos.gravador_tarefas import GravadorSegundoPlano, gravar_atomico
+
+
+TAMANHO_LOTE = 1000
+
+
+class Persistencia(ABC):
+    """
+    Classe abstrata que representa um mecanismo de armazenamento das tarefas de um TarefaOrganizador.
+
+    Atributos:
+        - organizador (TarefaOrganizador or None): O organizador observado, definido ao carregar.
+        - gravador (GravadorSegundoPlano or None): Thread de gravação, ou None no modo síncrono.
+        - erro_gravacao (Exception or None): O erro da última gravação, ou None se ela foi bem-sucedida.
+        - ao_falhar (Callable[[Exception], Any] or None): Chamada a cada gravação que falha (na thread do gravador).
+
+    Métodos:
+        - carregar(organizador)
+        - carregar_em_lotes(organizador, tamanho_lote)
+        - carregar_medido(organizador, tamanho_lote)
+        - alterado()
+        - gravar()
+        - falha_gravacao(erro)
+        - gravar_pendencias()
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+        - fechar()
+    """
+    def __init__(self, assincrono: bool = True):
+        """
+        Construtor da classe Persistencia.
+
+        Parâmetros:
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano; caso contrário,
+              cada alteração é gravada imediatamente na thread que a realizou.
+        """
+        self.organizador = None
+        self.erro_gravacao = None
+        self.ao_falhar = None
+        self.gravador = GravadorSegundoPlano(self.gravar, ao_falhar=self.falha_gravacao) if assincrono else None
+
+    def carregar(self, organizador: TarefaOrganizador):
+        """
+        Carrega todas as tarefas no organizador e passa a observá-lo.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+        """
+        for _ in self.carregar_medido(organizador):
+            pass
+
+    @abstractmethod
+    def carregar_em_lotes(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Método abstrato que carrega as tarefas de forma incremental, entregando um lote ao organizador a cada passo
+        da iteração, e passa a observar o organizador depois do último lote.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        pass
+
+    def carregar_medido(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Carrega as tarefas em lotes como "carregar_em_lotes", registrando nas métricas (quando ativadas) o tempo
+        total do carregamento e a quantidade de tarefas carregadas.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        return METRICAS.medir_iteracao(self.carregar_em_lotes(organizador, tamanho_lote), "notestation_carregamento_segundos", "notestation_tarefas_carregadas_total", persistencia=type(self).__name__)
+
+    def alterado(self):
+        """
+        Sinaliza que há alterações a persistir: agenda a gravação no gravador ou grava imediatamente no modo síncrono.
+        """
+        if self.gravador is not None:
+            self.gravador.marcar_sujo()
+        else:
+            self.gravar()
+
+    def gravar(self):
+        """
+        Grava as alterações pendentes, registrando a latência da gravação nas métricas quando elas estão ativadas.
+        """
+        try:
+            if METRICAS.ativo:
+                METRICAS.cronometrar(self.gravar_pendencias, "notestation_gravacao_segundos", persistencia=type(self).__name__)
+            else:
+                self.gravar_pendencias()
+        except Exception as erro:
+            # No modo assíncrono, o gravador entrega o erro a "falha_gravacao"
+            if self.gravador is None:
+                self.falha_gravacao(erro)
+
+            raise
+
+        self.erro_gravacao = None
+
+    def falha_gravacao(self, erro: Exception):
+        """
+        Registra uma gravação que falhou e avisa "ao_falhar". As alterações continuam pendentes.
+
+        Parâmetros:
+            - erro (Exception): O erro da gravação.
+        """
+        self.erro_gravacao = erro
+        METRICAS.contar("notestation_falhas_gravacao_total", persistencia=type(self).__name__)
+
+        if self.ao_falhar is not None:
+            self.ao_falhar(erro)
+
+    @abstractmethod
+    def gravar_pendencias(self):
+        """
+        Método abstrato que grava as alterações pendentes. Executado na thread do gravador (ou diretamente no modo síncrono).
+        """
+        pass
+
+    @abstractmethod
+    def comando_executado(self, comando: TarefaCommand):
+        """
+        Método abstrato chamado pelo organizador após a execução de um comando.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        pass
+
+    @abstractmethod
+    def comando_desfeito(self, comando: TarefaCommand):
+        """
+        Método abstrato chamado pelo organizador após um comando ser desfeito.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        pass
+
+    def fechar(self):
+        """
+        Descarrega as gravações pendentes e encerra a thread de gravação. Deve ser chamado ao sair do programa.
+        """
+        if self.gravador is not None:
+            self.gravador.fechar()
+
+
+class PersistenciaJson(Persistencia):
+    """
+    Persistência que mantém a lista de tarefas em um único arquivo JSON, reescrito por completo após as operações.
+
+    Atributos:
+        - dir (str): Caminho do arquivo JSON de tarefas.
+        - decoder (TarefaDecoder): Decodificador usado para reconstruir as tarefas.
+        - processos (int or None): Quantidade de processos usados para codificar listas muito grandes.
+
+    Métodos:
+        - carregar_em_lotes(organizador, tamanho_lote)
+        - capturar_estado()
+        - salvar(estado)
+        - gravar_pendencias()
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+    """
+    def __init__(self, dir: str, assincrono: bool = True, processos: int = None):
+        """
+        Construtor da classe PersistenciaJson.
+
+        Parâmetros:
+            - dir (str): Caminho do arquivo JSON de tarefas.
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano.
+            - processos (int or None): Quantidade de processos usados para codificar listas muito grandes (None: sequencial).
+        """
+        self.dir = dir
+        self.decoder = TarefaDecoder()
+        self.processos = processos
+        super().__init__(assincrono)
+
+    def carregar_em_lotes(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Carrega as tarefas de forma incremental: a cada passo da iteração um lote é lido do arquivo e entregue ao
+        organizador. A persistência só passa a observar o organizador depois do último lote.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        yield from self.carregar_snapshot(organizador, tamanho_lote)
+        organizador.observadores.append(self)
+
+    def carregar_snapshot(self, organizador: TarefaOrganizador, tamanho_lote: int, ids: list = None):
+        """
+        Lê o arquivo JSON em lotes e os entrega ao organizador. Cria o arquivo caso ele não exista.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas lidas por passo.
+            - ids (List[int] or None): Os IDs das tarefas, na ordem do arquivo; se None, as posições são usadas como IDs.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        self.organizador = organizador
+        organizador.tarefas = []
+
+        if os.path.exists(self.dir):
+            ids = iter(ids) if ids is not None else None
+
+            for lote in self.decoder.iterar_lotes(self.dir, tamanho_lote):
+                if ids is not None:
+                    for tarefa in lote:
+                        tarefa.base.id = next(ids)
+
+                organizador.carregar_lote(lote)
+                yield len(lote)
+        else:
+            with open(self.dir, "w", encoding='UTF-8') as arquivo:
+                arquivo.write("")
+
+    def capturar_estado(self) -> list:
+        """
+        Captura o estado atual do organizador para a gravação do arquivo. A captura apenas obtém o retrato imutável
+        do organizador, sem percorrer ou codificar as tarefas, e pode ser feita na thread que realizou a operação.
+
+        Retorna:
+            - RetratoOrganizador: O retrato da versão atual.
+        """
+        return self.organizador.retrato()
+
+    def salvar(self, estado: RetratoOrganizador = None):
+        """
+        Reescreve, de forma atômica e em uma única passada, o arquivo JSON com todas as tarefas. A codificação é
+        feita aqui, na thread do gravador (ou diretamente no modo síncrono), a partir dos registros imutáveis do
+        estado, que não são afetados pelas operações feitas enquanto o arquivo é gravado.
+
+        Parâmetros:
+            - estado (RetratoOrganizador or None): O estado já capturado a ser gravado; se None, o estado atual do organizador é capturado.
+        """
+        if estado is None:
+            estado = self.capturar_estado()
+
+        partes = codificar_tarefas(estado.itens(), self.processos)
+        gravar_atomico(self.dir, lambda arquivo: escrever_tarefas(arquivo, partes))
+
+    def gravar_pendencias(self):
+        """
+        Grava as alterações pendentes. Executado na thread do gravador (ou diretamente no modo síncrono).
+        """
+        self.salvar()
+
+    def comando_executado(self, comando: TarefaCommand):
+        """
+        Agenda a persistência do estado do organizador após a execução de um comando.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        self.alterado()
+
+    def comando_desfeito(self, comando: TarefaCommand):
+        """
+        Agenda a persistência do estado do organizador após um comando ser desfeito.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        self.alterado()
+
+
+class PersistenciaDiario(PersistenciaJson):
+    """
+    Persistência em modo diário: cada comando executado ou desfeito é anexado como um registro ao diário, e o
+    snapshot JSON só é reescrito (compactação) quando o diário passa do tamanho limite e do tamanho do próprio
+    snapshot. Como o limite cresce junto com a lista, inserções em massa (ex.: uma importação) reescrevem o snapshot
+    um número logarítmico de vezes, e não a cada poucos lotes.
+
+    Atributos:
+        - dir_diario (str): Caminho do arquivo de diário.
+        - limite_compactacao (int): Tamanho mínimo do diário, em bytes, a partir do qual a compactação é feita.
+        - tamanho_diario (int): Tamanho do diário, em bytes, contando os registros ainda não gravados.
+        - tamanho_snapshot (int): Tamanho do snapshot, em bytes, na última leitura ou compactação.
+        - pendentes (list): Linhas do diário e pedidos de compactação (estados capturados) ainda não gravados, em ordem.
+        - trava (threading.Lock): Protege a lista de pendentes entre a thread da interface e a do gravador.
+    """
+    LIMITE_COMPACTACAO = 4 * 1024 * 1024
+
+    def __init__(self, dir: str, limite_compactacao: int = LIMITE_COMPACTACAO, assincrono: bool = True, processos: int = None):
+        """
+        Construtor da classe PersistenciaDiario.
+
+        Parâmetros:
+            - dir (str): Caminho do arquivo JSON de tarefas (snapshot).
+            - limite_compactacao (int): Tamanho mínimo do diário, em bytes, a partir do qual a compactação é feita.
+            - assincrono (bool): Se True, as gravações são feitas por uma thread em segundo plano.
+            - processos (int or None): Quantidade de processos usados para codificar listas muito grandes (None: sequencial).
+        """
+        self.dir_diario = dir + ".diario"
+        self.limite_compactacao = limite_compactacao
+        self.tamanho_diario = 0
+        self.tamanho_snapshot = 0
+        self.pendentes = []
+        self.trava = threading.Lock()
+        super().__init__(dir, assincrono, processos)
+
+    def carregar_em_lotes(self, organizador: TarefaOrganizador, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Carrega o snapshot em lotes, reaplica o diário sobre ele e passa a observar o organizador.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador que receberá as tarefas.
+            - tamanho_lote (int): A quantidade máxima de tarefas do snapshot lidas por passo.
+
+        Retorna:
+            - Iterator[int]: A quantidade de tarefas carregadas em cada passo.
+        """
+        cabecalho = self.ler_cabecalho()
+        yield from self.carregar_snapshot(organizador, tamanho_lote, cabecalho.get("ids") if cabecalho is not None else None)
+
+        registros = self.ler_diario()
+
+        if registros is None:
+            self.iniciar_diario()
+        else:
+            for registro in registros:
+                self.aplicar_registro(registro)
+
+            # O histórico de desfazer começa vazio a cada sessão, assim como no modo JSON
+            organizador.limpar_historico()
+
+        self.tamanho_diario = os.path.getsize(self.dir_diario)
+        self.tamanho_snapshot = os.path.getsize(self.dir)
+        organizador.observadores.append(self)
+
+        if self.precisa_compactar():
+            self.solicitar_compactacao()
+            self.alterado()
+
+    def cabecalho(self, ids: list = None) -> dict:
+        """
+        Gera o registro de cabeçalho que identifica o snapshot atual.
+
+        Parâmetros:
+            - ids (List[int] or None): Os IDs das tarefas do snapshot, quando diferentes das suas posições.
+
+        Retorna:
+            - dict: O tamanho e a data de modificação (em nanossegundos) do snapshot e, se informados, os IDs.
+        """
+        info = os.stat(self.dir)
+        cabecalho = {"op": "snapshot", "tamanho": info.st_size, "mtime": info.st_mtime_ns}
+
+        if ids is not None:
+            cabecalho["ids"] = ids
+
+        return cabecalho
+
+    def ids_snapshot(self, estado: RetratoOrganizador) -> list:
+        """
+        Obtém os IDs que devem ser guardados no cabeçalho do diário para o snapshot gravado a partir de um estado.
+
+        Parâmetros:
+            - estado (RetratoOrganizador): O estado gravado no snapshot.
+
+        Retorna:
+            - List[int] or None: Os IDs, na ordem do snapshot, ou None se forem iguais às posições ("0" a "n-1").
+        """
+        ids = list(estado.ids)
+        return None if ids == list(range(len(ids))) else ids
+
+    def ler_cabecalho(self):
+        """
+        Lê o cabeçalho do diário, desde que ele corresponda ao snapshot atual.
+
+        Retorna:
+            - dict or None: O cabeçalho ou None se o diário não existir ou estiver obsoleto.
+        """
+        if not os.path.exists(self.dir_diario) or not os.path.exists(self.dir):
+            return None
+
+        with open(self.dir_diario, "r", encoding='UTF-8') as arquivo:
+            linha = arquivo.readline()
+
+        if not linha.endswith("\n"):
+            return None
+
+        cabecalho = json.loads(linha)
+        atual = self.cabecalho()
+
+        if any(cabecalho.get(chave) != valor for chave, valor in atual.items()):
+            return None
+
+        return cabecalho
+
+    def ler_diario(self):
+        """
+        Lê os registros do diário, desde que ele corresponda ao snapshot atual.
+
+        Retorna:
+            - List[dict] or None: Os registros do diário ou None se o diário não existir ou estiver obsoleto.
+        """
+        if self.ler_cabecalho() is None:
+            return None
+
+        registros = []
+        tamanho_valido = 0
+
+        with open(self.dir_diario, "r", encoding='UTF-8') as arquivo:
+            linhas = iter(arquivo)
+            tamanho_valido = len(next(linhas).encode('UTF-8'))
+
+            for linha in linhas:
+                # Uma última linha incompleta indica que a gravação foi interrompida; ela é descartada
+                if not linha.endswith("\n"):
+                    break
+
+                registros.append(json.loads(linha))
+                tamanho_valido += len(linha.encode('UTF-8'))
+
+        if os.path.getsize(self.dir_diario) != tamanho_valido:
+            os.truncate(self.dir_diario, tamanho_valido)
+
+        return registros
+
+    def iniciar_diario(self, ids: list = None):
+        """
+        Cria um diário vazio (apenas com o cabeçalho) para o snapshot atual.
+
+        Parâmetros:
+            - ids (List[int] or None): Os IDs das tarefas do snapshot, quando diferentes das suas posições.
+        """
+        linha = json.dumps(self.cabecalho(ids), separators=(',', ':')) + "\n"
+        gravar_atomico(self.dir_diario, lambda arquivo: arquivo.write(linha))
+
+    def compactar(self, estado: RetratoOrganizador = None):
+        """
+        Grava um novo snapshot e reinicia o diário.
+
+        Parâmetros:
+            - estado (RetratoOrganizador or None): O estado capturado no momento da compactação; se None, o estado atual do organizador é capturado.
+        """
+        if estado is None:
+            estado = self.capturar_estado()
+
+        self.salvar(estado)
+        self.tamanho_snapshot = os.path.getsize(self.dir)
+        self.iniciar_diario(self.ids_snapshot(estado))
+
+    def precisa_compactar(self) -> bool:
+        """
+        Verifica se o diário passou do tamanho limite e do tamanho do snapshot.
+
+        Retorna:
+            - bool: True se a compactação deve ser feita.
+        """
+        return self.tamanho_diario > max(self.limite_compactacao, self.tamanho_snapshot)
+
+    def solicitar_compactacao(self):
+        """
+        Captura o estado atual do organizador e enfileira a compactação após os registros já pendentes.
+
+        A captura (um retrato imutável, sem codificação) é feita na thread que realizou a operação, para que o
+        snapshot corresponda exatamente aos registros anteriores a ele; a codificação e a escrita em disco ficam a
+        cargo do gravador.
+        """
+        estado = self.capturar_estado()
+        linhas = []
+
+        # O snapshot é gravado na ordem de exibição; a visão ordenada ativa é reaplicada pelo primeiro registro do novo diário
+        if self.organizador.ordem is not None:
+            linhas.append(json.dumps({"op": "ordenar", "filtro": self.organizador.ordem}, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+        with self.trava:
+            self.pendentes.append(estado)
+            self.pendentes.extend(linhas)
+
+        self.tamanho_diario = sum(len(linha.encode('UTF-8')) for linha in linhas)
+
+    def registro_comando(self, comando: TarefaCommand) -> dict:
+        """
+        Converte um comando executado em um registro do diário.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+
+        Retorna:
+            - dict: O registro correspondente ao comando.
+        """
+        if isinstance(comando, CriarTarefaCommand):
+            return {
+                "op": "criar",
+                "id": self.organizador.get_id(comando.tarefa),
+                "tarefa": TarefaEncoder().default(comando.tarefa)
+            }
+
+        if isinstance(comando, ExcluirTarefaCommand):
+            return {"op": "excluir", "id": self.organizador.get_id(comando.tarefa)}
+
+        if isinstance(comando, EditarTarefaCommand):
+            return {
+                "op": "editar",
+                "id": self.organizador.get_id(comando.tarefa),
+                "titulo": comando.nTitulo,
+                "descricao": comando.nDescricao,
+                "lembrete": comando.nLembrete,
+                "prazo": formatar_prazo(comando.nPrazo) or None
+            }
+
+        if isinstance(comando, MarcarConcluidaCommand):
+            return {"op": "concluir", "id": self.organizador.get_id(comando.tarefa)}
+
+        if isinstance(comando, OrdenarListaTarefasCommand):
+            return {"op": "ordenar", "filtro": comando.filtro}
+
+        # Um lote ocupa uma única linha, de modo que uma gravação interrompida nunca reaplica apenas parte dele
+        if isinstance(comando, LoteCommand):
+            return {"op": "lote", "registros": [self.registro_comando(subcomando) for subcomando in comando.comandos]}
+
+        raise ValueError(f'Comando não suportado pelo diário: {comando.__class__.__name__}')
+
+    def registro_desfazer(self, comando: TarefaCommand) -> dict:
+        """
+        Converte um comando desfeito em um registro do diário que descreve o estado resultante.
+
+        O registro não depende do histórico de comandos, de modo que um comando anterior à última compactação
+        também pode ser desfeito e reaplicado corretamente.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+
+        Retorna:
+            - dict: O registro correspondente ao comando desfeito.
+        """
+        if isinstance(comando, CriarTarefaCommand):
+            return {"op": "excluir", "id": self.organizador.get_id(comando.tarefa)}
+
+        if isinstance(comando, ExcluirTarefaCommand):
+            return self.registro_comando(CriarTarefaCommand(comando.tarefa, self.organizador))
+
+        if isinstance(comando, EditarTarefaCommand):
+            return {
+                "op": "definir",
+                "id": self.organizador.get_id(comando.tarefa),
+                "tarefa": TarefaEncoder().default(comando.tarefa)
+            }
+
+        if isinstance(comando, MarcarConcluidaCommand):
+            return {"op": "reabrir", "id": self.organizador.get_id(comando.tarefa)}
+
+        if isinstance(comando, OrdenarListaTarefasCommand):
+            if comando.ordemAnterior is not None:
+                return {"op": "ordenar", "filtro": comando.ordemAnterior}
+
+            # A ordem original pode ser diferente da ordem do snapshot, que é gravado na ordem de exibição
+            return {"op": "reordenar", "ids": list(self.organizador.tarefas_por_id)}
+
+        if isinstance(comando, LoteCommand):
+            return {"op": "lote", "registros": [self.registro_desfazer(subcomando) for subcomando in reversed(comando.comandos)]}
+
+        raise ValueError(f'Comando não suportado pelo diário: {comando.__class__.__name__}')
+
+    def aplicar_registro(self, registro: dict):
+        """
+        Reaplica um registro do diário no organizador, através dos mesmos métodos usados pela interface.
+
+        Parâmetros:
+            - registro (dict): O registro a ser aplicado.
+        """
+        op = registro["op"]
+
+        if op == "lote":
+            with self.organizador.transacao():
+                for subregistro in registro["registros"]:
+                    self.aplicar_registro(subregistro)
+            return
+
+        if op == "ordenar":
+            self.organizador.sort_tarefas(registro["filtro"])
+            return
+
+        if op == "reordenar":
+            self.organizador.reordenar_tarefas([self.organizador.get_tarefa_por_id(tarefa_id) for tarefa_id in registro["ids"]])
+            return
+
+        if op == "criar":
+            self.organizador.add_tarefa(self.decoder.decodificar(registro["tarefa"], registro["id"]))
+            return
+
+        tarefa = self.organizador.get_tarefa_por_id(registro["id"])
+
+        if op == "excluir":
+            self.organizador.del_tarefa(tarefa)
+
+        elif op == "editar":
+            self.organizador.edit_tarefa(tarefa, registro["titulo"], registro["descricao"], registro["lembrete"], registro["prazo"])
+
+        elif op == "concluir":
+            self.organizador.mark_tarefa(tarefa)
+
+        elif op == "reabrir":
+            with self.organizador.trava:
+                tarefa.base.concluida = False
+                self.organizador.registrar_alteracao([tarefa])
+
+        elif op == "definir":
+            with self.organizador.trava:
+                self.definir_tarefa(tarefa, registro["tarefa"])
+                self.organizador.registrar_alteracao([tarefa])
+
+    def definir_tarefa(self, tarefa: Tarefa, tarefa_obj: dict):
+        """
+        Restaura título, descrição, lembrete e prazo de uma tarefa a partir de um dicionário do TarefaEncoder.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser restaurada.
+            - tarefa_obj (dict): O estado da tarefa no formato produzido pelo TarefaEncoder.
+        """
+        tarefa_base = tarefa.base
+        self.organizador.renomear_tarefa(tarefa_base, tarefa_obj["titulo"])
+        tarefa_base.descricao = tarefa_obj["descricao"]
+
+        lembrete = tarefa_base.get_recurso(TarefaComLembrete.RECURSO)
+        prazo = tarefa_base.get_recurso(TarefaComPrazo.RECURSO)
+
+        if lembrete is not None:
+            lembrete.alterar_lembrete(tarefa_obj["lembrete"])
+
+        if prazo is not None:
+            prazo.atualizar_prazo(tarefa_obj["prazo"])
+
+    def anexar(self, registro: dict):
+        """
+        Enfileira um registro para o diário e solicita a compactação se o tamanho limite for ultrapassado.
+
+        Parâmetros:
+            - registro (dict): O registro a ser anexado.
+        """
+        linha = json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+        with self.trava:
+            self.pendentes.append(linha)
+
+        self.tamanho_diario += len(linha.encode('UTF-8'))
+
+        if self.precisa_compactar():
+            self.solicitar_compactacao()
+
+        self.alterado()
+
+    def gravar_pendencias(self):
+        """
+        Grava, na ordem em que foram produzidos, os registros e as compactações pendentes. As linhas consecutivas são
+        anexadas ao diário com uma única escrita seguida de fsync. Se uma escrita falhar, os itens ainda não gravados
+        voltam para o início das pendências, antes dos que chegaram durante a gravação.
+        """
+        with self.trava:
+            pendentes, self.pendentes = self.pendentes, []
+
+        # Posição do primeiro item ainda não gravado
+        inicio = 0
+
+        try:
+            for posicao, item in enumerate(pendentes):
+                if isinstance(item, str):
+                    continue
+
+                self.escrever_diario(pendentes[inicio:posicao])
+                inicio = posicao
+                self.compactar(item)
+                inicio = posicao + 1
+
+            self.escrever_diario(pendentes[inicio:])
+            inicio = len(pendentes)
+        finally:
+            if inicio < len(pendentes):
+                with self.trava:
+                    self.pendentes[:0] = pendentes[inicio:]
+
+    def escrever_diario(self, linhas: list):
+        """
+        Anexa um grupo de linhas ao diário e sincroniza o arquivo com o disco. Se a escrita falhar, o diário volta ao
+        tamanho anterior, para que a nova tentativa não duplique as linhas já escritas.
+
+        Parâmetros:
+            - linhas (List[str]): As linhas a serem anexadas.
+        """
+        if not linhas:
+            return
+
+        tamanho = os.path.getsize(self.dir_diario)
+
+        try:
+            with open(self.dir_diario, "a", encoding='UTF-8') as arquivo:
+                arquivo.write("".join(linhas))
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+        except OSError:
+            try:
+                os.truncate(self.dir_diario, tamanho)
+            except OSError:
+                pass
+
+            raise
+
+    def comando_executado(self, comando: TarefaCommand):
+        """
+        Anexa ao diário o registro do comando executado.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        self.anexar(self.registro_comando(comando))
+
+    def comando_desfeito(self, comando: TarefaCommand):
+        """
+        Anexa ao diário o registro do estado resultante do comando desfeito.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        self.anexar(self.registro_desfazer(comando))
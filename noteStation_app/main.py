@@ -2,7 +2,8 @@
 Módulo de Inicialização da Aplicação NoteStation
 ===============================================
 
-Este módulo inicia a aplicação NoteStation.
+Este módulo inicia a aplicação NoteStation (interface gráfica). Para usar as tarefas pelo terminal, sem importar
+a interface gráfica, use o módulo "notestation.py".
 
 Módulos importados:
     - os: Módulo que fornece funções para interagir com o sistema operacional,
@@ -23,9 +24,10 @@ Variáveis:
 
 Detalhes das constantes e variáveis:
     - PATH_FILE: Caminho completo para o diretório onde será armazenado o arquivo de lista de tarefas JSON.
-      - O caminho é construído usando o módulo os e o método os.path.expanduser para expandir o caminho
-        inicial usando o diretório do usuário atual.
-      - Se o diretório não existir, é criado usando o método os.mkdir.
+      - O caminho é construído com os.path.join a partir do diretório do usuário atual (os.path.expanduser),
+        de modo que o separador correto é usado em qualquer sistema operacional.
+      - Se o diretório não existir, é criado usando o método os.makedirs (o diretório "Documents" também é
+        criado, se necessário).
       - A variável dir recebe o caminho completo para o arquivo de lista de tarefas JSON usando a
         variável PATH_FILE como base.
 
@@ -35,19 +37,21 @@ Detalhes das constantes e variáveis:
         de tarefas JSON como argumento.
       - A função exibir() da instância main_app é chamada para iniciar a aplicação e exibir a tela inicial
         do NoteStation.
+      - A aplicação só é iniciada quando o módulo é executado como programa principal: os processos filhos do
+        multiprocessing (criados por "forkserver" ou "spawn") importam este módulo novamente.
 """
 
 import os
 
 from notestation_interfaces import *
 
-PATH_FILE = os.path.expanduser('~\\Documents\\noteStation')
+PATH_FILE = os.path.join(os.path.expanduser('~'), 'Documents', 'noteStation')
 
-if not os.path.exists(PATH_FILE):
-    os.mkdir(PATH_FILE)
+os.makedirs(PATH_FILE, exist_ok=True)
 
-dir = os.path.expanduser(PATH_FILE + '\\lista_tarefas.json')
+dir = os.path.join(PATH_FILE, 'lista_tarefas.json')
 
-main_app = TelaInicial(dir)
+if __name__ == "__main__":
+    main_app = TelaInicial(dir)
 
-main_app.exibir()
\ No newline at end of file
+    main_app.exibir()
\ No newline at end of file
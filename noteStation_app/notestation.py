@@ -0,0 +1,20 @@
+"""
+Módulo de Execução da Linha de Comando do NoteStation
+=====================================================
+
+Este módulo executa os comandos do noteStation pelo terminal, sem carregar a interface gráfica
+(ex.: "python notestation.py add \"Enviar relatório\" --prazo 20/10/2026", "python notestation.py list --pendentes"
+ou "python notestation.py gui" para abrir a interface).
+
+Módulos importados:
+    - sys: Módulo do sistema Python, usado para o código de saída.
+
+    - notestation_cli: Módulo contendo a função main da linha de comando.
+"""
+
+import sys
+
+from notestation_cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+Módulo contendo os benchmarks do núcleo do aplicativo "NoteStation", executados sem interface gráfica.
+
+Funções:
+    - gerar_tarefas, gerar_organizador: Geram tarefas sintéticas reprodutíveis.
+    - executar_benchmarks: Executa os benchmarks para cada tamanho de lista e devolve os resultados em um dicionário JSON.
+    - comparar: Compara dois resultados e aponta as regressões.
+    - medir_partida, verificar_partida: Medem a partida da linha de comando e verificam o seu orçamento.
+
+Módulos importados:
+    - gerar_tarefas, gerar_organizador: Importados do módulo "notestation_benchmark.gerador_tarefas".
+    - executar_benchmarks, comparar: Importados do módulo "notestation_benchmark.benchmark_nucleo".
+    - medir_partida, verificar_partida: Importados do módulo "notestation_benchmark.partida".
+"""
+
+from notestation_benchmark.gerador_tarefas import (
+    gerar_tarefas,
+    gerar_organizador
+)
+
+from notestation_benchmark.benchmark_nucleo import (
+    executar_benchmarks,
+    comparar
+)
+
+from notestation_benchmark.partida import (
+    medir_partida,
+    verificar_partida
+)
@@ -0,0 +1,345 @@
+"""
+Módulo contendo os benchmarks do núcleo do noteStation (organizador, comandos e persistência JSON).
+
+Funções:
+    - medir(funcao, repeticoes, preparar, operacoes): Mede o tempo de uma operação várias vezes.
+    - desfazer_tudo(organizador): Cria uma função que desfaz todo o histórico do organizador.
+    - executar_benchmarks(tamanhos, repeticoes, operacoes, semente, diretorio, progresso, partida): Executa todos os
+      benchmarks para cada tamanho de lista e, opcionalmente, o benchmark de partida da linha de comando.
+    - benchmarks_tamanho(quantidade, repeticoes, operacoes, semente, diretorio): Executa os benchmarks para um tamanho de lista.
+    - identificar_commit(): Obtém o commit do repositório em que os benchmarks foram executados.
+    - comparar(anterior, atual, tolerancia): Compara dois resultados e aponta as medidas que ficaram mais lentas.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - gc: Módulo do coletor de lixo, usado para coletar os objetos das medições anteriores antes de cada medição.
+    - time: Módulo que fornece funções de medição de tempo (perf_counter).
+    - random: Módulo de números pseudoaleatórios, usado para escolher as tarefas consultadas e editadas.
+    - platform: Módulo que identifica a plataforma e a versão do Python, registradas nos resultados.
+    - statistics: Módulo usado para calcular a mediana e a média das amostras.
+    - subprocess: Módulo usado para obter o commit atual com o git.
+    - tempfile: Módulo usado para criar o diretório temporário dos arquivos gravados e lidos nos benchmarks.
+    - datetime: Classe do módulo datetime usada para registrar a data da execução.
+
+    - tarefa_classes: Módulo contendo o organizador e as chaves de ordenação.
+    - gerenciamento_arquivos: Módulo contendo a PersistenciaJson, a PersistenciaBinaria, a PersistenciaFragmentada e a
+      importação e exportação em massa.
+    - notestation_benchmark.gerador_tarefas: Módulo contendo o gerador de tarefas sintéticas.
+    - notestation_benchmark.partida: Módulo contendo o benchmark de partida da linha de comando.
+
+Medidas (para cada tamanho de lista):
+    - carregar_json: Leitura do arquivo JSON completo para um organizador vazio, como em TelaInicial.carregar_arquivo.
+    - salvar_json: Gravação atômica do arquivo JSON completo (PersistenciaJson.salvar).
+    - carregar_binario, salvar_binario: As mesmas medidas com o snapshot binário (PersistenciaBinaria), para a
+      comparação com o formato JSON.
+    - carregar_binario_sob_demanda: Leitura do snapshot binário com os textos sob demanda (a descrição e o lembrete
+      não são lidos).
+    - carregar_fragmentado: Leitura do diretório de fragmentos (PersistenciaFragmentada), com os fragmentos lidos em
+      paralelo.
+    - salvar_edicao_fragmentada: Gravação depois da edição de uma única tarefa, que regrava apenas o seu fragmento e
+      o manifesto (compare com salvar_json, que regrava a lista inteira).
+    - exportar_ndjson, importar_ndjson: Exportação da lista em NDJSON e importação do arquivo exportado para um
+      organizador vazio (sem persistência), em lotes de LOTE_IMPORTACAO tarefas.
+    - get_tarefa: Busca de uma tarefa pelo título (por operação).
+    - ordenar_<filtro>: Ordenação pela primeira vez em cada filtro de CHAVES_ORDENACAO (a visão ordenada é descartada
+      antes de cada repetição).
+    - editar: Edição do título e da descrição de uma tarefa (por operação), com todas as visões ordenadas montadas.
+    - desfazer: Desfazer de uma edição (por operação).
+
+Formato dos resultados:
+    - Um dicionário JSON com a identificação da execução ("commit", "data", "python", "plataforma" e os parâmetros)
+      e, em "resultados", para cada tamanho (como texto) e cada medida, o tempo mínimo, a mediana e a média em
+      segundos ("min", "mediana", "media") e as amostras. As medidas por operação dividem o tempo de cada amostra
+      pela quantidade de operações ("operacoes").
+    - Em "partida", as medidas "importacao" e "processo" do comando "list" da linha de comando, no mesmo formato, e
+      os módulos proibidos que ele importou (ver notestation_benchmark.partida).
+"""
+
+import sys
+import os
+import gc
+import time
+import random
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import CHAVES_ORDENACAO
+from gerenciamento_arquivos import PersistenciaJson, PersistenciaBinaria, PersistenciaFragmentada, importar_tarefas, exportar_tarefas
+from notestation_benchmark.gerador_tarefas import gerar_tarefas
+from notestation_benchmark.partida import medir_partida
+
+FORMATO = 1
+
+TAMANHOS = [1000, 100000, 1000000]
+REPETICOES = 3
+OPERACOES = 1000
+TOLERANCIA = 0.2
+
+
+def medir(funcao, repeticoes: int, preparar=None, operacoes: int = 1) -> dict:
+    """
+    Mede o tempo de uma operação várias vezes. O coletor de lixo é executado antes de cada amostra, para que os
+    objetos das amostras anteriores não sejam coletados durante a medição seguinte.
+
+    Parâmetros:
+        - funcao (Callable[[], Any]): A operação medida.
+        - repeticoes (int): A quantidade de amostras.
+        - preparar (Callable[[], Any] or None): Função executada antes de cada amostra, fora da medição.
+        - operacoes (int): A quantidade de operações feitas por "funcao"; o tempo de cada amostra é dividido por ela.
+
+    Retorna:
+        - dict: O tempo mínimo, a mediana e a média (em segundos) e as amostras.
+    """
+    amostras = []
+
+    for _ in range(repeticoes):
+        if preparar is not None:
+            preparar()
+
+        gc.collect()
+        inicio = time.perf_counter()
+        funcao()
+        amostras.append((time.perf_counter() - inicio) / operacoes)
+
+    return {
+        "min": min(amostras),
+        "mediana": statistics.median(amostras),
+        "media": statistics.fmean(amostras),
+        "amostras": amostras,
+        "operacoes": operacoes
+    }
+
+
+def desfazer_tudo(organizador: TarefaOrganizador):
+    """
+    Cria uma função que desfaz todo o histórico do organizador, usada para voltar ao estado inicial entre as amostras.
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+
+    Retorna:
+        - Callable[[], None]: A função.
+    """
+    def desfazer():
+        while organizador.comandos:
+            organizador.desfazer()
+
+    return desfazer
+
+
+def benchmarks_tamanho(quantidade: int, repeticoes: int, operacoes: int, semente: int, diretorio: str) -> dict:
+    """
+    Executa os benchmarks para uma lista de tarefas sintéticas de um tamanho.
+
+    Parâmetros:
+        - quantidade (int): A quantidade de tarefas da lista.
+        - repeticoes (int): A quantidade de amostras de cada medida.
+        - operacoes (int): A quantidade de operações por amostra nas medidas por operação.
+        - semente (int): A semente do gerador de tarefas e das escolhas aleatórias.
+        - diretorio (str): Diretório onde o arquivo JSON é gravado e lido.
+
+    Retorna:
+        - Dict[str, dict]: Medida -> resultado de "medir".
+    """
+    resultados = {}
+    arquivo = os.path.join(diretorio, f'lista_tarefas_{quantidade}.json')
+    aleatorio = random.Random(semente)
+
+    organizador = TarefaOrganizador()
+    organizador.carregar_lote(gerar_tarefas(quantidade, semente))
+
+    persistencia = PersistenciaJson(arquivo, assincrono=False)
+    persistencia.organizador = organizador
+    resultados["salvar_json"] = medir(persistencia.salvar, repeticoes)
+
+    def carregar():
+        carregado = TarefaOrganizador()
+        PersistenciaJson(arquivo, assincrono=False).carregar(carregado)
+
+    resultados["carregar_json"] = medir(carregar, repeticoes)
+
+    arquivo_binario = os.path.join(diretorio, f'lista_tarefas_{quantidade}.nsb')
+    persistencia_binaria = PersistenciaBinaria(arquivo_binario, assincrono=False)
+    persistencia_binaria.organizador = organizador
+    resultados["salvar_binario"] = medir(persistencia_binaria.salvar, repeticoes)
+
+    def carregar_binario():
+        carregado = TarefaOrganizador()
+        PersistenciaBinaria(arquivo_binario, assincrono=False).carregar(carregado)
+
+    resultados["carregar_binario"] = medir(carregar_binario, repeticoes)
+
+    def carregar_binario_sob_demanda():
+        carregado = TarefaOrganizador()
+        PersistenciaBinaria(arquivo_binario, assincrono=False, textos_sob_demanda=True).carregar(carregado)
+
+    resultados["carregar_binario_sob_demanda"] = medir(carregar_binario_sob_demanda, repeticoes)
+
+    # O diretório de fragmentos é criado pela migração do arquivo JSON gravado acima
+    diretorio_fragmentos = os.path.join(diretorio, f'lista_tarefas_{quantidade}.fragmentos')
+    fragmentado = TarefaOrganizador()
+    persistencia_fragmentada = PersistenciaFragmentada(diretorio_fragmentos, dir_json=arquivo, assincrono=False)
+    persistencia_fragmentada.carregar(fragmentado)
+
+    def carregar_fragmentado():
+        carregado = TarefaOrganizador()
+        PersistenciaFragmentada(diretorio_fragmentos, assincrono=False).carregar(carregado)
+
+    resultados["carregar_fragmentado"] = medir(carregar_fragmentado, repeticoes)
+
+    editada = fragmentado.tarefas[aleatorio.randrange(quantidade)]
+
+    def editar_uma():
+        fragmentado.edit_tarefa(editada, f'{editada.base.titulo}!', editada.base.descricao, "", None)
+
+    resultados["salvar_edicao_fragmentada"] = medir(persistencia_fragmentada.gravar_pendencias, repeticoes, preparar=editar_uma)
+
+    arquivo_ndjson = os.path.join(diretorio, f'lista_tarefas_{quantidade}.ndjson')
+
+    def exportar_ndjson():
+        with open(arquivo_ndjson, "w", encoding='UTF-8') as saida:
+            exportar_tarefas(organizador, saida, "ndjson")
+
+    resultados["exportar_ndjson"] = medir(exportar_ndjson, repeticoes)
+
+    def importar_ndjson():
+        with open(arquivo_ndjson, "r", encoding='UTF-8') as entrada:
+            importar_tarefas(TarefaOrganizador(), entrada, "ndjson")
+
+    resultados["importar_ndjson"] = medir(importar_ndjson, repeticoes)
+
+    titulos = [tarefa.base.titulo for tarefa in aleatorio.choices(list(organizador.tarefas_por_id.values()), k=operacoes)]
+
+    def buscar():
+        for titulo in titulos:
+            organizador.get_tarefa(titulo)
+
+    resultados["get_tarefa"] = medir(buscar, repeticoes, operacoes=operacoes)
+
+    for filtro in CHAVES_ORDENACAO:
+        resultados[f'ordenar_{filtro}'] = medir(lambda: organizador.sort_tarefas(filtro), repeticoes, preparar=lambda: organizador.visoes.pop(filtro, None))
+
+    # Com todas as visões montadas, cada edição de título também reposiciona a tarefa na visão por título
+    editadas = aleatorio.sample(list(organizador.tarefas_por_id.values()), min(operacoes, quantidade))
+    organizador.limpar_historico()
+
+    def editar():
+        for numero, tarefa in enumerate(editadas):
+            organizador.edit_tarefa(tarefa, f'{tarefa.base.titulo} (editada {numero})', "Descrição editada", "", None)
+
+    def desfazer():
+        for _ in editadas:
+            organizador.desfazer()
+
+    voltar = desfazer_tudo(organizador)
+
+    def preparar_desfazer():
+        voltar()
+        editar()
+
+    # Cada amostra de edição é desfeita antes da próxima, e cada amostra de desfazer é precedida pelas edições
+    resultados["editar"] = medir(editar, repeticoes, preparar=voltar, operacoes=len(editadas))
+    resultados["desfazer"] = medir(desfazer, repeticoes, preparar=preparar_desfazer, operacoes=len(editadas))
+
+    return resultados
+
+
+def identificar_commit() -> str:
+    """
+    Obtém o commit do repositório em que os benchmarks foram executados.
+
+    Retorna:
+        - str or None: O hash do commit (com o sufixo "-sujo" se houver alterações não gravadas), ou None fora de um repositório git.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=diretorio_pai, capture_output=True, text=True, check=True).stdout.strip()
+        alteracoes = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=diretorio_pai, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return f'{commit}-sujo' if alteracoes.strip() else commit
+
+
+def executar_benchmarks(tamanhos: list = TAMANHOS, repeticoes: int = REPETICOES, operacoes: int = OPERACOES, semente: int = 0, diretorio: str = None, progresso=None, partida: bool = True) -> dict:
+    """
+    Executa os benchmarks do núcleo para cada tamanho de lista.
+
+    Parâmetros:
+        - tamanhos (List[int]): As quantidades de tarefas.
+        - repeticoes (int): A quantidade de amostras de cada medida.
+        - operacoes (int): A quantidade de operações por amostra nas medidas por operação.
+        - semente (int): A semente do gerador de tarefas.
+        - diretorio (str or None): Diretório dos arquivos gravados e lidos; se None, um diretório temporário é usado.
+        - progresso (Callable[[str], None] or None): Função chamada com uma mensagem ao terminar cada tamanho.
+        - partida (bool): Se True, também mede a partida da linha de comando.
+
+    Retorna:
+        - dict: Os resultados, no formato descrito no módulo.
+    """
+    resultados = {}
+
+    with tempfile.TemporaryDirectory(dir=diretorio) as temporario:
+        for quantidade in tamanhos:
+            inicio = time.perf_counter()
+            resultados[str(quantidade)] = benchmarks_tamanho(quantidade, repeticoes, operacoes, semente, temporario)
+
+            if progresso is not None:
+                progresso(f'{quantidade} tarefas: {time.perf_counter() - inicio:.1f} s')
+
+        medidas_partida = medir_partida(semente=semente, diretorio=temporario) if partida else None
+
+    return {
+        "formato": FORMATO,
+        "commit": identificar_commit(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "semente": semente,
+        "resultados": resultados,
+        "partida": medidas_partida
+    }
+
+
+def comparar(anterior: dict, atual: dict, tolerancia: float = TOLERANCIA) -> list:
+    """
+    Compara as medianas de dois resultados, medida a medida, para os tamanhos e medidas presentes em ambos (as
+    medidas de partida aparecem com o tamanho "partida").
+
+    Parâmetros:
+        - anterior (dict): Os resultados de referência (ex.: do commit anterior).
+        - atual (dict): Os resultados novos.
+        - tolerancia (float): Aumento relativo tolerado antes de uma medida ser considerada uma regressão (0.2 = 20%).
+
+    Retorna:
+        - List[Tuple[str, str, float, float, bool]]: Para cada medida, o tamanho, o nome, a mediana anterior, a
+          mediana atual e se houve regressão.
+    """
+    comparacao = []
+
+    for quantidade, medidas in atual["resultados"].items():
+        medidas_anteriores = anterior["resultados"].get(quantidade, {})
+
+        for nome, resultado in medidas.items():
+            if nome not in medidas_anteriores:
+                continue
+
+            mediana_anterior = medidas_anteriores[nome]["mediana"]
+            mediana = resultado["mediana"]
+            comparacao.append((quantidade, nome, mediana_anterior, mediana, mediana > mediana_anterior * (1 + tolerancia)))
+
+    if anterior.get("partida") and atual.get("partida"):
+        for nome in ("importacao", "processo"):
+            mediana_anterior = anterior["partida"][nome]["mediana"]
+            mediana = atual["partida"][nome]["mediana"]
+            comparacao.append(("partida", nome, mediana_anterior, mediana, mediana > mediana_anterior * (1 + tolerancia)))
+
+    return comparacao
@@ -0,0 +1,97 @@
+"""
+Módulo contendo o gerador de tarefas sintéticas usado pelos benchmarks.
+
+Funções:
+    - gerar_tarefas(quantidade, semente): Gera uma lista reprodutível de tarefas com a mistura de tipos e recursos do aplicativo.
+    - gerar_organizador(quantidade, semente): Cria um TarefaOrganizador já preenchido com as tarefas geradas.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - random: Módulo de números pseudoaleatórios, usado com uma semente fixa para que a geração seja reprodutível.
+    - date, datetime, timedelta: Classes do módulo datetime usadas para as datas de criação e os prazos.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+
+Mistura de tarefas:
+    - Metade das tarefas é criada pela TarefaTrabalhoFactory e metade pela TarefaComPrioridadeFactory.
+    - PROPORCAO_LEMBRETE das tarefas recebem um lembrete (TarefaComLembrete), PROPORCAO_PRAZO um prazo
+      (TarefaComPrazo), e PROPORCAO_CONCLUIDA estão concluídas; os recursos são sorteados de forma independente, de
+      modo que algumas tarefas têm lembrete e prazo.
+    - Os títulos combinam palavras de um vocabulário fixo com um número sequencial (sempre únicos), e as datas de
+      criação se espalham pelo último ano, como em uma lista usada por muito tempo.
+"""
+
+import sys
+import os
+import random
+from datetime import date, datetime, timedelta
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import para_epoca
+
+PROPORCAO_LEMBRETE = 0.3
+PROPORCAO_PRAZO = 0.3
+PROPORCAO_CONCLUIDA = 0.1
+
+PALAVRAS = ["Relatório", "reunião", "cliente", "projeto", "revisar", "enviar", "orçamento", "apresentação",
+            "contrato", "ligar", "comprar", "planejar", "entrega", "código", "documentação", "equipe"]
+
+LEMBRETES = ["Levar o notebook", "Confirmar por e-mail", "Reunião às 14:30", "Antes do almoço", "Avisar a equipe"]
+
+
+def gerar_tarefas(quantidade: int, semente: int = 0) -> list:
+    """
+    Gera uma lista reprodutível de tarefas sintéticas (a mesma semente sempre gera as mesmas tarefas, exceto pela
+    data de criação, que é relativa ao dia atual).
+
+    Parâmetros:
+        - quantidade (int): A quantidade de tarefas a serem geradas.
+        - semente (int): A semente do gerador de números pseudoaleatórios.
+
+    Retorna:
+        - List[Tarefa]: As tarefas geradas, sem ID (ainda não pertencem a um organizador).
+    """
+    aleatorio = random.Random(semente)
+    fabricas = [TarefaTrabalhoFactory(), TarefaComPrioridadeFactory()]
+    agora = para_epoca(datetime.now())
+    um_ano = 365 * 24 * 60 * 60 * 1000000
+    hoje = date.today()
+    tarefas = []
+
+    for numero in range(quantidade):
+        titulo = f'{aleatorio.choice(PALAVRAS)} {aleatorio.choice(PALAVRAS)} {numero}'
+        descricao = " ".join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(3, 12)))
+        tarefa = fabricas[numero % 2].criar_tarefa(titulo, descricao)
+        tarefa.criado_em = agora - aleatorio.randrange(um_ano)
+        tarefa.concluida = aleatorio.random() < PROPORCAO_CONCLUIDA
+
+        if aleatorio.random() < PROPORCAO_LEMBRETE:
+            tarefa = TarefaComLembrete(tarefa, aleatorio.choice(LEMBRETES))
+
+        if aleatorio.random() < PROPORCAO_PRAZO:
+            tarefa = TarefaComPrazo(tarefa, hoje + timedelta(days=aleatorio.randint(-30, 180)))
+
+        tarefas.append(tarefa)
+
+    return tarefas
+
+
+def gerar_organizador(quantidade: int, semente: int = 0) -> TarefaOrganizador:
+    """
+    Cria um organizador preenchido com tarefas sintéticas, carregadas como se fossem lidas de um arquivo (sem
+    comandos no histórico).
+
+    Parâmetros:
+        - quantidade (int): A quantidade de tarefas.
+        - semente (int): A semente do gerador de números pseudoaleatórios.
+
+    Retorna:
+        - TarefaOrganizador: O organizador com as tarefas geradas.
+    """
+    organizador = TarefaOrganizador()
+    organizador.carregar_lote(gerar_tarefas(quantidade, semente))
+    return organizador
@@ -0,0 +1,140 @@
+"""
+Módulo contendo o benchmark de partida (cold start) da linha de comando do noteStation.
+
+Funções:
+    - ler_importtime(saida): Lê o relatório de "python -X importtime" e obtém o tempo de importação de cada módulo.
+    - medir_partida(repeticoes, quantidade, semente, diretorio): Mede a partida do comando "list" em processos novos.
+    - verificar_partida(partida, orcamento): Aponta as violações do orçamento de partida.
+
+Módulos importados:
+    - sys: Módulo do sistema Python, usado para obter o interpretador atual.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - time: Módulo que fornece funções de medição de tempo (perf_counter).
+    - statistics: Módulo usado para calcular a mediana e a média das amostras.
+    - subprocess: Módulo usado para executar a linha de comando em processos novos.
+
+    - gerenciamento_arquivos: Módulo contendo a PersistenciaJson, usada para gravar a lista medida.
+    - notestation_benchmark.gerador_tarefas: Módulo contendo o gerador de tarefas sintéticas.
+
+Medidas:
+    - importacao: Soma dos tempos próprios ("self") de todos os módulos importados pelo processo, lida do relatório
+      de "-X importtime" (inclui os módulos da inicialização do Python).
+    - processo: Tempo total do processo "notestation.py list", da criação ao término.
+    - Antes das amostras, uma execução descartada compila os arquivos .pyc, para que apenas a partida "fria" do
+      processo (e não a compilação) seja medida.
+
+Orçamento:
+    - A mediana da importação deve ficar abaixo de ORCAMENTO_IMPORTACAO segundos, e nenhum dos MODULOS_PROIBIDOS
+      (a interface gráfica, o servidor e módulos caros usados apenas por eles) pode ser importado pelo comando "list".
+"""
+
+import sys
+import os
+import time
+import statistics
+import subprocess
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from gerenciamento_arquivos import PersistenciaJson
+from notestation_benchmark.gerador_tarefas import gerar_organizador
+
+SCRIPT_CLI = os.path.join(diretorio_pai, "notestation.py")
+
+ORCAMENTO_IMPORTACAO = 0.1
+MODULOS_PROIBIDOS = ["dearpygui", "notestation_interfaces", "notestation_servidor", "asyncio", "multiprocessing"]
+
+REPETICOES_PARTIDA = 5
+TAREFAS_PARTIDA = 1000
+
+
+def ler_importtime(saida: str) -> dict:
+    """
+    Lê o relatório de "python -X importtime" (linhas "import time: <próprio> | <acumulado> | <módulo>").
+
+    Parâmetros:
+        - saida (str): A saída de erros do processo.
+
+    Retorna:
+        - Dict[str, float]: Módulo -> tempo próprio de importação, em segundos.
+    """
+    modulos = {}
+
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:"):
+            continue
+
+        proprio, _, modulo = linha[len("import time:"):].split("|")
+
+        if proprio.strip().isdigit():
+            modulos[modulo.strip()] = int(proprio) / 1000000
+
+    return modulos
+
+
+def medir_partida(repeticoes: int = REPETICOES_PARTIDA, quantidade: int = TAREFAS_PARTIDA, semente: int = 0, diretorio: str = None) -> dict:
+    """
+    Mede a partida do comando "list" da linha de comando, cada amostra em um processo novo.
+
+    Parâmetros:
+        - repeticoes (int): A quantidade de amostras.
+        - quantidade (int): A quantidade de tarefas da lista listada.
+        - semente (int): A semente do gerador de tarefas.
+        - diretorio (str): Diretório onde o arquivo da lista é gravado.
+
+    Retorna:
+        - dict: "importacao" e "processo" (tempo mínimo, mediana, média e amostras, em segundos, como em
+          benchmark_nucleo.medir) e os módulos proibidos importados em "modulos_proibidos".
+    """
+    arquivo = os.path.join(diretorio, f'partida_{quantidade}.json')
+    persistencia = PersistenciaJson(arquivo, assincrono=False)
+    persistencia.organizador = gerar_organizador(quantidade, semente)
+    persistencia.salvar()
+
+    comando = [sys.executable, "-X", "importtime", SCRIPT_CLI, "--arquivo", arquivo, "--sem-diario", "list", "--limite", "20"]
+    importacao = []
+    processo = []
+    proibidos = set()
+
+    for amostra in range(repeticoes + 1):
+        inicio = time.perf_counter()
+        resultado = subprocess.run(comando, capture_output=True, text=True, check=True)
+        decorrido = time.perf_counter() - inicio
+
+        modulos = ler_importtime(resultado.stderr)
+        proibidos.update(modulo for modulo in modulos if modulo.split(".")[0] in MODULOS_PROIBIDOS)
+
+        # A primeira execução apenas compila os arquivos .pyc
+        if amostra:
+            importacao.append(sum(modulos.values()))
+            processo.append(decorrido)
+
+    return {
+        "importacao": {"min": min(importacao), "mediana": statistics.median(importacao), "media": statistics.fmean(importacao), "amostras": importacao, "operacoes": 1},
+        "processo": {"min": min(processo), "mediana": statistics.median(processo), "media": statistics.fmean(processo), "amostras": processo, "operacoes": 1},
+        "modulos_proibidos": sorted(proibidos)
+    }
+
+
+def verificar_partida(partida: dict, orcamento: float = ORCAMENTO_IMPORTACAO) -> list:
+    """
+    Verifica o resultado de "medir_partida" contra o orçamento.
+
+    Parâmetros:
+        - partida (dict): O resultado de "medir_partida".
+        - orcamento (float): O tempo máximo de importação, em segundos (mediana).
+
+    Retorna:
+        - List[str]: As violações encontradas (vazia se o orçamento foi respeitado).
+    """
+    violacoes = []
+    mediana = partida["importacao"]["mediana"]
+
+    if mediana > orcamento:
+        violacoes.append(f'importação de {mediana * 1000:.1f} ms acima do orçamento de {orcamento * 1000:.1f} ms')
+
+    for modulo in partida["modulos_proibidos"]:
+        violacoes.append(f'módulo proibido importado: {modulo}')
+
+    return violacoes
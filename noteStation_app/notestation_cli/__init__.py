@@ -0,0 +1,17 @@
+"""
+Módulo contendo a interface de linha de comando do aplicativo "NoteStation", que não depende da interface gráfica.
+
+Classes:
+    - ErroComando: Exceção lançada quando um comando não pode ser executado.
+
+Funções:
+    - main: Lê os argumentos da linha de comando e executa o comando pedido (add, list, done, delete, search, export, convert ou gui).
+
+Módulos importados:
+    - main, ErroComando: Importados do módulo "notestation_cli.linha_comando".
+"""
+
+from notestation_cli.linha_comando import (
+    main,
+    ErroComando
+)
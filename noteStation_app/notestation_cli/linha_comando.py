@@ -0,0 +1,511 @@
+"""
+Módulo contendo a interface de linha de comando do noteStation.
+
+Este módulo permite adicionar, listar, concluir, excluir, buscar, importar, exportar e converter as tarefas pelo terminal,
+usando o mesmo arquivo e as mesmas estratégias de persistência da interface gráfica. Apenas o núcleo
+(tarefa_classes) e a camada de armazenamento (gerenciamento_arquivos) são importados: a DearPyGui só é importada
+pelo comando "gui".
+
+Classes:
+    - ErroComando: Exceção lançada quando um comando não pode ser executado.
+
+Funções:
+    - criar_parser(): Cria o parser dos argumentos da linha de comando.
+    - abrir_persistencia(arquivo, modo_diario): Cria a persistência adequada ao arquivo, sem gravação em segundo plano.
+    - carregar(argumentos): Carrega as tarefas do arquivo em um organizador.
+    - consultar_banco(argumentos): Lista as tarefas de um banco SQLite com uma consulta, sem carregar a lista inteira.
+    - encontrar_tarefas(organizador, referencias): Obtém as tarefas indicadas pelos IDs ou títulos.
+    - descrever_tarefa(tarefa): Monta a linha exibida para uma tarefa.
+    - comando_add(argumentos), comando_list(argumentos), comando_done(argumentos), comando_delete(argumentos),
+      comando_search(argumentos), comando_import(argumentos), comando_export(argumentos), comando_convert(argumentos),
+      comando_gui(argumentos): Executam cada comando.
+    - formato_arquivo(caminho, formato): Obtém o formato de importação ou exportação pela extensão do arquivo.
+    - main(argv): Lê os argumentos e executa o comando pedido.
+
+Módulos importados:
+    - sys: Módulo do sistema Python, usado para a saída padrão e para as mensagens de erro.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - argparse: Módulo da biblioteca padrão usado para ler os argumentos da linha de comando.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas, o organizador e o índice de busca.
+    - gerenciamento_arquivos: Módulo contendo as estratégias de persistência e a importação e exportação em massa.
+
+Partida rápida:
+    - Cada execução carrega a lista inteira, de modo que o tempo de importação é parte de todo comando. Por isso os
+      módulos usados por apenas um comando (csv na importação e na exportação e a interface gráfica no comando "gui") são
+      importados dentro do comando, e a persistência é síncrona: não há thread de gravação para iniciar ou aguardar.
+      O orçamento de importação do comando "list" é verificado pelos benchmarks (notestation_benchmark.partida).
+"""
+
+import sys
+import os
+import argparse
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa, CHAVES_ORDENACAO, converter_prazo, formatar_prazo
+from gerenciamento_arquivos import *
+from gerenciamento_arquivos.importacao_tarefas import FORMATOS_IMPORTACAO, FORMATOS_EXPORTACAO, LOTE_IMPORTACAO
+
+PATH_FILE = os.path.join(os.path.expanduser('~'), 'Documents', 'noteStation')
+
+
+class ErroComando(Exception):
+    """
+    Exceção lançada quando um comando não pode ser executado. A mensagem é exibida na saída de erros.
+    """
+    pass
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """
+    Cria o parser dos argumentos da linha de comando, com um subcomando para cada operação.
+
+    Retorna:
+        - argparse.ArgumentParser: O parser.
+    """
+    parser = argparse.ArgumentParser(prog="notestation", description="Gerencia a lista de tarefas do noteStation pelo terminal.")
+    parser.add_argument("--arquivo", default=os.path.join(PATH_FILE, 'lista_tarefas.json'), help="Arquivo da lista de tarefas (.json, .nsb, .db, .sqlite ou um diretório .fragmentos).")
+    parser.add_argument("--sem-diario", action="store_true", help="Reescreve o arquivo JSON completo em vez de usar o diário.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    adicionar = comandos.add_parser("add", help="Adiciona uma tarefa.")
+    adicionar.add_argument("titulo")
+    adicionar.add_argument("--descricao", default="")
+    adicionar.add_argument("--prioridade", action="store_true", help="Cria uma tarefa com prioridade (em vez de uma tarefa de trabalho).")
+    adicionar.add_argument("--lembrete")
+    adicionar.add_argument("--prazo", help="Prazo no formato dd/mm/aaaa.")
+    adicionar.set_defaults(funcao=comando_add)
+
+    listar = comandos.add_parser("list", help="Lista as tarefas.")
+    listar.add_argument("--ordem", choices=list(CHAVES_ORDENACAO), help="Ordem da listagem (por padrão, a ordem da lista).")
+    situacao = listar.add_mutually_exclusive_group()
+    situacao.add_argument("--pendentes", action="store_true", help="Lista apenas as tarefas pendentes.")
+    situacao.add_argument("--concluidas", action="store_true", help="Lista apenas as tarefas concluídas.")
+    listar.add_argument("--limite", type=int, help="Quantidade máxima de tarefas listadas.")
+    listar.set_defaults(funcao=comando_list)
+
+    concluir = comandos.add_parser("done", help="Marca tarefas como concluídas.")
+    concluir.add_argument("tarefas", nargs="+", help="Títulos ou IDs das tarefas.")
+    concluir.set_defaults(funcao=comando_done)
+
+    excluir = comandos.add_parser("delete", help="Exclui tarefas.")
+    excluir.add_argument("tarefas", nargs="+", help="Títulos ou IDs das tarefas.")
+    excluir.set_defaults(funcao=comando_delete)
+
+    buscar = comandos.add_parser("search", help="Busca tarefas pelo título, descrição e lembrete.")
+    buscar.add_argument("consulta")
+    buscar.add_argument("--limite", type=int, default=20, help="Quantidade máxima de resultados.")
+    buscar.set_defaults(funcao=comando_search)
+
+    importar = comandos.add_parser("import", help="Importa tarefas de um arquivo NDJSON ou CSV, ignorando os títulos que já existem.")
+    importar.add_argument("entrada", help="Arquivo importado (\"-\" para a entrada padrão).")
+    importar.add_argument("--formato", choices=FORMATOS_IMPORTACAO, help="Formato do arquivo (por padrão, pela extensão: \".csv\" ou NDJSON).")
+    importar.add_argument("--lote", type=int, default=LOTE_IMPORTACAO, help="Tarefas adicionadas (e gravadas) por vez.")
+    importar.set_defaults(funcao=comando_import)
+
+    exportar = comandos.add_parser("export", help="Exporta as tarefas em JSON, NDJSON ou CSV.")
+    exportar.add_argument("--formato", choices=FORMATOS_EXPORTACAO, help="Formato da saída (por padrão, pela extensão do arquivo de saída, ou JSON).")
+    exportar.add_argument("--saida", help="Arquivo de saída (por padrão, a saída padrão).")
+    exportar.set_defaults(funcao=comando_export)
+
+    converter = comandos.add_parser("convert", help="Converte a lista de tarefas entre o formato JSON e o binário (.nsb).")
+    converter.add_argument("destino", help="Arquivo gerado: \".nsb\" a partir de um arquivo JSON, ou \".json\" a partir de um \".nsb\".")
+    converter.set_defaults(funcao=comando_convert)
+
+    gui = comandos.add_parser("gui", help="Abre a interface gráfica.")
+    gui.set_defaults(funcao=comando_gui)
+
+    return parser
+
+
+def abrir_persistencia(arquivo: str, modo_diario: bool = True) -> Persistencia:
+    """
+    Cria a persistência adequada ao arquivo, como a interface gráfica, mas gravando de forma síncrona: cada comando
+    é gravado antes de o processo terminar, sem thread de gravação.
+
+    Parâmetros:
+        - arquivo (str): O arquivo da lista de tarefas.
+        - modo_diario (bool): Se True, as operações são anexadas a um diário em vez de reescrever o arquivo JSON.
+
+    Retorna:
+        - Persistencia: A persistência.
+    """
+    if arquivo.endswith((".db", ".sqlite")):
+        return PersistenciaSQLite(arquivo, dir_json=os.path.join(os.path.dirname(arquivo), "lista_tarefas.json"), assincrono=False)
+
+    if arquivo.endswith(".fragmentos"):
+        return PersistenciaFragmentada(arquivo, dir_json=os.path.join(os.path.dirname(arquivo), "lista_tarefas.json"), assincrono=False)
+
+    if arquivo.endswith(".nsb"):
+        return PersistenciaBinaria(arquivo, dir_json=os.path.join(os.path.dirname(arquivo), "lista_tarefas.json"), assincrono=False)
+
+    if modo_diario:
+        return PersistenciaDiario(arquivo, assincrono=False)
+
+    return PersistenciaJson(arquivo, assincrono=False)
+
+
+def carregar(argumentos: argparse.Namespace) -> tuple:
+    """
+    Carrega as tarefas do arquivo indicado nos argumentos em um novo organizador.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): Os argumentos lidos ("arquivo" e "sem_diario").
+
+    Retorna:
+        - Tuple[TarefaOrganizador, Persistencia]: O organizador e a persistência que o observa (deve ser fechada).
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(argumentos.arquivo)), exist_ok=True)
+
+    organizador = TarefaOrganizador()
+    persistencia = abrir_persistencia(argumentos.arquivo, not argumentos.sem_diario)
+    persistencia.carregar(organizador)
+
+    return organizador, persistencia
+
+
+def consultar_banco(argumentos: argparse.Namespace) -> list:
+    """
+    Obtém as tarefas listadas pelo comando "list" em um banco SQLite já existente. O filtro de conclusão, a ordem e o
+    limite são executados pelo SQLite, e apenas as tarefas exibidas são lidas e reconstruídas.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "arquivo", "ordem", "pendentes", "concluidas" e "limite".
+
+    Retorna:
+        - List[Tarefa]: As tarefas, na mesma ordem da listagem a partir de um organizador carregado.
+    """
+    persistencia = abrir_persistencia(argumentos.arquivo)
+
+    try:
+        persistencia.abrir()
+
+        if argumentos.pendentes:
+            concluida = False
+        elif argumentos.concluidas:
+            concluida = True
+        else:
+            concluida = None
+
+        ids = persistencia.consultar_ids(argumentos.ordem or persistencia.ordem_salva(), concluida=concluida, limite=argumentos.limite)
+        return persistencia.ler_tarefas(ids)
+    finally:
+        persistencia.fechar()
+
+
+def encontrar_tarefas(organizador: TarefaOrganizador, referencias: list) -> list:
+    """
+    Obtém as tarefas indicadas pelos títulos ou, se nenhum título corresponder, pelos IDs exibidos em "list".
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+        - referencias (List[str]): Os títulos ou IDs.
+
+    Retorna:
+        - List[Tarefa]: As tarefas, na ordem das referências e sem repetições.
+    """
+    tarefas = {}
+
+    for referencia in referencias:
+        tarefa = organizador.get_tarefa(referencia)
+
+        if tarefa is None and referencia.isdigit():
+            tarefa = organizador.get_tarefa_por_id(int(referencia))
+
+        if tarefa is None:
+            raise ErroComando(f'Tarefa não encontrada: {referencia}')
+
+        tarefas[tarefa.base.id] = tarefa
+
+    return list(tarefas.values())
+
+
+def descrever_tarefa(tarefa: Tarefa) -> str:
+    """
+    Monta a linha exibida para uma tarefa: ID, conclusão, título, lembrete e prazo.
+
+    Parâmetros:
+        - tarefa (Tarefa): A tarefa.
+
+    Retorna:
+        - str: A linha.
+    """
+    base = tarefa.base
+    linha = f'{base.id:>6} [{"x" if base.concluida else " "}] {base.titulo}'
+
+    if base.get_lembrete():
+        linha += f' (lembrete: {base.get_lembrete()})'
+
+    if base.get_data_prazo() is not None:
+        linha += f' (prazo: {formatar_prazo(base.get_data_prazo())})'
+
+    return linha
+
+
+def comando_add(argumentos: argparse.Namespace):
+    """
+    Adiciona uma tarefa, como a janela de criação da interface.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "titulo", "descricao", "prioridade", "lembrete" e "prazo".
+    """
+    prazo = converter_prazo(argumentos.prazo)
+    organizador, persistencia = carregar(argumentos)
+
+    try:
+        if organizador.existe_titulo(argumentos.titulo):
+            raise ErroComando(f'Já existe uma tarefa com o título: {argumentos.titulo}')
+
+        if argumentos.prioridade:
+            tarefa = TarefaComPrioridadeFactory().criar_tarefa(argumentos.titulo, argumentos.descricao)
+        else:
+            tarefa = TarefaTrabalhoFactory().criar_tarefa(argumentos.titulo, argumentos.descricao)
+
+        if argumentos.lembrete:
+            tarefa = TarefaComLembrete(tarefa, argumentos.lembrete)
+
+        if prazo is not None:
+            tarefa = TarefaComPrazo(tarefa, prazo)
+
+        organizador.add_tarefa(tarefa)
+        print(descrever_tarefa(tarefa))
+    finally:
+        persistencia.fechar()
+
+
+def comando_list(argumentos: argparse.Namespace):
+    """
+    Lista as tarefas, opcionalmente filtradas pela conclusão e em outra ordem. A ordem da lista não é alterada.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "ordem", "pendentes", "concluidas" e "limite".
+    """
+    if argumentos.arquivo.endswith((".db", ".sqlite")) and os.path.exists(argumentos.arquivo):
+        linhas = [descrever_tarefa(tarefa) for tarefa in consultar_banco(argumentos)]
+
+        if linhas:
+            sys.stdout.write("\n".join(linhas) + "\n")
+
+        return
+
+    organizador, persistencia = carregar(argumentos)
+    persistencia.fechar()
+
+    tarefas_por_id = organizador.tarefas_por_id
+    ids = organizador.visao(argumentos.ordem) if argumentos.ordem else organizador.ids_exibicao()
+    limite = argumentos.limite
+    linhas = []
+
+    for tarefa_id in ids:
+        if limite is not None and len(linhas) >= limite:
+            break
+
+        tarefa = tarefas_por_id[tarefa_id]
+
+        if (argumentos.pendentes and tarefa.base.concluida) or (argumentos.concluidas and not tarefa.base.concluida):
+            continue
+
+        linhas.append(descrever_tarefa(tarefa))
+
+    if linhas:
+        sys.stdout.write("\n".join(linhas) + "\n")
+
+
+def comando_done(argumentos: argparse.Namespace):
+    """
+    Marca as tarefas indicadas como concluídas, em uma única transação (uma gravação).
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "tarefas".
+    """
+    organizador, persistencia = carregar(argumentos)
+
+    try:
+        tarefas = encontrar_tarefas(organizador, argumentos.tarefas)
+        organizador.mark_tarefas(tarefas)
+
+        for tarefa in tarefas:
+            print(descrever_tarefa(tarefa))
+    finally:
+        persistencia.fechar()
+
+
+def comando_delete(argumentos: argparse.Namespace):
+    """
+    Exclui as tarefas indicadas, em uma única transação (uma gravação).
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "tarefas".
+    """
+    organizador, persistencia = carregar(argumentos)
+
+    try:
+        tarefas = encontrar_tarefas(organizador, argumentos.tarefas)
+        organizador.del_tarefas(tarefas)
+        print(f'{len(tarefas)} tarefa(s) excluída(s)')
+    finally:
+        persistencia.fechar()
+
+
+def comando_search(argumentos: argparse.Namespace):
+    """
+    Busca as tarefas pelo título, descrição e lembrete, com o mesmo índice da caixa de busca da interface.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "consulta" e "limite".
+    """
+    organizador, persistencia = carregar(argumentos)
+    persistencia.fechar()
+
+    indice = IndiceBusca(organizador)
+    indice.construir()
+
+    # Uma única consulta: as tarefas examinadas não são limitadas, como na interface, e os resultados são exatos
+    for tarefa_id in indice.buscar(argumentos.consulta, limite=argumentos.limite, candidatos=None):
+        print(descrever_tarefa(organizador.tarefas_por_id[tarefa_id]))
+
+
+def formato_arquivo(caminho: str, formato: str = None, padrao: str = "ndjson") -> str:
+    """
+    Obtém o formato de importação ou exportação: o informado pelo usuário ou, na falta dele, o da extensão do arquivo.
+
+    Parâmetros:
+        - caminho (str or None): O arquivo (None ou "-" para a entrada ou saída padrão).
+        - formato (str or None): O formato informado pelo usuário.
+        - padrao (str): O formato usado quando a extensão não indica nenhum.
+
+    Retorna:
+        - str: O formato.
+    """
+    if formato:
+        return formato
+
+    extensao = os.path.splitext(caminho or "")[1].lower()
+
+    if extensao == ".csv":
+        return "csv"
+
+    if extensao in (".ndjson", ".jsonl"):
+        return "ndjson"
+
+    return padrao
+
+
+def comando_import(argumentos: argparse.Namespace):
+    """
+    Importa as tarefas de um arquivo NDJSON ou CSV, lendo um registro por vez e gravando uma vez por lote. O
+    progresso é exibido na saída de erros quando ela é um terminal.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "entrada", "formato" e "lote".
+    """
+    if argumentos.lote < 1:
+        raise ErroComando("o lote deve ter pelo menos uma tarefa")
+
+    formato = formato_arquivo(argumentos.entrada, argumentos.formato)
+
+    if argumentos.entrada != "-" and not os.path.exists(argumentos.entrada):
+        raise ErroComando(f'Arquivo não encontrado: {argumentos.entrada}')
+
+    progresso = None
+
+    if sys.stderr.isatty():
+        def progresso(resultado: ResultadoImportacao):
+            print(f'\r{resultado.importadas} tarefa(s) importada(s), {resultado.ignoradas} ignorada(s)', end="", file=sys.stderr, flush=True)
+
+    organizador, persistencia = carregar(argumentos)
+    entrada = open(argumentos.entrada, "r", encoding='UTF-8', newline="") if argumentos.entrada != "-" else sys.stdin
+
+    try:
+        resultado = importar_tarefas(organizador, entrada, formato, tamanho_lote=argumentos.lote, progresso=progresso)
+    finally:
+        if progresso is not None:
+            print(file=sys.stderr)
+
+        if entrada is not sys.stdin:
+            entrada.close()
+
+        persistencia.fechar()
+
+    print(f'{resultado.importadas} tarefa(s) importada(s), {resultado.ignoradas} ignorada(s) por título repetido')
+
+
+def comando_export(argumentos: argparse.Namespace):
+    """
+    Exporta as tarefas, na ordem da lista, em JSON (uma lista com os campos do arquivo e o ID), NDJSON ou CSV,
+    escrevendo um registro por vez.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "formato" e "saida".
+    """
+    formato = formato_arquivo(argumentos.saida, argumentos.formato, padrao="json")
+    organizador, persistencia = carregar(argumentos)
+    persistencia.fechar()
+
+    saida = open(argumentos.saida, "w", encoding='UTF-8', newline="") if argumentos.saida else sys.stdout
+
+    try:
+        exportar_tarefas(organizador, saida, formato)
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+
+def comando_convert(argumentos: argparse.Namespace):
+    """
+    Converte o arquivo de tarefas entre o formato JSON e o snapshot binário. O arquivo de origem não é alterado.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "arquivo" (a origem) e "destino".
+    """
+    origem_binaria = argumentos.arquivo.endswith(".nsb")
+
+    if origem_binaria == argumentos.destino.endswith(".nsb"):
+        raise ErroComando('a conversão deve ser de um arquivo ".json" para um ".nsb" ou de um ".nsb" para um ".json"')
+
+    if not os.path.exists(argumentos.arquivo):
+        raise ErroComando(f'Arquivo não encontrado: {argumentos.arquivo}')
+
+    if origem_binaria:
+        quantidade = converter_binario_para_json(argumentos.arquivo, argumentos.destino)
+    else:
+        quantidade = converter_json_para_binario(argumentos.arquivo, argumentos.destino)
+
+    print(f'{quantidade} tarefa(s) convertida(s) para {argumentos.destino}')
+
+
+def comando_gui(argumentos: argparse.Namespace):
+    """
+    Abre a interface gráfica com o arquivo indicado. A interface (e a DearPyGui) só é importada aqui.
+
+    Parâmetros:
+        - argumentos (argparse.Namespace): "arquivo" e "sem_diario".
+    """
+    from notestation_interfaces import TelaInicial
+
+    os.makedirs(os.path.dirname(os.path.abspath(argumentos.arquivo)), exist_ok=True)
+    TelaInicial(argumentos.arquivo, modo_diario=not argumentos.sem_diario).exibir()
+
+
+def main(argv: list = None) -> int:
+    """
+    Lê os argumentos da linha de comando e executa o comando pedido.
+
+    Parâmetros:
+        - argv (List[str] or None): Os argumentos (por padrão, os do processo).
+
+    Retorna:
+        - int: O código de saída (0 em caso de sucesso, 1 em caso de erro).
+    """
+    argumentos = criar_parser().parse_args(argv)
+
+    try:
+        argumentos.funcao(argumentos)
+    except (ErroComando, ValueError, OSError) as erro:
+        print(f'notestation: {erro}', file=sys.stderr)
+        return 1
+
+    return 0
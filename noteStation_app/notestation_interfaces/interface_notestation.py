@@ -1,7 +1,7 @@
 """
 Módulo para a classe TelaInicial e funcionalidades relacionadas
 
-Este módulo contém a classe TelaInicial, responsável por exibir a interface gráfica principal do programa utilizando a biblioteca dearpygui. Também inclui funcionalidades para carregar tarefas a partir de um arquivo JSON, criar, editar, marcar como concluída e excluir tarefas, além de realizar ordenações na lista de tarefas exibida na interface gráfica.
+Este módulo contém a classe TelaInicial, responsável por exibir a interface gráfica principal do programa utilizando a biblioteca dearpygui. Também inclui funcionalidades para carregar tarefas a partir de um arquivo JSON, criar, editar, marcar como concluída e excluir tarefas, além de realizar ordenações e buscas textuais na lista de tarefas exibida na interface gráfica.
 
 Classes:
     - TelaInicial: Classe que representa a tela inicial do programa e gerencia as tarefas e a interação com o usuário.
@@ -10,9 +10,13 @@ Módulos importados:
     - dearpygui.dearpygui: Módulo da biblioteca dearpygui que é utilizada para criar a interface gráfica.
     - sys: Módulo padrão do Python que fornece acesso a algumas variáveis usadas ou mantidas pelo interpretador e a funções que interagem fortemente com o interpretador.
     - os: Módulo padrão do Python que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
-    - json: Módulo padrão do Python que fornece funções para trabalhar com dados JSON.
+    - time: Módulo padrão do Python que fornece funções de medição de tempo.
+    - calendar: Módulo padrão do Python usado para obter o dia da semana e a quantidade de dias de cada mês do calendário.
+    - date: Classe do módulo datetime que representa uma data, usada para os prazos escolhidos na interface e no calendário.
+    - deque: Fila de duas pontas do módulo collections, usada para receber as notificações da thread do agendador.
+    - bisect_left: Função do módulo bisect usada para localizar uma tarefa excluída na lista da ordem original.
 
-    - tarefa_classes: Módulo contendo as classes TarefaBase, TarefaComLembrete, TarefaComPrazo, TarefaOrganizador e suas fábricas.
+    - tarefa_classes: Módulo contendo as classes TarefaBase, TarefaComLembrete, TarefaComPrazo, TarefaOrganizador, suas fábricas, o índice de busca IndiceBusca, o índice de prazos IndicePrazos, o agendador de lembretes AgendadorLembretes e o registro de métricas METRICAS.
     - gerenciamento_arquivos: Módulo contendo o Encoder personalizado TarefaEncoder para serialização das tarefas em formato JSON.
 """
 
@@ -20,7 +24,11 @@ import dearpygui.dearpygui as dpg
 
 import sys
 import os
-import json
+import time
+import calendar
+from datetime import date
+from collections import deque
+from bisect import bisect_left
 
 diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(diretorio_pai)
@@ -28,6 +36,28 @@ sys.path.append(diretorio_pai)
 from tarefa_classes import *
 from gerenciamento_arquivos import *
 
+# Botões que alteram as tarefas; ficam desabilitados enquanto o arquivo ainda está sendo carregado
+BOTOES_EDICAO = ["EditarButton", "MarkTarefa", "openPopUp", "ExcluirButton", "DesfazerButton", "RefazerButton", "OrdenarButton"]
+
+# Intervalo mínimo, em segundos, entre as atualizações da lista durante o carregamento
+INTERVALO_ATUALIZACAO_CARREGAMENTO = 0.5
+
+# Quantidade de linhas da lista de tarefas criadas na interface; apenas as tarefas visíveis ocupam essas linhas
+LINHAS_VISIVEIS = 16
+ALTURA_LINHA = 20
+LINHAS_POR_ROLAGEM = 3
+
+# Intervalo, em segundos, entre as atualizações da janela de métricas
+INTERVALO_ATUALIZACAO_METRICAS = 0.5
+
+# Quantidade máxima de notificações listadas na janela de lembretes (e de tarefas listadas no calendário)
+LIMITE_NOTIFICACOES = 10
+
+# O calendário tem 6 semanas de 7 dias, suficientes para qualquer mês
+DIAS_CALENDARIO = 42
+NOMES_MESES = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"]
+NOMES_DIAS_SEMANA = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+
 
 class TelaInicial:
     """
@@ -38,15 +68,87 @@ class TelaInicial:
         - tPrioridade (TarefaComPrioridadeFactory): Instância da classe TarefaComPrioridadeFactory utilizada para criar tarefas com prioridade.
         - tTrabalho (TarefaTrabalhoFactory): Instância da classe TarefaTrabalhoFactory utilizada para criar tarefas de trabalho.
         - dir (str): Diretório do arquivo JSON usado para armazenar as tarefas.
+        - persistencia (Persistencia): Estratégia de persistência que observa o organizador e grava cada operação.
+        - carregamento (Iterator[int] or None): Carregamento em lotes ainda em andamento, ou None quando todas as tarefas já foram carregadas.
+        - interface_ativa (bool): Indica se a janela da interface gráfica está aberta.
+        - ids_originais (List[int]): IDs das tarefas na ordem original do organizador, atualizados a cada comando.
+        - sequencia (Dict[int, int]): ID -> número de ordem da tarefa em "ids_originais", crescente ao longo da lista,
+          usado para localizar uma tarefa por busca binária.
+        - proxima_sequencia (int): Número de ordem da próxima tarefa acrescentada ao fim de "ids_originais".
+        - inicio (int): Índice, na ordem de exibição, da tarefa mostrada na primeira linha da lista.
+        - ids_visiveis (List[int or None]): ID da tarefa mostrada em cada linha da lista (None para linhas vazias).
+        - selecionada (int or None): ID da última tarefa clicada na lista (usada por "Editar" e "Visualizar").
+        - selecionadas (Set[int]): IDs das tarefas selecionadas (Ctrl + clique seleciona várias), usadas pelas ações em lote.
+        - id_em_edicao (int or None): ID da tarefa aberta na janela de edição.
+        - indice (IndiceBusca): Índice de busca textual das tarefas, construído ao final do carregamento.
+        - consulta (str): O texto da caixa de busca ("" quando nenhuma busca está ativa).
+        - resultados (List[int]): IDs das tarefas encontradas pela busca, da mais relevante para a menos relevante.
+        - agendador (AgendadorLembretes): Agendador dos lembretes e prazos, iniciado ao final do carregamento.
+        - prazos (IndicePrazos): Índice dos prazos das tarefas pendentes, construído ao final do carregamento e usado pelo calendário.
+        - mes_calendario (Tuple[int, int] or None): Ano e mês exibidos no calendário, ou None com o calendário fechado.
+        - dia_calendario (date or None): Dia do calendário cujas tarefas estão listadas.
+        - notificacoes (deque): Notificações entregues pelo agendador e ainda não exibidas; a thread do agendador
+          apenas as enfileira, e a janela é aberta pelo laço de renderização.
+        - avisos (deque): Avisos ao usuário ainda não exibidos (ex.: uma gravação que falhou, entregue pela thread do
+          gravador), exibidos pelo laço de renderização.
+        - ultima_atualizacao_metricas (float): Instante da última atualização da janela de métricas.
+
+    Lista virtualizada:
+        - A lista possui apenas LINHAS_VISIVEIS linhas (selectables), reaproveitadas conforme a lista é rolada. A
+          interface observa o organizador e, a cada comando, ajusta a sua lista de IDs e atualiza somente as linhas
+          afetadas, sem reenviar os títulos de todas as tarefas. A seleção é guardada pelo ID da tarefa, e não pelo título.
+        - "Excluir tarefa" e "Concluir tarefa" atuam sobre todas as tarefas selecionadas, em uma única transação do
+          organizador: uma entrada no histórico de desfazer e uma única gravação.
+        - O calendário mostra apenas o mês visível: a quantidade de tarefas de cada dia vem do índice de prazos (sem
+          percorrer as tarefas), e os títulos são obtidos apenas para o dia clicado.
+        - Com uma busca ativa, a lista exibe os resultados do índice de busca. A busca só é refeita após um comando
+          que altera uma tarefa exibida nos resultados ou que passa a corresponder à busca (o índice também observa o
+          organizador e é atualizado antes da interface). Quando o índice limita as tarefas examinadas, um aviso ao
+          lado da caixa de busca indica que os resultados são aproximados.
+
+    Métricas:
+        - Todos os callbacks são registrados por "medido", e cada quadro é medido em "notestation_quadro_segundos"
+          enquanto as métricas estão ativas. F12 alterna as métricas e uma pequena janela com o resumo dos
+          histogramas, de onde elas podem ser exportadas para "metricas.prom".
 
     Métodos:
         - carregar_arquivo()
+        - carregar_proximo_lote()
         - exibir()
         - visualizar_tarefa(Sender)
         - editar_tarefa_window(Sender)
         - editar_tarefa(Sender)
         - marcar_concluida(Sender)
         - atualizar_lista()
+        - atualizar_linha(tarefa_id)
+        - linhas_exibicao()
+        - reconstruir_lista()
+        - acrescentar_original(tarefa_id)
+        - remover_original(tarefa_id)
+        - selecionar_linha(Sender, app_data)
+        - tarefa_selecionada()
+        - tarefas_selecionadas()
+        - selecionar_tudo()
+        - rolar_lista(Sender, app_data)
+        - rolar_roda(Sender, app_data)
+        - buscar(Sender, app_data)
+        - atualizar_busca()
+        - busca_afetada(comando)
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+        - exibir_notificacoes()
+        - exibir_avisos()
+        - medido(funcao)
+        - alternar_metricas()
+        - atualizar_metricas()
+        - exportar_metricas()
+        - abrir_calendario()
+        - fechar_calendario()
+        - mudar_mes(Sender)
+        - atualizar_calendario()
+        - selecionar_dia(Sender)
+        - exibir_atrasadas()
+        - listar_tarefas_calendario(cabecalho, ids)
         - exibir_lembrete()
         - exibir_prazo()
         - checar_tarefa(titulo)
@@ -54,103 +156,212 @@ class TelaInicial:
         - criar_tarefa()
         - excluir_tarefa(Sender)
         - desfazer_operacao()
+        - refazer_operacao()
         - ordenar_lista(Sender)
     """
-    def __init__(self, dir):
+    def __init__(self, dir, modo_diario=True):
         """
         Inicializa a classe TelaInicial.
 
         Atributos:
-            - dir (str): O diretório do arquivo JSON usado para armazenar as tarefas.
+            - dir (str): O diretório do arquivo usado para armazenar as tarefas. Arquivos ".db" ou ".sqlite" usam a
+              persistência SQLite e arquivos ".nsb" o snapshot binário com diário (ambos migrando o
+              "lista_tarefas.json" da mesma pasta, se existir), com a descrição e o lembrete lidos apenas ao
+              visualizar ou editar cada tarefa; diretórios ".fragmentos" a persistência em fragmentos lidos em
+              paralelo (também migrando o "lista_tarefas.json"); os demais, JSON.
+            - modo_diario (bool): Se True, as operações são anexadas a um diário em vez de reescrever o arquivo JSON a cada operação.
         """
         self.organizador = TarefaOrganizador()
         self.tPrioridade = TarefaComPrioridadeFactory()
         self.tTrabalho = TarefaTrabalhoFactory()
         self.dir = dir
 
-        self.carregar_arquivo()
+        if dir.endswith((".db", ".sqlite")):
+            self.persistencia = PersistenciaSQLite(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"))
+        elif dir.endswith(".fragmentos"):
+            self.persistencia = PersistenciaFragmentada(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"))
+        elif dir.endswith(".nsb"):
+            self.persistencia = PersistenciaBinaria(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"), textos_sob_demanda=True)
+        elif modo_diario:
+            self.persistencia = PersistenciaDiario(dir)
+        else:
+            self.persistencia = PersistenciaJson(dir)
+
+        self.avisos = deque()
+        # As falhas de gravação chegam pela thread do gravador, que continua tentando gravar
+        self.persistencia.ao_falhar = lambda erro: self.avisos.append(f'Erro ao gravar as tarefas: {erro}. A gravação será repetida.')
+        self.carregamento = self.persistencia.carregar_medido(self.organizador)
+        self.ultima_atualizacao = 0.0
+        self.interface_ativa = False
+        self.ids_originais = []
+        self.sequencia = {}
+        self.proxima_sequencia = 0
+        self.inicio = 0
+        self.ids_visiveis = [None] * LINHAS_VISIVEIS
+        self.selecionada = None
+        self.selecionadas = set()
+        self.id_em_edicao = None
+        self.indice = IndiceBusca(self.organizador)
+        self.consulta = ""
+        self.resultados = []
+        self.notificacoes = deque()
+        self.agendador = AgendadorLembretes(self.organizador, destino=self.notificacoes.extend)
+        self.prazos = IndicePrazos(self.organizador)
+        self.mes_calendario = None
+        self.dia_calendario = None
+        self.ultima_atualizacao_metricas = 0.0
+
+        # Apenas o primeiro lote é carregado antes da janela aparecer; os demais são carregados entre os quadros
+        self.carregar_proximo_lote()
 
     def carregar_arquivo(self):
         """
-        Carrega as tarefas a partir do arquivo JSON especificado no atributo "dir" e as adiciona ao organizador.
-        """
-        if os.path.exists(self.dir):
-            with open(self.dir, "r", encoding='UTF-8') as arquivo:
-                lista_tarefas = json.load(arquivo)
-                json_to_tarefas = []
-
-                for tarefa_id in lista_tarefas:
-                    tarefa_obj = lista_tarefas[tarefa_id]
-
-                    tarefa = None
-                    if tarefa_obj['prioridade'] == True:
-                        tarefa = self.tPrioridade.criar_tarefa(tarefa_obj['titulo'], tarefa_obj['descricao'])
-                    else:
-                        tarefa = self.tTrabalho.criar_tarefa(tarefa_obj['titulo'], tarefa_obj['descricao'])
-                    
-                    tarefa.data_criacao = tarefa_obj['data_criacao']
-                    tarefa.data_exata = tarefa_obj['data_exata']
-                    tarefa.concluida = tarefa_obj['concluida']
-                    tarefa._tarefa = tarefa_obj['_tarefa']
-
-                    if tarefa_obj['lembrete']:
-                        tarefa = TarefaComLembrete(tarefa, tarefa_obj['lembrete'])
-                    
-                    if tarefa_obj['prazo']:
-                        tarefa = TarefaComPrazo(tarefa, tarefa_obj['prazo'])
-                    
-                    json_to_tarefas.append(tarefa)
-                
-                self.organizador.tarefas = json_to_tarefas
-        else:
-            with open(self.dir, "w", encoding='UTF-8') as arquivo:
-                arquivo.write("")
+        Carrega todas as tarefas restantes a partir do arquivo JSON especificado no atributo "dir" (e do diário, no modo diário) e as adiciona ao organizador.
+        """
+        while self.carregamento is not None:
+            self.carregar_proximo_lote()
 
-    def exibir(self):
+    def carregar_proximo_lote(self):
         """
-        Exibe a interface gráfica principal do programa, mostrando a lista de tarefas e opções para interagir com elas.
+        Carrega o próximo lote de tarefas do arquivo. Com a interface aberta, a lista é atualizada periodicamente e,
+        ao final do carregamento, os botões de edição são habilitados.
         """
-        self.titulos = [self.organizador.checkTarefaDecorator(tarefa).titulo for tarefa in self.organizador.tarefas]
+        if next(self.carregamento, None) is not None:
+            if self.interface_ativa and time.monotonic() - self.ultima_atualizacao > INTERVALO_ATUALIZACAO_CARREGAMENTO:
+                self.reconstruir_lista()
+                self.atualizar_lista()
+                self.ultima_atualizacao = time.monotonic()
+            return
+
+        self.carregamento = None
+
+        # O índice de busca passa a observar o organizador antes da interface, para que as buscas refeitas a
+        # cada comando já encontrem o índice atualizado
+        self.indice.construir()
 
+        self.prazos.construir()
 
+        # Os lembretes e prazos futuros são agendados e passam a acompanhar os comandos
+        self.agendador.construir()
+        self.organizador.observadores.append(self.agendador)
+        self.agendador.iniciar()
+
+        # A partir daqui a lista de IDs é mantida pelos comandos, observados como a persistência os observa
+        self.reconstruir_lista()
+        self.organizador.observadores.append(self.prazos)
+        self.organizador.observadores.append(self)
+
+        if self.interface_ativa:
+            self.atualizar_lista()
+            dpg.configure_item("BuscaInput", enabled=True)
+            dpg.configure_item("CalendarioButton", enabled=True)
+
+            for botao in BOTOES_EDICAO:
+                dpg.configure_item(botao, enabled=True)
+
+    def exibir(self):
+        """
+        Exibe a interface gráfica principal do programa, mostrando a lista de tarefas e opções para interagir com elas.
+        """
         dpg.create_context()
         dpg.create_viewport(title="noteStation", max_width=700, max_height=400, min_width=700, min_height=400)
         dpg.setup_dearpygui()
 
         with dpg.window(label="noteStation" , width=700, height=400, no_title_bar=True, no_resize=True, no_move=True, tag="PrimWindow"):
-            # Listbox para exibir as tarefas
+            # Lista virtualizada para exibir as tarefas: apenas as linhas visíveis existem na interface
             with dpg.group():
-                self.listbox = dpg.add_listbox(label="Tarefas", items=self.titulos, num_items=16, width=500)
+                # Busca pelo título, descrição e lembrete; refeita a cada caractere digitado
+                with dpg.group(horizontal=True):
+                    dpg.add_input_text(tag="BuscaInput", hint="Buscar tarefas", width=514, callback=self.medido(self.buscar))
+                    dpg.add_text("Resultados aproximados", tag="BuscaAproximada", show=False)
+
+                with dpg.item_handler_registry(tag="LinhaHandler"):
+                    dpg.add_item_clicked_handler(button=dpg.mvMouseButton_Left, callback=self.medido(self.selecionar_linha))
+                    dpg.add_item_clicked_handler(button=dpg.mvMouseButton_Right, callback=self.medido(self.selecionar_linha))
+
+                with dpg.group(horizontal=True):
+                    with dpg.child_window(tag="ListaTarefas", width=500, height=LINHAS_VISIVEIS * ALTURA_LINHA + 8, no_scrollbar=True):
+                        for linha in range(LINHAS_VISIVEIS):
+                            dpg.add_selectable(label="", tag=f"LinhaTarefa{linha}", user_data=linha, show=False)
+                            dpg.bind_item_handler_registry(f"LinhaTarefa{linha}", "LinhaHandler")
+
+                    dpg.add_slider_int(tag="RolagemLista", vertical=True, height=LINHAS_VISIVEIS * ALTURA_LINHA + 8, width=14, min_value=0, max_value=0, format="", callback=self.medido(self.rolar_lista))
 
-                with dpg.popup(dpg.last_item(), max_size=(150, 15)):
-                    dpg.add_button(label="Editar tarefa", width=135, callback=self.editar_tarefa_window, drag_callback=self.listbox)
+                with dpg.popup("ListaTarefas", max_size=(150, 15)):
+                    dpg.add_button(label="Editar tarefa", width=135, tag="EditarButton", callback=self.medido(self.editar_tarefa_window))
 
-                    dpg.add_button(label="Visualizar tarefa", width=135, tag="VisuButton", callback=self.visualizar_tarefa, drag_callback=self.listbox)
+                    dpg.add_button(label="Visualizar tarefa", width=135, tag="VisuButton", callback=self.medido(self.visualizar_tarefa))
 
-                    dpg.add_button(label="Concluir tarefa", width=135, tag="MarkTarefa", callback=self. marcar_concluida, drag_callback=self.listbox)
+                    dpg.add_button(label="Concluir tarefa", width=135, tag="MarkTarefa", callback=self.medido(self.marcar_concluida))
 
 
                 with dpg.group(horizontal=True):
-                    dpg.add_button(label="Adicionar tarefa", tag="openPopUp", callback=self.criar_tarefa_popup)
+                    dpg.add_button(label="Adicionar tarefa", tag="openPopUp", callback=self.medido(self.criar_tarefa_popup))
+
+                    dpg.add_button(label="Excluir tarefa", tag="ExcluirButton", callback=self.medido(self.excluir_tarefa))
+
+                    dpg.add_button(label="Selecionar tudo", tag="SelecionarTudoButton", callback=self.medido(self.selecionar_tudo))
 
-                    dpg.add_button(label="Excluir tarefa", callback=self.excluir_tarefa, drag_callback=self.listbox)
+                    dpg.add_button(label="Desfazer", tag="DesfazerButton", callback=self.medido(self.desfazer_operacao))
 
-                    dpg.add_button(label="Desfazer", callback=self.desfazer_operacao)
+                    dpg.add_button(label="Refazer", tag="RefazerButton", callback=self.medido(self.refazer_operacao))
 
                     dpg.add_button(label="Ordenar", tag="OrdenarButton")
 
+                    dpg.add_button(label="Calendário", tag="CalendarioButton", callback=self.medido(self.abrir_calendario))
+
                     with dpg.popup(parent="OrdenarButton", mousebutton=dpg.mvMouseButton_Left, tag="OrdenarPopUp", min_size=(130, 60)):
-                        dpg.add_button(label="Título", callback=self.ordenar_lista, width=120)
+                        dpg.add_button(label="Título", callback=self.medido(self.ordenar_lista), width=120)
+
+                        dpg.add_button(label="Data de criação", callback=self.medido(self.ordenar_lista), width=120)
+
+                        dpg.add_button(label="Tipo de tarefa", callback=self.medido(self.ordenar_lista), width=120)
+
+        with dpg.handler_registry():
+            dpg.add_mouse_wheel_handler(callback=self.medido(self.rolar_roda))
+            dpg.add_key_press_handler(dpg.mvKey_F12, callback=self.alternar_metricas)
 
-                        dpg.add_button(label="Data de criação", callback=self.ordenar_lista, width=120)
+        # Janela de depuração das métricas, alternada com F12
+        with dpg.window(tag="MetricasJanela", label="Métricas", width=520, height=220, pos=(170, 170), show=False):
+            dpg.add_button(label="Exportar (Prometheus)", callback=self.exportar_metricas)
+            dpg.add_text("", tag="MetricasExportacao")
+            dpg.add_text("", tag="MetricasTexto")
 
-                        dpg.add_button(label="Tipo de tarefa", callback=self.ordenar_lista, width=120)
+        if self.carregamento is not None:
+            dpg.configure_item("BuscaInput", enabled=False)
+            dpg.configure_item("CalendarioButton", enabled=False)
+
+            for botao in BOTOES_EDICAO:
+                dpg.configure_item(botao, enabled=False)
 
         dpg.show_viewport()
         dpg.set_primary_window("PrimWindow", True)
-        dpg.start_dearpygui()
+        self.interface_ativa = True
+        self.atualizar_lista()
+
+        # Laço de renderização manual: enquanto houver tarefas a carregar, um lote é lido a cada quadro
+        while dpg.is_dearpygui_running():
+            if self.carregamento is not None:
+                self.carregar_proximo_lote()
+
+            if self.notificacoes:
+                self.exibir_notificacoes()
+
+            if self.avisos:
+                self.exibir_avisos()
+
+            if METRICAS.ativo:
+                METRICAS.cronometrar(dpg.render_dearpygui_frame, "notestation_quadro_segundos")
+                self.atualizar_metricas()
+            else:
+                dpg.render_dearpygui_frame()
+
+        self.interface_ativa = False
         dpg.destroy_context()
 
+        self.agendador.fechar()
+        self.persistencia.fechar()
+
     def visualizar_tarefa(self, Sender):
         """
         Exibe os detalhes de uma tarefa em uma janela popup quando o usuário clica em "Visualizar tarefa".
@@ -158,8 +369,10 @@ class TelaInicial:
         Atributos:
             - Sender: O objeto que enviou o sinal de clique.
         """
-        tarefa_titulo = dpg.get_value(dpg.get_item_drag_callback(Sender))
-        tarefa = self.organizador.get_tarefa(tarefa_titulo)
+        tarefa = self.tarefa_selecionada()
+
+        if tarefa is None:
+            return
 
         if dpg.does_item_exist("Visu"):
             dpg.set_value("VisuText", tarefa.exibir())
@@ -176,9 +389,13 @@ class TelaInicial:
         Atributos:
             - Sender: O objeto que enviou o sinal de clique.
         """
-        tarefa_titulo = dpg.get_value(dpg.get_item_drag_callback(Sender))
-        tarefa = self.organizador.get_tarefa(tarefa_titulo)
-        tarefa = self.organizador.checkTarefaDecorator(tarefa)
+        tarefa = self.tarefa_selecionada()
+
+        if tarefa is None:
+            return
+
+        tarefa = tarefa.base
+        self.id_em_edicao = tarefa.id
 
         if dpg.does_item_exist("Edit"):
             dpg.configure_item("att_titulo", default_value=tarefa.titulo)
@@ -193,11 +410,11 @@ class TelaInicial:
 
                 dpg.add_input_text(label="Descrição", default_value=tarefa.descricao, tag="att_descricao")
 
-                dpg.add_input_text(label="Lembrete", tag="att_lembrete")
+                dpg.add_input_text(label="Lembrete", tag="att_lembrete", hint="ex.: Reunião 10/5/2026 14:30")
 
                 dpg.add_date_picker(label="Prazo", tag="att_prazo")
 
-                dpg.add_button(label="Atualizar tarefa", callback=self.editar_tarefa, tag="AtualizarButton", drag_callback=self.listbox)
+                dpg.add_button(label="Atualizar tarefa", callback=self.medido(self.editar_tarefa), tag="AtualizarButton")
 
     def editar_tarefa(self, Sender):
         """
@@ -206,64 +423,514 @@ class TelaInicial:
         Atributos:
             - Sender: O objeto que enviou o sinal de clique.
         """
-        tarefa_titulo = dpg.get_value(dpg.get_item_drag_callback(Sender))
-        tarefa = self.organizador.get_tarefa(tarefa_titulo)
+        tarefa = self.organizador.get_tarefa_por_id(self.id_em_edicao)
+
+        if tarefa is None:
+            return
 
         titulo = dpg.get_value("att_titulo")
         descricao = dpg.get_value("att_descricao")
         lembrete = dpg.get_value("att_lembrete")
 
         prazo = dpg.get_value("att_prazo")
-        prazo_text = f'{prazo["month_day"]}/{prazo["month"] + 1}/{prazo["year"] + 1900}'
+        prazo_data = date(prazo["year"] + 1900, prazo["month"] + 1, prazo["month_day"])
 
-        self.organizador.edit_tarefa(tarefa, titulo, descricao, lembrete, prazo_text)
-
-        self.atualizar_lista()
+        self.organizador.edit_tarefa(tarefa, titulo, descricao, lembrete, prazo_data)
 
     def marcar_concluida(self, Sender):
         """
-        Marca uma tarefa como concluída e exibe uma mensagem em uma janela popup.
+        Marca as tarefas selecionadas como concluídas (em lote, se houver mais de uma) e exibe uma mensagem em uma
+        janela popup.
 
         Atributos:
             - Sender: O objeto que enviou o sinal de clique.
         """
-        tarefa_titulo = dpg.get_value(dpg.get_item_drag_callback(Sender))
-        tarefa = self.organizador.get_tarefa(tarefa_titulo)
+        tarefas = self.tarefas_selecionadas()
 
-        self.organizador.mark_tarefa(tarefa)
+        if not tarefas:
+            return
+
+        if len(tarefas) > 1:
+            self.organizador.mark_tarefas(tarefas)
+            mensagem = f'{len(tarefas)} tarefas concluídas!'
+        else:
+            self.organizador.mark_tarefa(tarefas[0])
+            mensagem = f'Tarefa {tarefas[0].base.titulo} concluída!'
 
         mark_popup = dpg.window(tag="Mark", label="Tarefa concluída", autosize=True)
         with mark_popup:
-            dpg.add_text(f'Tarefa {tarefa_titulo} concluída!')
+            dpg.add_text(mensagem)
     
     def atualizar_lista(self):
         """
-        Atualiza a lista de tarefas exibida na interface gráfica após modificações (adicionar, editar, excluir tarefas).
+        Atualiza as linhas visíveis da lista de tarefas (no máximo LINHAS_VISIVEIS) e o limite da barra de rolagem.
+        A gravação em disco é feita pela persistência, que observa o organizador.
         """
-        self.titulos = [self.organizador.checkTarefaDecorator(tarefa).titulo for tarefa in self.organizador.tarefas]
-        dpg.configure_item(self.listbox, items=self.titulos)
+        ids = self.linhas_exibicao()
+        maximo = max(0, len(ids) - LINHAS_VISIVEIS)
+        self.inicio = min(self.inicio, maximo)
 
-        tarefas_to_json = {}
-        count = 0
+        # O slider vertical cresce para cima, então o valor é o inverso do índice da primeira linha
+        dpg.configure_item("RolagemLista", max_value=maximo)
+        dpg.set_value("RolagemLista", maximo - self.inicio)
 
-        with open(self.dir, "w", encoding='UTF-8') as arquivo:
-            for tarefa in self.organizador.tarefas:
-                tarefa_json = json.dumps(
-                    tarefa,
-                    cls=TarefaEncoder
-                )
-                
-                tarefa_json = json.loads(tarefa_json)
+        for linha in range(LINHAS_VISIVEIS):
+            indice = self.inicio + linha
+            tarefa_id = ids[indice] if indice < len(ids) else None
+            self.ids_visiveis[linha] = tarefa_id
+
+            if tarefa_id is None:
+                dpg.configure_item(f"LinhaTarefa{linha}", show=False)
+                continue
+
+            dpg.configure_item(f"LinhaTarefa{linha}", label=self.organizador.get_tarefa_por_id(tarefa_id).base.titulo, show=True)
+            dpg.set_value(f"LinhaTarefa{linha}", tarefa_id in self.selecionadas)
 
-                tarefas_to_json[count] = tarefa_json
-                count += 1
+    def atualizar_linha(self, tarefa_id: int):
+        """
+        Atualiza apenas a linha que exibe uma tarefa, caso ela esteja visível.
+
+        Atributos:
+            - tarefa_id (int): O ID da tarefa alterada.
+        """
+        if tarefa_id not in self.ids_visiveis:
+            return
+
+        linha = self.ids_visiveis.index(tarefa_id)
+        dpg.configure_item(f"LinhaTarefa{linha}", label=self.organizador.get_tarefa_por_id(tarefa_id).base.titulo)
+
+    def linhas_exibicao(self) -> list:
+        """
+        Obtém os IDs das tarefas na ordem de exibição, sem copiar a lista: os resultados da busca ativa, a própria
+        visão ordenada do organizador ou a lista de IDs na ordem original mantida pela interface.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas, na ordem de exibição.
+        """
+        if self.consulta:
+            return self.resultados
+
+        if self.organizador.ordem is None:
+            return self.ids_originais
+
+        return self.organizador.visao(self.organizador.ordem)
+
+    def reconstruir_lista(self):
+        """
+        Reconstrói a lista de IDs na ordem original a partir do organizador (usado durante o carregamento).
+        """
+        self.ids_originais = list(self.organizador.tarefas_por_id)
+        self.sequencia = {tarefa_id: posicao for posicao, tarefa_id in enumerate(self.ids_originais)}
+        self.proxima_sequencia = len(self.ids_originais)
+
+    def acrescentar_original(self, tarefa_id: int):
+        """
+        Acrescenta uma tarefa ao fim da lista de IDs na ordem original.
+
+        Atributos:
+            - tarefa_id (int): O ID da tarefa.
+        """
+        self.sequencia[tarefa_id] = self.proxima_sequencia
+        self.proxima_sequencia += 1
+        self.ids_originais.append(tarefa_id)
+
+    def remover_original(self, tarefa_id: int):
+        """
+        Remove uma tarefa da lista de IDs na ordem original, localizando-a por busca binária pelo seu número de ordem.
+
+        Atributos:
+            - tarefa_id (int): O ID da tarefa.
+        """
+        indice = bisect_left(self.ids_originais, self.sequencia[tarefa_id], key=self.sequencia.__getitem__)
+        del self.ids_originais[indice]
+        del self.sequencia[tarefa_id]
+
+    def selecionar_linha(self, Sender, app_data):
+        """
+        Seleciona a tarefa exibida na linha clicada (com o botão esquerdo ou direito do mouse). Com o Ctrl
+        pressionado, o clique esquerdo acrescenta a tarefa à seleção (ou a retira), em vez de substituí-la.
+
+        Atributos:
+            - Sender: O handler que recebeu o clique.
+            - app_data: O botão do mouse e a linha clicada.
+        """
+        linha = dpg.get_item_user_data(app_data[1])
+        tarefa_id = self.ids_visiveis[linha]
+
+        if app_data[0] == dpg.mvMouseButton_Left and dpg.is_key_down(dpg.mvKey_Control):
+            self.selecionadas ^= {tarefa_id}
+        elif app_data[0] == dpg.mvMouseButton_Left or tarefa_id not in self.selecionadas:
+            # O clique direito sobre uma tarefa já selecionada mantém a seleção, para as ações em lote do menu
+            self.selecionadas = {tarefa_id}
+
+        self.selecionada = tarefa_id
+
+        for linha_visivel, id_visivel in enumerate(self.ids_visiveis):
+            if id_visivel is not None:
+                dpg.set_value(f"LinhaTarefa{linha_visivel}", id_visivel in self.selecionadas)
+
+    def tarefa_selecionada(self):
+        """
+        Obtém a tarefa selecionada na lista.
+
+        Retorna:
+            - Tarefa or None: A tarefa selecionada, ou None se nenhuma tarefa estiver selecionada (ou se ela tiver sido excluída).
+        """
+        if self.selecionada is None:
+            return None
+
+        return self.organizador.get_tarefa_por_id(self.selecionada)
+
+    def tarefas_selecionadas(self) -> list:
+        """
+        Obtém as tarefas selecionadas na lista que ainda pertencem ao organizador.
+
+        Retorna:
+            - List[Tarefa]: As tarefas selecionadas.
+        """
+        tarefas = (self.organizador.get_tarefa_por_id(tarefa_id) for tarefa_id in self.selecionadas)
+        return [tarefa for tarefa in tarefas if tarefa is not None]
+
+    def selecionar_tudo(self):
+        """
+        Seleciona todas as tarefas exibidas na lista (ou todos os resultados da busca ativa), para as ações em lote.
+        """
+        self.selecionadas = set(self.linhas_exibicao())
+        self.atualizar_lista()
+
+    def rolar_lista(self, Sender, app_data):
+        """
+        Rola a lista de tarefas de acordo com a barra de rolagem.
+
+        Atributos:
+            - Sender: A barra de rolagem.
+            - app_data: O valor da barra de rolagem.
+        """
+        maximo = max(0, len(self.linhas_exibicao()) - LINHAS_VISIVEIS)
+        self.inicio = maximo - app_data
+        self.atualizar_lista()
+
+    def rolar_roda(self, Sender, app_data):
+        """
+        Rola a lista de tarefas com a roda do mouse, quando o cursor estiver sobre a lista.
+
+        Atributos:
+            - Sender: O handler da roda do mouse.
+            - app_data: O deslocamento da roda (positivo para cima).
+        """
+        if not dpg.is_item_hovered("ListaTarefas"):
+            return
+
+        self.inicio = max(0, self.inicio - int(app_data) * LINHAS_POR_ROLAGEM)
+        self.atualizar_lista()
+
+    def buscar(self, Sender, app_data):
+        """
+        Filtra a lista de tarefas pelo texto digitado na caixa de busca. Com a caixa vazia, a lista completa volta a ser exibida.
 
-            json.dump(
-                tarefas_to_json,
-                arquivo,
-                ensure_ascii=False
-            )
+        Atributos:
+            - Sender: A caixa de busca.
+            - app_data: O texto digitado.
+        """
+        self.consulta = app_data.strip()
+        self.inicio = 0
+        self.atualizar_busca()
+        self.atualizar_lista()
+
+    def atualizar_busca(self):
+        """
+        Refaz a busca ativa no índice (as tarefas criadas, editadas ou excluídas podem entrar ou sair dos resultados).
+        """
+        self.resultados = self.indice.buscar(self.consulta) if self.consulta else []
+
+        if self.interface_ativa:
+            dpg.configure_item("BuscaAproximada", show=bool(self.consulta) and self.indice.aproximada)
+
+    def busca_afetada(self, comando) -> bool:
+        """
+        Verifica se um comando pode alterar os resultados da busca ativa: se alterou o texto de uma tarefa exibida
+        nos resultados ou de uma tarefa que passou a corresponder à busca.
+
+        Atributos:
+            - comando (TarefaCommand): O comando executado ou desfeito.
+
+        Retorna:
+            - bool: True se a busca precisa ser refeita.
+        """
+        if not self.consulta or isinstance(comando, (MarcarConcluidaCommand, OrdenarListaTarefasCommand)):
+            return False
+
+        tarefas = comando.tarefas_afetadas()
+
+        if tarefas is None:
+            return True
+
+        resultados = set(self.resultados)
+        return any(tarefa.base.id in resultados or self.indice.corresponde(self.consulta, tarefa.base.id) for tarefa in tarefas)
+
+    def comando_executado(self, comando):
+        """
+        Ajusta a lista de IDs e as linhas visíveis após a execução de um comando no organizador.
+
+        Atributos:
+            - comando (TarefaCommand): O comando executado.
+        """
+        self.atualizar_calendario()
+        afetada = self.busca_afetada(comando)
+
+        if isinstance(comando, LoteCommand):
+            # Um lote pode alterar muitas tarefas; a lista é reconstruída uma única vez
+            self.reconstruir_lista()
+        elif isinstance(comando, CriarTarefaCommand):
+            self.acrescentar_original(self.organizador.get_id(comando.tarefa))
+        elif isinstance(comando, ExcluirTarefaCommand):
+            self.remover_original(self.organizador.get_id(comando.tarefa))
+        elif isinstance(comando, (EditarTarefaCommand, MarcarConcluidaCommand)) and not afetada and (self.consulta or self.organizador.ordem != "Título"):
+            # A tarefa não mudou de posição; apenas a sua linha é atualizada
+            if self.interface_ativa:
+                self.atualizar_linha(self.organizador.get_id(comando.tarefa))
+            return
+        elif not isinstance(comando, (EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand)):
+            self.reconstruir_lista()
+
+        if afetada:
+            self.atualizar_busca()
+
+        if self.interface_ativa:
+            self.atualizar_lista()
+
+    def comando_desfeito(self, comando):
+        """
+        Ajusta a lista de IDs e as linhas visíveis após um comando ser desfeito no organizador.
+
+        Atributos:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        self.atualizar_calendario()
+        afetada = self.busca_afetada(comando)
+
+        if isinstance(comando, LoteCommand):
+            self.reconstruir_lista()
+        elif isinstance(comando, CriarTarefaCommand):
+            self.remover_original(self.organizador.get_id(comando.tarefa))
+        elif isinstance(comando, ExcluirTarefaCommand):
+            # Desfazer uma exclusão devolve a tarefa ao fim da ordem original, como no organizador
+            self.acrescentar_original(self.organizador.get_id(comando.tarefa))
+        elif not isinstance(comando, (EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand)):
+            self.reconstruir_lista()
+
+        if afetada:
+            self.atualizar_busca()
+
+        if self.interface_ativa:
+            self.atualizar_lista()
         
+    def exibir_notificacoes(self):
+        """
+        Exibe, em uma janela, as notificações de lembretes e prazos recebidas do agendador desde o último quadro.
+        Uma janela anterior ainda aberta é substituída pela nova.
+        """
+        notificacoes = []
+
+        while self.notificacoes:
+            notificacoes.append(self.notificacoes.popleft())
+
+        if dpg.does_item_exist("Notificacoes"):
+            dpg.delete_item("Notificacoes")
+
+        with dpg.window(tag="Notificacoes", label="Lembretes", autosize=True):
+            for notificacao in notificacoes[:LIMITE_NOTIFICACOES]:
+                dpg.add_text(notificacao.exibir())
+
+            if len(notificacoes) > LIMITE_NOTIFICACOES:
+                dpg.add_text(f'... e mais {len(notificacoes) - LIMITE_NOTIFICACOES} lembretes')
+
+    def exibir_avisos(self):
+        """
+        Exibe, em uma janela, os avisos recebidos desde o último quadro. Uma janela anterior ainda aberta é
+        substituída pela nova.
+        """
+        avisos = []
+
+        while self.avisos:
+            avisos.append(self.avisos.popleft())
+
+        if dpg.does_item_exist("Avisos"):
+            dpg.delete_item("Avisos")
+
+        with dpg.window(tag="Avisos", label="Avisos", autosize=True):
+            for aviso in avisos[-LIMITE_NOTIFICACOES:]:
+                dpg.add_text(aviso)
+
+    def medido(self, funcao):
+        """
+        Envolve um callback da interface para que a sua latência seja registrada nas métricas (quando ativadas).
+
+        Parâmetros:
+            - funcao (Callable): O método usado como callback.
+
+        Retorna:
+            - Callable: O callback envolvido.
+        """
+        return METRICAS.medir_callback(funcao, funcao.__name__)
+
+    def alternar_metricas(self):
+        """
+        Ativa ou desativa as métricas ao pressionar F12, exibindo ou ocultando a janela de depuração.
+        """
+        METRICAS.ativar(not METRICAS.ativo)
+        dpg.configure_item("MetricasJanela", show=METRICAS.ativo)
+        self.ultima_atualizacao_metricas = 0.0
+
+    def atualizar_metricas(self):
+        """
+        Atualiza o texto da janela de métricas, no máximo uma vez a cada INTERVALO_ATUALIZACAO_METRICAS segundos.
+        """
+        if time.monotonic() - self.ultima_atualizacao_metricas < INTERVALO_ATUALIZACAO_METRICAS:
+            return
+
+        dpg.set_value("MetricasTexto", "\n".join(METRICAS.resumo()) or "Nenhuma medida registrada")
+        self.ultima_atualizacao_metricas = time.monotonic()
+
+    def exportar_metricas(self):
+        """
+        Grava as métricas, no formato de texto do Prometheus, no arquivo "metricas.prom" da pasta das tarefas, e
+        informa o resultado na janela de métricas.
+        """
+        caminho = os.path.join(os.path.dirname(self.dir), "metricas.prom")
+
+        try:
+            METRICAS.gravar_prometheus(caminho)
+        except OSError as erro:
+            dpg.set_value("MetricasExportacao", f'Erro ao exportar as métricas: {erro}')
+            return
+
+        dpg.set_value("MetricasExportacao", f'Métricas exportadas para {caminho} às {time.strftime("%H:%M:%S")}')
+
+    def abrir_calendario(self):
+        """
+        Abre o calendário de prazos no mês atual (ou reexibe o calendário já criado).
+        """
+        hoje = date.today()
+        self.mes_calendario = (hoje.year, hoje.month)
+
+        if dpg.does_item_exist("Calendario"):
+            dpg.show_item("Calendario")
+            self.atualizar_calendario()
+            return
+
+        with dpg.window(tag="Calendario", label="Calendário", autosize=True, on_close=self.fechar_calendario):
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="<", user_data=-1, callback=self.medido(self.mudar_mes))
+                dpg.add_text("", tag="MesCalendario")
+                dpg.add_button(label=">", user_data=1, callback=self.medido(self.mudar_mes))
+                dpg.add_button(label="Atrasadas", tag="AtrasadasButton", callback=self.medido(self.exibir_atrasadas))
+
+            with dpg.group(horizontal=True):
+                for nome_dia in NOMES_DIAS_SEMANA:
+                    dpg.add_button(label=nome_dia, width=56, enabled=False)
+
+            # Os botões dos dias são criados uma única vez e reaproveitados a cada mês
+            for semana in range(DIAS_CALENDARIO // 7):
+                with dpg.group(horizontal=True):
+                    for dia_semana in range(7):
+                        dpg.add_button(label="", tag=f"DiaCalendario{semana * 7 + dia_semana}", width=56, callback=self.medido(self.selecionar_dia))
+
+            dpg.add_text("", tag="TarefasCalendario")
+
+        self.atualizar_calendario()
+
+    def fechar_calendario(self):
+        """
+        Marca o calendário como fechado, para que deixe de ser atualizado a cada comando.
+        """
+        self.mes_calendario = None
+        self.dia_calendario = None
+
+    def mudar_mes(self, Sender):
+        """
+        Avança ou volta um mês no calendário.
+
+        Atributos:
+            - Sender: O botão clicado ("<" ou ">"), cujo user_data é o deslocamento em meses.
+        """
+        ano, mes = self.mes_calendario
+        ano, mes = divmod(ano * 12 + mes - 1 + dpg.get_item_user_data(Sender), 12)
+        self.mes_calendario = (ano, mes + 1)
+        self.dia_calendario = None
+        self.atualizar_calendario()
+
+    def atualizar_calendario(self):
+        """
+        Atualiza os dias do mês exibido no calendário com a quantidade de tarefas pendentes de cada dia, consultando
+        o índice de prazos apenas para o mês visível. Com o calendário fechado, nada é feito.
+        """
+        if self.mes_calendario is None or not self.interface_ativa:
+            return
+
+        ano, mes = self.mes_calendario
+        primeiro_dia_semana, dias_mes = calendar.monthrange(ano, mes)
+        contagens = self.prazos.contagem_por_dia(date(ano, mes, 1), date(ano, mes, dias_mes))
+        hoje = date.today()
+
+        dpg.set_value("MesCalendario", f'{NOMES_MESES[mes - 1]} de {ano}')
+
+        for posicao in range(DIAS_CALENDARIO):
+            numero = posicao - primeiro_dia_semana + 1
+
+            if not 1 <= numero <= dias_mes:
+                dpg.configure_item(f"DiaCalendario{posicao}", label="", enabled=False, user_data=None)
+                continue
+
+            dia = date(ano, mes, numero)
+            quantidade = contagens.get(dia, 0)
+            rotulo = f'{numero} ({quantidade})' if quantidade else str(numero)
+
+            if dia == hoje:
+                rotulo = f'[{rotulo}]'
+
+            dpg.configure_item(f"DiaCalendario{posicao}", label=rotulo, enabled=True, user_data=dia)
+
+        if self.dia_calendario is not None:
+            self.listar_tarefas_calendario(f'Prazo em {self.dia_calendario.day}/{self.dia_calendario.month}/{self.dia_calendario.year}', self.prazos.do_dia(self.dia_calendario))
+        else:
+            dpg.set_value("TarefasCalendario", "")
+
+    def selecionar_dia(self, Sender):
+        """
+        Lista as tarefas pendentes com prazo no dia clicado do calendário.
+
+        Atributos:
+            - Sender: O botão do dia clicado, cujo user_data é a data.
+        """
+        self.dia_calendario = dpg.get_item_user_data(Sender)
+
+        if self.dia_calendario is not None:
+            self.atualizar_calendario()
+
+    def exibir_atrasadas(self):
+        """
+        Lista, no calendário, as tarefas pendentes cujo prazo já passou.
+        """
+        self.dia_calendario = None
+        self.listar_tarefas_calendario("Atrasadas", self.prazos.atrasadas())
+
+    def listar_tarefas_calendario(self, cabecalho: str, ids: list):
+        """
+        Exibe, abaixo do calendário, os títulos de até LIMITE_NOTIFICACOES tarefas.
+
+        Parâmetros:
+            - cabecalho (str): O texto exibido antes dos títulos.
+            - ids (List[int]): Os IDs das tarefas.
+        """
+        linhas = [f'{cabecalho}: {len(ids)} tarefa(s)']
+        linhas.extend(self.organizador.get_tarefa_por_id(tarefa_id).base.titulo for tarefa_id in ids[:LIMITE_NOTIFICACOES])
+
+        if len(ids) > LIMITE_NOTIFICACOES:
+            linhas.append(f'... e mais {len(ids) - LIMITE_NOTIFICACOES}')
+
+        dpg.set_value("TarefasCalendario", "\n".join(linhas))
+
     def exibir_lembrete(self):
         """
         Exibe ou oculta o campo de lembrete dependendo do valor do checkbox "Lembrete".
@@ -280,7 +947,7 @@ class TelaInicial:
 
     def checar_tarefa(self, titulo):
         """
-        Verifica se o título da tarefa já existe na lista de títulos de tarefas exibida na interface gráfica.
+        Verifica se o título da tarefa já existe no índice de títulos do organizador.
 
         Atributos:
             - titulo (str): O título da tarefa a ser verificado.
@@ -288,11 +955,7 @@ class TelaInicial:
         Retorna:
             - bool: True se o título não existir, False caso contrário.
         """
-        for tar_titulo in self.titulos:
-            if tar_titulo == titulo:
-                    return False
-
-        return True
+        return not self.organizador.existe_titulo(titulo)
 
     def criar_tarefa_popup(self):
         """
@@ -306,14 +969,14 @@ class TelaInicial:
             dpg.add_input_text(label="Título", tag="tarefa_titulo")
             dpg.add_input_text(label="Descrição", tag="tarefa_descricao")
 
-            dpg.add_checkbox(label="Lembrete", tag="tarefa_lembrete_check", callback=self.exibir_lembrete)
-            dpg.add_input_text(tag="lembrete_input", show=False)
+            dpg.add_checkbox(label="Lembrete", tag="tarefa_lembrete_check", callback=self.medido(self.exibir_lembrete))
+            dpg.add_input_text(tag="lembrete_input", hint="ex.: Reunião 10/5/2026 14:30", show=False)
 
-            dpg.add_checkbox(label="Prazo", tag="tarefa_prazo_check", callback=self.exibir_prazo)
+            dpg.add_checkbox(label="Prazo", tag="tarefa_prazo_check", callback=self.medido(self.exibir_prazo))
 
             dpg.add_date_picker(tag="prazo_input", show=False)
 
-            dpg.add_button(label="Adicionar", tag="adicionar_button", callback=self.criar_tarefa)
+            dpg.add_button(label="Adicionar", tag="adicionar_button", callback=self.medido(self.criar_tarefa))
 
     def criar_tarefa(self):
         """
@@ -344,40 +1007,46 @@ class TelaInicial:
             if prazo_check:
 
                 prazo = dpg.get_value("prazo_input")
-                prazo_text = f'{prazo["month_day"]}/{prazo["month"] + 1}/{prazo["year"] + 1900}'
+                prazo_data = date(prazo["year"] + 1900, prazo["month"] + 1, prazo["month_day"])
                 
-                tarefa = TarefaComPrazo(tarefa, prazo_text)
+                tarefa = TarefaComPrazo(tarefa, prazo_data)
 
             self.organizador.add_tarefa(tarefa)
-            self.atualizar_lista()
             return
 
     def excluir_tarefa(self, Sender):
         """
-        Exclui uma tarefa selecionada na lista quando o usuário clica em "Excluir tarefa".
+        Exclui as tarefas selecionadas na lista (em lote, se houver mais de uma) quando o usuário clica em
+        "Excluir tarefa".
 
         Atributos:
             - Sender: O objeto que enviou o sinal de clique.
         """
-        item_titulo = dpg.get_value(dpg.get_item_drag_callback(Sender))
-
-        for tarefa in self.organizador.tarefas:
-            tarefa_ch = self.organizador.checkTarefaDecorator(tarefa)
-
-            if tarefa_ch.titulo == item_titulo:
-                self.organizador.del_tarefa(tarefa)
-                print(f'Tarefa removida')
-                self.atualizar_lista()
-                break
+        tarefas = self.tarefas_selecionadas()
+
+        if len(tarefas) > 1:
+            self.organizador.del_tarefas(tarefas)
+            print(f'{len(tarefas)} tarefas removidas')
+        elif tarefas:
+            self.organizador.del_tarefa(tarefas[0])
+            print(f'Tarefa removida')
         else:
             print(f'Tarefa não encontrada')
 
+        self.selecionada = None
+        self.selecionadas = set()
+
     def desfazer_operacao(self):
         """
         Desfaz a última operação realizada pelo usuário (adicionar, editar, excluir, concluir e ordenar).
         """
         self.organizador.desfazer()
-        self.atualizar_lista()
+
+    def refazer_operacao(self):
+        """
+        Refaz a última operação desfeita pelo usuário.
+        """
+        self.organizador.refazer()
 
     def ordenar_lista(self, Sender):
         """
@@ -389,5 +1058,3 @@ class TelaInicial:
         filtro = dpg.get_item_configuration(Sender)['label']
         
         self.organizador.sort_tarefas(filtro)
-
-        self.atualizar_lista()
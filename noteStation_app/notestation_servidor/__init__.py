@@ -0,0 +1,17 @@
+"""
+Módulo contendo o servidor headless (sem interface gráfica) do aplicativo "NoteStation".
+
+Classes:
+    - ServidorTarefas: Servidor asyncio que expõe as operações do organizador de tarefas através de uma API JSON.
+    - ClienteTarefas: Cliente assíncrono da API, usado por scripts e geradores de carga.
+    - ErroRequisicao: Exceção lançada quando uma requisição não pode ser atendida.
+
+Módulos importados:
+    - ServidorTarefas, ClienteTarefas, ErroRequisicao: Importados do módulo "notestation_servidor.servidor_api".
+"""
+
+from notestation_servidor.servidor_api import (
+    ServidorTarefas,
+    ClienteTarefas,
+    ErroRequisicao
+)
@@ -0,0 +1,687 @@
+"""
+Módulo contendo o servidor sem interface gráfica (headless) do noteStation.
+
+Este módulo expõe as operações do TarefaOrganizador e das fábricas de tarefas através de uma API JSON servida com
+asyncio, por TCP ou por um socket Unix, para que scripts e ferramentas de automação não dependam da interface gráfica.
+
+Classes:
+    - ErroRequisicao: Exceção lançada quando uma requisição é inválida (operação desconhecida, tarefa inexistente etc.).
+    - ServidorTarefas: Servidor que carrega as tarefas, executa as requisições no organizador e atende os clientes.
+    - ClienteTarefas: Cliente assíncrono simples do protocolo, usado por scripts e geradores de carga.
+
+Funções:
+    - tarefa_resposta(tarefa): Converte uma tarefa no dicionário enviado nas respostas.
+    - campo_texto(requisicao, campo, obrigatorio): Obtém um campo de texto de uma requisição, verificando o seu tipo.
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo que permite trabalhar com dados JSON (JavaScript Object Notation).
+    - asyncio: Módulo da biblioteca padrão para E/S assíncrona, usado para atender vários clientes simultaneamente.
+    - islice: Função do módulo itertools usada para paginar as consultas sem copiar a lista de tarefas.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, o organizador, as fábricas, os comandos e o índice de busca.
+    - gerenciamento_arquivos: Módulo contendo as estratégias de persistência e o TarefaEncoder.
+
+Protocolo:
+    - Cada requisição é um objeto JSON em uma linha (NDJSON) e recebe exatamente uma linha de resposta, na mesma
+      ordem. Um cliente pode enviar várias linhas sem esperar as respostas (pipelining).
+    - A requisição informa a operação em "op" e pode informar um identificador em "ref", devolvido na resposta.
+      As respostas têm "ok": true e os dados da operação, ou "ok": false e a mensagem em "erro".
+    - Uma lista JSON em uma linha (ou a operação "lote" com a lista em "operacoes") é um lote: as operações são
+      executadas em sequência e a resposta traz a lista de respostas em "resultados". Um erro em uma operação do
+      lote não interrompe as seguintes.
+    - Com "transacao": true, a operação "lote" é executada em uma transação do organizador: ocupa uma única entrada
+      do histórico de desfazer, é gravada de uma só vez e, se alguma operação falhar, todo o lote é desfeito. Um
+      lote em transação não pode conter "desfazer" nem "refazer".
+
+Operações:
+    - criar: "titulo", "descricao", "prioridade" (bool), "lembrete" e "prazo" ("dd/mm/aaaa") opcionais -> "id".
+    - editar: "id" e os campos a alterar ("titulo", "descricao", "lembrete", "prazo").
+    - excluir, concluir, obter: "id".
+    - ordenar: "filtro" ("Título", "Data de criação" ou "Tipo de tarefa").
+    - desfazer, refazer: sem parâmetros.
+    - consultar: "busca", "ordem", "concluida", "inicio" e "limite" opcionais -> "total" e "tarefas".
+    - metricas: "formato" opcional ("prometheus") -> os histogramas e contadores de METRICAS em "metricas" (ou o
+      texto no formato do Prometheus, em "texto").
+
+Detalhes:
+    - Todas as requisições são executadas na thread do laço de eventos, uma de cada vez, de modo que o organizador
+      nunca é acessado concorrentemente. A persistência observa o organizador como na interface gráfica e grava em
+      segundo plano (GravadorSegundoPlano), de modo que nenhuma requisição espera pelo disco.
+"""
+
+import sys
+import os
+import json
+import asyncio
+from itertools import islice
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import Tarefa, CHAVES_ORDENACAO, converter_prazo
+from gerenciamento_arquivos import *
+
+LIMITE_CONSULTA = 100
+
+# Quantidade de bytes aguardando envio a partir da qual o servidor espera o cliente ler as respostas
+LIMITE_BUFFER_ESCRITA = 64 * 1024
+
+# Tamanho máximo de uma linha de requisição (um lote grande ocupa uma única linha)
+LIMITE_LINHA = 64 * 1024 * 1024
+
+CODIFICADOR = TarefaEncoder()
+
+
+class ErroRequisicao(Exception):
+    """
+    Exceção lançada quando uma requisição não pode ser atendida. A mensagem é enviada ao cliente em "erro".
+    """
+    pass
+
+
+def tarefa_resposta(tarefa: Tarefa) -> dict:
+    """
+    Converte uma tarefa no dicionário enviado nas respostas: o mesmo formato do arquivo JSON, acrescido do ID.
+
+    Parâmetros:
+        - tarefa (Tarefa): A tarefa a ser convertida.
+
+    Retorna:
+        - dict: O dicionário da tarefa.
+    """
+    resposta = CODIFICADOR.default(tarefa)
+    resposta["id"] = tarefa.base.id
+
+    return resposta
+
+
+def campo_texto(requisicao: dict, campo: str, obrigatorio: bool = False):
+    """
+    Obtém um campo de texto de uma requisição. Os campos são verificados antes de chegar ao organizador, para que um
+    valor de outro tipo seja recusado com um erro da requisição, e não gravado e indexado.
+
+    Parâmetros:
+        - requisicao (dict): A requisição.
+        - campo (str): O nome do campo.
+        - obrigatorio (bool): Se True, o campo não pode estar ausente nem vazio.
+
+    Retorna:
+        - str or None: O valor do campo, ou None se ele estiver ausente.
+    """
+    valor = requisicao.get(campo)
+
+    if valor is None:
+        if obrigatorio:
+            raise ErroRequisicao(f'"{campo}" é obrigatório')
+
+        return None
+
+    if not isinstance(valor, str):
+        raise ErroRequisicao(f'"{campo}" deve ser um texto')
+
+    if obrigatorio and not valor:
+        raise ErroRequisicao(f'"{campo}" é obrigatório')
+
+    return valor
+
+
+class ServidorTarefas:
+    """
+    Classe que representa o servidor headless do noteStation.
+
+    Atributos:
+        - organizador (TarefaOrganizador): O organizador das tarefas.
+        - tPrioridade (TarefaComPrioridadeFactory): Fábrica das tarefas com prioridade.
+        - tTrabalho (TarefaTrabalhoFactory): Fábrica das tarefas de trabalho.
+        - persistencia (Persistencia): Estratégia de persistência que observa o organizador.
+        - indice (IndiceBusca): Índice de busca textual usado pela operação "consultar".
+        - operacoes (Dict[str, Callable[[dict], dict]]): Nome da operação -> método que a executa.
+        - servidores (List[asyncio.AbstractServer]): Os servidores TCP e Unix em execução.
+
+    Métodos:
+        - carregar()
+        - executar(requisicao)
+        - executar_lote(requisicoes)
+        - obter_tarefa(requisicao)
+        - criar(requisicao)
+        - editar(requisicao)
+        - excluir(requisicao)
+        - concluir(requisicao)
+        - ordenar(requisicao)
+        - desfazer(requisicao)
+        - refazer(requisicao)
+        - obter(requisicao)
+        - consultar(requisicao)
+        - metricas(requisicao)
+        - atender(leitor, escritor)
+        - iniciar(host, porta, caminho_unix)
+        - servir(host, porta, caminho_unix)
+        - fechar()
+    """
+    def __init__(self, dir: str, modo_diario: bool = True):
+        """
+        Construtor da classe ServidorTarefas.
+
+        Parâmetros:
+            - dir (str): O diretório do arquivo usado para armazenar as tarefas. Arquivos ".db" ou ".sqlite" usam a
+              persistência SQLite, arquivos ".nsb" o snapshot binário com diário (com os textos lidos sob demanda), diretórios ".fragmentos" a persistência em fragmentos; os demais, JSON (com diário, se modo_diario for True), como na interface gráfica.
+            - modo_diario (bool): Se True, as operações são anexadas a um diário em vez de reescrever o arquivo JSON.
+        """
+        self.organizador = TarefaOrganizador()
+        self.tPrioridade = TarefaComPrioridadeFactory()
+        self.tTrabalho = TarefaTrabalhoFactory()
+
+        if dir.endswith((".db", ".sqlite")):
+            self.persistencia = PersistenciaSQLite(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"))
+        elif dir.endswith(".fragmentos"):
+            self.persistencia = PersistenciaFragmentada(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"))
+        elif dir.endswith(".nsb"):
+            self.persistencia = PersistenciaBinaria(dir, dir_json=os.path.join(os.path.dirname(dir), "lista_tarefas.json"), textos_sob_demanda=True)
+        elif modo_diario:
+            self.persistencia = PersistenciaDiario(dir)
+        else:
+            self.persistencia = PersistenciaJson(dir)
+
+        self.indice = IndiceBusca(self.organizador)
+        self.servidores = []
+
+        self.operacoes = {
+            "criar": self.criar,
+            "editar": self.editar,
+            "excluir": self.excluir,
+            "concluir": self.concluir,
+            "ordenar": self.ordenar,
+            "desfazer": self.desfazer,
+            "refazer": self.refazer,
+            "obter": self.obter,
+            "consultar": self.consultar,
+            "metricas": self.metricas,
+            "lote": lambda requisicao: self.executar_lote(requisicao.get("operacoes", []), bool(requisicao.get("transacao")))
+        }
+
+    def carregar(self):
+        """
+        Carrega todas as tarefas do arquivo e constrói o índice de busca.
+        """
+        self.persistencia.carregar(self.organizador)
+        self.indice.construir()
+
+    def executar(self, requisicao) -> dict:
+        """
+        Executa uma requisição (ou um lote, se for uma lista) e monta a sua resposta. Nunca lança exceções.
+
+        Parâmetros:
+            - requisicao (dict or list): A requisição decodificada.
+
+        Retorna:
+            - dict: A resposta da requisição.
+        """
+        if isinstance(requisicao, list):
+            return self.executar_lote(requisicao)
+
+        if not isinstance(requisicao, dict):
+            return {"ok": False, "erro": "A requisição deve ser um objeto JSON"}
+
+        try:
+            operacao = self.operacoes.get(requisicao.get("op")) if isinstance(requisicao.get("op"), str) else None
+
+            if operacao is None:
+                raise ErroRequisicao(f'Operação desconhecida: {requisicao.get("op")}')
+
+            if METRICAS.ativo:
+                resposta = METRICAS.cronometrar(lambda: operacao(requisicao), "notestation_requisicao_segundos", op=requisicao["op"])
+            else:
+                resposta = operacao(requisicao)
+
+            resposta["ok"] = True
+        except (ErroRequisicao, ValueError, TypeError) as erro:
+            resposta = {"ok": False, "erro": str(erro)}
+        except Exception as erro:
+            # Uma falha inesperada é respondida como erro, para não derrubar a conexão do cliente
+            resposta = {"ok": False, "erro": f'Erro interno: {erro.__class__.__name__}: {erro}'}
+
+        if "ref" in requisicao:
+            resposta["ref"] = requisicao["ref"]
+
+        return resposta
+
+    def executar_lote(self, requisicoes: list, transacao: bool = False) -> dict:
+        """
+        Executa uma lista de requisições em sequência.
+
+        Parâmetros:
+            - requisicoes (List[dict]): As requisições do lote.
+            - transacao (bool): Se True, o lote é executado em uma transação do organizador e desfeito por inteiro
+              se alguma requisição falhar.
+
+        Retorna:
+            - dict: A resposta do lote, com a resposta de cada requisição em "resultados".
+        """
+        if not isinstance(requisicoes, list):
+            raise ErroRequisicao('"operacoes" deve ser uma lista')
+
+        if not transacao:
+            return {"ok": True, "resultados": [self.executar(requisicao) for requisicao in requisicoes]}
+
+        with self.organizador.transacao():
+            resultados = [self.executar(requisicao) for requisicao in requisicoes]
+
+            for posicao, resultado in enumerate(resultados):
+                if not resultado["ok"]:
+                    # A exceção faz a transação desfazer as operações já executadas
+                    raise ErroRequisicao(f'A operação {posicao} do lote falhou ({resultado["erro"]}); nenhuma operação foi aplicada')
+
+        return {"ok": True, "resultados": resultados}
+
+    def obter_tarefa(self, requisicao: dict) -> Tarefa:
+        """
+        Obtém a tarefa indicada pelo "id" de uma requisição.
+
+        Parâmetros:
+            - requisicao (dict): A requisição.
+
+        Retorna:
+            - Tarefa: A tarefa encontrada.
+        """
+        tarefa_id = requisicao.get("id")
+
+        if not isinstance(tarefa_id, int) or isinstance(tarefa_id, bool):
+            raise ErroRequisicao('"id" deve ser um número inteiro')
+
+        tarefa = self.organizador.get_tarefa_por_id(tarefa_id)
+
+        if tarefa is None:
+            raise ErroRequisicao(f'Tarefa não encontrada: {requisicao.get("id")}')
+
+        return tarefa
+
+    def criar(self, requisicao: dict) -> dict:
+        """
+        Cria uma tarefa com as fábricas e a adiciona ao organizador, como a janela de criação da interface.
+
+        Parâmetros:
+            - requisicao (dict): "titulo", "descricao", "prioridade", "lembrete" e "prazo".
+
+        Retorna:
+            - dict: O ID da tarefa criada em "id".
+        """
+        titulo = campo_texto(requisicao, "titulo", obrigatorio=True)
+        descricao = campo_texto(requisicao, "descricao") or ""
+        lembrete = campo_texto(requisicao, "lembrete")
+
+        if self.organizador.existe_titulo(titulo):
+            raise ErroRequisicao(f'Já existe uma tarefa com o título: {titulo}')
+
+        prazo = converter_prazo(campo_texto(requisicao, "prazo"))
+
+        if requisicao.get("prioridade"):
+            tarefa = self.tPrioridade.criar_tarefa(titulo, descricao)
+        else:
+            tarefa = self.tTrabalho.criar_tarefa(titulo, descricao)
+
+        if lembrete is not None:
+            tarefa = TarefaComLembrete(tarefa, lembrete)
+
+        if prazo is not None:
+            tarefa = TarefaComPrazo(tarefa, prazo)
+
+        self.organizador.add_tarefa(tarefa)
+
+        return {"id": tarefa.base.id}
+
+    def editar(self, requisicao: dict) -> dict:
+        """
+        Edita uma tarefa. Os campos ausentes (ou vazios) são mantidos, como no EditarTarefaCommand.
+
+        Parâmetros:
+            - requisicao (dict): "id" e os campos "titulo", "descricao", "lembrete" e "prazo".
+
+        Retorna:
+            - dict: A tarefa editada em "tarefa".
+        """
+        tarefa = self.obter_tarefa(requisicao)
+        titulo = campo_texto(requisicao, "titulo")
+        descricao = campo_texto(requisicao, "descricao")
+        lembrete = campo_texto(requisicao, "lembrete")
+
+        if titulo and titulo != tarefa.base.titulo and self.organizador.existe_titulo(titulo):
+            raise ErroRequisicao(f'Já existe uma tarefa com o título: {titulo}')
+
+        prazo = converter_prazo(campo_texto(requisicao, "prazo"))
+        self.organizador.edit_tarefa(tarefa, titulo, descricao, lembrete, prazo)
+
+        return {"tarefa": tarefa_resposta(tarefa)}
+
+    def excluir(self, requisicao: dict) -> dict:
+        """
+        Exclui uma tarefa.
+
+        Parâmetros:
+            - requisicao (dict): "id".
+
+        Retorna:
+            - dict: Resposta sem dados adicionais.
+        """
+        self.organizador.del_tarefa(self.obter_tarefa(requisicao))
+
+        return {}
+
+    def concluir(self, requisicao: dict) -> dict:
+        """
+        Marca uma tarefa como concluída.
+
+        Parâmetros:
+            - requisicao (dict): "id".
+
+        Retorna:
+            - dict: Resposta sem dados adicionais.
+        """
+        self.organizador.mark_tarefa(self.obter_tarefa(requisicao))
+
+        return {}
+
+    def ordenar(self, requisicao: dict) -> dict:
+        """
+        Ordena a lista de tarefas (operação que pode ser desfeita, como o botão "Ordenar").
+
+        Parâmetros:
+            - requisicao (dict): "filtro".
+
+        Retorna:
+            - dict: Resposta sem dados adicionais.
+        """
+        filtro = campo_texto(requisicao, "filtro")
+
+        if filtro not in CHAVES_ORDENACAO:
+            raise ErroRequisicao(f'Filtro de ordenação desconhecido: {filtro}')
+
+        self.organizador.sort_tarefas(filtro)
+
+        return {}
+
+    def desfazer(self, requisicao: dict) -> dict:
+        """
+        Desfaz a última operação.
+
+        Parâmetros:
+            - requisicao (dict): Sem parâmetros.
+
+        Retorna:
+            - dict: Se havia uma operação a desfazer, em "alterado".
+        """
+        if self.organizador.lote is not None:
+            raise ErroRequisicao('"desfazer" não pode ser usado em um lote com "transacao"')
+
+        alterado = bool(self.organizador.comandos)
+        self.organizador.desfazer()
+
+        return {"alterado": alterado}
+
+    def refazer(self, requisicao: dict) -> dict:
+        """
+        Refaz a última operação desfeita.
+
+        Parâmetros:
+            - requisicao (dict): Sem parâmetros.
+
+        Retorna:
+            - dict: Se havia uma operação a refazer, em "alterado".
+        """
+        if self.organizador.lote is not None:
+            raise ErroRequisicao('"refazer" não pode ser usado em um lote com "transacao"')
+
+        alterado = bool(self.organizador.desfeitos)
+        self.organizador.refazer()
+
+        return {"alterado": alterado}
+
+    def obter(self, requisicao: dict) -> dict:
+        """
+        Obtém uma tarefa pelo ID.
+
+        Parâmetros:
+            - requisicao (dict): "id".
+
+        Retorna:
+            - dict: A tarefa em "tarefa".
+        """
+        return {"tarefa": tarefa_resposta(self.obter_tarefa(requisicao))}
+
+    def consultar(self, requisicao: dict) -> dict:
+        """
+        Lista as tarefas, opcionalmente filtradas por uma busca textual e pela conclusão, com paginação.
+
+        Sem "busca", as tarefas seguem a ordem indicada em "ordem" (um filtro de ordenação) ou, na sua ausência, a
+        ordem exibida pelo organizador; com "busca", seguem a relevância. A ordem do organizador não é alterada.
+
+        Parâmetros:
+            - requisicao (dict): "busca", "ordem", "concluida" (bool), "inicio" e "limite".
+
+        Retorna:
+            - dict: A quantidade de tarefas que atendem aos filtros em "total" e a página pedida em "tarefas".
+        """
+        organizador = self.organizador
+        inicio = int(requisicao.get("inicio", 0))
+        limite = int(requisicao.get("limite", LIMITE_CONSULTA))
+        ordem = requisicao.get("ordem", organizador.ordem)
+        concluida = requisicao.get("concluida")
+
+        if inicio < 0 or limite < 0:
+            raise ErroRequisicao('"inicio" e "limite" não podem ser negativos')
+
+        busca = campo_texto(requisicao, "busca")
+        tarefas_por_id = organizador.tarefas_por_id
+
+        if busca:
+            # O total conta todas as tarefas encontradas; a página é obtida pela busca limitada, sem ordenar as demais
+            pontos = self.indice.pontuar_consulta(busca)
+            aceitar = None
+
+            if concluida is not None:
+                pontos = [tarefa_id for tarefa_id in pontos if tarefas_por_id[tarefa_id].base.concluida == concluida]
+                aceitar = lambda tarefa_id: tarefas_por_id[tarefa_id].base.concluida == concluida
+
+            pagina = self.indice.buscar(busca, inicio + limite, aceitar=aceitar, candidatos=None)[inicio:]
+            return {"total": len(pontos), "tarefas": [tarefa_resposta(tarefas_por_id[tarefa_id]) for tarefa_id in pagina]}
+
+        if ordem is None:
+            ids = organizador.tarefas_por_id
+        elif ordem in CHAVES_ORDENACAO:
+            ids = organizador.visao(ordem)
+        else:
+            raise ErroRequisicao(f'Filtro de ordenação desconhecido: {ordem}')
+
+        if concluida is None:
+            total = len(ids)
+            pagina = islice(ids, inicio, inicio + limite)
+        else:
+            filtrados = [tarefa_id for tarefa_id in ids if tarefas_por_id[tarefa_id].base.concluida == concluida]
+            total = len(filtrados)
+            pagina = filtrados[inicio:inicio + limite]
+
+        return {"total": total, "tarefas": [tarefa_resposta(tarefas_por_id[tarefa_id]) for tarefa_id in pagina]}
+
+    def metricas(self, requisicao: dict) -> dict:
+        """
+        Obtém as métricas do processo (vazias, a não ser que tenham sido ativadas com "--metricas").
+
+        Parâmetros:
+            - requisicao (dict): "formato" ("prometheus" para o texto do Prometheus).
+
+        Retorna:
+            - dict: As métricas em "metricas", ou o texto em "texto".
+        """
+        if requisicao.get("formato") == "prometheus":
+            return {"texto": METRICAS.exportar_prometheus()}
+
+        return {"metricas": METRICAS.consultar()}
+
+    async def atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Atende um cliente: lê as requisições linha a linha e escreve uma linha de resposta para cada uma.
+
+        Parâmetros:
+            - leitor (asyncio.StreamReader): O fluxo de leitura da conexão.
+            - escritor (asyncio.StreamWriter): O fluxo de escrita da conexão.
+        """
+        try:
+            while True:
+                linha = await leitor.readline()
+
+                if not linha:
+                    break
+
+                if not linha.strip():
+                    continue
+
+                try:
+                    resposta = self.executar(json.loads(linha))
+                except ValueError as erro:
+                    resposta = {"ok": False, "erro": f'JSON inválido: {erro}'}
+
+                escritor.write(json.dumps(resposta, ensure_ascii=False, separators=(',', ':')).encode('UTF-8') + b"\n")
+
+                # As respostas se acumulam no buffer enquanto o cliente envia requisições em sequência
+                if escritor.transport.get_write_buffer_size() > LIMITE_BUFFER_ESCRITA:
+                    await escritor.drain()
+
+            await escritor.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    def iniciar(self, host: str = None, porta: int = None, caminho_unix: str = None):
+        """
+        Carrega as tarefas e atende os clientes até o processo ser interrompido (Ctrl+C). As gravações pendentes
+        são descarregadas ao final.
+
+        Parâmetros:
+            - host (str or None): O endereço TCP a ser escutado.
+            - porta (int or None): A porta TCP a ser escutada (None para não escutar por TCP).
+            - caminho_unix (str or None): O caminho do socket Unix (None para não usar socket Unix).
+        """
+        self.carregar()
+        print(f'{len(self.organizador.tarefas_por_id)} tarefas carregadas; índice de busca construído em {self.indice.tempo_construcao * 1000:.1f} ms')
+
+        try:
+            asyncio.run(self.servir(host, porta, caminho_unix))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.fechar()
+
+    async def servir(self, host: str = None, porta: int = None, caminho_unix: str = None):
+        """
+        Abre os servidores TCP e/ou Unix e os mantém em execução.
+
+        Parâmetros:
+            - host (str or None): O endereço TCP a ser escutado.
+            - porta (int or None): A porta TCP a ser escutada (None para não escutar por TCP).
+            - caminho_unix (str or None): O caminho do socket Unix (None para não usar socket Unix).
+        """
+        if porta is None and caminho_unix is None:
+            raise ValueError("Informe uma porta TCP ou o caminho de um socket Unix")
+
+        if porta is not None:
+            self.servidores.append(await asyncio.start_server(self.atender, host, porta, limit=LIMITE_LINHA))
+            print(f'Servindo em {host or "0.0.0.0"}:{self.servidores[-1].sockets[0].getsockname()[1]}')
+
+        if caminho_unix is not None:
+            self.servidores.append(await asyncio.start_unix_server(self.atender, caminho_unix, limit=LIMITE_LINHA))
+            print(f'Servindo em {caminho_unix}')
+
+        await asyncio.gather(*(servidor.serve_forever() for servidor in self.servidores))
+
+    def fechar(self):
+        """
+        Descarrega as gravações pendentes e encerra a persistência.
+        """
+        self.persistencia.fechar()
+
+
+class ClienteTarefas:
+    """
+    Cliente assíncrono do protocolo do ServidorTarefas.
+
+    Atributos:
+        - leitor (asyncio.StreamReader): O fluxo de leitura da conexão.
+        - escritor (asyncio.StreamWriter): O fluxo de escrita da conexão.
+
+    Métodos:
+        - conectar(host, porta, caminho_unix)
+        - requisitar(requisicao)
+        - requisitar_varias(requisicoes)
+        - fechar()
+    """
+    def __init__(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Construtor da classe ClienteTarefas. Use ClienteTarefas.conectar para abrir a conexão.
+
+        Parâmetros:
+            - leitor (asyncio.StreamReader): O fluxo de leitura da conexão.
+            - escritor (asyncio.StreamWriter): O fluxo de escrita da conexão.
+        """
+        self.leitor = leitor
+        self.escritor = escritor
+
+    @classmethod
+    async def conectar(cls, host: str = "127.0.0.1", porta: int = None, caminho_unix: str = None):
+        """
+        Conecta-se a um ServidorTarefas por TCP ou por socket Unix.
+
+        Parâmetros:
+            - host (str): O endereço TCP do servidor.
+            - porta (int or None): A porta TCP do servidor.
+            - caminho_unix (str or None): O caminho do socket Unix (tem prioridade sobre a porta).
+
+        Retorna:
+            - ClienteTarefas: O cliente conectado.
+        """
+        if caminho_unix is not None:
+            leitor, escritor = await asyncio.open_unix_connection(caminho_unix, limit=LIMITE_LINHA)
+        else:
+            leitor, escritor = await asyncio.open_connection(host, porta, limit=LIMITE_LINHA)
+
+        return cls(leitor, escritor)
+
+    async def requisitar(self, requisicao) -> dict:
+        """
+        Envia uma requisição (ou um lote) e aguarda a resposta.
+
+        Parâmetros:
+            - requisicao (dict or list): A requisição.
+
+        Retorna:
+            - dict: A resposta do servidor.
+        """
+        return (await self.requisitar_varias([requisicao]))[0]
+
+    async def requisitar_varias(self, requisicoes: list) -> list:
+        """
+        Envia várias requisições de uma vez (pipelining) e aguarda todas as respostas.
+
+        Parâmetros:
+            - requisicoes (List[dict]): As requisições, cada uma enviada em sua própria linha.
+
+        Retorna:
+            - List[dict]: As respostas, na ordem das requisições.
+        """
+        self.escritor.write("".join(json.dumps(requisicao, ensure_ascii=False, separators=(',', ':')) + "\n" for requisicao in requisicoes).encode('UTF-8'))
+
+        # As respostas são lidas antes de esperar o envio terminar: com muitas requisições, o servidor só continua
+        # lendo depois que o cliente consumir as respostas já enviadas
+        respostas = [json.loads(await self.leitor.readline()) for _ in requisicoes]
+        await self.escritor.drain()
+
+        return respostas
+
+    async def fechar(self):
+        """
+        Encerra a conexão.
+        """
+        self.escritor.close()
+        await self.escritor.wait_closed()
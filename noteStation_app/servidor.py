@@ -0,0 +1,57 @@
+"""
+Módulo de Inicialização do Servidor Headless do NoteStation
+===========================================================
+
+Este módulo inicia o noteStation sem interface gráfica, atendendo a API JSON do ServidorTarefas por TCP e/ou por
+um socket Unix (ex.: "python servidor.py --porta 8765" ou "python servidor.py --unix /tmp/notestation.sock").
+
+Módulos importados:
+    - os: Módulo que fornece funções para interagir com o sistema operacional, usado para montar o caminho padrão do arquivo.
+    - argparse: Módulo da biblioteca padrão usado para ler os argumentos da linha de comando.
+
+    - notestation_servidor: Módulo contendo o ServidorTarefas.
+    - tarefa_classes: Módulo contendo o registro de métricas METRICAS, ativado com "--metricas".
+
+Constantes:
+    - PATH_FILE: Diretório padrão onde fica o arquivo da lista de tarefas (o mesmo da interface gráfica).
+
+Funções:
+    - main(): Lê os argumentos, carrega as tarefas e atende os clientes até o processo ser interrompido.
+"""
+
+import os
+import argparse
+
+from notestation_servidor import *
+from tarefa_classes import METRICAS
+
+PATH_FILE = os.path.join(os.path.expanduser('~'), 'Documents', 'noteStation')
+
+
+def main():
+    """
+    Lê os argumentos da linha de comando e inicia o servidor.
+    """
+    parser = argparse.ArgumentParser(description="Servidor headless do noteStation (API JSON, uma requisição por linha).")
+    parser.add_argument("--arquivo", default=os.path.join(PATH_FILE, 'lista_tarefas.json'), help="Arquivo da lista de tarefas (.json, .nsb, .db, .sqlite ou um diretório .fragmentos).")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço TCP a ser escutado.")
+    parser.add_argument("--porta", type=int, help="Porta TCP a ser escutada.")
+    parser.add_argument("--unix", help="Caminho do socket Unix a ser escutado.")
+    parser.add_argument("--sem-diario", action="store_true", help="Reescreve o arquivo JSON completo em vez de usar o diário.")
+    parser.add_argument("--metricas", action="store_true", help="Ativa as métricas de latência (consultadas pela operação \"metricas\").")
+    argumentos = parser.parse_args()
+
+    if argumentos.porta is None and argumentos.unix is None:
+        parser.error("informe --porta e/ou --unix")
+
+    if argumentos.metricas:
+        METRICAS.ativar()
+
+    os.makedirs(os.path.dirname(os.path.abspath(argumentos.arquivo)), exist_ok=True)
+
+    servidor = ServidorTarefas(argumentos.arquivo, modo_diario=not argumentos.sem_diario)
+    servidor.iniciar(argumentos.host, argumentos.porta, argumentos.unix)
+
+
+if __name__ == "__main__":
+    main()
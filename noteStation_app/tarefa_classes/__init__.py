@@ -6,7 +6,11 @@ Este módulo contém classes relacionadas a tarefas, organização de tarefas e
 Módulos importados:
     - tarefa_classes.tarefa: Módulo que contém as classes TarefaBase, TarefaComLembrete, TarefaComPrazo e TarefaOrganizador.
     - tarefa_classes.tarefa_factory: Módulo que contém as classes TarefaComPrioridadeFactory e TarefaTrabalhoFactory.
-    - tarefa_classes.tarefa_command: Módulo que contém as classes CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand e MarcarConcluidaCommand.
+    - tarefa_classes.tarefa_command: Módulo que contém as classes TarefaCommand, CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand e LoteCommand.
+    - tarefa_classes.indice_busca: Módulo que contém a classe IndiceBusca.
+    - tarefa_classes.indice_prazos: Módulo que contém a classe IndicePrazos.
+    - tarefa_classes.agendador: Módulo que contém as classes AgendadorLembretes e Notificacao.
+    - tarefa_classes.metricas: Módulo que contém a classe Metricas e o registro de métricas METRICAS.
 """
 
 from tarefa_classes.tarefa import (
@@ -22,8 +26,29 @@ from tarefa_classes.tarefa_factory import (
 )
 
 from tarefa_classes.tarefa_command import (
+    TarefaCommand,
     CriarTarefaCommand,
     ExcluirTarefaCommand,
     EditarTarefaCommand,
-    MarcarConcluidaCommand
-)
\ No newline at end of file
+    MarcarConcluidaCommand,
+    OrdenarListaTarefasCommand,
+    LoteCommand
+)
+
+from tarefa_classes.indice_busca import (
+    IndiceBusca
+)
+
+from tarefa_classes.indice_prazos import (
+    IndicePrazos
+)
+
+from tarefa_classes.agendador import (
+    AgendadorLembretes,
+    Notificacao
+)
+
+from tarefa_classes.metricas import (
+    Metricas,
+    METRICAS
+)
@@ -0,0 +1,477 @@
+"""
+Módulo contendo o agendador de lembretes e prazos das tarefas.
+
+Classes:
+    - Notificacao: Aviso de um lembrete ou prazo vencido, entregue ao destino do agendador.
+    - AgendadorLembretes: Fila de prioridade (heap) com os próximos lembretes e prazos das tarefas de um
+      TarefaOrganizador, atualizada a cada comando executado ou desfeito e servida por uma thread que só acorda no
+      próximo instante agendado.
+
+Funções:
+    - instante_lembrete(lembrete, prazo): Obtém a data e hora indicada no texto de um lembrete.
+    - instante_prazo(prazo): Obtém a data e hora em que o prazo de uma tarefa é avisado.
+    - imprimir_notificacoes(notificacoes): Destino padrão do agendador, que imprime as notificações.
+
+Módulos importados:
+    - re: Módulo de expressões regulares, usado para encontrar a data e a hora no texto dos lembretes.
+    - time: Módulo que fornece funções de medição de tempo, usado para obter o instante atual.
+    - heapq: Módulo que fornece filas de prioridade, usado para manter os instantes agendados.
+    - threading: Módulo que fornece threads e primitivas de sincronização, usado na thread do agendador.
+    - datetime: Módulo padrão do Python que fornece classes para manipulação de datas e horas.
+    - date: Classe do módulo datetime que representa uma data, usada para os prazos.
+    - NamedTuple: Classe do módulo typing usada para definir a Notificacao imutável.
+
+Detalhes:
+    - O lembrete é um texto livre. Quando ele contém uma data ("d/m/aaaa") e/ou uma hora ("HH:MM" ou "HHhMM"), a
+      tarefa é avisada nesse instante: sem hora, às HORARIO_PADRAO; sem data, no dia do prazo da tarefa. Lembretes
+      sem data nem hora reconhecíveis (ex.: "Levar o notebook") não são agendados. O prazo é avisado no próprio dia,
+      às HORARIO_PADRAO.
+    - Cada instante agendado é uma entrada do heap. Alterar ou remover um agendamento não reorganiza o heap: a
+      entrada antiga apenas é marcada como removida e descartada quando chega ao topo, e o heap é compactado quando
+      as entradas removidas passam da metade. Assim, criar, editar, concluir ou excluir uma tarefa custa O(log n).
+    - A thread do agendador espera na condição ("condicao") até o instante do topo do heap (ou indefinidamente, com o
+      heap vazio) e é acordada apenas quando um novo agendamento passa a ser o mais próximo. Nenhuma varredura
+      periódica das tarefas é feita.
+    - As notificações vencidas dentro de JANELA_LOTE segundos umas das outras são entregues juntas, em uma única
+      chamada ao destino, feita pela thread do agendador e fora da trava. Um destino de interface gráfica deve apenas
+      enfileirar as notificações e exibi-las na sua própria thread.
+    - Instantes que já passaram quando a tarefa é agendada (ex.: ao abrir o programa) não são avisados.
+"""
+
+import re
+import time
+import heapq
+import threading
+from datetime import datetime, date
+from typing import NamedTuple
+
+from tarefa_classes.tarefa import Tarefa, TarefaOrganizador, formatar_prazo
+from tarefa_classes.tarefa_command import CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand, LoteCommand
+
+DATA_LEMBRETE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+HORA_LEMBRETE = re.compile(r"\b(\d{1,2})[:h](\d{2})\b")
+
+# Horário dos avisos de prazo e dos lembretes que indicam apenas a data
+HORARIO_PADRAO = (9, 0)
+
+# Notificações vencidas dentro deste intervalo (em segundos) são entregues no mesmo lote
+JANELA_LOTE = 1.0
+
+# Espera máxima da thread, em segundos, para acompanhar mudanças no relógio do sistema
+ESPERA_MAXIMA = 60.0
+
+# Quantidade mínima de entradas removidas para que o heap seja compactado
+MINIMO_COMPACTACAO = 1024
+
+
+class Notificacao(NamedTuple):
+    """
+    Aviso de um lembrete ou prazo vencido.
+
+    Atributos:
+        - tarefa_id (int): O ID da tarefa.
+        - tipo (str): "lembrete" ou "prazo".
+        - titulo (str): O título da tarefa.
+        - texto (str): O texto do lembrete, ou o prazo no formato "d/m/aaaa".
+        - instante (datetime): A data e hora agendada.
+    """
+    tarefa_id: int
+    tipo: str
+    titulo: str
+    texto: str
+    instante: datetime
+
+    def exibir(self) -> str:
+        """
+        Formata a notificação para exibição.
+
+        Retorna:
+            - str: Uma string com o título da tarefa e o lembrete ou o prazo.
+        """
+        if self.tipo == "prazo":
+            return f'{self.titulo}: prazo em {self.texto}'
+
+        return f'{self.titulo}: {self.texto}'
+
+
+def instante_lembrete(lembrete: str, prazo: date = None) -> datetime:
+    """
+    Obtém a data e hora indicada no texto de um lembrete (ex.: "Reunião 10/5/2026 14:30").
+
+    Parâmetros:
+        - lembrete (str): O texto do lembrete.
+        - prazo (date or None): O prazo da tarefa, usado como data quando o lembrete indica apenas a hora.
+
+    Retorna:
+        - datetime or None: O instante do lembrete, ou None se o texto não indicar uma data (nem uma hora, em uma
+          tarefa com prazo) válida.
+    """
+    if not lembrete:
+        return None
+
+    data = DATA_LEMBRETE.search(lembrete)
+    hora = HORA_LEMBRETE.search(lembrete)
+
+    if data is None and (hora is None or prazo is None):
+        return None
+
+    horas, minutos = (int(hora.group(1)), int(hora.group(2))) if hora is not None else HORARIO_PADRAO
+
+    try:
+        if data is not None:
+            return datetime(int(data.group(3)), int(data.group(2)), int(data.group(1)), horas, minutos)
+
+        return datetime(prazo.year, prazo.month, prazo.day, horas, minutos)
+    except ValueError:
+        # Datas ou horas inexistentes (ex.: "31/2/2026" ou "25:00") não são agendadas
+        return None
+
+
+def instante_prazo(prazo: date) -> datetime:
+    """
+    Obtém a data e hora em que o prazo de uma tarefa é avisado (no próprio dia, às HORARIO_PADRAO).
+
+    Parâmetros:
+        - prazo (date or None): O prazo da tarefa.
+
+    Retorna:
+        - datetime or None: O instante do aviso, ou None se a tarefa não possuir prazo.
+    """
+    if prazo is None:
+        return None
+
+    return datetime(prazo.year, prazo.month, prazo.day, *HORARIO_PADRAO)
+
+
+def imprimir_notificacoes(notificacoes: list):
+    """
+    Destino padrão do agendador: imprime cada notificação de um lote.
+
+    Parâmetros:
+        - notificacoes (List[Notificacao]): As notificações vencidas.
+    """
+    for notificacao in notificacoes:
+        print(f'Lembrete: {notificacao.exibir()}')
+
+
+class AgendadorLembretes:
+    """
+    Agendador dos lembretes e prazos das tarefas de um TarefaOrganizador.
+
+    Atributos:
+        - organizador (TarefaOrganizador): O organizador cujas tarefas são agendadas.
+        - destino (Callable[[List[Notificacao]], None]): Função que recebe cada lote de notificações vencidas.
+        - fila (List[list]): Heap de entradas [instante (float), sequência, ID da tarefa, tipo, título, texto]; o ID
+          de uma entrada removida é None.
+        - agendados (Dict[Tuple[int, str], list]): A entrada atual de cada par (ID da tarefa, tipo).
+        - removidos (int): Quantidade de entradas removidas que ainda estão no heap.
+        - sequencia (int): Contador usado como desempate entre entradas com o mesmo instante.
+        - condicao (threading.Condition): Trava do heap, na qual a thread espera pelo próximo instante.
+        - thread (threading.Thread or None): A thread que entrega as notificações, ou None antes de "iniciar()".
+        - encerrado (bool): Indica que a thread deve terminar.
+
+    Métodos:
+        - construir()
+        - entradas_tarefa(tarefa_id, tarefa, agora, lembrete)
+        - agendar_tarefa(tarefa)
+        - remover_tarefa(tarefa_id)
+        - agendar(entrada)
+        - remover(tarefa_id, tipo)
+        - compactar()
+        - proximo_instante()
+        - retirar_vencidas(agora)
+        - iniciar()
+        - executar()
+        - fechar()
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+    """
+    def __init__(self, organizador: TarefaOrganizador, destino=imprimir_notificacoes):
+        """
+        Inicializa um agendador vazio; as tarefas já existentes são agendadas por "construir()".
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador cujas tarefas serão agendadas.
+            - destino (Callable[[List[Notificacao]], None]): Função que recebe cada lote de notificações vencidas.
+        """
+        self.organizador = organizador
+        self.destino = destino
+        self.fila = []
+        self.agendados = {}
+        self.removidos = 0
+        self.sequencia = 0
+        self.condicao = threading.Condition()
+        self.thread = None
+        self.encerrado = False
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de lembretes e prazos agendados.
+        """
+        return len(self.agendados)
+
+    def construir(self):
+        """
+        Agenda os lembretes e prazos futuros de todas as tarefas não concluídas do organizador, descartando os
+        agendamentos anteriores. O heap é montado de uma só vez (heapify), em O(n).
+        """
+        agora = time.time()
+        fila = []
+        agendados = {}
+
+        # Os lembretes adiados são lidos da fonte em uma passagem sequencial, sem passar pelo cache de textos
+        for tarefa_id, tarefa, _, lembrete in self.organizador.percorrer_textos():
+            for entrada in self.entradas_tarefa(tarefa_id, tarefa, agora, lembrete):
+                fila.append(entrada)
+                agendados[(tarefa_id, entrada[3])] = entrada
+
+        heapq.heapify(fila)
+
+        with self.condicao:
+            self.fila = fila
+            self.agendados = agendados
+            self.removidos = 0
+            self.condicao.notify()
+
+    def entradas_tarefa(self, tarefa_id: int, tarefa: Tarefa, agora: float, lembrete: str = None) -> list:
+        """
+        Monta as entradas do heap para o lembrete e o prazo futuros de uma tarefa.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+            - tarefa (Tarefa): A tarefa.
+            - agora (float): O instante atual; instantes anteriores não são agendados.
+            - lembrete (str or None): O lembrete já lido; se None, é obtido da tarefa.
+
+        Retorna:
+            - List[list]: As entradas (nenhuma, se a tarefa estiver concluída).
+        """
+        base = tarefa.base
+
+        if base.concluida:
+            return []
+
+        entradas = []
+        prazo = base.get_data_prazo()
+        lembrete = base.get_lembrete() if lembrete is None else lembrete
+
+        if lembrete:
+            instante = instante_lembrete(lembrete, prazo)
+
+            if instante is not None and instante.timestamp() > agora:
+                self.sequencia += 1
+                entradas.append([instante.timestamp(), self.sequencia, tarefa_id, "lembrete", base.titulo, lembrete])
+
+        if prazo is not None:
+            instante = instante_prazo(prazo).timestamp()
+
+            if instante > agora:
+                self.sequencia += 1
+                entradas.append([instante, self.sequencia, tarefa_id, "prazo", base.titulo, formatar_prazo(prazo)])
+
+        return entradas
+
+    def agendar_tarefa(self, tarefa: Tarefa):
+        """
+        Agenda (ou reagenda) o lembrete e o prazo de uma tarefa, removendo os agendamentos que deixaram de valer
+        (ex.: tarefa concluída ou prazo removido). Uma tarefa que não pertence mais ao organizador (ex.: editada e
+        excluída no mesmo lote, cujos subcomandos são notificados depois do lote inteiro) apenas perde os agendamentos.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser agendada.
+        """
+        tarefa_id = tarefa.base.id
+        tarefa = self.organizador.tarefas_por_id.get(tarefa_id)
+
+        if tarefa is None:
+            self.remover_tarefa(tarefa_id)
+            return
+
+        with self.condicao:
+            entradas = self.entradas_tarefa(tarefa_id, tarefa, time.time())
+            tipos = {entrada[3] for entrada in entradas}
+
+            for tipo in ("lembrete", "prazo"):
+                if tipo not in tipos:
+                    self.remover(tarefa_id, tipo)
+
+            for entrada in entradas:
+                self.agendar(entrada)
+
+    def remover_tarefa(self, tarefa_id: int):
+        """
+        Remove os agendamentos de uma tarefa.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+        """
+        with self.condicao:
+            self.remover(tarefa_id, "lembrete")
+            self.remover(tarefa_id, "prazo")
+
+    def agendar(self, entrada: list):
+        """
+        Insere uma entrada no heap, substituindo o agendamento anterior do mesmo par (ID da tarefa, tipo). A thread só
+        é acordada se a entrada passar a ser a mais próxima. Deve ser chamado com a trava ("condicao") adquirida.
+
+        Parâmetros:
+            - entrada (list): A entrada [instante, sequência, ID da tarefa, tipo, título, texto].
+        """
+        chave = (entrada[2], entrada[3])
+        anterior = self.agendados.get(chave)
+
+        if anterior is not None:
+            if anterior[0] == entrada[0] and anterior[4:] == entrada[4:]:
+                return
+
+            anterior[2] = None
+            self.removidos += 1
+
+        self.agendados[chave] = entrada
+        heapq.heappush(self.fila, entrada)
+
+        if self.fila[0] is entrada:
+            self.condicao.notify()
+
+        self.compactar()
+
+    def remover(self, tarefa_id: int, tipo: str):
+        """
+        Marca como removido o agendamento de um par (ID da tarefa, tipo), se existir. Deve ser chamado com a trava
+        ("condicao") adquirida.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+            - tipo (str): "lembrete" ou "prazo".
+        """
+        entrada = self.agendados.pop((tarefa_id, tipo), None)
+
+        if entrada is not None:
+            entrada[2] = None
+            self.removidos += 1
+            self.compactar()
+
+    def compactar(self):
+        """
+        Descarta as entradas removidas do heap quando elas passam da metade das entradas.
+        """
+        if self.removidos >= MINIMO_COMPACTACAO and self.removidos * 2 > len(self.fila):
+            self.fila = [entrada for entrada in self.fila if entrada[2] is not None]
+            heapq.heapify(self.fila)
+            self.removidos = 0
+
+    def proximo_instante(self) -> float:
+        """
+        Obtém o instante do próximo agendamento, descartando as entradas removidas do topo do heap. Deve ser chamado
+        com a trava ("condicao") adquirida.
+
+        Retorna:
+            - float or None: O instante (segundos desde 01/01/1970), ou None se nada estiver agendado.
+        """
+        while self.fila and self.fila[0][2] is None:
+            heapq.heappop(self.fila)
+            self.removidos -= 1
+
+        return self.fila[0][0] if self.fila else None
+
+    def retirar_vencidas(self, agora: float) -> list:
+        """
+        Retira do heap as entradas vencidas até o instante informado (mais JANELA_LOTE). Deve ser chamado com a trava
+        ("condicao") adquirida.
+
+        Parâmetros:
+            - agora (float): O instante atual.
+
+        Retorna:
+            - List[Notificacao]: As notificações vencidas, em ordem de instante.
+        """
+        notificacoes = []
+        proximo = self.proximo_instante()
+
+        while proximo is not None and proximo <= agora + JANELA_LOTE:
+            instante, _, tarefa_id, tipo, titulo, texto = heapq.heappop(self.fila)
+            del self.agendados[(tarefa_id, tipo)]
+            notificacoes.append(Notificacao(tarefa_id, tipo, titulo, texto, datetime.fromtimestamp(instante)))
+            proximo = self.proximo_instante()
+
+        return notificacoes
+
+    def iniciar(self):
+        """
+        Inicia a thread que entrega as notificações.
+        """
+        self.encerrado = False
+        self.thread = threading.Thread(target=self.executar, name="AgendadorLembretes", daemon=True)
+        self.thread.start()
+
+    def executar(self):
+        """
+        Laço da thread do agendador: espera até o próximo instante agendado e entrega as notificações vencidas ao
+        destino, em lotes.
+        """
+        while True:
+            with self.condicao:
+                while not self.encerrado:
+                    proximo = self.proximo_instante()
+                    agora = time.time()
+
+                    if proximo is not None and proximo <= agora:
+                        break
+
+                    # Sem agendamentos, a thread só acorda quando algo for agendado
+                    self.condicao.wait(None if proximo is None else min(proximo - agora, ESPERA_MAXIMA))
+
+                if self.encerrado:
+                    return
+
+                notificacoes = self.retirar_vencidas(time.time())
+
+            # O destino é chamado fora da trava, para que os comandos do organizador não esperem pela entrega
+            if notificacoes:
+                self.destino(notificacoes)
+
+    def fechar(self):
+        """
+        Encerra a thread do agendador e espera o seu término.
+        """
+        with self.condicao:
+            self.encerrado = True
+            self.condicao.notify()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def comando_executado(self, comando):
+        """
+        Atualiza os agendamentos após a execução de um comando no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in comando.comandos:
+                self.comando_executado(subcomando)
+        elif isinstance(comando, ExcluirTarefaCommand):
+            self.remover_tarefa(comando.tarefa.base.id)
+        elif isinstance(comando, (CriarTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand)):
+            self.agendar_tarefa(comando.tarefa)
+        elif not isinstance(comando, OrdenarListaTarefasCommand):
+            self.construir()
+
+    def comando_desfeito(self, comando):
+        """
+        Atualiza os agendamentos após um comando ser desfeito no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in reversed(comando.comandos):
+                self.comando_desfeito(subcomando)
+        elif isinstance(comando, CriarTarefaCommand):
+            self.remover_tarefa(comando.tarefa.base.id)
+        elif isinstance(comando, (ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand)):
+            self.agendar_tarefa(comando.tarefa)
+        elif not isinstance(comando, OrdenarListaTarefasCommand):
+            self.construir()
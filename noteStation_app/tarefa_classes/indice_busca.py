@@ -0,0 +1,520 @@
+"""
+Módulo contendo o índice de busca textual das tarefas.
+
+Classes:
+    - IndiceBusca: Índice invertido, em memória, sobre o título, a descrição e o lembrete das tarefas de um
+      TarefaOrganizador, atualizado a cada comando executado ou desfeito.
+
+Funções:
+    - normalizar(texto): Converte um texto para minúsculas e remove os acentos.
+    - tokenizar(texto): Separa um texto normalizado em palavras.
+
+Módulos importados:
+    - re: Módulo de expressões regulares, usado para separar as palavras.
+    - sys: Módulo do sistema Python, usado para internalizar (sys.intern) as palavras indexadas.
+    - time: Módulo que fornece funções de medição de tempo, usado para medir a construção do índice.
+    - unicodedata: Módulo que fornece a decomposição de caracteres Unicode, usada para remover os acentos.
+    - heapq: Módulo que fornece filas de prioridade, usado para intercalar as ocorrências das palavras de um termo e
+      para guardar os resultados mais relevantes.
+    - itemgetter: Função do módulo operator usada para intercalar as ocorrências pela ordem de indexação.
+    - bisect_left, insort: Funções do módulo bisect usadas para manter o vocabulário ordenado (busca por prefixo).
+
+    - tarefa_classes.metricas: Módulo contendo o registro de métricas METRICAS, que recebe a duração da construção do índice.
+
+Detalhes:
+    - O peso de uma palavra em uma tarefa soma os campos em que ela aparece (título: 4, lembrete: 2, descrição: 1).
+      Cada palavra do vocabulário aponta para as suas ocorrências agrupadas por peso: peso -> (ID -> ordem de
+      indexação). A ordem de indexação cresce a cada tarefa indexada (ao construir, criar ou editar), de modo que
+      cada grupo fica, pela ordem de inserção do dicionário, da tarefa indexada há mais tempo para a mais recente.
+      O vocabulário também é mantido em uma lista ordenada, de modo que as palavras que começam com um prefixo são
+      encontradas por busca binária.
+    - Na consulta, cada termo é tratado como prefixo (a busca acompanha a digitação) e todos os termos precisam
+      ser encontrados. A relevância de uma tarefa soma, para cada termo, o maior peso entre as palavras
+      correspondentes, em dobro quando a palavra é exatamente o termo. Empates favorecem as tarefas indexadas mais
+      recentemente. Para manter o tempo de resposta limitado, cada prefixo considera no máximo LIMITE_EXPANSOES palavras.
+    - "buscar" não pontua todas as tarefas encontradas. O termo com menos ocorrências (o guia) é percorrido da maior
+      relevância para a menor e, em cada relevância, da tarefa mais recente para a mais antiga, apenas verificando os
+      demais termos de cada tarefa. Como a relevância dos demais termos tem um máximo conhecido, a busca para assim
+      que nenhuma tarefa ainda não vista puder superar os resultados já encontrados. Uma consulta de um só termo
+      examina pouco mais do que "limite" tarefas, mesmo que o prefixo corresponda a quase toda a lista.
+    - Com vários termos, as tarefas do guia podem não conter os demais; se LIMITE_CANDIDATOS tarefas forem
+      examinadas e descartadas, a busca para com os resultados encontrados até ali e é marcada como aproximada
+      ("aproximada"). O trabalho de uma busca fica limitado a cerca de "limite" + LIMITE_CANDIDATOS tarefas.
+    - "pontuar_consulta" pontua todas as tarefas encontradas (para contar os resultados exatamente, como no
+      servidor), com custo proporcional à quantidade de ocorrências dos termos.
+"""
+
+import re
+import sys
+import time
+import unicodedata
+import heapq
+from operator import itemgetter
+from bisect import bisect_left, insort
+
+from tarefa_classes.tarefa import Tarefa, TarefaOrganizador
+from tarefa_classes.metricas import METRICAS
+from tarefa_classes.tarefa_command import CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand, LoteCommand
+
+PALAVRAS = re.compile(r"\w+")
+
+# Peso de cada campo na relevância de uma tarefa
+PESOS_CAMPOS = (("titulo", 4), ("lembrete", 2), ("descricao", 1))
+
+LIMITE_RESULTADOS = 200
+LIMITE_EXPANSOES = 64
+LIMITE_CANDIDATOS = 1500
+
+
+def normalizar(texto: str) -> str:
+    """
+    Converte um texto para minúsculas e remove os acentos (ex.: "Ação" -> "acao").
+
+    Parâmetros:
+        - texto (str): O texto a ser normalizado.
+
+    Retorna:
+        - str: O texto normalizado.
+    """
+    texto = texto.lower()
+
+    if texto.isascii():
+        return texto
+
+    return "".join(caractere for caractere in unicodedata.normalize("NFD", texto) if not unicodedata.combining(caractere))
+
+
+def tokenizar(texto: str) -> list:
+    """
+    Separa um texto em palavras normalizadas.
+
+    Parâmetros:
+        - texto (str): O texto a ser separado.
+
+    Retorna:
+        - List[str]: As palavras, na ordem do texto.
+    """
+    return PALAVRAS.findall(normalizar(texto))
+
+
+class IndiceBusca:
+    """
+    Índice invertido sobre o título, a descrição e o lembrete das tarefas de um organizador.
+
+    O índice observa o organizador (como a persistência) e é atualizado a cada criação, edição ou exclusão, sem
+    ser reconstruído.
+
+    Atributos:
+        - organizador (TarefaOrganizador): O organizador cujas tarefas são indexadas.
+        - postings (Dict[str, Dict[int, Dict[int, int]]]): Palavra -> peso -> (ID da tarefa -> ordem de indexação).
+        - vocabulario (List[str]): As palavras indexadas, em ordem alfabética.
+        - palavras_por_id (Dict[int, Tuple[str, ...]]): As palavras indexadas de cada tarefa, usadas para removê-la do índice.
+        - proxima_ordem (int): Ordem de indexação atribuída à próxima tarefa indexada.
+        - aproximada (bool): Indica se a última chamada de "buscar" parou em LIMITE_CANDIDATOS tarefas descartadas.
+        - tempo_construcao (float): Duração, em segundos, da última construção completa do índice.
+
+    Métodos:
+        - construir()
+        - indexar_tarefa(tarefa)
+        - remover_tarefa(tarefa_id)
+        - atualizar_tarefa(tarefa_id)
+        - corresponde(consulta, tarefa_id)
+        - relevancia_termo(palavras, tarefa_id)
+        - niveis_termo(palavras)
+        - niveis_consulta(consulta)
+        - pontuar_consulta(consulta)
+        - buscar(consulta, limite, aceitar, candidatos)
+        - ordenar_resultados(melhores)
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+    """
+    def __init__(self, organizador: TarefaOrganizador):
+        """
+        Construtor da classe IndiceBusca.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador cujas tarefas serão indexadas.
+        """
+        self.organizador = organizador
+        self.postings = {}
+        self.vocabulario = []
+        self.palavras_por_id = {}
+        self.proxima_ordem = 0
+        self.aproximada = False
+        self.tempo_construcao = 0.0
+
+    def construir(self):
+        """
+        Indexa todas as tarefas do organizador, mede o tempo gasto (registrado também nas métricas) e passa a
+        observar o organizador.
+        """
+        inicio = time.perf_counter()
+
+        self.postings = {}
+        self.palavras_por_id = {}
+
+        # Os textos adiados são lidos da fonte em uma passagem sequencial, sem passar pelo cache de textos
+        for _, tarefa, descricao, lembrete in self.organizador.percorrer_textos():
+            self.indexar_tarefa(tarefa, ordenar=False, textos=(descricao, lembrete))
+
+        # O vocabulário é ordenado uma única vez, e não a cada palavra nova
+        self.vocabulario = sorted(self.postings)
+        self.tempo_construcao = time.perf_counter() - inicio
+
+        # A construção é rara: a duração é registrada mesmo com as métricas desativadas, para aparecer quando forem ativadas
+        METRICAS.observar("notestation_construcao_indice_segundos", self.tempo_construcao)
+
+        if self not in self.organizador.observadores:
+            self.organizador.observadores.append(self)
+
+    def pesos_tarefa(self, tarefa: Tarefa, textos: tuple = None) -> dict:
+        """
+        Calcula o peso de cada palavra de uma tarefa.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa.
+            - textos (Tuple[str, str] or None): A descrição e o lembrete já lidos; se None, são obtidos da tarefa.
+
+        Retorna:
+            - Dict[str, int]: Palavra -> soma dos pesos dos campos em que ela aparece.
+        """
+        tarefa_base = tarefa.base
+        descricao, lembrete = textos if textos is not None else (tarefa_base.descricao, tarefa_base.get_lembrete())
+        textos = {"titulo": tarefa_base.titulo, "lembrete": lembrete, "descricao": descricao}
+        pesos = {}
+
+        for campo, peso in PESOS_CAMPOS:
+            for palavra in set(tokenizar(textos[campo])):
+                pesos[palavra] = pesos.get(palavra, 0) + peso
+
+        return pesos
+
+    def indexar_tarefa(self, tarefa: Tarefa, ordenar: bool = True, textos: tuple = None):
+        """
+        Acrescenta uma tarefa ao índice.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser indexada.
+            - ordenar (bool): Se True, as palavras novas são inseridas no vocabulário ordenado.
+            - textos (Tuple[str, str] or None): A descrição e o lembrete já lidos; se None, são obtidos da tarefa.
+        """
+        tarefa_id = tarefa.base.id
+        postings = self.postings
+        palavras = []
+        ordem = self.proxima_ordem
+        self.proxima_ordem += 1
+
+        for palavra, peso in self.pesos_tarefa(tarefa, textos).items():
+            # As palavras são internalizadas, para que o índice e palavras_por_id compartilhem a mesma string
+            palavra = sys.intern(palavra)
+            grupos = postings.get(palavra)
+
+            if grupos is None:
+                grupos = postings[palavra] = {}
+
+                if ordenar:
+                    insort(self.vocabulario, palavra)
+
+            ids = grupos.get(peso)
+
+            if ids is None:
+                ids = grupos[peso] = {}
+
+            ids[tarefa_id] = ordem
+            palavras.append(palavra)
+
+        self.palavras_por_id[tarefa_id] = tuple(palavras)
+
+    def remover_tarefa(self, tarefa_id: int):
+        """
+        Remove uma tarefa do índice, descartando as palavras que deixarem de ocorrer.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa a ser removida.
+        """
+        for palavra in self.palavras_por_id.pop(tarefa_id, ()):
+            grupos = self.postings[palavra]
+
+            for peso, ids in grupos.items():
+                if tarefa_id in ids:
+                    del ids[tarefa_id]
+
+                    if not ids:
+                        del grupos[peso]
+
+                    break
+
+            if not grupos:
+                del self.postings[palavra]
+                del self.vocabulario[bisect_left(self.vocabulario, palavra)]
+
+    def atualizar_tarefa(self, tarefa_id: int):
+        """
+        Reindexa uma tarefa com o seu estado atual no organizador, ou apenas a remove se ela não pertence mais a ele.
+        Os subcomandos de um lote são notificados depois do lote inteiro: uma tarefa editada e excluída no mesmo lote
+        não deve voltar ao índice.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+        """
+        self.remover_tarefa(tarefa_id)
+        tarefa = self.organizador.tarefas_por_id.get(tarefa_id)
+
+        if tarefa is not None:
+            self.indexar_tarefa(tarefa)
+
+    def expandir(self, termo: str) -> list:
+        """
+        Obtém as palavras do vocabulário que começam com um termo.
+
+        Parâmetros:
+            - termo (str): O termo (já normalizado).
+
+        Retorna:
+            - List[Tuple[str, int]]: As palavras (no máximo LIMITE_EXPANSOES) e o multiplicador do peso (2 se a palavra for exatamente o termo).
+        """
+        vocabulario = self.vocabulario
+        posicao = bisect_left(vocabulario, termo)
+        palavras = []
+
+        while posicao < len(vocabulario) and len(palavras) < LIMITE_EXPANSOES and vocabulario[posicao].startswith(termo):
+            palavra = vocabulario[posicao]
+            palavras.append((palavra, 2 if palavra == termo else 1))
+            posicao += 1
+
+        return palavras
+
+    def corresponde(self, consulta: str, tarefa_id: int) -> bool:
+        """
+        Verifica se uma tarefa indexada contém todos os termos de uma consulta (cada termo como prefixo de uma palavra).
+
+        Parâmetros:
+            - consulta (str): O texto digitado.
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - bool: True se a tarefa está no índice e contém todos os termos.
+        """
+        palavras = self.palavras_por_id.get(tarefa_id)
+        termos = tokenizar(consulta)
+
+        if palavras is None or not termos:
+            return False
+
+        return all(any(palavra.startswith(termo) for palavra in palavras) for termo in termos)
+
+    def relevancia_termo(self, palavras: dict, tarefa_id: int) -> int:
+        """
+        Obtém a relevância que um termo dá a uma tarefa, percorrendo as palavras da própria tarefa (poucas) em vez
+        das ocorrências de todas as palavras correspondentes ao termo.
+
+        Parâmetros:
+            - palavras (Dict[str, int]): As palavras correspondentes ao termo e seus multiplicadores.
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - int: A relevância, ou 0 se a tarefa não contém o termo.
+        """
+        melhor = 0
+
+        for palavra in self.palavras_por_id[tarefa_id]:
+            multiplicador = palavras.get(palavra)
+
+            if multiplicador:
+                for peso, ids in self.postings[palavra].items():
+                    if tarefa_id in ids:
+                        melhor = max(melhor, peso * multiplicador)
+                        break
+
+        return melhor
+
+    def niveis_termo(self, palavras: list) -> list:
+        """
+        Agrupa as ocorrências das palavras correspondentes a um termo pela relevância que elas dão à tarefa.
+
+        Parâmetros:
+            - palavras (List[Tuple[str, int]]): As palavras correspondentes ao termo e seus multiplicadores.
+
+        Retorna:
+            - List[Tuple[int, List[Dict[int, int]]]]: Pares (relevância, grupos de ocorrências ID -> ordem de indexação), da maior relevância para a menor.
+        """
+        niveis = {}
+
+        for palavra, multiplicador in palavras:
+            for peso, ids in self.postings[palavra].items():
+                niveis.setdefault(peso * multiplicador, []).append(ids)
+
+        return sorted(niveis.items(), key=itemgetter(0), reverse=True)
+
+    def niveis_consulta(self, consulta: str) -> list:
+        """
+        Obtém os níveis de relevância de cada termo da consulta, do termo com menos ocorrências para o com mais.
+
+        Parâmetros:
+            - consulta (str): O texto digitado.
+
+        Retorna:
+            - List[Tuple[list, dict]] or None: Para cada termo, os seus níveis (ver "niveis_termo") e as palavras
+              correspondentes com seus multiplicadores; None se algum termo não for encontrado.
+        """
+        termos = list(dict.fromkeys(tokenizar(consulta)))
+        expansoes = [self.expandir(termo) for termo in termos]
+
+        if not termos or not all(expansoes):
+            return None
+
+        niveis = [(self.niveis_termo(palavras), dict(palavras)) for palavras in expansoes]
+        niveis.sort(key=lambda termo: sum(len(ids) for _, grupos in termo[0] for ids in grupos))
+
+        return niveis
+
+    def pontuar_consulta(self, consulta: str) -> dict:
+        """
+        Encontra todas as tarefas que contêm todos os termos da consulta (cada termo como prefixo de uma palavra) e
+        calcula a relevância de cada uma. Usado quando a quantidade exata de tarefas encontradas é necessária.
+
+        Parâmetros:
+            - consulta (str): O texto digitado.
+
+        Retorna:
+            - Dict[int, int]: ID -> relevância de cada tarefa encontrada.
+        """
+        niveis = self.niveis_consulta(consulta)
+
+        if niveis is None:
+            return {}
+
+        # O termo com menos ocorrências define os candidatos, cada um com a maior relevância em que aparece
+        pontos = {}
+
+        for ponto, grupos in niveis[0][0]:
+            for ids in grupos:
+                pontos.update(dict.fromkeys(ids.keys() - pontos.keys(), ponto))
+
+        # Os demais termos apenas filtram os candidatos, percorrendo o que for menor: as ocorrências ou os candidatos
+        for termo, palavras in niveis[1:]:
+            melhores = {}
+
+            if sum(len(ids) for _, grupos in termo for ids in grupos) <= len(pontos):
+                for ponto, grupos in termo:
+                    for ids in grupos:
+                        melhores.update(dict.fromkeys((ids.keys() & pontos.keys()) - melhores.keys(), ponto))
+            else:
+                for tarefa_id in pontos:
+                    ponto = self.relevancia_termo(palavras, tarefa_id)
+
+                    if ponto:
+                        melhores[tarefa_id] = ponto
+
+            pontos = {tarefa_id: pontos[tarefa_id] + melhor for tarefa_id, melhor in melhores.items()}
+
+        return pontos
+
+    def buscar(self, consulta: str, limite: int = LIMITE_RESULTADOS, aceitar=None, candidatos: int = LIMITE_CANDIDATOS) -> list:
+        """
+        Busca as tarefas mais relevantes que contêm todos os termos da consulta (cada termo como prefixo de uma
+        palavra), sem pontuar todas as tarefas encontradas (ver "Detalhes" no módulo).
+
+        Parâmetros:
+            - consulta (str): O texto digitado.
+            - limite (int): A quantidade máxima de resultados.
+            - aceitar (Callable[[int], bool] or None): Filtro adicional aplicado ao ID de cada tarefa encontrada.
+            - candidatos (int or None): A quantidade máxima de tarefas examinadas e descartadas (sem algum dos demais
+              termos ou recusadas por "aceitar"); se None, a busca é sempre exata.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas encontradas (no máximo limite), da mais relevante para a menos relevante.
+        """
+        self.aproximada = False
+        niveis = self.niveis_consulta(consulta)
+
+        if niveis is None or limite <= 0:
+            return []
+
+        guia, demais = niveis[0][0], [palavras for _, palavras in niveis[1:]]
+        maximo_demais = sum(termo[0][0] for termo, _ in niveis[1:])
+        melhores = []
+        vistos = set()
+        descartadas = 0
+
+        for ponto, grupos in guia:
+            teto = ponto + maximo_demais
+
+            if len(grupos) == 1:
+                ocorrencias = reversed(grupos[0].items())
+            else:
+                ocorrencias = heapq.merge(*(reversed(ids.items()) for ids in grupos), key=itemgetter(1), reverse=True)
+
+            for tarefa_id, ordem in ocorrencias:
+                # As tarefas restantes têm relevância de no máximo "teto" e foram indexadas antes desta
+                if len(melhores) >= limite and melhores[0][:2] > (teto, ordem):
+                    return self.ordenar_resultados(melhores)
+
+                if tarefa_id in vistos:
+                    continue
+
+                vistos.add(tarefa_id)
+                total = ponto if aceitar is None or aceitar(tarefa_id) else 0
+
+                for palavras in demais:
+                    if not total:
+                        break
+
+                    relevancia = self.relevancia_termo(palavras, tarefa_id)
+                    total = total + relevancia if relevancia else 0
+
+                if not total:
+                    # Tarefa examinada em vão: o trabalho perdido com elas é o que LIMITE_CANDIDATOS limita
+                    descartadas += 1
+
+                    if candidatos is not None and descartadas > candidatos:
+                        self.aproximada = True
+                        return self.ordenar_resultados(melhores)
+                elif len(melhores) < limite:
+                    heapq.heappush(melhores, (total, ordem, tarefa_id))
+                elif (total, ordem) > melhores[0][:2]:
+                    heapq.heapreplace(melhores, (total, ordem, tarefa_id))
+
+        return self.ordenar_resultados(melhores)
+
+    def ordenar_resultados(self, melhores: list) -> list:
+        """
+        Ordena os resultados guardados por "buscar".
+
+        Parâmetros:
+            - melhores (List[Tuple[int, int, int]]): Triplas (relevância, ordem de indexação, ID).
+
+        Retorna:
+            - List[int]: Os IDs, do mais relevante para o menos relevante.
+        """
+        return [tarefa_id for _, _, tarefa_id in sorted(melhores, reverse=True)]
+
+    def comando_executado(self, comando):
+        """
+        Atualiza o índice após a execução de um comando no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in comando.comandos:
+                self.comando_executado(subcomando)
+        elif isinstance(comando, (CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand)):
+            self.atualizar_tarefa(comando.tarefa.base.id)
+        elif not isinstance(comando, (MarcarConcluidaCommand, OrdenarListaTarefasCommand)):
+            self.construir()
+
+    def comando_desfeito(self, comando):
+        """
+        Atualiza o índice após um comando ser desfeito no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in reversed(comando.comandos):
+                self.comando_desfeito(subcomando)
+        elif isinstance(comando, (CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand)):
+            self.atualizar_tarefa(comando.tarefa.base.id)
+        elif not isinstance(comando, (MarcarConcluidaCommand, OrdenarListaTarefasCommand)):
+            self.construir()
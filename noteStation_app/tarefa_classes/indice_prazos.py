@@ -0,0 +1,245 @@
+"""
+Módulo contendo o índice de prazos das tarefas.
+
+Classes:
+    - IndicePrazos: Índice ordenado, em memória, dos prazos das tarefas pendentes de um TarefaOrganizador,
+      atualizado a cada comando executado ou desfeito.
+
+Módulos importados:
+    - date: Classe do módulo datetime que representa uma data, usada para os prazos.
+    - timedelta: Classe do módulo datetime que representa uma duração, usada para percorrer os dias de um intervalo.
+    - bisect_left, insort: Funções do módulo bisect usadas para manter o índice ordenado e para as consultas por
+      intervalo.
+
+Detalhes:
+    - O índice guarda uma lista ordenada de pares (dia, ID), em que o dia é o número ordinal do prazo
+      (date.toordinal), e a quantidade de tarefas em cada dia. Assim, as tarefas de um intervalo de datas são
+      encontradas por busca binária, sem percorrer todas as tarefas, e a contagem de um dia custa O(1).
+    - Apenas as tarefas pendentes (não concluídas) com prazo são indexadas: concluir uma tarefa a retira do índice e
+      desfazer a conclusão a devolve. Criar, excluir, editar e concluir uma tarefa atualizam apenas a sua entrada.
+"""
+
+from datetime import date, timedelta
+from bisect import bisect_left, insort
+
+from tarefa_classes.tarefa import Tarefa, TarefaOrganizador
+from tarefa_classes.tarefa_command import CriarTarefaCommand, ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand, OrdenarListaTarefasCommand, LoteCommand
+
+
+class IndicePrazos:
+    """
+    Índice ordenado dos prazos das tarefas pendentes de um organizador.
+
+    Atributos:
+        - organizador (TarefaOrganizador): O organizador cujas tarefas são indexadas.
+        - chaves (List[Tuple[int, int]]): Pares (dia ordinal do prazo, ID da tarefa), em ordem crescente.
+        - dia_por_id (Dict[int, int]): ID da tarefa -> dia ordinal do seu prazo.
+        - contagem (Dict[int, int]): Dia ordinal -> quantidade de tarefas pendentes com prazo nesse dia.
+
+    Métodos:
+        - construir()
+        - indexar_tarefa(tarefa)
+        - remover_tarefa(tarefa_id)
+        - intervalo(inicio, fim)
+        - do_dia(dia)
+        - atrasadas(hoje)
+        - contagem_dia(dia)
+        - contagem_por_dia(inicio, fim)
+        - comando_executado(comando)
+        - comando_desfeito(comando)
+    """
+    def __init__(self, organizador: TarefaOrganizador):
+        """
+        Inicializa um índice vazio; as tarefas já existentes são indexadas por "construir()".
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador cujas tarefas serão indexadas.
+        """
+        self.organizador = organizador
+        self.chaves = []
+        self.dia_por_id = {}
+        self.contagem = {}
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de tarefas pendentes com prazo.
+        """
+        return len(self.chaves)
+
+    def construir(self):
+        """
+        Indexa todas as tarefas pendentes com prazo do organizador, descartando o índice anterior.
+        """
+        dia_por_id = {}
+        contagem = {}
+
+        for tarefa_id, tarefa in self.organizador.tarefas_por_id.items():
+            base = tarefa.base
+            prazo = base.get_data_prazo()
+
+            if prazo is not None and not base.concluida:
+                dia = prazo.toordinal()
+                dia_por_id[tarefa_id] = dia
+                contagem[dia] = contagem.get(dia, 0) + 1
+
+        self.chaves = sorted((dia, tarefa_id) for tarefa_id, dia in dia_por_id.items())
+        self.dia_por_id = dia_por_id
+        self.contagem = contagem
+
+    def indexar_tarefa(self, tarefa: Tarefa):
+        """
+        Indexa (ou reindexa) o prazo de uma tarefa. Tarefas concluídas, sem prazo ou que não pertencem mais ao
+        organizador (ex.: excluídas e depois editadas no mesmo lote) são retiradas do índice.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser indexada.
+        """
+        base = tarefa.base
+        prazo = base.get_data_prazo()
+
+        if prazo is None or base.concluida or base.id not in self.organizador.tarefas_por_id:
+            self.remover_tarefa(base.id)
+            return
+
+        dia = prazo.toordinal()
+
+        if self.dia_por_id.get(base.id) == dia:
+            return
+
+        self.remover_tarefa(base.id)
+        self.dia_por_id[base.id] = dia
+        self.contagem[dia] = self.contagem.get(dia, 0) + 1
+        insort(self.chaves, (dia, base.id))
+
+    def remover_tarefa(self, tarefa_id: int):
+        """
+        Retira uma tarefa do índice, se estiver indexada.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+        """
+        dia = self.dia_por_id.pop(tarefa_id, None)
+
+        if dia is None:
+            return
+
+        del self.chaves[bisect_left(self.chaves, (dia, tarefa_id))]
+
+        if self.contagem[dia] == 1:
+            del self.contagem[dia]
+        else:
+            self.contagem[dia] -= 1
+
+    def intervalo(self, inicio: date = None, fim: date = None) -> list:
+        """
+        Obtém as tarefas pendentes com prazo entre duas datas (inclusive), em ordem de prazo.
+
+        Parâmetros:
+            - inicio (date or None): A primeira data do intervalo, ou None para não limitar o início.
+            - fim (date or None): A última data do intervalo, ou None para não limitar o fim.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas, em ordem de prazo (e de ID, no mesmo dia).
+        """
+        chaves = self.chaves
+        primeiro = 0 if inicio is None else bisect_left(chaves, (inicio.toordinal(),))
+        ultimo = len(chaves) if fim is None else bisect_left(chaves, (fim.toordinal() + 1,))
+
+        return [tarefa_id for _, tarefa_id in chaves[primeiro:ultimo]]
+
+    def do_dia(self, dia: date) -> list:
+        """
+        Obtém as tarefas pendentes com prazo em um dia.
+
+        Parâmetros:
+            - dia (date): O dia.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas, em ordem de ID.
+        """
+        return self.intervalo(dia, dia)
+
+    def atrasadas(self, hoje: date = None) -> list:
+        """
+        Obtém as tarefas pendentes cujo prazo já passou.
+
+        Parâmetros:
+            - hoje (date or None): A data de referência (por padrão, a data atual); prazos anteriores a ela estão atrasados.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas, do prazo mais antigo para o mais recente.
+        """
+        hoje = hoje or date.today()
+        return self.intervalo(None, hoje - timedelta(days=1))
+
+    def contagem_dia(self, dia: date) -> int:
+        """
+        Obtém a quantidade de tarefas pendentes com prazo em um dia.
+
+        Parâmetros:
+            - dia (date): O dia.
+
+        Retorna:
+            - int: A quantidade de tarefas.
+        """
+        return self.contagem.get(dia.toordinal(), 0)
+
+    def contagem_por_dia(self, inicio: date, fim: date) -> dict:
+        """
+        Obtém a quantidade de tarefas pendentes de cada dia de um intervalo que possua algum prazo. O custo é
+        proporcional à quantidade de dias distintos com prazo no intervalo, e não à de tarefas.
+
+        Parâmetros:
+            - inicio (date): A primeira data do intervalo.
+            - fim (date): A última data do intervalo (inclusive).
+
+        Retorna:
+            - Dict[date, int]: Dia -> quantidade de tarefas (apenas os dias com prazo).
+        """
+        chaves = self.chaves
+        contagens = {}
+        posicao = bisect_left(chaves, (inicio.toordinal(),))
+        ultimo_dia = fim.toordinal()
+
+        # Salta de um dia com prazo para o próximo, usando a contagem para pular as tarefas de cada dia
+        while posicao < len(chaves) and chaves[posicao][0] <= ultimo_dia:
+            dia = chaves[posicao][0]
+            quantidade = self.contagem[dia]
+            contagens[date.fromordinal(dia)] = quantidade
+            posicao += quantidade
+
+        return contagens
+
+    def comando_executado(self, comando):
+        """
+        Atualiza o índice após a execução de um comando no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in comando.comandos:
+                self.comando_executado(subcomando)
+        elif isinstance(comando, ExcluirTarefaCommand):
+            self.remover_tarefa(comando.tarefa.base.id)
+        elif isinstance(comando, (CriarTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand)):
+            self.indexar_tarefa(comando.tarefa)
+        elif not isinstance(comando, OrdenarListaTarefasCommand):
+            self.construir()
+
+    def comando_desfeito(self, comando):
+        """
+        Atualiza o índice após um comando ser desfeito no organizador.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando desfeito.
+        """
+        if isinstance(comando, LoteCommand):
+            for subcomando in reversed(comando.comandos):
+                self.comando_desfeito(subcomando)
+        elif isinstance(comando, CriarTarefaCommand):
+            self.remover_tarefa(comando.tarefa.base.id)
+        elif isinstance(comando, (ExcluirTarefaCommand, EditarTarefaCommand, MarcarConcluidaCommand)):
+            self.indexar_tarefa(comando.tarefa)
+        elif not isinstance(comando, OrdenarListaTarefasCommand):
+            self.construir()
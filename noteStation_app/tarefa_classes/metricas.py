@@ -0,0 +1,407 @@
+"""
+Módulo contendo a instrumentação (métricas de latência e contadores) do noteStation.
+
+Classes:
+    - Histograma: Histograma de latências com faixas fixas em escala logarítmica, no formato do Prometheus.
+    - Metricas: Registro dos histogramas e contadores do processo, consultável em memória e exportável em texto.
+
+Funções:
+    - formatar_rotulos(rotulos): Formata os rótulos de uma métrica no formato do Prometheus.
+
+Constantes:
+    - METRICAS: O registro único do processo, usado pelo organizador, pelas persistências e pela interface.
+
+Módulos importados:
+    - os: Módulo que fornece funções para interagir com o sistema operacional, usado na gravação atômica do arquivo de métricas.
+    - threading: Módulo que fornece primitivas de sincronização, usado para proteger o registro (as métricas são
+      atualizadas pela thread da interface e pelas threads de gravação).
+    - bisect_left: Função do módulo bisect usada para encontrar a faixa de uma latência.
+    - perf_counter: Função do módulo time usada para medir as latências.
+
+Custo:
+    - Com as métricas desativadas (o padrão, a não ser que a variável de ambiente NOTESTATION_METRICAS seja "1"),
+      cada ponto instrumentado custa apenas a leitura de "METRICAS.ativo": as funções medidas são chamadas
+      diretamente, sem envoltórios, e iteradores e callbacks são devolvidos sem alteração sempre que possível.
+    - Com as métricas ativadas, cada observação custa uma busca binária nas faixas do histograma e o incremento de
+      alguns contadores, dentro de uma trava.
+
+Nomes:
+    - Os nomes seguem as convenções do Prometheus ("notestation_<medida>_segundos" para histogramas e
+      "notestation_<medida>_total" para contadores), com rótulos (ex.: comando="CriarTarefaCommand").
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Limites superiores das faixas dos histogramas, em segundos: de 1 µs a cerca de 8 s, dobrando a cada faixa
+LIMITES_HISTOGRAMA = tuple(1e-6 * 2 ** expoente for expoente in range(24))
+
+
+class Histograma:
+    """
+    Histograma de latências com faixas fixas.
+
+    Atributos:
+        - faixas (List[int]): Quantidade de observações em cada faixa de LIMITES_HISTOGRAMA (a última faixa reúne as
+          observações acima do maior limite).
+        - contagem (int): Quantidade total de observações.
+        - soma (float): Soma das observações, em segundos.
+        - maximo (float): Maior observação, em segundos.
+
+    Métodos:
+        - observar(segundos)
+        - quantil(q)
+    """
+    __slots__ = ("faixas", "contagem", "soma", "maximo")
+
+    def __init__(self):
+        """
+        Construtor da classe Histograma.
+        """
+        self.faixas = [0] * (len(LIMITES_HISTOGRAMA) + 1)
+        self.contagem = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+
+    def observar(self, segundos: float):
+        """
+        Registra uma observação.
+
+        Parâmetros:
+            - segundos (float): A latência observada.
+        """
+        self.faixas[bisect_left(LIMITES_HISTOGRAMA, segundos)] += 1
+        self.contagem += 1
+        self.soma += segundos
+
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def quantil(self, q: float) -> float:
+        """
+        Estima um quantil das observações pelo limite superior da faixa em que ele cai.
+
+        Parâmetros:
+            - q (float): O quantil (ex.: 0.5 para a mediana, 0.99 para o percentil 99).
+
+        Retorna:
+            - float: A estimativa, em segundos (0.0 sem observações).
+        """
+        alvo = q * self.contagem
+        acumulado = 0
+
+        for posicao, quantidade in enumerate(self.faixas):
+            acumulado += quantidade
+
+            if quantidade and acumulado >= alvo:
+                return min(LIMITES_HISTOGRAMA[posicao], self.maximo) if posicao < len(LIMITES_HISTOGRAMA) else self.maximo
+
+        return 0.0
+
+
+class Metricas:
+    """
+    Registro dos histogramas e contadores do processo.
+
+    Atributos:
+        - ativo (bool): Indica se as métricas estão sendo coletadas.
+        - histogramas (Dict[Tuple[str, tuple], Histograma]): (nome, rótulos) -> histograma.
+        - contadores (Dict[Tuple[str, tuple], int]): (nome, rótulos) -> valor.
+        - trava (threading.Lock): Trava que protege os histogramas e contadores.
+
+    Métodos:
+        - ativar(ativo)
+        - observar(nome, segundos, **rotulos)
+        - contar(nome, quantidade, **rotulos)
+        - cronometrar(funcao, nome, **rotulos)
+        - medir_iteracao(iterador, nome, contador, **rotulos)
+        - iterar_medindo(iterador, nome, contador, rotulos)
+        - medir_callback(funcao, nome)
+        - consultar()
+        - resumo()
+        - exportar_prometheus()
+        - gravar_prometheus(caminho)
+        - limpar()
+    """
+    def __init__(self, ativo: bool = False):
+        """
+        Construtor da classe Metricas.
+
+        Parâmetros:
+            - ativo (bool): Se True, as métricas começam a ser coletadas imediatamente.
+        """
+        self.ativo = ativo
+        self.histogramas = {}
+        self.contadores = {}
+        self.trava = threading.Lock()
+
+    def ativar(self, ativo: bool = True):
+        """
+        Ativa ou desativa a coleta das métricas. Os valores já coletados são mantidos.
+
+        Parâmetros:
+            - ativo (bool): True para ativar, False para desativar.
+        """
+        self.ativo = ativo
+
+    def observar(self, nome: str, segundos: float, **rotulos):
+        """
+        Registra uma latência no histograma de um nome e rótulos.
+
+        Parâmetros:
+            - nome (str): O nome da métrica.
+            - segundos (float): A latência observada.
+            - **rotulos: Os rótulos da métrica (ex.: comando="CriarTarefaCommand").
+        """
+        chave = (nome, tuple(sorted(rotulos.items())))
+
+        with self.trava:
+            histograma = self.histogramas.get(chave)
+
+            if histograma is None:
+                histograma = self.histogramas[chave] = Histograma()
+
+            histograma.observar(segundos)
+
+    def contar(self, nome: str, quantidade: int = 1, **rotulos):
+        """
+        Incrementa o contador de um nome e rótulos.
+
+        Parâmetros:
+            - nome (str): O nome da métrica.
+            - quantidade (int): O incremento.
+            - **rotulos: Os rótulos da métrica.
+        """
+        chave = (nome, tuple(sorted(rotulos.items())))
+
+        with self.trava:
+            self.contadores[chave] = self.contadores.get(chave, 0) + quantidade
+
+    def cronometrar(self, funcao, nome: str, **rotulos):
+        """
+        Chama uma função sem argumentos e registra a sua latência (mesmo se ela lançar uma exceção).
+
+        Parâmetros:
+            - funcao (Callable[[], Any]): A função medida.
+            - nome (str): O nome do histograma.
+            - **rotulos: Os rótulos da métrica.
+
+        Retorna:
+            - Any: O retorno da função.
+        """
+        inicio = perf_counter()
+
+        try:
+            return funcao()
+        finally:
+            self.observar(nome, perf_counter() - inicio, **rotulos)
+
+    def medir_iteracao(self, iterador, nome: str, contador: str = None, **rotulos):
+        """
+        Mede o tempo total gasto dentro de um iterador (ex.: um carregamento em lotes, consumido aos poucos entre os
+        quadros da interface), registrado como uma única observação ao fim da iteração. Com as métricas
+        desativadas, o próprio iterador é devolvido.
+
+        Parâmetros:
+            - iterador (Iterator[int]): O iterador medido.
+            - nome (str): O nome do histograma.
+            - contador (str or None): Nome de um contador incrementado com a soma dos valores produzidos (ex.: a
+              quantidade de tarefas de cada lote).
+            - **rotulos: Os rótulos da métrica.
+
+        Retorna:
+            - Iterator: Um iterador que produz os mesmos valores.
+        """
+        if not self.ativo:
+            return iterador
+
+        return self.iterar_medindo(iter(iterador), nome, contador, rotulos)
+
+    def iterar_medindo(self, iterador, nome: str, contador: str, rotulos: dict):
+        """
+        Gerador usado por "medir_iteracao".
+
+        Parâmetros:
+            - iterador (Iterator[int]): O iterador medido.
+            - nome (str): O nome do histograma.
+            - contador (str or None): Nome do contador dos valores produzidos.
+            - rotulos (dict): Os rótulos da métrica.
+
+        Retorna:
+            - Iterator: Os valores do iterador medido.
+        """
+        decorrido = 0.0
+        total = 0
+
+        while True:
+            inicio = perf_counter()
+            valor = next(iterador, None)
+            decorrido += perf_counter() - inicio
+
+            if valor is None:
+                break
+
+            total += valor
+            yield valor
+
+        self.observar(nome, decorrido, **rotulos)
+
+        if contador is not None:
+            self.contar(contador, total, **rotulos)
+
+    def medir_callback(self, funcao, nome: str):
+        """
+        Envolve um callback da interface gráfica para registrar a sua latência em "notestation_callback_segundos".
+        O envoltório recebe os argumentos (sender, app_data, user_data) da DearPyGui e repassa à função apenas a
+        quantidade de argumentos que ela declara, como a própria DearPyGui faz.
+
+        Parâmetros:
+            - funcao (Callable): O callback (função ou método).
+            - nome (str): O nome do callback, usado no rótulo "callback".
+
+        Retorna:
+            - Callable: O envoltório.
+        """
+        codigo = funcao.__code__
+        quantidade = min(codigo.co_argcount - (1 if hasattr(funcao, "__self__") else 0), 3)
+
+        def callback(sender=None, app_data=None, user_data=None):
+            argumentos = (sender, app_data, user_data)[:quantidade]
+
+            if not self.ativo:
+                return funcao(*argumentos)
+
+            return self.cronometrar(lambda: funcao(*argumentos), "notestation_callback_segundos", callback=nome)
+
+        return callback
+
+    def consultar(self) -> dict:
+        """
+        Obtém uma cópia dos valores atuais, para consulta dentro do processo (ou pela API).
+
+        Retorna:
+            - dict: "histogramas" (nome -> lista de {rotulos, contagem, soma, maximo, p50, p90, p99}) e
+              "contadores" (nome -> lista de {rotulos, valor}).
+        """
+        histogramas = {}
+        contadores = {}
+
+        with self.trava:
+            for (nome, rotulos), histograma in sorted(self.histogramas.items()):
+                histogramas.setdefault(nome, []).append({
+                    "rotulos": dict(rotulos),
+                    "contagem": histograma.contagem,
+                    "soma": histograma.soma,
+                    "maximo": histograma.maximo,
+                    "p50": histograma.quantil(0.5),
+                    "p90": histograma.quantil(0.9),
+                    "p99": histograma.quantil(0.99)
+                })
+
+            for (nome, rotulos), valor in sorted(self.contadores.items()):
+                contadores.setdefault(nome, []).append({"rotulos": dict(rotulos), "valor": valor})
+
+        return {"histogramas": histogramas, "contadores": contadores}
+
+    def resumo(self) -> list:
+        """
+        Resume os histogramas em linhas de texto curtas (usadas na janela de depuração da interface).
+
+        Retorna:
+            - List[str]: Uma linha por histograma, com a contagem, a mediana, o percentil 99 e o máximo em milissegundos.
+        """
+        linhas = []
+
+        with self.trava:
+            for (nome, rotulos), histograma in sorted(self.histogramas.items()):
+                descricao = ",".join(str(valor) for _, valor in rotulos)
+                linhas.append(f'{nome.removeprefix("notestation_").removesuffix("_segundos")}[{descricao}] n={histograma.contagem} '
+                              f'p50={histograma.quantil(0.5) * 1000:.3f} p99={histograma.quantil(0.99) * 1000:.3f} max={histograma.maximo * 1000:.3f} ms')
+
+        return linhas
+
+    def exportar_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato de texto do Prometheus (histogramas com faixas cumulativas "le", "_sum" e
+        "_count", e contadores).
+
+        Retorna:
+            - str: O texto das métricas.
+        """
+        linhas = []
+        tipos = set()
+
+        with self.trava:
+            for (nome, rotulos), histograma in sorted(self.histogramas.items()):
+                if nome not in tipos:
+                    tipos.add(nome)
+                    linhas.append(f'# TYPE {nome} histogram')
+
+                acumulado = 0
+
+                for limite, quantidade in zip(LIMITES_HISTOGRAMA + ("+Inf",), histograma.faixas):
+                    acumulado += quantidade
+                    linhas.append(f'{nome}_bucket{formatar_rotulos(rotulos + (("le", limite if isinstance(limite, str) else f"{limite:.6g}"),))} {acumulado}')
+
+                linhas.append(f'{nome}_sum{formatar_rotulos(rotulos)} {histograma.soma:.9g}')
+                linhas.append(f'{nome}_count{formatar_rotulos(rotulos)} {histograma.contagem}')
+
+            for (nome, rotulos), valor in sorted(self.contadores.items()):
+                if nome not in tipos:
+                    tipos.add(nome)
+                    linhas.append(f'# TYPE {nome} counter')
+
+                linhas.append(f'{nome}{formatar_rotulos(rotulos)} {valor}')
+
+        return "\n".join(linhas) + "\n"
+
+    def gravar_prometheus(self, caminho: str):
+        """
+        Grava as métricas no formato de texto do Prometheus, substituindo o arquivo de forma atômica (ex.: para o
+        coletor de arquivos de texto do node_exporter).
+
+        Parâmetros:
+            - caminho (str): O caminho do arquivo.
+        """
+        temporario = caminho + ".tmp"
+
+        with open(temporario, "w", encoding='UTF-8') as arquivo:
+            arquivo.write(self.exportar_prometheus())
+
+        os.replace(temporario, caminho)
+
+    def limpar(self):
+        """
+        Descarta todos os valores coletados.
+        """
+        with self.trava:
+            self.histogramas.clear()
+            self.contadores.clear()
+
+
+def formatar_rotulos(rotulos: tuple) -> str:
+    """
+    Formata os rótulos de uma métrica no formato do Prometheus (ex.: '{comando="CriarTarefaCommand"}').
+
+    Parâmetros:
+        - rotulos (Tuple[Tuple[str, Any], ...]): Os pares (nome, valor).
+
+    Retorna:
+        - str: Os rótulos entre chaves, ou uma string vazia sem rótulos.
+    """
+    if not rotulos:
+        return ""
+
+    pares = []
+
+    for nome, valor in rotulos:
+        # Barras invertidas e aspas são escapadas, como exige o formato
+        texto = str(valor).replace("\\", "\\\\").replace('"', '\\"')
+        pares.append(f'{nome}="{texto}"')
+
+    return "{" + ",".join(pares) + "}"
+
+
+METRICAS = Metricas(ativo=os.environ.get("NOTESTATION_METRICAS") == "1")
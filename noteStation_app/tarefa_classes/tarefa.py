@@ -8,16 +8,226 @@ Classes:
     - TarefaComLembrete: Classe concreta que adiciona uma funcionalidade de lembrete a uma tarefa existente.
     - TarefaComPrazo: Classe concreta que adiciona uma funcionalidade de prazo a uma tarefa existente.
     - TarefaOrganizador: Classe que gerencia as tarefas, oferecendo métodos para adicionar, excluir, editar, marcar como concluída e ordenar a lista de tarefas.
+    - RegistroTarefa: Cópia imutável dos dados de uma tarefa, usada nos retratos do organizador.
+    - RetratoOrganizador: Retrato (snapshot) imutável das tarefas do organizador em uma versão.
 
 Módulos importados:
     - ABC: Módulo do pacote "abc" que fornece as classes e funções para trabalhar com metaprogramação orientada a aspectos.
     - abstractmethod: Decorador para um método abstrato, que deve ser implementado nas classes derivadas.
     - datetime: Módulo padrão do Python que fornece classes para manipulação de datas e horas.
     - date: Classe do módulo datetime que representa uma data (ano, mês e dia).
+    - timedelta: Classe do módulo datetime que representa uma duração, usada na conversão das datas para inteiros.
+    - bisect_left, insort: Funções do módulo bisect usadas para manter as visões ordenadas do TarefaOrganizador.
+    - deque: Fila de duas pontas do módulo collections, usada no histórico de comandos (descarte dos mais antigos).
+    - threading: Módulo que fornece primitivas de sincronização entre threads, usado na trava de escrita do TarefaOrganizador.
+    - NamedTuple: Classe do módulo typing usada para definir o RegistroTarefa imutável.
+    - MappingProxyType: Classe do módulo types que fornece uma visão somente leitura de um dicionário.
+    - contextmanager: Decorador do módulo contextlib usado para definir a transação do TarefaOrganizador.
+    - METRICAS: Registro de métricas do módulo tarefa_classes.metricas, usado para medir a execução dos comandos.
+
+Funções:
+    - para_epoca(data): Converte uma data e hora em um inteiro (microssegundos desde 01/01/1970).
+    - de_epoca(epoca): Converte o inteiro de volta em uma data e hora.
+    - ler_data_exata(texto): Converte a data exata no formato legado ("dd/mm/aaaa HH:MM:SS.ms") em um inteiro.
+    - converter_prazo(prazo): Converte um prazo (date ou texto "d/m/aaaa") em um date.
+    - formatar_prazo(prazo): Converte um prazo em texto, no formato exibido e gravado no JSON ("d/m/aaaa").
+    - formatar_data_exata(criado_em): Converte a data de criação em texto, no formato gravado no JSON ("dd/mm/aaaa HH:MM:SS.ms").
+
+Acesso à tarefa base e aos recursos:
+    - Toda tarefa, decorada ou não, possui o atributo "base", que aponta diretamente para a TarefaBase no fim da
+      cadeia de decorators. A tarefa base mantém uma referência a cada decorator aplicado, por nome de recurso
+      (ex.: "lembrete" -> TarefaComLembrete, "prazo" -> TarefaComPrazo), preenchida pelos próprios decorators ao serem
+      criados. Assim, o lembrete e o prazo são alcançados em tempo constante, qualquer que seja a profundidade da cadeia.
+    - Para não acrescentar um dicionário a cada tarefa, cada recurso ocupa um slot "recurso_<nome>" da TarefaBase;
+      um novo tipo de decorator deve declarar o seu slot em TarefaBase.
+
+Memória:
+    - As classes de tarefa declaram "__slots__", de modo que nenhuma instância (nem os decorators) carrega um
+      "__dict__" próprio.
+
+Textos sob demanda:
+    - A descrição e o lembrete de uma tarefa podem ser adiados (TEXTO_ADIADO): a tarefa guarda apenas uma referência
+      à fonte dos textos ("fonte_textos", ex.: o snapshot binário mapeado na memória), que os lê na primeira vez em
+      que são acessados, através do método "ler(tarefa_id)" -> (descrição, lembrete). A lista exibe apenas os
+      títulos, de modo que os textos só são lidos ao visualizar, editar, buscar ou gravar a tarefa.
+    - As construções que precisam dos textos de todas as tarefas (índice de busca e agendador) usam
+      "TarefaOrganizador.percorrer_textos", que lê os textos adiados em lotes, pelo método "ler_varios(tarefa_ids)"
+      da fonte, em uma passagem sequencial e sem ocupar o cache de textos da fonte.
+    - Um texto alterado passa a ficar na própria tarefa. Ao excluir uma tarefa, os seus textos adiados são fixados
+      (TarefaBase.fixar_textos), para que ela possa ser restaurada mesmo depois que a fonte for substituída.
+
+Datas e chaves de ordenação:
+    - A data de criação é guardada como um inteiro ("criado_em", microssegundos desde 01/01/1970, no horário local)
+      e o prazo como um objeto date. Os textos "data_criacao", "data_exata" e do prazo são gerados apenas para a
+      exibição e para o formato JSON legado, e nunca são convertidos de volta durante uma ordenação.
+    - As chaves de ordenação (chave_titulo, chave_criacao e chave_tipo) são calculadas uma única vez por tarefa; a
+      chave do título fica em cache até o título ser alterado.
+
+Visões ordenadas:
+    - Para cada filtro de ordenação (CHAVES_ORDENACAO) o TarefaOrganizador mantém uma lista de IDs ordenada pela
+      chave do filtro (com o ID como desempate). Cada visão é montada na primeira vez em que o filtro é usado e, a
+      partir daí, atualizada por busca binária a cada inclusão, exclusão ou renomeação. Ordenar a lista apenas troca
+      a visão exibida, e desfazer a ordenação volta para a visão anterior.
+
+Histórico de desfazer e refazer:
+    - O histórico de comandos é limitado pela quantidade de comandos ("limite_comandos") e pela memória estimada
+      retida por eles ("limite_bytes", somando desfazer e refazer); ao ultrapassar um dos limites, os comandos mais
+      antigos são descartados. Comandos desfeitos vão para a pilha de refazer, que é esvaziada quando um novo
+      comando é executado.
+
+Concorrência:
+    - O organizador tem um único caminho de escrita: os comandos (executar, desfazer e refazer), a carga de lotes e a
+      substituição ou reordenação das tarefas são feitos com a trava do organizador ("trava") e incrementam a versão
+      ("versao"). Os observadores são notificados dentro da trava, de modo que sempre veem o estado logo após o comando.
+    - As demais threads (ex.: gravação em segundo plano) não leem as tarefas diretamente: "retrato()" devolve um
+      RetratoOrganizador imutável, com a ordem de exibição e um RegistroTarefa por tarefa. O retrato de uma versão é
+      reaproveitado por todos os leitores até a próxima escrita, e os registros ficam em cache no organizador: após
+      uma escrita, apenas os registros das tarefas afetadas pelo comando (TarefaCommand.tarefas_afetadas) são
+      refeitos, e o novo retrato custa apenas a cópia da ordem e do dicionário de registros. A trava é mantida só
+      durante essa cópia, nunca durante o uso do retrato.
+
+Transações:
+    - Dentro de "with organizador.transacao():", cada comando é executado imediatamente, mas fica guardado em um
+      LoteCommand em vez de entrar no histórico. Ao final, o lote entra no histórico como uma única entrada (desfeita
+      e refeita de uma só vez) e os observadores são notificados uma única vez, de modo que a persistência grava o
+      lote inteiro de uma vez. Se uma exceção interromper a transação, os comandos já executados são desfeitos.
+      Desfazer e refazer não são permitidos dentro de uma transação (lançam RuntimeError).
+    - Em lotes grandes (LoteCommand.LIMITE_VISOES comandos), as visões ordenadas são descartadas e remontadas uma
+      única vez quando usadas novamente, em vez de atualizadas por busca binária a cada comando.
+
+Métricas:
+    - Com as métricas ativadas (tarefa_classes.metricas), a execução, o desfazer e o refazer de cada comando são
+      medidos no histograma "notestation_comando_segundos", com o nome do comando e a operação como rótulos.
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import islice
+import threading
+from typing import NamedTuple
+from types import MappingProxyType
+from contextlib import contextmanager
+
+from tarefa_classes.metricas import METRICAS
+
+EPOCA = datetime(1970, 1, 1)
+MICROSSEGUNDO = timedelta(microseconds=1)
+
+
+def para_epoca(data: datetime) -> int:
+    """
+    Converte uma data e hora (sem fuso horário) em um inteiro.
+
+    Parâmetros:
+        - data (datetime): A data e hora a ser convertida.
+
+    Retorna:
+        - int: A quantidade de microssegundos desde 01/01/1970 00:00.
+    """
+    return (data - EPOCA) // MICROSSEGUNDO
+
+
+def de_epoca(epoca: int) -> datetime:
+    """
+    Converte um inteiro produzido por "para_epoca" de volta em uma data e hora.
+
+    Parâmetros:
+        - epoca (int): A quantidade de microssegundos desde 01/01/1970 00:00.
+
+    Retorna:
+        - datetime: A data e hora correspondente.
+    """
+    segundos, microssegundos = divmod(epoca, 1000000)
+    return EPOCA + timedelta(0, segundos, microssegundos)
+
+
+def ler_data_exata(texto: str) -> int:
+    """
+    Converte a data exata no formato legado ("dd/mm/aaaa HH:MM:SS.ms") em um inteiro, sem usar o datetime.strptime
+    (bem mais lento) quando o texto tem o tamanho fixo gerado pelo próprio programa.
+
+    Parâmetros:
+        - texto (str): A data exata.
+
+    Retorna:
+        - int: A quantidade de microssegundos desde 01/01/1970 00:00.
+    """
+    if len(texto) == 26:
+        data = datetime(int(texto[6:10]), int(texto[3:5]), int(texto[0:2]), int(texto[11:13]), int(texto[14:16]), int(texto[17:19]), int(texto[20:26]))
+    else:
+        data = datetime.strptime(texto, "%d/%m/%Y %H:%M:%S.%f")
+
+    return para_epoca(data)
+
+
+def converter_prazo(prazo) -> date:
+    """
+    Converte um prazo em um objeto date.
+
+    Parâmetros:
+        - prazo (date or str or None): O prazo, como date ou como texto no formato "d/m/aaaa".
+
+    Retorna:
+        - date or None: O prazo convertido, ou None se o prazo estiver vazio.
+    """
+    if not prazo:
+        return None
+
+    if isinstance(prazo, datetime):
+        return prazo.date()
+
+    if isinstance(prazo, date):
+        return prazo
+
+    dia, mes, ano = prazo.split("/")
+    return date(int(ano), int(mes), int(dia))
+
+
+def formatar_prazo(prazo: date) -> str:
+    """
+    Converte um prazo no texto exibido na interface e gravado no formato JSON ("d/m/aaaa").
+
+    Parâmetros:
+        - prazo (date or None): O prazo.
+
+    Retorna:
+        - str: O prazo formatado, ou uma string vazia se não houver prazo.
+    """
+    if prazo is None:
+        return ""
+
+    return f'{prazo.day}/{prazo.month}/{prazo.year}'
+
+
+def formatar_data_exata(criado_em: int) -> str:
+    """
+    Converte a data de criação de uma tarefa em texto, para o formato JSON.
+
+    Parâmetros:
+        - criado_em (int): A data de criação, em microssegundos desde 01/01/1970.
+
+    Retorna:
+        - str: A data no formato "dd/mm/aaaa HH:MM:SS.ms".
+    """
+    data = de_epoca(criado_em)
+    return "%02d/%02d/%04d %02d:%02d:%02d.%06d" % (data.day, data.month, data.year, data.hour, data.minute, data.second, data.microsecond)
+
+
+# Marca de um texto (descrição ou lembrete) ainda não lido da fonte de textos da tarefa
+TEXTO_ADIADO = object()
+
+# Quantidade de tarefas cujos textos adiados são lidos de uma vez por "percorrer_textos"
+TAMANHO_LOTE_TEXTOS = 1000
+
+# Chave de ordenação de cada filtro, calculada (e mantida em cache) pela própria tarefa base
+CHAVES_ORDENACAO = {
+    "Data de criação": lambda tarefa_base: tarefa_base.chave_criacao,
+    "Tipo de tarefa": lambda tarefa_base: tarefa_base.chave_tipo,
+    "Título": lambda tarefa_base: tarefa_base.chave_titulo
+}
+
 
 class Tarefa(ABC):
     """
@@ -26,6 +236,8 @@ class Tarefa(ABC):
     Métodos:
         - exibir() -> str: Retorna uma string com as informações da tarefa.
     """
+    __slots__ = ()
+
     @abstractmethod
     def exibir() -> str:
         """
@@ -43,26 +255,246 @@ class TarefaBase(Tarefa):
 
     Atributos:
         - titulo (str): O título da tarefa.
-        - descricao (str): A descrição da tarefa.
-        - data_criacao (str): Data e hora de criação da tarefa (formato: "dd/mm/aaaa HH:MM").
-        - data_exata (str): Data e hora exata de criação da tarefa (formato: "dd/mm/aaaa HH:MM:SS.ms").
+        - descricao (str): A descrição da tarefa (lida da fonte de textos na primeira vez, se estiver adiada).
+        - criado_em (int): Data e hora exata de criação da tarefa, em microssegundos desde 01/01/1970.
+        - data_criacao (str): Data e hora de criação da tarefa (formato: "dd/mm/aaaa HH:MM"), gerada a partir de "criado_em".
+        - data_exata (str): Data e hora exata de criação da tarefa (formato: "dd/mm/aaaa HH:MM:SS.ms"), gerada a partir de "criado_em".
         - concluida (bool): Indica se a tarefa foi concluída (True) ou não (False).
         - _tarefa (Tarefa): Referência à tarefa base.
+        - id (int or None): Identificador estável atribuído pelo TarefaOrganizador (None enquanto a tarefa não pertence a um organizador).
+        - recurso_lembrete (TarefaComLembrete or None): Decorator de lembrete aplicado à tarefa.
+        - recurso_prazo (TarefaComPrazo or None): Decorator de prazo aplicado à tarefa.
+        - fonte_textos (FonteTextos or None): Fonte da descrição e do lembrete adiados (TEXTO_ADIADO), ou None.
+        - recursos (Dict[str, TarefaDecorator]): Mapa nome do recurso -> decorator, montado a partir dos slots de recurso.
+        - base (TarefaBase): A própria tarefa.
+        - chave_titulo (str): Chave de ordenação por título (título em minúsculas), mantida em cache.
+        - chave_criacao (int): Chave de ordenação por data de criação.
+        - chave_tipo (str): Chave de ordenação por tipo de tarefa.
     """
+    __slots__ = ("_titulo", "_chave_titulo", "_descricao", "criado_em", "concluida", "_tarefa", "id", "recurso_lembrete", "recurso_prazo", "fonte_textos")
+
+    RECURSOS = ("lembrete", "prazo")
+
     def __init__(self, titulo: str, descricao: str):
         """
         Construtor da classe TarefaBase.
 
         Parâmetros:
             - titulo (str): O título da tarefa.
-            - descricao (str): A descrição da tarefa.
+            - descricao (str): A descrição da tarefa (ou TEXTO_ADIADO, com a fonte definida em "fonte_textos").
         """
         self.titulo = titulo
         self.descricao = descricao
-        self.data_criacao = datetime.now().strftime("%d/%m/%Y %H:%M")
-        self.data_exata = datetime.now().strftime("%d/%m/%Y %H:%M:%S.%f")
+        self.criado_em = para_epoca(datetime.now())
         self.concluida = False
         self._tarefa = None
+        self.id = None
+        self.recurso_lembrete = None
+        self.recurso_prazo = None
+        self.fonte_textos = None
+
+    @property
+    def titulo(self) -> str:
+        """
+        O título da tarefa.
+
+        Retorna:
+            - str: O título.
+        """
+        return self._titulo
+
+    @titulo.setter
+    def titulo(self, titulo: str):
+        """
+        Altera o título da tarefa, invalidando a chave de ordenação por título.
+
+        Parâmetros:
+            - titulo (str): O novo título.
+        """
+        self._titulo = titulo
+        self._chave_titulo = None
+
+    @property
+    def descricao(self) -> str:
+        """
+        A descrição da tarefa. Uma descrição adiada é obtida da fonte de textos (que mantém os textos lidos em cache).
+
+        Retorna:
+            - str: A descrição.
+        """
+        descricao = self._descricao
+
+        if descricao is TEXTO_ADIADO:
+            return self.fonte_textos.ler(self.id)[0]
+
+        return descricao
+
+    @descricao.setter
+    def descricao(self, descricao: str):
+        """
+        Altera a descrição da tarefa, que passa a ficar na própria tarefa.
+
+        Parâmetros:
+            - descricao (str): A nova descrição.
+        """
+        self._descricao = descricao
+
+    @property
+    def chave_titulo(self) -> str:
+        """
+        Chave de ordenação por título, calculada apenas na primeira vez após cada alteração do título.
+
+        Retorna:
+            - str: O título em minúsculas.
+        """
+        chave = self._chave_titulo
+
+        if chave is None:
+            chave = self._chave_titulo = self._titulo.lower()
+
+        return chave
+
+    @property
+    def chave_criacao(self) -> int:
+        """
+        Chave de ordenação por data de criação.
+
+        Retorna:
+            - int: A data exata de criação, em microssegundos desde 01/01/1970.
+        """
+        return self.criado_em
+
+    @property
+    def chave_tipo(self) -> str:
+        """
+        Chave de ordenação por tipo de tarefa.
+
+        Retorna:
+            - str: O nome da classe da tarefa.
+        """
+        return self.__class__.__name__
+
+    @property
+    def data_criacao(self) -> str:
+        """
+        Data e hora de criação da tarefa, para exibição e para o formato JSON.
+
+        Retorna:
+            - str: A data no formato "dd/mm/aaaa HH:MM".
+        """
+        return self.data_exata[:16]
+
+    @property
+    def data_exata(self) -> str:
+        """
+        Data e hora exata de criação da tarefa, para o formato JSON.
+
+        Retorna:
+            - str: A data no formato "dd/mm/aaaa HH:MM:SS.ms".
+        """
+        return formatar_data_exata(self.criado_em)
+
+    @data_exata.setter
+    def data_exata(self, data_exata: str):
+        """
+        Define a data de criação a partir do formato JSON legado.
+
+        Parâmetros:
+            - data_exata (str): A data no formato "dd/mm/aaaa HH:MM:SS.ms".
+        """
+        self.criado_em = ler_data_exata(data_exata)
+
+    @property
+    def base(self):
+        """
+        A tarefa base, que no caso de uma TarefaBase é a própria tarefa.
+
+        Retorna:
+            - TarefaBase: A própria tarefa.
+        """
+        return self
+
+    @property
+    def recursos(self) -> dict:
+        """
+        Mapa dos recursos aplicados à tarefa.
+
+        Retorna:
+            - Dict[str, TarefaDecorator]: Nome do recurso -> decorator, apenas para os recursos presentes.
+        """
+        return {nome: self.get_recurso(nome) for nome in self.RECURSOS if self.get_recurso(nome) is not None}
+
+    def adicionar_recurso(self, nome: str, decorator):
+        """
+        Registra um decorator aplicado à tarefa.
+
+        Parâmetros:
+            - nome (str): O nome do recurso (ex.: "lembrete" ou "prazo").
+            - decorator (TarefaDecorator): O decorator que fornece o recurso.
+        """
+        setattr(self, "recurso_" + nome, decorator)
+
+    def get_recurso(self, nome: str):
+        """
+        Obtém o decorator que fornece um recurso da tarefa.
+
+        Parâmetros:
+            - nome (str): O nome do recurso (ex.: "lembrete" ou "prazo").
+
+        Retorna:
+            - TarefaDecorator or None: O decorator, ou None se a tarefa não possuir o recurso.
+        """
+        return getattr(self, "recurso_" + nome, None)
+
+    def fixar_textos(self):
+        """
+        Lê da fonte os textos ainda adiados (descrição e lembrete), que passam a ficar na própria tarefa, e desliga a
+        tarefa da fonte de textos.
+        """
+        if self.fonte_textos is None:
+            return
+
+        descricao, lembrete = self.fonte_textos.ler(self.id)
+
+        if self._descricao is TEXTO_ADIADO:
+            self._descricao = descricao
+
+        recurso = self.recurso_lembrete
+
+        if recurso is not None and recurso._lembrete is TEXTO_ADIADO:
+            recurso._lembrete = lembrete
+
+        self.fonte_textos = None
+
+    def get_lembrete(self) -> str:
+        """
+        Obtém o lembrete da tarefa.
+
+        Retorna:
+            - str: O lembrete, ou uma string vazia se a tarefa não possuir lembrete.
+        """
+        recurso = self.recurso_lembrete
+        return recurso.lembrete if recurso is not None else ""
+
+    def get_prazo(self) -> str:
+        """
+        Obtém o prazo da tarefa como texto, para exibição e para o formato JSON.
+
+        Retorna:
+            - str: O prazo no formato "d/m/aaaa", ou uma string vazia se a tarefa não possuir prazo.
+        """
+        recurso = self.recurso_prazo
+        return formatar_prazo(recurso.prazo) if recurso is not None else ""
+
+    def get_data_prazo(self) -> date:
+        """
+        Obtém o prazo da tarefa.
+
+        Retorna:
+            - date or None: O prazo, ou None se a tarefa não possuir prazo.
+        """
+        recurso = self.recurso_prazo
+        return recurso.prazo if recurso is not None else None
 
     def exibir(self) -> str:
         """
@@ -84,15 +516,25 @@ class TarefaDecorator(Tarefa):
 
     Atributos:
         - _tarefa (Tarefa): Referência à tarefa decorada.
+        - base (TarefaBase): Referência direta à tarefa base no fim da cadeia de decorators.
+        - RECURSO (str or None): Nome do recurso registrado pelo decorator no mapa de recursos da tarefa base.
     """
+    __slots__ = ("_tarefa", "base")
+
+    RECURSO = None
+
     def __init__(self, tarefa: Tarefa):
         """
-        Construtor da classe TarefaDecorator.
+        Construtor da classe TarefaDecorator. Registra o decorator no mapa de recursos da tarefa base.
 
         Parâmetros:
             - tarefa (Tarefa): A tarefa a ser decorada.
         """
         self._tarefa = tarefa
+        self.base = tarefa.base
+
+        if self.RECURSO is not None:
+            self.base.adicionar_recurso(self.RECURSO, self)
 
     @abstractmethod
     def exibir(self) -> str:
@@ -110,20 +552,49 @@ class TarefaComLembrete(TarefaDecorator):
     Classe que representa uma tarefa com lembrete.
 
     Atributos:
-        - lembrete (str): O lembrete associado à tarefa.
+        - lembrete (str): O lembrete associado à tarefa (lido da fonte de textos da tarefa base, se estiver adiado).
     """
-    
+    __slots__ = ("_lembrete",)
+
+    RECURSO = "lembrete"
+
     def __init__(self, tarefa: Tarefa, lembrete: str):
         """
         Construtor da classe TarefaComLembrete.
 
         Parâmetros:
             - tarefa (Tarefa): A tarefa a ser decorada.
-            - lembrete (str): O lembrete associado à tarefa.
+            - lembrete (str): O lembrete associado à tarefa (ou TEXTO_ADIADO, com a fonte definida na tarefa base).
         """
         super().__init__(tarefa)
         self.lembrete = lembrete
 
+    @property
+    def lembrete(self) -> str:
+        """
+        O lembrete associado à tarefa. Um lembrete adiado é obtido da fonte de textos da tarefa base.
+
+        Retorna:
+            - str: O lembrete.
+        """
+        lembrete = self._lembrete
+
+        if lembrete is TEXTO_ADIADO:
+            base = self.base
+            return base.fonte_textos.ler(base.id)[1]
+
+        return lembrete
+
+    @lembrete.setter
+    def lembrete(self, lembrete: str):
+        """
+        Altera o lembrete, que passa a ficar no próprio decorator.
+
+        Parâmetros:
+            - lembrete (str): O novo lembrete.
+        """
+        self._lembrete = lembrete
+
     def exibir(self) -> str:
         """
         Método para exibir informações da tarefa com lembrete.
@@ -151,16 +622,20 @@ class TarefaComPrazo(TarefaDecorator):
     Atributos:
         - prazo (date): O prazo associado à tarefa.
     """
+    __slots__ = ("prazo",)
+
+    RECURSO = "prazo"
+
     def __init__(self, tarefa: Tarefa, prazo: date):
         """
         Construtor da classe TarefaComPrazo.
 
         Parâmetros:
             - tarefa (Tarefa): A tarefa a ser decorada.
-            - prazo (date): O prazo associado à tarefa.
+            - prazo (date or str): O prazo associado à tarefa (um texto "d/m/aaaa" é convertido em date).
         """
         super().__init__(tarefa)
-        self.prazo = prazo
+        self.prazo = converter_prazo(prazo)
 
     def exibir(self) -> str:
         """
@@ -169,7 +644,7 @@ class TarefaComPrazo(TarefaDecorator):
         Retorna:
             - str: Uma string com as informações da tarefa decorada com prazo.
         """
-        tarefa_prazo = f'Prazo: {self.prazo}'
+        tarefa_prazo = f'Prazo: {formatar_prazo(self.prazo)}'
         return self._tarefa.exibir() + "\n" +  tarefa_prazo
     
     def atualizar_prazo(self, nPrazo: date):
@@ -177,25 +652,256 @@ class TarefaComPrazo(TarefaDecorator):
         Atualiza o prazo associado à tarefa.
 
         Parâmetros:
-            - novo_prazo (date): O novo prazo a ser associado à tarefa.
+            - novo_prazo (date or str): O novo prazo a ser associado à tarefa (um texto "d/m/aaaa" é convertido em date).
         """
-        self.prazo = nPrazo
+        self.prazo = converter_prazo(nPrazo)
     
 
+class RegistroTarefa(NamedTuple):
+    """
+    Cópia imutável dos dados de uma tarefa em um determinado momento.
+
+    Atributos:
+        - id (int): O ID da tarefa.
+        - tipo (str): O nome da classe da tarefa base (ex.: "TarefaTrabalho" ou "TarefaComPrioridade").
+        - titulo (str): O título da tarefa.
+        - descricao (str): A descrição da tarefa.
+        - criado_em (int): A data de criação, em microssegundos desde 01/01/1970.
+        - concluida (bool): Indica se a tarefa foi concluída.
+        - lembrete (str): O lembrete, ou uma string vazia se a tarefa não possuir lembrete (como em get_lembrete).
+        - prazo (date or None): O prazo, ou None se a tarefa não possuir prazo.
+        - data_exata (str): A data de criação no formato "dd/mm/aaaa HH:MM:SS.ms".
+    """
+    id: int
+    tipo: str
+    titulo: str
+    descricao: str
+    criado_em: int
+    concluida: bool
+    lembrete: str
+    prazo: date
+
+    @classmethod
+    def de_tarefa(cls, tarefa: Tarefa):
+        """
+        Copia os dados de uma tarefa (decorada ou não).
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser copiada.
+
+        Retorna:
+            - RegistroTarefa: O registro com os dados atuais da tarefa.
+        """
+        base = tarefa.base
+        return cls(base.id, base.__class__.__name__, base.titulo, base.descricao, base.criado_em, base.concluida, base.get_lembrete(), base.get_data_prazo())
+
+    @property
+    def data_exata(self) -> str:
+        """
+        Data e hora exata de criação da tarefa, para o formato JSON.
+
+        Retorna:
+            - str: A data no formato "dd/mm/aaaa HH:MM:SS.ms".
+        """
+        return formatar_data_exata(self.criado_em)
+
+
+class RetratoOrganizador:
+    """
+    Retrato (snapshot) imutável das tarefas de um TarefaOrganizador em uma versão. Pode ser lido por qualquer thread,
+    sem travas, enquanto o organizador continua sendo alterado.
+
+    Atributos:
+        - versao (int): A versão do organizador no momento do retrato.
+        - ordem (str or None): O filtro da visão exibida no momento do retrato.
+        - ids (Tuple[int, ...]): Os IDs das tarefas, na ordem de exibição.
+        - registros (Mapping[int, RegistroTarefa]): ID -> registro da tarefa (somente leitura).
+
+    Métodos:
+        - get(tarefa_id)
+        - itens()
+    """
+    __slots__ = ("versao", "ordem", "ids", "registros")
+
+    def __init__(self, versao: int, ordem: str, ids: tuple, registros: MappingProxyType):
+        """
+        Construtor da classe RetratoOrganizador.
+
+        Parâmetros:
+            - versao (int): A versão do organizador.
+            - ordem (str or None): O filtro da visão exibida.
+            - ids (Tuple[int, ...]): Os IDs das tarefas, na ordem de exibição.
+            - registros (Mapping[int, RegistroTarefa]): ID -> registro da tarefa.
+        """
+        self.versao = versao
+        self.ordem = ordem
+        self.ids = ids
+        self.registros = registros
+
+    def __len__(self) -> int:
+        """
+        Quantidade de tarefas no retrato.
+
+        Retorna:
+            - int: A quantidade de tarefas.
+        """
+        return len(self.ids)
+
+    def __iter__(self):
+        """
+        Percorre os registros das tarefas na ordem de exibição.
+
+        Retorna:
+            - Iterator[RegistroTarefa]: Os registros.
+        """
+        registros = self.registros
+        return (registros[tarefa_id] for tarefa_id in self.ids)
+
+    def get(self, tarefa_id: int):
+        """
+        Obtém o registro de uma tarefa pelo ID.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa.
+
+        Retorna:
+            - RegistroTarefa or None: O registro, ou None se a tarefa não existia nesta versão.
+        """
+        return self.registros.get(tarefa_id)
+
+    def itens(self) -> list:
+        """
+        Pares (ID, registro) na ordem de exibição.
+
+        Retorna:
+            - List[Tuple[int, RegistroTarefa]]: Os pares.
+        """
+        registros = self.registros
+        return [(tarefa_id, registros[tarefa_id]) for tarefa_id in self.ids]
+
+
 class TarefaOrganizador:
     """
     Classe que representa um organizador de tarefas.
 
+    As tarefas ficam armazenadas em um dicionário primário indexado pelo ID estável de cada tarefa
+    (que também preserva a ordem de exibição) e em um índice secundário de títulos, de forma que a
+    busca, a exclusão e a verificação de títulos duplicados ocorram em tempo constante.
+
     Atributos:
-        - tarefas (List[Tarefa]): Lista de tarefas no organizador.
-        - comandos (List[TarefaCommand]): Lista de comandos realizados no organizador.
+        - tarefas_por_id (Dict[int, Tarefa]): Índice primário ID -> tarefa, na ordem de exibição.
+        - ids_por_titulo (Dict[str, List[int]]): Índice secundário título -> IDs das tarefas com esse título.
+        - comandos (Deque[TarefaCommand]): Histórico de comandos realizados no organizador, do mais antigo ao mais recente.
+        - tamanhos (Deque[int]): Memória estimada, em bytes, de cada comando do histórico.
+        - desfeitos (List[Tuple[TarefaCommand, int]]): Pilha de comandos desfeitos (com a memória estimada), usada para refazer.
+        - bytes_historico (int): Memória estimada retida pelo histórico e pela pilha de refazer.
+        - limite_comandos (int): Quantidade máxima de comandos no histórico.
+        - limite_bytes (int): Memória estimada máxima do histórico e da pilha de refazer.
+        - proximo_id (int): Próximo ID a ser atribuído a uma tarefa nova.
+        - observadores (List): Objetos notificados, através dos métodos "comando_executado(comando)" e
+          "comando_desfeito(comando)", sempre que um comando é executado ou desfeito (ex.: persistência).
+        - visoes (Dict[str, List[int]]): Filtro de ordenação -> IDs das tarefas ordenados pela chave do filtro.
+        - ordem (str or None): O filtro da visão exibida, ou None para a ordem de "tarefas_por_id".
+        - trava (threading.RLock): Trava do caminho de escrita (comandos, carga e substituição das tarefas).
+        - versao (int): Incrementada a cada escrita; identifica os retratos.
+        - registros (Dict[int, RegistroTarefa] or None): Cache dos registros usados nos retratos (None até o primeiro retrato).
+        - sujos (Set[int]): IDs cujos registros em cache estão desatualizados.
+        - retrato_atual (RetratoOrganizador or None): O último retrato criado, reaproveitado enquanto a versão não mudar.
+        - lote (LoteCommand or None): O lote da transação em andamento, ou None fora de uma transação.
     """
-    def __init__(self):
+    LIMITE_COMANDOS = 1000
+    LIMITE_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, limite_comandos: int = LIMITE_COMANDOS, limite_bytes: int = LIMITE_BYTES):
         """
         Construtor da classe TarefaOrganizador.
+
+        Parâmetros:
+            - limite_comandos (int): Quantidade máxima de comandos no histórico de desfazer.
+            - limite_bytes (int): Memória estimada máxima, em bytes, do histórico de desfazer e refazer.
+        """
+        self.tarefas_por_id = {}
+        self.ids_por_titulo = {}
+        self.comandos = deque()
+        self.tamanhos = deque()
+        self.desfeitos = []
+        self.bytes_historico = 0
+        self.limite_comandos = limite_comandos
+        self.limite_bytes = limite_bytes
+        self.proximo_id = 0
+        self.observadores = []
+        self.visoes = {}
+        self.ordem = None
+        self.trava = threading.RLock()
+        self.versao = 0
+        self.registros = None
+        self.sujos = set()
+        self.retrato_atual = None
+        self.lote = None
+
+    @property
+    def tarefas(self):
+        """
+        Tarefas do organizador, na ordem de exibição. O resultado é montado a cada acesso a partir de tarefas_por_id
+        e é somente leitura: as tarefas são adicionadas e removidas pelos comandos (add_tarefa, del_tarefa) ou
+        substituídas todas de uma vez pelo setter.
+
+        Retorna:
+            - Tuple[Tarefa, ...]: As tarefas.
+        """
+        if self.ordem is None:
+            return tuple(self.tarefas_por_id.values())
+
+        tarefas_por_id = self.tarefas_por_id
+        return tuple(tarefas_por_id[tarefa_id] for tarefa_id in self.visao(self.ordem))
+
+    @tarefas.setter
+    def tarefas(self, tarefas):
         """
-        self.tarefas = []
-        self.comandos = []
+        Substitui todas as tarefas do organizador, reconstruindo os índices.
+
+        Parâmetros:
+            - tarefas (List[Tarefa]): As novas tarefas, na ordem de exibição.
+        """
+        with self.trava:
+            self.tarefas_por_id = {}
+            self.ids_por_titulo = {}
+            self.visoes = {}
+            self.ordem = None
+
+            for tarefa in tarefas:
+                self.indexar_tarefa(tarefa)
+
+            self.registrar_alteracao(None)
+
+    def ids_exibicao(self) -> list:
+        """
+        IDs das tarefas do organizador, na ordem de exibição.
+
+        Retorna:
+            - List[int]: Uma nova lista com os IDs.
+        """
+        if self.ordem is None:
+            return list(self.tarefas_por_id)
+
+        return list(self.visao(self.ordem))
+
+    def carregar_lote(self, tarefas):
+        """
+        Acrescenta um lote de tarefas já existentes (ex.: lidas de um arquivo) ao final do organizador, sem
+        registrar comandos no histórico.
+
+        Parâmetros:
+            - tarefas (List[Tarefa]): As tarefas do lote, na ordem de exibição.
+        """
+        with self.trava:
+            # As visões são descartadas e remontadas com uma única ordenação quando forem usadas novamente
+            self.visoes = {}
+
+            for tarefa in tarefas:
+                self.indexar_tarefa(tarefa)
+
+            self.registrar_alteracao(tarefas)
 
     def get_tarefa(self, titulo: str):
         """
@@ -207,16 +913,52 @@ class TarefaOrganizador:
         Retorna:
             - Tarefa or None: A tarefa encontrada ou None se não encontrada.
         """
-        for tarefa in self.tarefas:
-            tarefa_cpy = self.checkTarefaDecorator(tarefa)
-            if tarefa_cpy.titulo == titulo:
-                return tarefa
-        
-        return None
+        ids = self.ids_por_titulo.get(titulo)
+
+        if not ids:
+            return None
+
+        return self.tarefas_por_id[ids[0]]
+
+    def get_tarefa_por_id(self, tarefa_id: int):
+        """
+        Obtém uma tarefa pelo ID.
+
+        Parâmetros:
+            - tarefa_id (int): O ID da tarefa a ser buscada.
+
+        Retorna:
+            - Tarefa or None: A tarefa encontrada ou None se não encontrada.
+        """
+        return self.tarefas_por_id.get(tarefa_id)
+
+    def get_id(self, tarefa: Tarefa):
+        """
+        Obtém o ID de uma tarefa, decorada ou não.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa cujo ID será obtido.
+
+        Retorna:
+            - int or None: O ID da tarefa ou None se ela ainda não pertence a um organizador.
+        """
+        return tarefa.base.id
+
+    def existe_titulo(self, titulo: str) -> bool:
+        """
+        Verifica se já existe uma tarefa com o título informado.
+
+        Parâmetros:
+            - titulo (str): O título a ser verificado.
+
+        Retorna:
+            - bool: True se o título já estiver em uso, False caso contrário.
+        """
+        return bool(self.ids_por_titulo.get(titulo))
 
     def checkTarefaDecorator(self, tarefa: Tarefa):
         """
-        Verifica se a tarefa é um decorator e obtém a tarefa base.
+        Verifica se a tarefa é um decorator e obtém a tarefa base, em tempo constante através do atributo "base".
 
         Parâmetros:
             - tarefa (Tarefa): A tarefa a ser verificada.
@@ -224,11 +966,158 @@ class TarefaOrganizador:
         Retorna:
             - Tarefa: A tarefa base, caso a tarefa seja um decorator.
         """
-        if not isinstance(tarefa, TarefaDecorator):
-            return tarefa
-        
-        chTarefa = tarefa._tarefa
-        return self.checkTarefaDecorator(chTarefa)
+        return tarefa.base
+
+    def indexar_tarefa(self, tarefa: Tarefa):
+        """
+        Insere uma tarefa nos índices do organizador, atribuindo um ID caso ela ainda não possua um.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser indexada.
+        """
+        tarefa_base = tarefa.base
+
+        if tarefa_base.id is None:
+            tarefa_base.id = self.proximo_id
+
+        self.proximo_id = max(self.proximo_id, tarefa_base.id + 1)
+
+        self.tarefas_por_id[tarefa_base.id] = tarefa
+        self.ids_por_titulo.setdefault(tarefa_base.titulo, []).append(tarefa_base.id)
+
+        for filtro, ids in self.visoes.items():
+            insort(ids, tarefa_base.id, key=self.chave_visao(filtro))
+
+    def desindexar_tarefa(self, tarefa: Tarefa):
+        """
+        Remove uma tarefa dos índices do organizador. O ID da tarefa é preservado para que ela possa ser reinserida.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser removida dos índices.
+        """
+        tarefa_base = tarefa.base
+
+        for filtro in self.visoes:
+            self.remover_visao(filtro, tarefa_base.id)
+
+        del self.tarefas_por_id[tarefa_base.id]
+        self.remover_titulo_indice(tarefa_base.titulo, tarefa_base.id)
+
+    def renomear_tarefa(self, tarefa: Tarefa, nTitulo: str):
+        """
+        Altera o título de uma tarefa mantendo o índice de títulos atualizado.
+
+        Parâmetros:
+            - tarefa (Tarefa): A tarefa a ser renomeada.
+            - nTitulo (str): O novo título da tarefa.
+        """
+        tarefa_base = tarefa.base
+
+        if tarefa_base.titulo == nTitulo:
+            return
+
+        if tarefa_base.id not in self.tarefas_por_id:
+            tarefa_base.titulo = nTitulo
+            return
+
+        self.remover_titulo_indice(tarefa_base.titulo, tarefa_base.id)
+        self.ids_por_titulo.setdefault(nTitulo, []).append(tarefa_base.id)
+
+        # Apenas a visão por título depende do título; a tarefa é reposicionada nela
+        visao_titulo = self.visoes.get("Título")
+
+        if visao_titulo is not None:
+            self.remover_visao("Título", tarefa_base.id)
+
+        tarefa_base.titulo = nTitulo
+
+        if visao_titulo is not None:
+            insort(visao_titulo, tarefa_base.id, key=self.chave_visao("Título"))
+
+    def reordenar_tarefas(self, tarefas):
+        """
+        Define uma ordem de exibição explícita para as tarefas, sem reconstruir os índices.
+
+        Parâmetros:
+            - tarefas (List[Tarefa]): As mesmas tarefas do organizador, na nova ordem.
+        """
+        with self.trava:
+            self.tarefas_por_id = {self.get_id(tarefa): tarefa for tarefa in tarefas}
+            self.ordem = None
+            self.registrar_alteracao(())
+
+    def chave_visao(self, filtro: str):
+        """
+        Obtém a função que calcula a posição de um ID na visão de um filtro.
+
+        Parâmetros:
+            - filtro (str): O filtro de ordenação.
+
+        Retorna:
+            - Callable[[int], tuple]: Função ID -> (chave do filtro, ID).
+        """
+        chave = CHAVES_ORDENACAO[filtro]
+        tarefas_por_id = self.tarefas_por_id
+
+        return lambda tarefa_id: (chave(tarefas_por_id[tarefa_id].base), tarefa_id)
+
+    def visao(self, filtro: str) -> list:
+        """
+        Obtém a visão ordenada de um filtro, montando-a caso ainda não exista.
+
+        Parâmetros:
+            - filtro (str): O filtro de ordenação.
+
+        Retorna:
+            - List[int]: Os IDs das tarefas, ordenados pela chave do filtro.
+        """
+        ids = self.visoes.get(filtro)
+
+        if ids is None:
+            ids = self.visoes[filtro] = sorted(self.tarefas_por_id, key=self.chave_visao(filtro))
+
+        return ids
+
+    def remover_visao(self, filtro: str, tarefa_id: int):
+        """
+        Remove um ID da visão de um filtro, localizando-o por busca binária.
+
+        Parâmetros:
+            - filtro (str): O filtro de ordenação.
+            - tarefa_id (int): O ID a ser removido (a tarefa ainda deve estar no índice primário).
+        """
+        chave = self.chave_visao(filtro)
+        ids = self.visoes[filtro]
+        del ids[bisect_left(ids, chave(tarefa_id), key=chave)]
+
+    def definir_ordem(self, filtro: str):
+        """
+        Troca a visão exibida, sem reordenar as tarefas.
+
+        Parâmetros:
+            - filtro (str or None): O filtro de ordenação, ou None para a ordem de "tarefas_por_id".
+        """
+        if filtro is not None:
+            if filtro not in CHAVES_ORDENACAO:
+                raise ValueError(f'Filtro de ordenação desconhecido: {filtro}')
+
+            self.visao(filtro)
+
+        self.ordem = filtro
+
+    def remover_titulo_indice(self, titulo: str, tarefa_id: int):
+        """
+        Remove um ID do índice de títulos, descartando a entrada quando ela fica vazia.
+
+        Parâmetros:
+            - titulo (str): O título indexado.
+            - tarefa_id (int): O ID a ser removido.
+        """
+        ids = self.ids_por_titulo[titulo]
+        ids.remove(tarefa_id)
+
+        if not ids:
+            del self.ids_por_titulo[titulo]
 
     def add_tarefa(self, tarefa: Tarefa):
         """
@@ -238,8 +1127,7 @@ class TarefaOrganizador:
             - tarefa (Tarefa): A tarefa a ser adicionada.
         """
         comando = CriarTarefaCommand(tarefa, self)
-        comando.executar()
-        self.comandos.append(comando)
+        self.executar_comando(comando)
 
     def del_tarefa(self, tarefa: Tarefa):
         """
@@ -249,8 +1137,7 @@ class TarefaOrganizador:
             - tarefa (Tarefa): A tarefa a ser removida.
         """
         comando = ExcluirTarefaCommand(tarefa, self)
-        comando.executar()
-        self.comandos.append(comando)
+        self.executar_comando(comando)
 
     def edit_tarefa(self, tarefa: Tarefa, nTitulo: str, nDescricao: str, nLembrete: str, nPrazo: str):
         """
@@ -264,8 +1151,7 @@ class TarefaOrganizador:
             - nPrazo (str): O novo prazo da tarefa.
         """
         comando = EditarTarefaCommand(tarefa, nTitulo, nDescricao, nLembrete, nPrazo, organizador=self)
-        comando.executar()
-        self.comandos.append(comando)
+        self.executar_comando(comando)
 
     def mark_tarefa(self, tarefa: Tarefa):
         """
@@ -275,27 +1161,316 @@ class TarefaOrganizador:
             - tarefa (Tarefa): A tarefa a ser marcada como concluída.
         """
         comando = MarcarConcluidaCommand(tarefa, organizador=self)
-        comando.executar()
-        self.comandos.append(comando)
+        self.executar_comando(comando)
 
     def sort_tarefas(self, filtro: str):
         """
         Ordena a lista de tarefas no organizador.
 
         Parâmetros:
-            - filtro (str): O critério de ordenação das tarefas (por título ou por prazo).
+            - filtro (str): O critério de ordenação das tarefas ("Data de criação", "Tipo de tarefa" ou "Título").
         """
         comando = OrdenarListaTarefasCommand(organizador=self, filtro=filtro)
-        comando.executar()
+        self.executar_comando(comando)
+
+    def del_tarefas(self, tarefas):
+        """
+        Remove várias tarefas do organizador em uma única transação (uma entrada no histórico).
+
+        Parâmetros:
+            - tarefas (Iterable[Tarefa]): As tarefas a serem removidas.
+        """
+        with self.transacao():
+            for tarefa in tarefas:
+                self.del_tarefa(tarefa)
+
+    def mark_tarefas(self, tarefas):
+        """
+        Marca várias tarefas como concluídas em uma única transação (uma entrada no histórico).
+
+        Parâmetros:
+            - tarefas (Iterable[Tarefa]): As tarefas a serem marcadas como concluídas.
+        """
+        with self.transacao():
+            for tarefa in tarefas:
+                self.mark_tarefa(tarefa)
+
+    @contextmanager
+    def transacao(self):
+        """
+        Agrupa os comandos executados dentro do bloco "with" em um único LoteCommand: uma entrada no histórico e
+        uma única notificação aos observadores ao final. Uma transação dentro de outra faz parte da externa.
+
+        Retorna:
+            - Iterator[LoteCommand]: O lote da transação.
+        """
+        with self.trava:
+            if self.lote is not None:
+                yield self.lote
+                return
+
+            lote = self.lote = LoteCommand(self)
+
+            try:
+                yield lote
+            except BaseException:
+                # Os comandos já executados são desfeitos e nada é registrado no histórico
+                self.lote = None
+                lote.desfazer_operacao()
+                self.registrar_alteracao(lote.tarefas_afetadas())
+                raise
+
+            self.lote = None
+
+            if lote.comandos:
+                self.registrar_execucao(lote)
+
+    def executar_comando(self, comando):
+        """
+        Executa um comando, registra-o no histórico de operações e notifica os observadores. Dentro de uma
+        transação, o comando é apenas executado e acrescentado ao lote.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando a ser executado.
+        """
+        with self.trava:
+            self.executar_medido(comando)
+
+            if self.lote is not None:
+                self.lote.comandos.append(comando)
+                self.registrar_alteracao(comando.tarefas_afetadas())
+
+                # Em lotes grandes, remontar as visões uma única vez é mais barato do que atualizá-las a cada comando
+                if len(self.lote.comandos) == LoteCommand.LIMITE_VISOES:
+                    self.visoes = {}
+
+                return
+
+            self.registrar_execucao(comando)
+
+    def executar_medido(self, comando):
+        """
+        Executa um comando, registrando a sua latência nas métricas quando elas estão ativadas.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando a ser executado.
+        """
+        if METRICAS.ativo:
+            METRICAS.cronometrar(comando.executar, "notestation_comando_segundos", comando=type(comando).__name__, operacao="executar")
+        else:
+            comando.executar()
+
+    def registrar_execucao(self, comando):
+        """
+        Registra um comando já executado: atualiza a versão, registra-o no histórico e notifica os observadores.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+        """
+        with self.trava:
+            self.registrar_alteracao(comando.tarefas_afetadas())
+
+            # Um novo comando invalida os comandos que poderiam ser refeitos
+            for _, tamanho in self.desfeitos:
+                self.bytes_historico -= tamanho
+
+            self.desfeitos.clear()
+            self.registrar_comando(comando, comando.tamanho())
+
+            for observador in self.observadores:
+                observador.comando_executado(comando)
+
+    def registrar_comando(self, comando, tamanho: int):
+        """
+        Acrescenta um comando ao histórico, descartando os mais antigos enquanto algum limite for ultrapassado.
+
+        Parâmetros:
+            - comando (TarefaCommand): O comando executado.
+            - tamanho (int): A memória estimada do comando, em bytes.
+        """
         self.comandos.append(comando)
+        self.tamanhos.append(tamanho)
+        self.bytes_historico += tamanho
+
+        # O comando mais recente é sempre mantido, mesmo que sozinho ultrapasse o limite de memória
+        while len(self.comandos) > 1 and (len(self.comandos) > self.limite_comandos or self.bytes_historico > self.limite_bytes):
+            self.comandos.popleft()
+            self.bytes_historico -= self.tamanhos.popleft()
+
+    def limpar_historico(self):
+        """
+        Descarta todo o histórico de desfazer e refazer.
+        """
+        with self.trava:
+            self.comandos.clear()
+            self.tamanhos.clear()
+            self.desfeitos.clear()
+            self.bytes_historico = 0
 
     def desfazer(self):
         """
-        Desfaz a última operação realizada no organizador.
+        Desfaz a última operação realizada no organizador e notifica os observadores. Sem operações no histórico, nada é feito.
+        Dentro de uma transação, lança RuntimeError: o lote em andamento ainda não está no histórico, e desfazer o
+        comando anterior a ele deixaria a transação sem como ser desfeita por inteiro.
+        """
+        with self.trava:
+            if self.lote is not None:
+                raise RuntimeError("Não é possível desfazer dentro de uma transação")
+
+            if not self.comandos:
+                return
+
+            ultimo_comando = self.comandos.pop()
+            self.desfeitos.append((ultimo_comando, self.tamanhos.pop()))
+
+            if METRICAS.ativo:
+                METRICAS.cronometrar(ultimo_comando.desfazer_operacao, "notestation_comando_segundos", comando=type(ultimo_comando).__name__, operacao="desfazer")
+            else:
+                ultimo_comando.desfazer_operacao()
+            self.registrar_alteracao(ultimo_comando.tarefas_afetadas())
+
+            for observador in self.observadores:
+                observador.comando_desfeito(ultimo_comando)
+
+    def refazer(self):
+        """
+        Executa novamente a última operação desfeita e notifica os observadores. Sem operações desfeitas, nada é feito.
+        Dentro de uma transação, lança RuntimeError, como "desfazer".
+        """
+        with self.trava:
+            if self.lote is not None:
+                raise RuntimeError("Não é possível refazer dentro de uma transação")
+
+            if not self.desfeitos:
+                return
+
+            comando, tamanho = self.desfeitos.pop()
+            self.executar_medido(comando)
+            self.registrar_alteracao(comando.tarefas_afetadas())
+
+            self.bytes_historico -= tamanho
+            self.registrar_comando(comando, comando.tamanho())
+
+            for observador in self.observadores:
+                observador.comando_executado(comando)
+
+    def registrar_alteracao(self, tarefas):
+        """
+        Registra uma escrita no organizador: incrementa a versão e marca os registros em cache das tarefas
+        afetadas como desatualizados. Deve ser chamado com a trava, após a alteração.
+
+        Parâmetros:
+            - tarefas (Iterable[Tarefa] or None): As tarefas cujos dados foram alterados (vazio se apenas a ordem
+              mudou), ou None se qualquer tarefa pode ter sido alterada.
+        """
+        with self.trava:
+            self.versao += 1
+
+            if self.registros is None:
+                return
+
+            if tarefas is None:
+                self.registros = None
+                self.sujos.clear()
+            else:
+                self.sujos.update(tarefa.base.id for tarefa in tarefas)
+
+    def retrato(self) -> RetratoOrganizador:
+        """
+        Obtém um retrato imutável das tarefas na versão atual, que pode ser lido por qualquer thread.
+
+        Retorna:
+            - RetratoOrganizador: O retrato da versão atual (o mesmo objeto até a próxima escrita).
+        """
+        with self.trava:
+            atual = self.retrato_atual
+
+            if atual is not None and atual.versao == self.versao:
+                return atual
+
+            tarefas_por_id = self.tarefas_por_id
+
+            if self.registros is None:
+                self.registros = {tarefa_id: RegistroTarefa.de_tarefa(tarefa) for tarefa_id, tarefa in tarefas_por_id.items()}
+            else:
+                for tarefa_id in self.sujos:
+                    tarefa = tarefas_por_id.get(tarefa_id)
+
+                    if tarefa is None:
+                        self.registros.pop(tarefa_id, None)
+                    else:
+                        self.registros[tarefa_id] = RegistroTarefa.de_tarefa(tarefa)
+
+            self.sujos.clear()
+
+            ids = tuple(tarefas_por_id) if self.ordem is None else tuple(self.visao(self.ordem))
+            self.retrato_atual = RetratoOrganizador(self.versao, self.ordem, ids, MappingProxyType(dict(self.registros)))
+
+            return self.retrato_atual
+
+    def descartar_retratos(self):
         """
-        ultimo_comando = self.comandos.pop()
-        ultimo_comando.desfazer_operacao()
+        Descarta o cache de registros e o último retrato. O próximo retrato refaz os registros de todas as tarefas;
+        usado quando os textos das tarefas são lidos sob demanda, para que os registros de uma gravação não os
+        mantenham na memória.
+        """
+        with self.trava:
+            self.registros = None
+            self.sujos.clear()
+            self.retrato_atual = None
+
+    def percorrer_textos(self, tamanho_lote: int = TAMANHO_LOTE_TEXTOS):
+        """
+        Percorre todas as tarefas, na ordem de "tarefas_por_id", com a descrição e o lembrete de cada uma. Os textos
+        adiados são lidos da fonte de textos em lotes ("ler_varios"), e não um a um pelas propriedades da tarefa, e
+        continuam adiados nas tarefas.
+
+        Parâmetros:
+            - tamanho_lote (int): A quantidade de tarefas cujos textos são lidos de uma vez.
+
+        Retorna:
+            - Iterator[Tuple[int, Tarefa, str, str]]: O ID, a tarefa, a descrição e o lembrete (uma string vazia se a
+              tarefa não possuir lembrete).
+        """
+        itens = iter(self.tarefas_por_id.items())
+
+        while True:
+            lote = list(islice(itens, tamanho_lote))
+
+            if not lote:
+                return
+
+            ids_por_fonte = {}
+
+            for tarefa_id, tarefa in lote:
+                fonte = tarefa.base.fonte_textos
+
+                if fonte is not None:
+                    ids_por_fonte.setdefault(fonte, []).append(tarefa_id)
+
+            lidos = {}
+
+            for fonte, ids in ids_por_fonte.items():
+                lidos.update(zip(ids, fonte.ler_varios(ids)))
+
+            for tarefa_id, tarefa in lote:
+                base = tarefa.base
+                textos = lidos.get(tarefa_id)
+
+                if textos is None:
+                    yield tarefa_id, tarefa, base.descricao, base.get_lembrete()
+                    continue
+
+                recurso = base.recurso_lembrete
+                descricao = textos[0] if base._descricao is TEXTO_ADIADO else base._descricao
+
+                if recurso is None:
+                    lembrete = ""
+                else:
+                    lembrete = textos[1] if recurso._lembrete is TEXTO_ADIADO else recurso._lembrete
+
+                yield tarefa_id, tarefa, descricao, lembrete
+
 
-        
 
 from tarefa_classes.tarefa_command import *
\ No newline at end of file
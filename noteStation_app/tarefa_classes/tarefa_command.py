@@ -8,22 +8,31 @@ Classes:
     - ExcluirTarefaCommand: Classe concreta que implementa um comando para excluir uma tarefa.
     - MarcarConcluidaCommand: Classe concreta que implementa um comando para marcar uma tarefa como concluída.
     - OrdenarListaTarefasCommand: Classe concreta que implementa um comando para ordenar a lista de tarefas.
+    - LoteCommand: Comando composto que agrupa vários comandos em uma única entrada do histórico (transação).
 
 Módulos importados:
     - ABC: Módulo do pacote "abc" que fornece as classes e funções para trabalhar com metaprogramação orientada a aspectos.
     - abstractmethod: Decorador para um método abstrato, que deve ser implementado nas classes derivadas.
     - Optional: Tipo de dado para indicar que um parâmetro pode ser do tipo especificado ou None.
     - date: Tipo de dado que representa uma data.
-    - datetime: Tipo de dado que representa uma data e hora.
-    - copy: Módulo que fornece funções para criar cópias de objetos.
+    - sys: Módulo do sistema Python, usado para estimar (sys.getsizeof) a memória retida por um comando no histórico.
+
+Memória do histórico:
+    - Os comandos guardam apenas o necessário para desfazer a operação: a edição guarda os valores anteriores dos
+      campos alterados (e não uma cópia da tarefa) e a ordenação guarda apenas o filtro da visão anterior. O método
+      "tamanho()" estima os bytes retidos por cada comando, usados pelo TarefaOrganizador para limitar o histórico.
+
+Tarefas afetadas:
+    - O método "tarefas_afetadas()" informa quais tarefas tiveram os dados alterados pelo comando (ao executar ou ao
+      desfazer), para que o TarefaOrganizador refaça apenas os registros dessas tarefas no próximo retrato.
 """
 
 from abc import ABC, abstractmethod
 from typing import Optional
-from datetime import date, datetime
-import copy
+from datetime import date
+import sys
 
-from tarefa_classes.tarefa import Tarefa, TarefaOrganizador, TarefaComLembrete, TarefaComPrazo
+from tarefa_classes.tarefa import Tarefa, TarefaOrganizador, TarefaComLembrete, TarefaComPrazo, converter_prazo
 
 class TarefaCommand(ABC):
     """
@@ -33,6 +42,23 @@ class TarefaCommand(ABC):
         - Nenhum atributo na classe abstrata.
     """
 
+    def tamanho(self) -> int:
+        """
+        Estima a memória, em bytes, retida pelo comando enquanto ele estiver no histórico.
+
+        Retorna:
+            - int: A estimativa em bytes.
+        """
+        return sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+
+    def tarefas_afetadas(self):
+        """
+        Informa as tarefas cujos dados são alterados pelo comando, ao executar ou ao desfazer.
+
+        Retorna:
+            - List[Tarefa] or None: As tarefas afetadas, ou None se qualquer tarefa pode ter sido alterada.
+        """
+        return None
 
     @abstractmethod
     def executar(self):
@@ -72,13 +98,22 @@ class CriarTarefaCommand(TarefaCommand):
         """
         Executa o comando de criar uma tarefa.
         """
-        self.organizador.tarefas.append(self.tarefa)
+        self.organizador.indexar_tarefa(self.tarefa)
     
     def desfazer_operacao(self) -> None:
         """
         Desfaz a operação de criação da tarefa.
         """
-        self.organizador.tarefas.remove(self.tarefa)
+        self.organizador.desindexar_tarefa(self.tarefa)
+
+    def tarefas_afetadas(self) -> list:
+        """
+        Informa as tarefas cujos dados são alterados pelo comando.
+
+        Retorna:
+            - List[Tarefa]: A própria tarefa do comando.
+        """
+        return [self.tarefa]
 
 
 class EditarTarefaCommand(TarefaCommand):
@@ -87,7 +122,7 @@ class EditarTarefaCommand(TarefaCommand):
 
     Atributos:
         - tarefa (Tarefa): A tarefa a ser editada.
-        - copiaTarefa (Tarefa): Uma cópia da tarefa original antes da edição.
+        - anteriores (Dict[str, Any]): Os valores anteriores dos campos alterados ("titulo", "descricao", "lembrete" e "prazo").
         - nTitulo (str): O novo título da tarefa.
         - nDescricao (str): A nova descrição da tarefa.
         - nLembrete (Optional[str]): O novo lembrete da tarefa (pode ser None).
@@ -103,89 +138,88 @@ class EditarTarefaCommand(TarefaCommand):
             - nTitulo (str): O novo título da tarefa.
             - nDescricao (str): A nova descrição da tarefa.
             - nLembrete (Optional[str]): O novo lembrete da tarefa (pode ser None).
-            - nPrazo (Optional[date]): O novo prazo da tarefa (pode ser None).
+            - nPrazo (Optional[date]): O novo prazo da tarefa (pode ser None; um texto "d/m/aaaa" é convertido em date).
             - organizador (TarefaOrganizador): O organizador de tarefas onde a tarefa será editada.
         """
         # A anotação Optional[date] indica que o tipo de dado pode ser date ou None, a mesma
         # coisa para o Optional[str]
         self.tarefa = tarefa
-        self.copiaTarefa = copy.deepcopy(tarefa)
+        self.anteriores = {}
         self.nTitulo = nTitulo
         self.nDescricao = nDescricao
         self.nLembrete = nLembrete
-        self.nPrazo = nPrazo
+        self.nPrazo = converter_prazo(nPrazo)
         self.organizador = organizador
 
     def executar(self) -> None:
         """
-        Executa o comando de editar a tarefa.
+        Executa o comando de editar a tarefa, guardando os valores anteriores apenas dos campos alterados.
         """
-        tarefa = self.organizador.checkTarefaDecorator(self.tarefa)
+        tarefa = self.tarefa.base
+        anteriores = {}
 
         if self.nTitulo:
-            tarefa.titulo = self.nTitulo
+            anteriores["titulo"] = tarefa.titulo
+            self.organizador.renomear_tarefa(tarefa, self.nTitulo)
         
         if self.nDescricao:
+            anteriores["descricao"] = tarefa.descricao
             tarefa.descricao = self.nDescricao
 
         if self.nLembrete:
-            if isinstance(self.tarefa, TarefaComLembrete):
-                self.tarefa.alterar_lembrete(self.nLembrete)
+            lembrete = tarefa.get_recurso(TarefaComLembrete.RECURSO)
 
-            elif isinstance(self.tarefa._tarefa, TarefaComLembrete):
-                self.tarefa._tarefa.alterar_lembrete(self.nLembrete)
+            if lembrete is not None:
+                anteriores["lembrete"] = lembrete.lembrete
+                lembrete.alterar_lembrete(self.nLembrete)
 
         if self.nPrazo:
-            if isinstance(self.tarefa, TarefaComPrazo):
-                self.tarefa.atualizar_prazo(self.nPrazo)
+            prazo = tarefa.get_recurso(TarefaComPrazo.RECURSO)
 
-            elif isinstance(self.tarefa._tarefa, TarefaComPrazo):
-                self.tarefa._tarefa.atualizar_prazo(self.nPrazo)
+            if prazo is not None:
+                anteriores["prazo"] = prazo.prazo
+                prazo.atualizar_prazo(self.nPrazo)
+
+        self.anteriores = anteriores
 
     def desfazer_operacao(self) -> None:
         """
-        Desfaz a operação de editar a tarefa, restaurando os valores originais da tarefa.
+        Desfaz a operação de editar a tarefa, restaurando os valores anteriores dos campos alterados.
         """
-        tarefa = self.organizador.checkTarefaDecorator(self.tarefa)
-        copiaTarefa = self.organizador.checkTarefaDecorator(self.copiaTarefa)
+        tarefa = self.tarefa.base
+        anteriores = self.anteriores
 
-        tarefa.titulo = copiaTarefa.titulo
-        tarefa.descricao = copiaTarefa.descricao
-            
-        if self.nLembrete:
-            try:
-                if isinstance(self.tarefa, TarefaComLembrete) and isinstance(self.copiaTarefa, TarefaComLembrete):
-                    self.tarefa.alterar_lembrete(self.copiaTarefa.lembrete)
+        if "titulo" in anteriores:
+            self.organizador.renomear_tarefa(tarefa, anteriores["titulo"])
 
-                elif isinstance(self.tarefa, TarefaComLembrete) and not isinstance(self.copiaTarefa, TarefaComLembrete):
-                    self.tarefa.alterar_lembrete(self.copiaTarefa._tarefa.lembrete)
+        if "descricao" in anteriores:
+            tarefa.descricao = anteriores["descricao"]
 
-                elif not isinstance(self.tarefa, TarefaComLembrete) and isinstance(self.copiaTarefa, TarefaComLembrete):
-                    self.tarefa._tarefa.alterar_lembrete(self.copiaTarefa.lembrete)
+        if "lembrete" in anteriores:
+            tarefa.get_recurso(TarefaComLembrete.RECURSO).alterar_lembrete(anteriores["lembrete"])
 
-                elif not isinstance(self.tarefa, TarefaComLembrete) and not isinstance(self.copiaTarefa, TarefaComLembrete):
-                    self.tarefa._tarefa.alterar_lembrete(self.copiaTarefa._tarefa.lembrete)
-                    
-            except:
-                raise Exception("Tarefa não possui lembrete.")
+        if "prazo" in anteriores:
+            tarefa.get_recurso(TarefaComPrazo.RECURSO).atualizar_prazo(anteriores["prazo"])
 
-        if self.nPrazo:
-            try:
-                if isinstance(self.tarefa, TarefaComPrazo) and isinstance(self.copiaTarefa, TarefaComPrazo):
-                    self.tarefa.atualizar_prazo(self.copiaTarefa.prazo)
+    def tamanho(self) -> int:
+        """
+        Estima a memória, em bytes, retida pelo comando, incluindo os valores novos e anteriores dos campos.
 
-                elif isinstance(self.tarefa, TarefaComPrazo) and not isinstance(self.copiaTarefa, TarefaComPrazo):
-                    self.tarefa.atualizar_prazo(self.copiaTarefa._tarefa.prazo)
+        Retorna:
+            - int: A estimativa em bytes.
+        """
+        valores = [self.nTitulo, self.nDescricao, self.nLembrete, self.nPrazo, *self.anteriores.values()]
+        return super().tamanho() + sys.getsizeof(self.anteriores) + sum(sys.getsizeof(valor) for valor in valores if valor is not None)
 
-                elif not isinstance(self.tarefa, TarefaComPrazo) and isinstance(self.copiaTarefa, TarefaComPrazo):
-                    self.tarefa._tarefa.atualizar_prazo(self.copiaTarefa.prazo)
+    def tarefas_afetadas(self) -> list:
+        """
+        Informa as tarefas cujos dados são alterados pelo comando.
 
-                elif not isinstance(self.tarefa, TarefaComPrazo) and not isinstance(self.copiaTarefa, TarefaComPrazo):
-                    self.tarefa._tarefa.atualizar_prazo(self.copiaTarefa._tarefa._tarefa.prazo)
+        Retorna:
+            - List[Tarefa]: A própria tarefa do comando.
+        """
+        return [self.tarefa]
 
-            except:
-                raise Exception("Tarefa não possui prazo")
-        
 
 class ExcluirTarefaCommand(TarefaCommand):
     """
@@ -208,15 +242,39 @@ class ExcluirTarefaCommand(TarefaCommand):
 
     def executar(self) -> None:
         """
-        Executa o comando de excluir a tarefa.
+        Executa o comando de excluir a tarefa. Os textos adiados da tarefa são fixados nela, pois a tarefa excluída
+        deixa de ser gravada nos snapshots e a fonte dos textos pode ser substituída antes de a exclusão ser desfeita.
         """
-        self.organizador.tarefas.remove(self.tarefa)
+        self.tarefa.base.fixar_textos()
+        self.organizador.desindexar_tarefa(self.tarefa)
 
     def desfazer_operacao(self) -> None:
         """
-        Desfaz a operação de exclusão da tarefa, adicionando a tarefa de volta ao organizador.
+        Desfaz a operação de exclusão da tarefa, adicionando a tarefa de volta ao organizador com o mesmo ID.
+        """
+        self.organizador.indexar_tarefa(self.tarefa)
+
+    def tamanho(self) -> int:
+        """
+        Estima a memória, em bytes, retida pelo comando. A tarefa excluída só continua na memória por causa do
+        histórico, e por isso os seus textos também são contados.
+
+        Retorna:
+            - int: A estimativa em bytes.
         """
-        self.organizador.tarefas.append(self.tarefa)
+        tarefa = self.tarefa.base
+        textos = [tarefa.titulo, tarefa.descricao, tarefa.get_lembrete()]
+
+        return super().tamanho() + sys.getsizeof(tarefa) + sum(sys.getsizeof(texto) for texto in textos)
+
+    def tarefas_afetadas(self) -> list:
+        """
+        Informa as tarefas cujos dados são alterados pelo comando.
+
+        Retorna:
+            - List[Tarefa]: A própria tarefa do comando.
+        """
+        return [self.tarefa]
 
 
 class MarcarConcluidaCommand(TarefaCommand):
@@ -242,22 +300,35 @@ class MarcarConcluidaCommand(TarefaCommand):
         """
         Executa o comando de marcar a tarefa como concluída.
         """
-        tarefa = self.organizador.checkTarefaDecorator(self.tarefa)
+        tarefa = self.tarefa.base
         tarefa.concluida = True
 
     def desfazer_operacao(self) -> None:
         """
         Desfaz a operação de marcar a tarefa como concluída, marcando a tarefa como pendente novamente.
         """
-        tarefa = self.organizador.checkTarefaDecorator(self.tarefa)
+        tarefa = self.tarefa.base
         tarefa.concluida = False
 
+    def tarefas_afetadas(self) -> list:
+        """
+        Informa as tarefas cujos dados são alterados pelo comando.
+
+        Retorna:
+            - List[Tarefa]: A própria tarefa do comando.
+        """
+        return [self.tarefa]
+
+
 class OrdenarListaTarefasCommand(TarefaCommand):
     """
     Classe que representa o comando de ordenar a lista de tarefas.
 
+    A ordenação apenas troca a visão ordenada exibida pelo organizador (mantida incrementalmente por ele), de modo que
+    nem a execução nem o desfazer copiam ou reordenam a lista de tarefas.
+
     Atributos:
-        - listaTarefasCopia (List[Tarefa]): Uma cópia da lista de tarefas original antes da ordenação.
+        - ordemAnterior (str or None): O filtro da visão exibida antes da ordenação (None para a ordem original).
         - organizador (TarefaOrganizador): O organizador de tarefas cuja lista será ordenada.
         - filtro (str): O critério de ordenação (pode ser "Data de criação", "Tipo de tarefa" ou "Título").
     """
@@ -269,7 +340,7 @@ class OrdenarListaTarefasCommand(TarefaCommand):
             - organizador (TarefaOrganizador): O organizador de tarefas cuja lista será ordenada.
             - filtro (str): O critério de ordenação (pode ser "Data de criação", "Tipo de tarefa" ou "Título").
         """
-        self.listaTarefasCopia = copy.copy(organizador.tarefas)
+        self.ordemAnterior = organizador.ordem
         self.organizador = organizador
         self.filtro = filtro
 
@@ -277,18 +348,96 @@ class OrdenarListaTarefasCommand(TarefaCommand):
         """
         Executa o comando de ordenar a lista de tarefas.
         """
-        if self.filtro == "Data de criação":
-            self.organizador.tarefas.sort(key=lambda x: datetime.strptime(self.organizador.checkTarefaDecorator(x).data_exata, ("%d/%m/%Y %H:%M:%S.%f")))
+        self.organizador.definir_ordem(self.filtro)
+    
+    def desfazer_operacao(self) -> None:
+        """
+        Desfaz a operação de ordenar a lista de tarefas, voltando para a visão exibida anteriormente.
+        """
+        self.organizador.definir_ordem(self.ordemAnterior)
 
-        if self.filtro == "Tipo de tarefa":
-            self.organizador.tarefas.sort(key=lambda x:self.organizador.checkTarefaDecorator(x).__class__.__name__)
+    def tarefas_afetadas(self) -> list:
+        """
+        Informa as tarefas cujos dados são alterados pelo comando: nenhuma, pois apenas a ordem exibida muda.
+
+        Retorna:
+            - List[Tarefa]: Uma lista vazia.
+        """
+        return []
+
+
+class LoteCommand(TarefaCommand):
+    """
+    Classe que representa um comando composto: vários comandos executados em sequência e desfeitos em ordem inversa,
+    como uma única operação.
+
+    É criado pelo TarefaOrganizador.transacao(): os comandos da transação são executados à medida que são
+    solicitados e, ao final, o lote entra no histórico como uma única entrada e é notificado aos observadores uma
+    única vez.
+
+    Atributos:
+        - organizador (TarefaOrganizador): O organizador de tarefas onde os comandos são executados.
+        - comandos (List[TarefaCommand]): Os comandos do lote, na ordem de execução.
+        - LIMITE_VISOES (int): A partir dessa quantidade de comandos, as visões ordenadas do organizador são
+          descartadas (e remontadas com uma única ordenação quando forem usadas), em vez de atualizadas a cada comando.
+    """
+    LIMITE_VISOES = 1000
+
+    def __init__(self, organizador: TarefaOrganizador, comandos: list = None):
+        """
+        Construtor da classe LoteCommand.
+
+        Parâmetros:
+            - organizador (TarefaOrganizador): O organizador de tarefas onde os comandos são executados.
+            - comandos (List[TarefaCommand] or None): Os comandos do lote, na ordem de execução.
+        """
+        self.organizador = organizador
+        self.comandos = list(comandos) if comandos else []
+
+    def executar(self) -> None:
+        """
+        Executa os comandos do lote, na ordem.
+        """
+        if len(self.comandos) >= self.LIMITE_VISOES:
+            self.organizador.visoes = {}
+
+        for comando in self.comandos:
+            comando.executar()
 
-        if self.filtro == "Título":
-            self.organizador.tarefas.sort(key=lambda x: str.lower(self.organizador.checkTarefaDecorator(x).titulo))
-    
     def desfazer_operacao(self) -> None:
         """
-        Desfaz a operação de ordenar a lista de tarefas, restaurando a lista de tarefas para o estado original.
+        Desfaz os comandos do lote, do último para o primeiro.
         """
-        self.organizador.tarefas = [tarefa for tarefa in self.listaTarefasCopia]
-        
+        if len(self.comandos) >= self.LIMITE_VISOES:
+            self.organizador.visoes = {}
+
+        for comando in reversed(self.comandos):
+            comando.desfazer_operacao()
+
+    def tamanho(self) -> int:
+        """
+        Estima a memória, em bytes, retida pelo lote e por todos os seus comandos.
+
+        Retorna:
+            - int: A estimativa em bytes.
+        """
+        return super().tamanho() + sys.getsizeof(self.comandos) + sum(comando.tamanho() for comando in self.comandos)
+
+    def tarefas_afetadas(self):
+        """
+        Informa as tarefas cujos dados são alterados por algum comando do lote.
+
+        Retorna:
+            - List[Tarefa] or None: As tarefas afetadas, ou None se algum comando puder alterar qualquer tarefa.
+        """
+        tarefas = []
+
+        for comando in self.comandos:
+            afetadas = comando.tarefas_afetadas()
+
+            if afetadas is None:
+                return None
+
+            tarefas.extend(afetadas)
+
+        return tarefas
@@ -52,6 +52,8 @@ class TarefaTrabalho(TarefaBase):
     Atributos:
         - Nenhum atributo específico nesta classe. Os atributos são herdados da classe TarefaBase.
     """
+    __slots__ = ()
+
     def exibir(self) -> str:
         """
         Retorna uma string formatada com os detalhes da tarefa de trabalho.
@@ -72,6 +74,8 @@ class TarefaComPrioridade(TarefaBase):
     Atributos:
         - Nenhum atributo específico nesta classe. Os atributos são herdados da classe TarefaBase.
     """
+    __slots__ = ()
+
     def exibir(self) -> str:
         """
         Retorna uma string formatada com os detalhes da tarefa com prioridade.
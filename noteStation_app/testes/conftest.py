@@ -0,0 +1,119 @@
+"""
+Configuração dos testes do aplicativo "NoteStation", executados com o pytest no diretório "noteStation_app".
+
+Módulos importados:
+    - sys: Módulo do sistema Python.
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+    - gerenciamento_arquivos.gravador_tarefas: Módulo contendo o gravador em segundo plano das persistências.
+
+Fixtures:
+    - espera_curta: Reduz a espera entre as tentativas de gravação do gravador em segundo plano.
+
+Funções:
+    - criar_tarefa(titulo, descricao, prioridade, lembrete, prazo): Cria uma tarefa pelas fábricas, com os decorators
+      de lembrete e prazo, como a janela de criação da interface.
+    - abrir(classe, caminho, **opcoes): Abre uma persistência e carrega as suas tarefas em um novo organizador.
+    - reabrir(classe, caminho): Lê novamente o arquivo de uma persistência já fechada.
+    - resumo(organizador): Resume as tarefas do organizador nos campos gravados.
+"""
+
+import sys
+import os
+
+import pytest
+
+diretorio_pai = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(diretorio_pai)
+
+from tarefa_classes import *
+from gerenciamento_arquivos.gravador_tarefas import GravadorSegundoPlano
+
+
+@pytest.fixture
+def espera_curta(monkeypatch):
+    """
+    Reduz a espera entre as tentativas de gravação, para que as falhas simuladas sejam repetidas rapidamente.
+    """
+    monkeypatch.setattr(GravadorSegundoPlano, "ESPERA_NOVA_TENTATIVA", 0.01)
+
+
+def criar_tarefa(titulo: str, descricao: str = "", prioridade: bool = False, lembrete: str = None, prazo: str = None):
+    """
+    Cria uma tarefa pelas fábricas, com os decorators de lembrete e prazo, como a janela de criação da interface.
+
+    Parâmetros:
+        - titulo (str): O título da tarefa.
+        - descricao (str): A descrição da tarefa.
+        - prioridade (bool): Se True, a tarefa é criada pela fábrica das tarefas com prioridade.
+        - lembrete (str or None): O lembrete da tarefa.
+        - prazo (str or None): O prazo da tarefa.
+
+    Retorna:
+        - Tarefa: A tarefa, ainda sem ID.
+    """
+    fabrica = TarefaComPrioridadeFactory() if prioridade else TarefaTrabalhoFactory()
+    tarefa = fabrica.criar_tarefa(titulo, descricao)
+
+    if lembrete:
+        tarefa = TarefaComLembrete(tarefa, lembrete)
+
+    if prazo:
+        tarefa = TarefaComPrazo(tarefa, prazo)
+
+    return tarefa
+
+
+def abrir(classe, caminho: str, **opcoes):
+    """
+    Abre uma persistência e carrega as suas tarefas em um novo organizador.
+
+    Parâmetros:
+        - classe (type): A classe da persistência.
+        - caminho (str): O caminho do arquivo (ou diretório) da persistência.
+        - **opcoes: Os demais parâmetros do construtor da persistência.
+
+    Retorna:
+        - Tuple[TarefaOrganizador, Persistencia]: O organizador e a persistência.
+    """
+    organizador = TarefaOrganizador()
+    persistencia = classe(caminho, **opcoes)
+    persistencia.carregar(organizador)
+
+    return organizador, persistencia
+
+
+def reabrir(classe, caminho: str, **opcoes) -> TarefaOrganizador:
+    """
+    Lê novamente o arquivo de uma persistência já fechada, com gravação síncrona.
+
+    Parâmetros:
+        - classe (type): A classe da persistência.
+        - caminho (str): O caminho do arquivo (ou diretório) da persistência.
+        - **opcoes: Os demais parâmetros do construtor da persistência.
+
+    Retorna:
+        - TarefaOrganizador: O organizador com as tarefas lidas.
+    """
+    organizador, persistencia = abrir(classe, caminho, assincrono=False, **opcoes)
+    persistencia.fechar()
+
+    return organizador
+
+
+def resumo(organizador: TarefaOrganizador) -> list:
+    """
+    Resume as tarefas do organizador, na ordem de exibição, nos campos gravados.
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+
+    Retorna:
+        - List[tuple]: Título, descrição, lembrete, prazo, conclusão e tipo de cada tarefa.
+    """
+    return [
+        (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo(), tarefa.base.concluida, tarefa.base.__class__.__name__)
+        for tarefa in organizador.tarefas
+    ]
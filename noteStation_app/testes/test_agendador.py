@@ -0,0 +1,168 @@
+"""
+Testes do agendador de lembretes e prazos: leitura dos instantes nos lembretes, reagendamento no heap a cada
+comando, tarefas excluídas dentro de transações e entrega das notificações pela thread.
+
+Módulos importados:
+    - time: Módulo que fornece funções de medição de tempo, usado para agendar entradas próximas do instante atual.
+    - threading: Módulo que fornece primitivas de sincronização, usado para esperar a entrega das notificações.
+    - datetime, date: Classes do módulo datetime usadas nos instantes esperados.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, o organizador e o agendador.
+    - tarefa_classes.agendador: Módulo contendo as funções de leitura dos instantes e o limite de compactação do heap.
+    - conftest: Módulo contendo a função criar_tarefa, compartilhada pelos testes.
+"""
+
+import time
+import threading
+from datetime import datetime, date
+
+import pytest
+
+import tarefa_classes.agendador as agendador_modulo
+from tarefa_classes import *
+from tarefa_classes.agendador import instante_lembrete, instante_prazo
+from conftest import criar_tarefa
+
+
+@pytest.fixture
+def organizador():
+    """
+    Organizador vazio, observado por um agendador cujas notificações são descartadas.
+    """
+    organizador = TarefaOrganizador()
+    agendador = AgendadorLembretes(organizador, destino=lambda notificacoes: None)
+    agendador.construir()
+    organizador.observadores.append(agendador)
+
+    return organizador
+
+
+def agendador_de(organizador: TarefaOrganizador) -> AgendadorLembretes:
+    """
+    Obtém o agendador que observa o organizador.
+    """
+    return next(observador for observador in organizador.observadores if isinstance(observador, AgendadorLembretes))
+
+
+def agendados(agendador: AgendadorLembretes) -> dict:
+    """
+    Resume os agendamentos atuais: (ID da tarefa, tipo) -> instante.
+    """
+    return {chave: datetime.fromtimestamp(entrada[0]) for chave, entrada in agendador.agendados.items()}
+
+
+@pytest.mark.parametrize("lembrete, prazo, esperado", [
+    ("Reunião 10/5/2030 14:30", None, datetime(2030, 5, 10, 14, 30)),
+    ("Entregar em 10/5/2030", None, datetime(2030, 5, 10, 9, 0)),
+    ("Ligar às 8h15", date(2030, 5, 10), datetime(2030, 5, 10, 8, 15)),
+    ("Ligar às 8h15", None, None),
+    ("Levar o notebook", date(2030, 5, 10), None),
+    ("31/2/2030", None, None),
+    ("25:00", date(2030, 5, 10), None),
+    ("", date(2030, 5, 10), None)
+])
+def test_instante_lembrete(lembrete, prazo, esperado):
+    assert instante_lembrete(lembrete, prazo) == esperado
+
+
+def test_instante_prazo():
+    assert instante_prazo(date(2030, 5, 10)) == datetime(2030, 5, 10, 9, 0)
+    assert instante_prazo(None) is None
+
+
+def test_agendamentos_acompanham_os_comandos(organizador):
+    agendador = agendador_de(organizador)
+    tarefa = criar_tarefa("Relatório", lembrete="10/5/2030 14:30", prazo="20/5/2030")
+    organizador.add_tarefa(tarefa)
+
+    assert agendados(agendador) == {(0, "lembrete"): datetime(2030, 5, 10, 14, 30), (0, "prazo"): datetime(2030, 5, 20, 9, 0)}
+
+    organizador.edit_tarefa(tarefa, "Relatório", "", "Revisar 11:00", "20/5/2030")
+    assert agendados(agendador) == {(0, "lembrete"): datetime(2030, 5, 20, 11, 0), (0, "prazo"): datetime(2030, 5, 20, 9, 0)}
+
+    organizador.mark_tarefa(tarefa)
+    assert agendados(agendador) == {}
+
+    organizador.desfazer()
+    assert len(agendador) == 2
+
+    organizador.del_tarefa(tarefa)
+    assert agendados(agendador) == {}
+
+    organizador.desfazer()
+    organizador.desfazer()
+    assert agendados(agendador) == {(0, "lembrete"): datetime(2030, 5, 10, 14, 30), (0, "prazo"): datetime(2030, 5, 20, 9, 0)}
+
+
+def test_instantes_passados_nao_sao_agendados(organizador):
+    organizador.add_tarefa(criar_tarefa("Antiga", lembrete="1/1/2000 10:00", prazo="1/1/2000"))
+
+    assert len(agendador_de(organizador)) == 0
+
+
+def test_reagendar_marca_entradas_antigas_e_compacta_o_heap(organizador, monkeypatch):
+    monkeypatch.setattr(agendador_modulo, "MINIMO_COMPACTACAO", 8)
+    agendador = agendador_de(organizador)
+    tarefas = [criar_tarefa(f"t{numero}", prazo=f"{numero + 1}/1/2031") for numero in range(3)]
+
+    for tarefa in tarefas:
+        organizador.add_tarefa(tarefa)
+
+    # Cada edição do prazo deixa a entrada anterior no heap, marcada como removida, até a compactação
+    for dia in range(20, 0, -1):
+        organizador.edit_tarefa(tarefas[0], "t0", "", "", f"{dia}/2/2030")
+        assert len(agendador.fila) - agendador.removidos == 3
+        assert len(agendador.fila) <= 2 * 3 + 8
+
+    with agendador.condicao:
+        assert datetime.fromtimestamp(agendador.proximo_instante()) == datetime(2030, 2, 1, 9, 0)
+        notificacoes = agendador.retirar_vencidas(datetime(2031, 1, 2, 9, 0).timestamp())
+
+    assert [(notificacao.titulo, notificacao.texto) for notificacao in notificacoes] == [("t0", "1/2/2030"), ("t1", "2/1/2031")]
+    assert agendados(agendador) == {(2, "prazo"): datetime(2031, 1, 3, 9, 0)}
+
+
+def test_agendador_ignora_tarefa_excluida_na_transacao(organizador):
+    agendador = agendador_de(organizador)
+    tarefa = criar_tarefa("Reunião de equipe", prazo="20/10/2030")
+    organizador.add_tarefa(tarefa)
+
+    with organizador.transacao():
+        organizador.edit_tarefa(tarefa, "Reunião de equipe", "", "10:00", "21/10/2030")
+        organizador.del_tarefa(tarefa)
+
+    assert agendados(agendador) == {}
+
+    organizador.desfazer()
+    assert agendados(agendador) == {(0, "prazo"): datetime(2030, 10, 20, 9, 0)}
+
+
+def test_thread_entrega_as_notificacoes_vencidas_em_lote():
+    recebidas = []
+    entregue = threading.Event()
+
+    def destino(notificacoes):
+        recebidas.append(notificacoes)
+        entregue.set()
+
+    agendador = AgendadorLembretes(TarefaOrganizador(), destino=destino)
+    agendador.iniciar()
+
+    try:
+        instante = time.time() + 0.2
+
+        with agendador.condicao:
+            agendador.agendar([instante, 1, 0, "lembrete", "a", "agora"])
+            agendador.agendar([instante + 0.05, 2, 1, "lembrete", "removida", "agora"])
+            agendador.agendar([instante + 0.1, 3, 2, "lembrete", "b", "logo depois"])
+            agendador.agendar([instante + 3600, 4, 3, "lembrete", "c", "mais tarde"])
+            agendador.remover(1, "lembrete")
+
+        assert entregue.wait(5)
+    finally:
+        agendador.fechar()
+
+    # "b" vence dentro de JANELA_LOTE depois de "a" e é entregue no mesmo lote
+    assert [[notificacao.titulo for notificacao in lote] for lote in recebidas] == [["a", "b"]]
+    assert list(agendador.agendados) == [(3, "lembrete")]
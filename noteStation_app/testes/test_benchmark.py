@@ -0,0 +1,45 @@
+"""
+Testes da suíte de benchmarks: geração reprodutível das tarefas, formato dos resultados e comparação entre execuções.
+
+Módulos importados:
+    - notestation_benchmark: Módulo contendo o gerador de tarefas, os benchmarks e a comparação dos resultados.
+"""
+
+from notestation_benchmark import *
+
+
+def test_gerador_e_reprodutivel():
+    primeiras = gerar_tarefas(200, semente=3)
+    segundas = gerar_tarefas(200, semente=3)
+
+    assert [(tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo()) for tarefa in primeiras] == \
+        [(tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo()) for tarefa in segundas]
+    assert len(gerar_organizador(200).tarefas_por_id) == 200
+
+
+def test_resultados_de_uma_execucao_pequena(tmp_path):
+    resultados = executar_benchmarks([50], repeticoes=2, operacoes=2, diretorio=str(tmp_path), partida=False)
+    medidas = resultados["resultados"]["50"]
+
+    assert {"carregar_json", "salvar_json", "get_tarefa", "editar", "desfazer"} <= set(medidas)
+
+    for resultado in medidas.values():
+        assert len(resultado["amostras"]) == 2
+        assert 0 <= resultado["min"] <= resultado["mediana"]
+
+
+def test_comparar_aponta_regressoes():
+    anterior = {"resultados": {"1000": {"editar": {"mediana": 1.0}, "desfazer": {"mediana": 1.0}}}}
+    atual = {"resultados": {"1000": {"editar": {"mediana": 1.1}, "desfazer": {"mediana": 1.5}, "nova": {"mediana": 9.0}}}}
+
+    assert comparar(anterior, atual, tolerancia=0.2) == [
+        ("1000", "editar", 1.0, 1.1, False),
+        ("1000", "desfazer", 1.0, 1.5, True)
+    ]
+
+
+def test_verificar_partida():
+    partida = {"importacao": {"mediana": 0.15}, "modulos_proibidos": ["dearpygui"]}
+
+    assert len(verificar_partida(partida, orcamento=0.1)) == 2
+    assert verificar_partida({"importacao": {"mediana": 0.05}, "modulos_proibidos": []}, orcamento=0.1) == []
@@ -0,0 +1,137 @@
+"""
+Testes da importação e da exportação em massa das tarefas, em NDJSON e em CSV (e da exportação em uma lista JSON),
+em lotes com progresso.
+
+Módulos importados:
+    - io: Módulo que fornece arquivos em memória (StringIO), usados como entrada e saída.
+    - json: Módulo que permite trabalhar com dados JSON, usado para montar os registros.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+    - gerenciamento_arquivos: Módulo contendo a importação e a exportação das tarefas.
+    - conftest: Módulo contendo a função criar_tarefa, compartilhada pelos testes.
+"""
+
+import io
+import json
+
+import pytest
+
+from tarefa_classes import *
+from gerenciamento_arquivos import *
+from conftest import criar_tarefa
+
+
+def ndjson(*registros) -> io.StringIO:
+    """
+    Monta um arquivo NDJSON em memória com um registro por linha.
+    """
+    return io.StringIO("".join(f'{json.dumps(registro)}\n' for registro in registros))
+
+
+@pytest.mark.parametrize("formato", ["ndjson", "csv"])
+def test_exportar_e_importar(formato):
+    origem = TarefaOrganizador()
+    origem.add_tarefa(criar_tarefa("Relatório", "Mensal", prioridade=True, lembrete="10:00", prazo="20/10/2030"))
+    origem.add_tarefa(criar_tarefa("Compras"))
+    origem.mark_tarefa(origem.get_tarefa("Compras"))
+
+    saida = io.StringIO(newline="")
+    assert exportar_tarefas(origem, saida, formato) == 2
+
+    destino = TarefaOrganizador()
+    resultado = importar_tarefas(destino, io.StringIO(saida.getvalue(), newline=""), formato)
+
+    assert resultado == ResultadoImportacao(2, 0)
+    assert [(tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo(), tarefa.base.concluida, tarefa.base.__class__.__name__) for tarefa in destino.tarefas] == [
+        (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo(), tarefa.base.concluida, tarefa.base.__class__.__name__) for tarefa in origem.tarefas
+    ]
+
+
+def test_titulos_duplicados_sao_ignorados():
+    organizador = TarefaOrganizador()
+    organizador.add_tarefa(criar_tarefa("a"))
+
+    resultado = importar_tarefas(organizador, ndjson({"titulo": "a"}, {"titulo": "b"}, {"titulo": "b"}, {"titulo": "c"}), tamanho_lote=2)
+
+    assert resultado == ResultadoImportacao(2, 2)
+    assert [tarefa.base.titulo for tarefa in organizador.tarefas] == ["a", "b", "c"]
+
+
+def test_cada_lote_e_uma_transacao():
+    organizador = TarefaOrganizador()
+
+    importar_tarefas(organizador, ndjson(*({"titulo": f"t{numero}"} for numero in range(5))), tamanho_lote=2)
+    organizador.desfazer()
+
+    assert [tarefa.base.titulo for tarefa in organizador.tarefas] == ["t0", "t1", "t2", "t3"]
+
+
+@pytest.mark.parametrize("registro, mensagem", [
+    ({"titulo": "y", "lembrete": 5}, 'linha 2: o campo "lembrete" deve ser um texto'),
+    ({"titulo": "y", "descricao": ["a"]}, 'linha 2: o campo "descricao" deve ser um texto'),
+    ({"titulo": "y", "prazo": 20301020}, 'linha 2: o campo "prazo" deve ser um texto'),
+    ({"titulo": 5}, 'linha 2: o campo "titulo" deve ser um texto'),
+    ({"descricao": "sem título"}, "linha 2: o título é obrigatório"),
+    ({"titulo": "y", "concluida": "talvez"}, "linha 2: valor booleano inválido: talvez")
+])
+def test_registro_invalido_indica_a_linha(registro, mensagem):
+    organizador = TarefaOrganizador()
+
+    with pytest.raises(ValueError) as erro:
+        importar_tarefas(organizador, ndjson({"titulo": "válida"}, registro))
+
+    assert str(erro.value) == mensagem
+    assert organizador.tarefas_por_id == {}
+
+
+def test_linha_que_nao_e_json():
+    with pytest.raises(ValueError, match="linha 1: JSON inválido"):
+        importar_tarefas(TarefaOrganizador(), io.StringIO("{titulo: x}\n"))
+
+
+def test_exportar_json_equivale_ao_ndjson():
+    organizador = TarefaOrganizador()
+
+    for titulo in ["b", "a", "c"]:
+        organizador.add_tarefa(criar_tarefa(titulo, "descrição \"entre aspas\""))
+
+    saida_ndjson = io.StringIO()
+    saida_json = io.StringIO()
+    exportar_tarefas(organizador, saida_ndjson, "ndjson")
+
+    assert exportar_tarefas(organizador, saida_json, "json", tamanho_lote=2) == 3
+    assert json.loads(saida_json.getvalue()) == [json.loads(linha) for linha in saida_ndjson.getvalue().splitlines()]
+
+    vazia = io.StringIO()
+    exportar_tarefas(TarefaOrganizador(), vazia, "json")
+    assert json.loads(vazia.getvalue()) == []
+
+
+def test_exportar_na_ordem_exibida_com_progresso():
+    organizador = TarefaOrganizador()
+
+    for titulo in ["c", "a", "d", "b", "e"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    organizador.sort_tarefas("Título")
+    saida = io.StringIO()
+    progresso = []
+
+    assert exportar_tarefas(organizador, saida, tamanho_lote=2, progresso=progresso.append) == 5
+    assert [json.loads(linha)["titulo"] for linha in saida.getvalue().splitlines()] == ["a", "b", "c", "d", "e"]
+    assert progresso == [2, 4, 5]
+
+
+def test_importar_informa_o_progresso_por_lote():
+    progresso = []
+    registros = ndjson(*({"titulo": titulo} for titulo in ["a", "b", "a", "c", "b", "d", "a"]))
+
+    assert importar_tarefas(TarefaOrganizador(), registros, tamanho_lote=2, progresso=progresso.append) == ResultadoImportacao(4, 3)
+    assert progresso == [ResultadoImportacao(2, 0), ResultadoImportacao(4, 2)]
+
+
+@pytest.mark.parametrize("funcao, formato", [(exportar_tarefas, "xml"), (importar_tarefas, "json")])
+def test_formato_desconhecido(funcao, formato):
+    with pytest.raises(ValueError, match="Formato de (exportação|importação) desconhecido"):
+        funcao(TarefaOrganizador(), io.StringIO(), formato)
@@ -0,0 +1,180 @@
+"""
+Testes do índice de busca: relevância, consistência com o organizador após comandos, transações, desfazer e
+refazer, e equivalência da busca limitada com a pontuação completa.
+
+Módulos importados:
+    - random: Módulo de números aleatórios, usado para gerar tarefas e consultas reprodutíveis.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, o organizador e o índice de busca.
+    - conftest: Módulo contendo a função criar_tarefa, compartilhada pelos testes.
+"""
+
+import random
+
+import pytest
+
+from tarefa_classes import *
+from conftest import criar_tarefa
+
+
+@pytest.fixture
+def organizador():
+    """
+    Organizador com três tarefas, observado por um índice de busca.
+    """
+    organizador = TarefaOrganizador()
+
+    organizador.add_tarefa(criar_tarefa("Enviar relatório", "Relatório mensal"))
+    organizador.add_tarefa(criar_tarefa("Comprar café", lembrete="09:00"))
+    organizador.add_tarefa(criar_tarefa("Reunião de equipe", prazo="20/10/2030"))
+
+    IndiceBusca(organizador).construir()
+
+    return organizador
+
+
+def indice_de(organizador: TarefaOrganizador) -> IndiceBusca:
+    """
+    Obtém o índice de busca que observa o organizador.
+    """
+    return next(observador for observador in organizador.observadores if isinstance(observador, IndiceBusca))
+
+
+def ordem_indexacao(indice: IndiceBusca) -> dict:
+    """
+    Obtém a ordem de indexação de cada tarefa, a partir das ocorrências do índice.
+    """
+    return {tarefa_id: ordem for grupos in indice.postings.values() for ids in grupos.values() for tarefa_id, ordem in ids.items()}
+
+
+def test_relevancia_favorece_titulo_palavra_exata_e_tarefas_recentes():
+    organizador = TarefaOrganizador()
+
+    organizador.add_tarefa(criar_tarefa("Planilha", "relatório"))
+    organizador.add_tarefa(criar_tarefa("Relatórios"))
+    organizador.add_tarefa(criar_tarefa("Relatório"))
+    organizador.add_tarefa(criar_tarefa("Outro relatório"))
+
+    indice = IndiceBusca(organizador)
+    indice.construir()
+
+    # Título com a palavra exata, do mais recente para o mais antigo; depois o prefixo no título; por fim a descrição
+    assert indice.buscar("relatorio") == [3, 2, 1, 0]
+    assert indice.buscar("RELAT") == [3, 2, 1, 0]
+
+    organizador.edit_tarefa(organizador.get_tarefa("Relatório"), "Relatório", "", "", "")
+    assert indice.buscar("relatorio") == [2, 3, 1, 0]
+
+
+def test_busca_acompanha_os_comandos(organizador):
+    indice = indice_de(organizador)
+    tarefa = organizador.get_tarefa("Comprar café")
+
+    assert indice.buscar("cafe") == [tarefa.base.id]
+    assert indice.buscar("comp caf") == [tarefa.base.id]
+
+    organizador.edit_tarefa(tarefa, "Comprar chá", "", "", "")
+    assert indice.buscar("cafe") == []
+    assert indice.buscar("cha") == [tarefa.base.id]
+
+    organizador.desfazer()
+    assert indice.buscar("cafe") == [tarefa.base.id]
+    assert "cha" not in indice.vocabulario
+
+    organizador.del_tarefa(tarefa)
+    assert indice.buscar("cafe") == []
+
+    organizador.desfazer()
+    assert indice.buscar("cafe") == [tarefa.base.id]
+
+
+def test_transacao_que_exclui_e_edita_nao_reindexa(organizador):
+    indice = indice_de(organizador)
+    tarefa = organizador.get_tarefa("Comprar café")
+
+    with organizador.transacao():
+        organizador.del_tarefa(tarefa)
+        organizador.edit_tarefa(tarefa, "zeta", "", "", "")
+
+    assert indice.buscar("zeta") == []
+    assert indice.buscar("cafe") == []
+    assert tarefa.base.id not in indice.palavras_por_id
+
+    organizador.desfazer()
+    assert indice.buscar("cafe") == [tarefa.base.id]
+
+    organizador.refazer()
+    assert indice.buscar("zeta") == []
+    assert all(tarefa_id in organizador.tarefas_por_id for tarefa_id in indice.palavras_por_id)
+
+
+def test_corresponde_verifica_todos_os_termos(organizador):
+    indice = indice_de(organizador)
+    tarefa_id = organizador.get_tarefa("Enviar relatório").base.id
+
+    assert indice.corresponde("env rel", tarefa_id)
+    assert indice.corresponde("MENSAL", tarefa_id)
+    assert not indice.corresponde("env cafe", tarefa_id)
+    assert not indice.corresponde("", tarefa_id)
+    assert not indice.corresponde("env", 999)
+
+
+def test_busca_limitada_equivale_a_pontuacao_completa():
+    gerador = random.Random(13)
+    palavras = ["ab", "abc", "abd", "b", "bc", "bcd", "c", "cd", "d", "da"]
+    organizador = TarefaOrganizador()
+    indice = IndiceBusca(organizador)
+    indice.construir()
+
+    for _ in range(600):
+        organizador.add_tarefa(criar_tarefa(" ".join(gerador.choices(palavras, k=2)), " ".join(gerador.choices(palavras, k=3))))
+
+    # Edições reindexam as tarefas, de modo que a ordem de indexação difere da ordem dos IDs
+    for tarefa in gerador.sample(organizador.tarefas, 100):
+        organizador.edit_tarefa(tarefa, " ".join(gerador.choices(palavras, k=2)), "", "", "")
+
+    ordem = ordem_indexacao(indice)
+
+    for _ in range(200):
+        consulta = " ".join(gerador.choices(palavras + ["a", "e"], k=gerador.randint(1, 3)))
+        limite = gerador.randint(1, 50)
+        pontos = indice.pontuar_consulta(consulta)
+        esperado = sorted(pontos, key=lambda tarefa_id: (pontos[tarefa_id], ordem[tarefa_id]), reverse=True)
+
+        assert indice.buscar(consulta, limite, candidatos=None) == esperado[:limite]
+        assert not indice.aproximada
+
+        pares = indice.buscar(consulta, limite, aceitar=lambda tarefa_id: tarefa_id % 2 == 0, candidatos=None)
+        assert pares == [tarefa_id for tarefa_id in esperado if tarefa_id % 2 == 0][:limite]
+
+
+def test_busca_com_muitos_descartes_e_aproximada():
+    organizador = TarefaOrganizador()
+    tarefas = [criar_tarefa(f"alfa beta {numero}") for numero in range(5)]
+    tarefas += [criar_tarefa(f"alfa {numero}") for numero in range(3000)] + [criar_tarefa(f"beta {numero}") for numero in range(3000)]
+    organizador.carregar_lote(tarefas)
+    indice = IndiceBusca(organizador)
+    indice.construir()
+
+    # As tarefas com os dois termos são as mais antigas: a busca para antes de chegar a elas
+    assert indice.buscar("alfa beta", candidatos=100) == []
+    assert indice.aproximada
+
+    assert indice.buscar("alfa beta", candidatos=None) == [4, 3, 2, 1, 0]
+    assert not indice.aproximada
+
+    # Com um único termo nenhuma tarefa é descartada
+    assert len(indice.buscar("alfa", limite=10, candidatos=0)) == 10
+    assert not indice.aproximada
+
+
+def test_total_de_um_termo_frequente_nao_e_truncado():
+    organizador = TarefaOrganizador()
+    organizador.carregar_lote([criar_tarefa(f"comum {numero}") for numero in range(8001)])
+    indice = IndiceBusca(organizador)
+    indice.construir()
+
+    assert len(indice.pontuar_consulta("comum")) == 8001
+    assert len(indice.buscar("comum", limite=100000)) == 8001
+    assert indice.buscar("comum", limite=3) == [8000, 7999, 7998]
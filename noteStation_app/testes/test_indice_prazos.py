@@ -0,0 +1,141 @@
+"""
+Testes do índice de prazos: consultas por intervalo, atrasadas e contagens por dia, mantidas a cada comando.
+
+Módulos importados:
+    - random: Módulo de números aleatórios, usado para gerar sequências reprodutíveis de operações.
+    - date, timedelta: Classes do módulo datetime usadas nos prazos e intervalos consultados.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, o organizador e o índice de prazos.
+    - conftest: Módulo contendo a função criar_tarefa, compartilhada pelos testes.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from tarefa_classes import *
+from conftest import criar_tarefa
+
+
+@pytest.fixture
+def organizador():
+    """
+    Organizador com tarefas em três dias de outubro de 2030 (uma delas concluída) e uma sem prazo, observado por
+    um índice de prazos.
+    """
+    organizador = TarefaOrganizador()
+
+    for titulo, prazo in [("a", "10/10/2030"), ("b", "12/10/2030"), ("c", "10/10/2030"), ("d", None), ("e", "20/10/2030"), ("f", "12/10/2030")]:
+        organizador.add_tarefa(criar_tarefa(titulo, prazo=prazo))
+
+    organizador.mark_tarefa(organizador.get_tarefa("f"))
+
+    prazos = IndicePrazos(organizador)
+    prazos.construir()
+    organizador.observadores.append(prazos)
+
+    return organizador
+
+
+def indice_de(organizador: TarefaOrganizador) -> IndicePrazos:
+    """
+    Obtém o índice de prazos que observa o organizador.
+    """
+    return next(observador for observador in organizador.observadores if isinstance(observador, IndicePrazos))
+
+
+def test_consultas_por_intervalo(organizador):
+    prazos = indice_de(organizador)
+
+    assert len(prazos) == 4
+    assert prazos.intervalo() == [0, 2, 1, 4]
+    assert prazos.intervalo(date(2030, 10, 11), date(2030, 10, 20)) == [1, 4]
+    assert prazos.intervalo(date(2030, 10, 13), date(2030, 10, 19)) == []
+    assert prazos.intervalo(None, date(2030, 10, 10)) == [0, 2]
+    assert prazos.do_dia(date(2030, 10, 10)) == [0, 2]
+
+
+def test_atrasadas(organizador):
+    prazos = indice_de(organizador)
+
+    assert prazos.atrasadas(date(2030, 10, 10)) == []
+    assert prazos.atrasadas(date(2030, 10, 13)) == [0, 2, 1]
+    assert prazos.atrasadas(date(2031, 1, 1)) == [0, 2, 1, 4]
+
+
+def test_contagens(organizador):
+    prazos = indice_de(organizador)
+
+    assert prazos.contagem_dia(date(2030, 10, 10)) == 2
+    assert prazos.contagem_dia(date(2030, 10, 12)) == 1
+    assert prazos.contagem_dia(date(2030, 10, 11)) == 0
+    assert prazos.contagem_por_dia(date(2030, 10, 1), date(2030, 10, 31)) == {date(2030, 10, 10): 2, date(2030, 10, 12): 1, date(2030, 10, 20): 1}
+    assert prazos.contagem_por_dia(date(2030, 10, 11), date(2030, 10, 12)) == {date(2030, 10, 12): 1}
+
+
+def test_indice_acompanha_os_comandos(organizador):
+    prazos = indice_de(organizador)
+    tarefa = organizador.get_tarefa("a")
+
+    organizador.edit_tarefa(tarefa, "a", "", "", "15/10/2030")
+    assert prazos.contagem_dia(date(2030, 10, 10)) == 1
+    assert prazos.do_dia(date(2030, 10, 15)) == [0]
+
+    organizador.mark_tarefa(organizador.get_tarefa("c"))
+    assert prazos.intervalo() == [1, 0, 4]
+
+    organizador.del_tarefa(organizador.get_tarefa("b"))
+    assert prazos.contagem_dia(date(2030, 10, 12)) == 0
+
+    for _ in range(3):
+        organizador.desfazer()
+
+    assert prazos.intervalo() == [0, 2, 1, 4]
+
+
+def test_transacao_que_exclui_e_edita_nao_reindexa(organizador):
+    prazos = indice_de(organizador)
+    tarefa = organizador.get_tarefa("a")
+
+    with organizador.transacao():
+        organizador.del_tarefa(tarefa)
+        organizador.edit_tarefa(tarefa, "a", "", "", "1/11/2030")
+
+    assert prazos.intervalo() == [2, 1, 4]
+
+    organizador.desfazer()
+    assert prazos.intervalo() == [0, 2, 1, 4]
+
+
+def test_indice_equivale_a_percorrer_as_tarefas():
+    gerador = random.Random(18)
+    organizador = TarefaOrganizador()
+    prazos = IndicePrazos(organizador)
+    prazos.construir()
+    organizador.observadores.append(prazos)
+    inicio = date(2030, 1, 1)
+
+    for passo in range(500):
+        operacao = gerador.random()
+        tarefas = organizador.tarefas
+        prazo = f"{(inicio + timedelta(days=gerador.randrange(60))):%d/%m/%Y}" if gerador.random() < 0.8 else None
+
+        if operacao < 0.4 or not tarefas:
+            organizador.add_tarefa(criar_tarefa(f"t{passo}", prazo=prazo))
+        elif operacao < 0.6:
+            organizador.edit_tarefa(gerador.choice(tarefas), f"t{passo}", "", "", prazo or "")
+        elif operacao < 0.75:
+            organizador.mark_tarefa(gerador.choice(tarefas))
+        elif operacao < 0.85:
+            organizador.del_tarefa(gerador.choice(tarefas))
+        else:
+            organizador.desfazer()
+
+    pendentes = sorted((tarefa.base.get_data_prazo(), tarefa.base.id) for tarefa in organizador.tarefas if tarefa.base.get_data_prazo() and not tarefa.base.concluida)
+    meio = inicio + timedelta(days=30)
+
+    assert prazos.intervalo() == [tarefa_id for _, tarefa_id in pendentes]
+    assert prazos.atrasadas(meio) == [tarefa_id for prazo, tarefa_id in pendentes if prazo < meio]
+    assert sum(prazos.contagem_por_dia(inicio, inicio + timedelta(days=59)).values()) == len(pendentes)
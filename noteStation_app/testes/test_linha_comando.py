@@ -0,0 +1,136 @@
+"""
+Testes da interface de linha de comando: cada comando executado por "main", sobre arquivos temporários, com a
+saída conferida.
+
+Módulos importados:
+    - pytest: Framework de testes.
+
+    - notestation_cli: Módulo contendo a função main da linha de comando.
+"""
+
+import pytest
+
+from notestation_cli import main
+
+
+def executar(capsys, arquivo: str, *argumentos: str) -> list:
+    """
+    Executa um comando sobre um arquivo de tarefas e verifica que ele terminou sem erro.
+
+    Parâmetros:
+        - capsys: A fixture do pytest que captura a saída.
+        - arquivo (str): O arquivo de tarefas.
+        - *argumentos (str): O comando e os seus argumentos.
+
+    Retorna:
+        - List[str]: As linhas escritas na saída padrão.
+    """
+    codigo = main(["--arquivo", arquivo, *argumentos])
+    saida = capsys.readouterr()
+
+    assert codigo == 0, saida.err
+
+    return saida.out.splitlines()
+
+
+def titulos(linhas: list) -> list:
+    """
+    Obtém os títulos das linhas de "list", "done" e "search" (após o ID e a marca de conclusão).
+    """
+    return [linha[11:].split(" (")[0] for linha in linhas]
+
+
+@pytest.fixture
+def arquivo(tmp_path, capsys) -> str:
+    """
+    Arquivo JSON (com diário) com quatro tarefas criadas pela linha de comando.
+    """
+    caminho = str(tmp_path / "tarefas.json")
+
+    executar(capsys, caminho, "add", "gama", "--descricao", "reunião mensal")
+    executar(capsys, caminho, "add", "Alfa", "--prioridade", "--prazo", "20/10/2030")
+    executar(capsys, caminho, "add", "beta", "--lembrete", "Ligar 10:00")
+    executar(capsys, caminho, "add", "delta")
+
+    return caminho
+
+
+def test_add_e_list(arquivo, capsys):
+    linhas = executar(capsys, arquivo, "list")
+
+    assert titulos(linhas) == ["gama", "Alfa", "beta", "delta"]
+    assert linhas[1] == "     1 [ ] Alfa (prazo: 20/10/2030)"
+    assert linhas[2] == "     2 [ ] beta (lembrete: Ligar 10:00)"
+
+    assert titulos(executar(capsys, arquivo, "list", "--ordem", "Título")) == ["Alfa", "beta", "delta", "gama"]
+    assert titulos(executar(capsys, arquivo, "list", "--limite", "2")) == ["gama", "Alfa"]
+
+
+def test_done_e_delete_por_titulo_ou_id(arquivo, capsys):
+    assert executar(capsys, arquivo, "done", "beta", "0") == ["     2 [x] beta (lembrete: Ligar 10:00)", "     0 [x] gama"]
+
+    assert titulos(executar(capsys, arquivo, "list", "--pendentes")) == ["Alfa", "delta"]
+    assert titulos(executar(capsys, arquivo, "list", "--concluidas")) == ["gama", "beta"]
+
+    assert executar(capsys, arquivo, "delete", "Alfa", "3") == ["2 tarefa(s) excluída(s)"]
+    assert titulos(executar(capsys, arquivo, "list")) == ["gama", "beta"]
+
+
+@pytest.mark.parametrize("argumentos, mensagem", [
+    (["add", "beta"], "Já existe uma tarefa com o título: beta"),
+    (["done", "inexistente"], "Tarefa não encontrada: inexistente"),
+    (["add", "x", "--prazo", "31/2/2030"], "day is out of range"),
+    (["convert", "outro.json"], "a conversão deve ser"),
+    (["import", "inexistente.ndjson"], "Arquivo não encontrado")
+])
+def test_erros_sao_informados_com_codigo_de_saida(arquivo, capsys, argumentos, mensagem):
+    assert main(["--arquivo", arquivo, *argumentos]) == 1
+
+    erro = capsys.readouterr().err
+    assert erro.startswith("notestation: ") and mensagem in erro
+    assert len(executar(capsys, arquivo, "list")) == 4
+
+
+def test_search(arquivo, capsys):
+    assert titulos(executar(capsys, arquivo, "search", "REUNIAO")) == ["gama"]
+    assert titulos(executar(capsys, arquivo, "search", "ligar 10")) == ["beta"]
+    assert executar(capsys, arquivo, "search", "inexistente") == []
+
+
+@pytest.mark.parametrize("extensao", ["ndjson", "csv"])
+def test_export_e_import(arquivo, capsys, tmp_path, extensao):
+    exportado = str(tmp_path / f"tarefas.{extensao}")
+    novo = str(tmp_path / "novo.json")
+
+    executar(capsys, arquivo, "export", "--saida", exportado)
+    executar(capsys, novo, "add", "beta")
+
+    assert executar(capsys, novo, "import", exportado) == ["3 tarefa(s) importada(s), 1 ignorada(s) por título repetido"]
+
+    linhas = executar(capsys, novo, "list")
+    assert titulos(linhas) == ["beta", "gama", "Alfa", "delta"]
+    assert linhas[2] == "     2 [ ] Alfa (prazo: 20/10/2030)"
+
+
+def test_convert_ida_e_volta(arquivo, capsys, tmp_path):
+    binario = str(tmp_path / "tarefas.nsb")
+    de_volta = str(tmp_path / "de_volta.json")
+    original = executar(capsys, arquivo, "list")
+
+    assert executar(capsys, arquivo, "convert", binario) == [f"4 tarefa(s) convertida(s) para {binario}"]
+    assert executar(capsys, binario, "list") == original
+
+    executar(capsys, binario, "convert", de_volta)
+    assert executar(capsys, de_volta, "list") == original
+
+
+@pytest.mark.parametrize("filtros", [[], ["--ordem", "Título"], ["--ordem", "Tipo de tarefa", "--pendentes"], ["--concluidas"], ["--limite", "3"]])
+def test_list_de_banco_sqlite_equivale_a_lista_carregada(arquivo, capsys, tmp_path, filtros):
+    banco = str(tmp_path / "tarefas.db")
+
+    executar(capsys, arquivo, "export", "--saida", str(tmp_path / "tarefas.ndjson"))
+    executar(capsys, banco, "import", str(tmp_path / "tarefas.ndjson"))
+    executar(capsys, banco, "done", "beta")
+    executar(capsys, arquivo, "done", "beta")
+
+    assert executar(capsys, banco, "list", *filtros) == executar(capsys, arquivo, "list", *filtros)
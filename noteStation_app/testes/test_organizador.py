@@ -0,0 +1,311 @@
+"""
+Testes do TarefaOrganizador: visões ordenadas mantidas a cada operação, histórico limitado de desfazer e refazer,
+transações e retratos imutáveis lidos por outras threads.
+
+Módulos importados:
+    - random: Módulo de números aleatórios, usado para gerar sequências reprodutíveis de operações.
+    - threading: Módulo que fornece threads, usado para ler retratos enquanto o organizador é alterado.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+    - tarefa_classes.tarefa: Módulo contendo as chaves de ordenação das visões e os registros dos retratos.
+    - conftest: Módulo contendo as funções compartilhadas pelos testes.
+"""
+
+import random
+import threading
+
+import pytest
+
+from tarefa_classes import *
+from tarefa_classes.tarefa import CHAVES_ORDENACAO, RegistroTarefa
+from conftest import criar_tarefa
+
+
+def titulos(organizador: TarefaOrganizador) -> list:
+    """
+    Obtém os títulos das tarefas do organizador, na ordem de exibição.
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+
+    Retorna:
+        - List[str]: Os títulos.
+    """
+    return [tarefa.base.titulo for tarefa in organizador.tarefas]
+
+
+def ordenados(organizador: TarefaOrganizador, filtro: str) -> list:
+    """
+    Ordena do zero os IDs das tarefas pela chave de um filtro, com o ID como desempate.
+
+    Parâmetros:
+        - organizador (TarefaOrganizador): O organizador.
+        - filtro (str): O filtro de ordenação.
+
+    Retorna:
+        - List[int]: Os IDs ordenados.
+    """
+    chave = CHAVES_ORDENACAO[filtro]
+    return sorted(organizador.tarefas_por_id, key=lambda tarefa_id: (chave(organizador.tarefas_por_id[tarefa_id].base), tarefa_id))
+
+
+def test_ordenar_e_desfazer_troca_a_visao_exibida():
+    organizador = TarefaOrganizador()
+
+    for titulo, prioridade in [("beta", False), ("Alfa", True), ("gama", False)]:
+        organizador.add_tarefa(criar_tarefa(titulo, prioridade=prioridade))
+
+    organizador.sort_tarefas("Título")
+    assert titulos(organizador) == ["Alfa", "beta", "gama"]
+
+    organizador.sort_tarefas("Tipo de tarefa")
+    assert titulos(organizador) == ["Alfa", "beta", "gama"]
+
+    organizador.desfazer()
+    assert organizador.ordem == "Título"
+
+    organizador.desfazer()
+    assert organizador.ordem is None
+    assert titulos(organizador) == ["beta", "Alfa", "gama"]
+
+
+def test_visoes_acompanham_inclusoes_exclusoes_e_renomeacoes():
+    gerador = random.Random(10)
+    organizador = TarefaOrganizador()
+
+    # Monta as visões antes das operações, para que sejam atualizadas de forma incremental
+    for filtro in CHAVES_ORDENACAO:
+        organizador.visao(filtro)
+
+    for passo in range(400):
+        operacao = gerador.random()
+        tarefas = organizador.tarefas
+
+        if operacao < 0.5 or not tarefas:
+            organizador.add_tarefa(criar_tarefa(f"{gerador.choice('abcABC')}{passo}", prioridade=gerador.random() < 0.5))
+        elif operacao < 0.7:
+            organizador.del_tarefa(gerador.choice(tarefas))
+        elif operacao < 0.85:
+            organizador.edit_tarefa(gerador.choice(tarefas), f"{gerador.choice('xyzXYZ')}{passo}", "", "", "")
+        else:
+            organizador.desfazer()
+
+        if passo % 50 == 0:
+            organizador.sort_tarefas(gerador.choice(list(CHAVES_ORDENACAO)))
+
+    for filtro in CHAVES_ORDENACAO:
+        assert organizador.visao(filtro) == ordenados(organizador, filtro)
+
+
+def test_filtro_desconhecido_e_recusado():
+    organizador = TarefaOrganizador()
+
+    with pytest.raises(ValueError):
+        organizador.definir_ordem("Cor")
+
+
+def test_historico_descarta_os_comandos_mais_antigos():
+    organizador = TarefaOrganizador(limite_comandos=3)
+
+    for indice in range(5):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    for _ in range(5):
+        organizador.desfazer()
+
+    assert titulos(organizador) == ["t0", "t1"]
+    assert len(organizador.desfeitos) == 3
+
+
+def test_historico_respeita_o_limite_de_memoria():
+    organizador = TarefaOrganizador(limite_bytes=1)
+
+    for indice in range(3):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    # O comando mais recente é mantido mesmo que sozinho ultrapasse o limite
+    assert len(organizador.comandos) == 1
+
+    tamanho = organizador.tamanhos[0]
+    organizador = TarefaOrganizador(limite_bytes=2 * tamanho)
+
+    for indice in range(6):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    assert organizador.bytes_historico <= 2 * tamanho
+    assert organizador.bytes_historico == sum(organizador.tamanhos)
+
+
+def test_desfazer_e_refazer_edicao():
+    organizador = TarefaOrganizador()
+    tarefa = criar_tarefa("Relatório", "Rascunho", lembrete="10:00", prazo="20/10/2030")
+    organizador.add_tarefa(tarefa)
+    antes = (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo())
+
+    organizador.edit_tarefa(tarefa, "Relatório final", "Enviado", "11:00", "21/10/2030")
+    depois = (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo())
+
+    organizador.desfazer()
+    assert (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo()) == antes
+    assert organizador.get_tarefa("Relatório") is tarefa
+
+    organizador.refazer()
+    assert (tarefa.base.titulo, tarefa.base.descricao, tarefa.base.get_lembrete(), tarefa.base.get_prazo()) == depois
+    assert organizador.get_tarefa("Relatório final") is tarefa
+
+
+def test_novo_comando_descarta_a_pilha_de_refazer():
+    organizador = TarefaOrganizador()
+    organizador.add_tarefa(criar_tarefa("a"))
+    organizador.add_tarefa(criar_tarefa("b"))
+
+    organizador.desfazer()
+    organizador.add_tarefa(criar_tarefa("c"))
+    organizador.refazer()
+
+    assert titulos(organizador) == ["a", "c"]
+    assert not organizador.desfeitos
+    assert organizador.bytes_historico == sum(organizador.tamanhos)
+
+
+def test_desfazer_e_refazer_sem_historico_nao_fazem_nada():
+    organizador = TarefaOrganizador()
+
+    organizador.desfazer()
+    organizador.refazer()
+
+    assert organizador.tarefas == ()
+
+
+def test_transacao_interrompida_desfaz_os_comandos_ja_executados():
+    organizador = TarefaOrganizador()
+    organizador.add_tarefa(criar_tarefa("x"))
+    tarefa = organizador.get_tarefa("x")
+
+    with pytest.raises(KeyError):
+        with organizador.transacao():
+            organizador.add_tarefa(criar_tarefa("y"))
+            organizador.edit_tarefa(tarefa, "x2", "", "", "")
+            organizador.mark_tarefa(tarefa)
+            raise KeyError("falha")
+
+    assert titulos(organizador) == ["x"]
+    assert not tarefa.base.concluida
+    assert organizador.lote is None
+    assert (len(organizador.comandos), len(organizador.desfeitos)) == (1, 0)
+
+
+@pytest.mark.parametrize("operacao", ["desfazer", "refazer"])
+def test_desfazer_e_refazer_sao_recusados_dentro_da_transacao(operacao):
+    organizador = TarefaOrganizador()
+    organizador.add_tarefa(criar_tarefa("a"))
+    organizador.add_tarefa(criar_tarefa("x"))
+    organizador.desfazer()
+
+    with pytest.raises(RuntimeError):
+        with organizador.transacao():
+            organizador.add_tarefa(criar_tarefa("y"))
+            getattr(organizador, operacao)()
+
+    # A transação é desfeita por inteiro e o histórico anterior continua intacto
+    assert titulos(organizador) == ["a"]
+    assert (len(organizador.comandos), len(organizador.desfeitos)) == (1, 1)
+
+    organizador.refazer()
+    assert titulos(organizador) == ["a", "x"]
+
+
+def test_lote_e_desfeito_e_refeito_como_uma_entrada():
+    organizador = TarefaOrganizador()
+
+    for titulo in ["a", "b", "c"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    organizador.del_tarefas([organizador.get_tarefa("a"), organizador.get_tarefa("c")])
+    assert titulos(organizador) == ["b"]
+
+    organizador.desfazer()
+    assert sorted(titulos(organizador)) == ["a", "b", "c"]
+
+    organizador.refazer()
+    assert titulos(organizador) == ["b"]
+    assert len(organizador.comandos) == 4
+
+
+def test_retrato_nao_muda_com_as_escritas_seguintes():
+    organizador = TarefaOrganizador()
+    organizador.add_tarefa(criar_tarefa("a", "primeira"))
+    organizador.add_tarefa(criar_tarefa("b"))
+
+    retrato = organizador.retrato()
+    assert organizador.retrato() is retrato
+
+    organizador.edit_tarefa(organizador.get_tarefa("a"), "z", "alterada", "", "")
+    organizador.del_tarefa(organizador.get_tarefa("b"))
+    organizador.add_tarefa(criar_tarefa("c"))
+    organizador.sort_tarefas("Título")
+
+    assert [(registro.id, registro.titulo, registro.descricao) for registro in retrato] == [(0, "a", "primeira"), (1, "b", "")]
+    assert retrato.ordem is None
+
+    novo = organizador.retrato()
+    assert novo.versao > retrato.versao
+    assert [registro.titulo for registro in novo] == ["c", "z"]
+    assert novo.ordem == "Título"
+
+    with pytest.raises(TypeError):
+        novo.registros[5] = novo.get(0)
+
+
+def test_retrato_acompanha_desfazer_e_descarte_do_cache():
+    organizador = TarefaOrganizador()
+    tarefa = criar_tarefa("a", lembrete="10:00")
+    organizador.add_tarefa(tarefa)
+    organizador.retrato()
+
+    organizador.mark_tarefa(tarefa)
+    assert organizador.retrato().get(0).concluida
+
+    organizador.desfazer()
+    assert not organizador.retrato().get(0).concluida
+
+    organizador.descartar_retratos()
+    assert organizador.retrato().itens() == [(0, RegistroTarefa.de_tarefa(tarefa))]
+
+
+def test_leitores_em_outra_thread_nao_veem_transacoes_pela_metade():
+    organizador = TarefaOrganizador()
+    pares = [(criar_tarefa(f"{numero}a"), criar_tarefa(f"{numero}b")) for numero in range(20)]
+
+    for primeira, segunda in pares:
+        organizador.add_tarefa(primeira)
+        organizador.add_tarefa(segunda)
+
+    parar = threading.Event()
+    inconsistentes = []
+
+    def ler():
+        while not parar.is_set():
+            retrato = organizador.retrato()
+            registros = list(retrato)
+
+            # As duas tarefas de cada par sempre recebem a mesma descrição na mesma transação
+            if len(registros) != len(retrato.registros) or any(registros[posicao].descricao != registros[posicao + 1].descricao for posicao in range(0, len(registros), 2)):
+                inconsistentes.append(retrato.versao)
+
+    leitor = threading.Thread(target=ler)
+    leitor.start()
+
+    try:
+        for rodada in range(300):
+            primeira, segunda = pares[rodada % len(pares)]
+
+            with organizador.transacao():
+                organizador.edit_tarefa(primeira, primeira.base.titulo, f"rodada {rodada}", "", "")
+                organizador.edit_tarefa(segunda, segunda.base.titulo, f"rodada {rodada}", "", "")
+    finally:
+        parar.set()
+        leitor.join()
+
+    assert inconsistentes == []
@@ -0,0 +1,437 @@
+"""
+Testes das persistências: ida e volta das tarefas pelo arquivo, diário, compactação, gravações que falham e consultas
+ao banco SQLite.
+
+Módulos importados:
+    - os: Módulo que fornece uma maneira de usar funcionalidades dependentes do sistema operacional.
+    - json: Módulo da biblioteca padrão, usado como referência do formato do arquivo JSON.
+    - threading: Módulo de threads, usado para verificar em qual thread a compactação codifica as tarefas.
+    - time: Módulo que fornece funções de medição de tempo, usado para aguardar as novas tentativas de gravação.
+    - sqlite3: Módulo de acesso a bancos SQLite, usado para montar um banco no esquema anterior à chave de título.
+    - pytest: Framework de testes.
+
+    - tarefa_classes: Módulo contendo as classes de tarefas, as fábricas e o organizador.
+    - gerenciamento_arquivos: Módulo contendo as persistências e o TarefaEncoder.
+    - gerenciamento_arquivos.persistencia_tarefas: Módulo cuja função codificar_tarefas é observada no teste da compactação.
+    - gerenciamento_arquivos.gravador_tarefas: Módulo contendo o gravador em segundo plano.
+    - gerenciamento_arquivos.persistencia_binaria: Módulo cuja função escrever_snapshot é observada no teste da
+      compactação com textos sob demanda.
+    - gerenciamento_arquivos.json_tarefa_encoder: Módulo cujo tamanho das partes é reduzido no teste da codificação
+      em paralelo.
+    - conftest: Módulo contendo as funções compartilhadas pelos testes.
+"""
+
+import os
+import json
+import threading
+import time
+import sqlite3
+
+import pytest
+
+from tarefa_classes import *
+from gerenciamento_arquivos import *
+from gerenciamento_arquivos.json_tarefa_encoder import TarefaEncoder
+import gerenciamento_arquivos.persistencia_tarefas as persistencia_tarefas
+from gerenciamento_arquivos.gravador_tarefas import GravadorSegundoPlano
+import gerenciamento_arquivos.persistencia_binaria as persistencia_binaria
+import gerenciamento_arquivos.json_tarefa_encoder as json_tarefa_encoder
+from conftest import criar_tarefa, abrir, reabrir, resumo
+
+PERSISTENCIAS = [
+    (PersistenciaJson, "tarefas.json"),
+    (PersistenciaDiario, "tarefas.json"),
+    (PersistenciaSQLite, "tarefas.db"),
+    (PersistenciaBinaria, "tarefas.nsb"),
+    (PersistenciaFragmentada, "tarefas.fragmentos")
+]
+
+# Método de cada persistência que efetivamente escreve no disco, substituído para simular uma falha
+ESCRITAS = {
+    PersistenciaDiario: "escrever_diario",
+    PersistenciaSQLite: "aplicar_pendencias",
+    PersistenciaBinaria: "escrever_diario",
+    PersistenciaFragmentada: "gravar_fragmentos"
+}
+
+
+@pytest.mark.parametrize("classe, nome", PERSISTENCIAS)
+def test_ida_e_volta(tmp_path, classe, nome):
+    caminho = str(tmp_path / nome)
+    organizador, persistencia = abrir(classe, caminho)
+
+    organizador.add_tarefa(criar_tarefa("Relatório", "Enviar à diretoria", prioridade=True, lembrete="10:00", prazo="20/10/2030"))
+    organizador.add_tarefa(criar_tarefa("Compras", "Pão e leite"))
+    organizador.add_tarefa(criar_tarefa("Reunião", lembrete="14:30"))
+    organizador.add_tarefa(criar_tarefa("Descartada"))
+
+    organizador.mark_tarefa(organizador.get_tarefa("Compras"))
+    organizador.edit_tarefa(organizador.get_tarefa("Reunião"), "Reunião semanal", "Sala 2", "15:00", "21/10/2030")
+    organizador.del_tarefa(organizador.get_tarefa("Descartada"))
+    esperado = resumo(organizador)
+    persistencia.fechar()
+
+    assert resumo(reabrir(classe, caminho)) == esperado
+
+
+@pytest.mark.parametrize("classe, nome", PERSISTENCIAS)
+def test_desfazer_exclusao_devolve_a_tarefa_ao_fim(tmp_path, classe, nome):
+    caminho = str(tmp_path / nome)
+    organizador, persistencia = abrir(classe, caminho)
+
+    for titulo in ["a", "b", "c"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    organizador.del_tarefa(organizador.get_tarefa("a"))
+    organizador.desfazer()
+    persistencia.fechar()
+
+    assert [tarefa.base.titulo for tarefa in reabrir(classe, caminho).tarefas] == ["b", "c", "a"]
+
+
+def test_diario_e_compactado_no_snapshot(tmp_path):
+    caminho = str(tmp_path / "tarefas.json")
+    organizador, persistencia = abrir(PersistenciaDiario, caminho, limite_compactacao=200, assincrono=False)
+
+    for indice in range(30):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    organizador.sort_tarefas("Título")
+    persistencia.fechar()
+
+    # O diário foi reiniciado pela compactação e guarda apenas os registros posteriores a ela
+    assert os.path.getsize(persistencia.dir_diario) < os.path.getsize(caminho)
+
+    reaberto = reabrir(PersistenciaDiario, caminho)
+    assert [tarefa.base.titulo for tarefa in reaberto.tarefas] == sorted(f"t{indice}" for indice in range(30))
+
+
+def test_arquivo_json_tem_o_formato_original(tmp_path):
+    caminho = str(tmp_path / "tarefas.json")
+    organizador, persistencia = abrir(PersistenciaJson, caminho, assincrono=False)
+
+    organizador.add_tarefa(criar_tarefa("Relatório", "Enviar à diretoria", prioridade=True, lembrete="10:00", prazo="20/10/2030"))
+    organizador.add_tarefa(criar_tarefa("Compras", "Pão e \"leite\""))
+    organizador.add_tarefa(criar_tarefa("Ábaco"))
+    organizador.add_tarefa(criar_tarefa("Descartada"))
+
+    organizador.del_tarefa(organizador.get_tarefa("Compras"))
+    organizador.sort_tarefas("Título")
+    persistencia.fechar()
+
+    # O mesmo dicionário posição -> tarefa que a interface gravava com o json.dump
+    tarefas = {indice: json.loads(json.dumps(tarefa, cls=TarefaEncoder)) for indice, tarefa in enumerate(organizador.tarefas)}
+
+    with open(caminho, encoding="UTF-8") as arquivo:
+        assert arquivo.read() == json.dumps(tarefas, ensure_ascii=False)
+
+
+def test_diario_mantem_os_ids_depois_da_compactacao(tmp_path):
+    caminho = str(tmp_path / "tarefas.json")
+    organizador, persistencia = abrir(PersistenciaDiario, caminho, assincrono=False)
+
+    for indice in range(10):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    organizador.del_tarefas([organizador.get_tarefa("t2"), organizador.get_tarefa("t5")])
+    persistencia.compactar()
+
+    # Registros posteriores à compactação, que se referem aos IDs da sessão e não às posições do snapshot
+    organizador.add_tarefa(criar_tarefa("nova"))
+    organizador.edit_tarefa(organizador.get_tarefa("t8"), "oito", "", "", "")
+    organizador.mark_tarefa(organizador.get_tarefa("t9"))
+    organizador.del_tarefa(organizador.get_tarefa("t6"))
+    esperado = {tarefa.base.id: tarefa.base.titulo for tarefa in organizador.tarefas}
+    persistencia.fechar()
+
+    reaberto = reabrir(PersistenciaDiario, caminho)
+
+    assert {tarefa.base.id: tarefa.base.titulo for tarefa in reaberto.tarefas} == esperado
+    assert reaberto.get_tarefa("t9").base.concluida
+
+
+def test_compactacao_codifica_as_tarefas_na_thread_do_gravador(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "tarefas.json")
+    organizador, persistencia = abrir(PersistenciaDiario, caminho, limite_compactacao=200)
+    threads = []
+    codificar_tarefas = persistencia_tarefas.codificar_tarefas
+
+    def codificar_registrando(*argumentos):
+        threads.append(threading.current_thread())
+        return codificar_tarefas(*argumentos)
+
+    monkeypatch.setattr(persistencia_tarefas, "codificar_tarefas", codificar_registrando)
+
+    for indice in range(30):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    persistencia.fechar()
+
+    assert threads
+    assert threading.main_thread() not in threads
+    assert len(reabrir(PersistenciaDiario, caminho).tarefas_por_id) == 30
+
+
+@pytest.mark.parametrize("classe, nome", [(classe, nome) for classe, nome in PERSISTENCIAS if classe in ESCRITAS])
+def test_gravacao_que_falha_e_repetida(tmp_path, espera_curta, classe, nome):
+    caminho = str(tmp_path / nome)
+    organizador, persistencia = abrir(classe, caminho)
+    erros = []
+    persistencia.ao_falhar = erros.append
+
+    escrita = getattr(persistencia, ESCRITAS[classe])
+    falhas = [2]
+
+    def escrita_com_falha(*argumentos):
+        if falhas[0]:
+            falhas[0] -= 1
+            raise OSError(28, "No space left on device")
+
+        return escrita(*argumentos)
+
+    setattr(persistencia, ESCRITAS[classe], escrita_com_falha)
+
+    for titulo in ["t0", "t1", "t2", "t3"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    organizador.del_tarefa(organizador.get_tarefa("t1"))
+
+    # As novas tentativas acontecem em segundo plano; fechar apenas descarrega o que falta
+    limite = time.monotonic() + 5
+
+    while falhas[0] and time.monotonic() < limite:
+        time.sleep(0.01)
+
+    persistencia.fechar()
+
+    assert erros
+    assert persistencia.erro_gravacao is None
+    assert [tarefa.base.titulo for tarefa in reabrir(classe, caminho).tarefas] == ["t0", "t2", "t3"]
+
+
+def test_binario_com_textos_sob_demanda_compacta_sem_bloquear_as_leituras(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "tarefas.nsb")
+    organizador, persistencia = abrir(PersistenciaBinaria, caminho, assincrono=False)
+
+    for numero in range(20):
+        organizador.add_tarefa(criar_tarefa(f"t{numero}", f"descrição {numero}", lembrete=f"{numero}:00"))
+
+    persistencia.fechar()
+    organizador, persistencia = abrir(PersistenciaBinaria, caminho, assincrono=False, textos_sob_demanda=True)
+    escrever_snapshot = persistencia_binaria.escrever_snapshot
+    livre = []
+
+    def tentar_trava():
+        livre.append(persistencia.textos.trava.acquire(blocking=False))
+
+        if livre[-1]:
+            persistencia.textos.trava.release()
+
+    # Outra thread tenta a trava da fonte dos textos enquanto o novo snapshot é escrito
+    def escrever_observando(arquivo, itens):
+        thread = threading.Thread(target=tentar_trava)
+        thread.start()
+        thread.join()
+        escrever_snapshot(arquivo, itens)
+
+    monkeypatch.setattr(persistencia_binaria, "escrever_snapshot", escrever_observando)
+    organizador.edit_tarefa(organizador.get_tarefa("t3"), "t3", "nova descrição", "", "")
+    persistencia.compactar()
+    esperado = resumo(organizador)
+
+    assert livre == [True]
+    assert organizador.get_tarefa("t7").base.descricao == "descrição 7"
+
+    persistencia.fechar()
+    assert resumo(reabrir(PersistenciaBinaria, caminho)) == esperado
+
+
+def test_indice_e_agendador_leem_os_textos_adiados_sem_o_cache(tmp_path):
+    caminho = str(tmp_path / "tarefas.nsb")
+    organizador, persistencia = abrir(PersistenciaBinaria, caminho, assincrono=False)
+
+    for numero in range(30):
+        organizador.add_tarefa(criar_tarefa(f"tarefa {numero}", f"descrição número {numero}", lembrete=f"Ligar {numero % 28 + 1}/5/2030 10:00"))
+
+    persistencia.compactar()
+    persistencia.fechar()
+
+    # Alterações no diário, depois do snapshot: uma edição, uma exclusão desfeita (a tarefa vai para o fim) e uma inclusão
+    organizador, persistencia = abrir(PersistenciaBinaria, caminho, assincrono=False)
+    organizador.edit_tarefa(organizador.get_tarefa("tarefa 3"), "tarefa 3", "editada", "Ligar 1/6/2030 08:00", "")
+    organizador.del_tarefa(organizador.get_tarefa("tarefa 5"))
+    organizador.desfazer()
+    organizador.add_tarefa(criar_tarefa("nova", "sem snapshot"))
+    persistencia.fechar()
+
+    construidos = []
+
+    for textos_sob_demanda in [False, True]:
+        organizador, persistencia = abrir(PersistenciaBinaria, caminho, assincrono=False, textos_sob_demanda=textos_sob_demanda)
+        lidos = list(persistencia.textos.cache) if textos_sob_demanda else None
+        indice = IndiceBusca(organizador)
+        indice.construir()
+        agendador = AgendadorLembretes(organizador, destino=lambda notificacoes: None)
+        agendador.construir()
+        construidos.append((indice.palavras_por_id, {chave: entrada[0] for chave, entrada in agendador.agendados.items()}))
+
+    assert construidos[0] == construidos[1]
+    # Os textos lidos para as construções não passam pelo cache (apenas a aplicação do diário o ocupa)
+    assert list(persistencia.textos.cache) == lidos
+    assert organizador.get_tarefa("tarefa 7").base.fonte_textos is persistencia.textos
+    assert indice.buscar("editada") == [3]
+
+    persistencia.fechar()
+
+
+def test_fragmentos_lidos_em_paralelo(tmp_path):
+    caminho = str(tmp_path / "tarefas.fragmentos")
+    organizador, persistencia = abrir(PersistenciaFragmentada, caminho, assincrono=False, quantidade_fragmentos=4)
+
+    for numero in range(40):
+        organizador.add_tarefa(criar_tarefa(f"t{numero}", f"descrição {numero}", prioridade=numero % 3 == 0, prazo=f"{numero % 28 + 1}/10/2030"))
+
+    organizador.del_tarefa(organizador.get_tarefa("t7"))
+    organizador.desfazer()
+    organizador.sort_tarefas("Título")
+    esperado = resumo(organizador)
+    persistencia.fechar()
+
+    # Dois processos filhos, criados com outras threads em execução (o gravador da persistência abaixo)
+    organizador, persistencia = abrir(PersistenciaFragmentada, caminho, processos=2)
+    assert resumo(organizador) == esperado
+
+    persistencia.fechar()
+
+
+def test_codificacao_em_paralelo_equivale_a_sequencial(monkeypatch):
+    monkeypatch.setattr(json_tarefa_encoder, "TAMANHO_PARTE", 7)
+    organizador = TarefaOrganizador()
+
+    for numero in range(30):
+        organizador.add_tarefa(criar_tarefa(f"t{numero}", "descrição \"entre aspas\"", lembrete="10:00" if numero % 2 else None))
+
+    itens = organizador.retrato().itens()
+
+    assert json_tarefa_encoder.codificar_tarefas(itens, processos=2) == json_tarefa_encoder.codificar_tarefas(itens)
+
+
+def test_falha_permanente_e_lancada_ao_fechar(tmp_path, espera_curta):
+    organizador, persistencia = abrir(PersistenciaDiario, str(tmp_path / "tarefas.json"))
+
+    def sem_permissao(*argumentos):
+        raise OSError(13, "Permission denied")
+
+    persistencia.escrever_diario = sem_permissao
+    organizador.add_tarefa(criar_tarefa("x"))
+
+    with pytest.raises(OSError):
+        persistencia.fechar()
+
+    assert persistencia.pendentes
+
+
+def test_sqlite_esquece_a_posicao_da_tarefa_excluida(tmp_path):
+    organizador, persistencia = abrir(PersistenciaSQLite, str(tmp_path / "tarefas.db"))
+
+    for titulo in ["a", "b", "c"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    tarefa = organizador.get_tarefa("b")
+    organizador.del_tarefa(tarefa)
+
+    assert tarefa.base.id not in persistencia.posicoes
+
+    organizador.desfazer()
+    persistencia.fechar()
+
+    assert tarefa.base.id in persistencia.posicoes
+
+
+@pytest.mark.parametrize("filtro", [None, "Título", "Data de criação", "Tipo de tarefa"])
+def test_sqlite_consulta_na_ordem_das_visoes(tmp_path, filtro):
+    caminho = str(tmp_path / "tarefas.db")
+    organizador, persistencia = abrir(PersistenciaSQLite, caminho, assincrono=False)
+
+    # Títulos que o COLLATE NOCASE do SQLite ordenaria de outra forma, e títulos iguais sem diferenciar maiúsculas
+    for indice, titulo in enumerate(["Zebra", "Água", "ábaco", "ÉPOCA", "abacate", "Abacate ", "éter", "b"]):
+        organizador.add_tarefa(criar_tarefa(titulo, prioridade=indice % 3 == 0))
+
+    organizador.mark_tarefa(organizador.get_tarefa("Água"))
+    organizador.del_tarefa(organizador.get_tarefa("b"))
+    persistencia.fechar()
+
+    esperado = organizador.visao(filtro) if filtro else organizador.ids_exibicao()
+    pendentes = [tarefa_id for tarefa_id in esperado if not organizador.tarefas_por_id[tarefa_id].base.concluida]
+
+    consulta = PersistenciaSQLite(caminho, assincrono=False)
+    consulta.abrir()
+
+    assert consulta.consultar_ids(filtro) == esperado
+    assert consulta.consultar_ids(filtro, concluida=False, limite=4) == pendentes[:4]
+    assert [tarefa.base.titulo for tarefa in consulta.ler_tarefas(pendentes)] == [organizador.tarefas_por_id[tarefa_id].base.titulo for tarefa_id in pendentes]
+
+    consulta.fechar()
+
+
+def test_sqlite_acrescenta_a_chave_de_titulo_aos_bancos_antigos(tmp_path):
+    caminho = str(tmp_path / "tarefas.db")
+    organizador, persistencia = abrir(PersistenciaSQLite, caminho, assincrono=False)
+
+    for titulo in ["b", "Água", "a"]:
+        organizador.add_tarefa(criar_tarefa(titulo))
+
+    persistencia.fechar()
+
+    # Remonta a tabela sem a coluna "titulo_chave", como nos bancos criados antes dela
+    conexao = sqlite3.connect(caminho)
+
+    with conexao:
+        conexao.execute("DROP INDEX idx_tarefas_titulo_chave")
+        conexao.execute("ALTER TABLE tarefas DROP COLUMN titulo_chave")
+
+    conexao.close()
+
+    consulta = PersistenciaSQLite(caminho, assincrono=False)
+    consulta.abrir()
+
+    assert consulta.consultar_ids("Título") == organizador.visao("Título")
+
+    consulta.fechar()
+
+
+def test_gravador_agrupa_as_solicitacoes():
+    gravacoes = []
+    liberar = threading.Event()
+
+    def gravar():
+        liberar.wait(5)
+        gravacoes.append(len(gravacoes))
+
+    gravador = GravadorSegundoPlano(gravar)
+
+    for _ in range(20):
+        gravador.marcar_sujo()
+
+    liberar.set()
+    gravador.fechar()
+
+    assert 1 <= len(gravacoes) <= 2
+
+
+def test_carregamento_em_lotes(tmp_path):
+    caminho = str(tmp_path / "tarefas.json")
+    organizador, persistencia = abrir(PersistenciaJson, caminho, assincrono=False)
+
+    for indice in range(25):
+        organizador.add_tarefa(criar_tarefa(f"t{indice}"))
+
+    persistencia.fechar()
+
+    organizador = TarefaOrganizador()
+    persistencia = PersistenciaJson(caminho, assincrono=False)
+    lotes = list(persistencia.carregar_em_lotes(organizador, tamanho_lote=10))
+
+    assert lotes == [10, 10, 5]
+    assert [tarefa.base.titulo for tarefa in organizador.tarefas] == [f"t{indice}" for indice in range(25)]
+    assert persistencia in organizador.observadores
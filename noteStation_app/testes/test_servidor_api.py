@@ -0,0 +1,199 @@
+"""
+Testes do servidor de tarefas: respostas das operações, validação das requisições, transações em lote e o
+protocolo por socket.
+
+Módulos importados:
+    - json: Módulo que permite trabalhar com dados JSON, usado para ler as respostas enviadas pelo servidor.
+    - asyncio: Módulo da biblioteca padrão para E/S assíncrona, usado para conectar um cliente ao servidor.
+    - pytest: Framework de testes.
+
+    - notestation_servidor: Módulo contendo o servidor de tarefas e o seu cliente.
+"""
+
+import json
+import asyncio
+
+import pytest
+
+from notestation_servidor import *
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    """
+    Servidor sobre um arquivo de tarefas vazio, com as gravações descarregadas ao final do teste.
+    """
+    servidor = ServidorTarefas(str(tmp_path / "tarefas.json"))
+    servidor.carregar()
+
+    yield servidor
+
+    servidor.persistencia.fechar()
+
+
+def criar(servidor, titulo: str, **campos) -> int:
+    """
+    Cria uma tarefa pelo servidor.
+
+    Retorna:
+        - int: O ID da tarefa criada.
+    """
+    resposta = servidor.executar({"op": "criar", "titulo": titulo, **campos})
+    assert resposta["ok"], resposta
+
+    return resposta["id"]
+
+
+def test_criar_editar_e_obter(servidor):
+    tarefa_id = criar(servidor, "Relatório", descricao="Mensal", lembrete="10:00", prazo="20/10/2030")
+
+    resposta = servidor.executar({"op": "editar", "id": tarefa_id, "titulo": "Relatório anual"})
+    assert resposta["ok"], resposta
+
+    tarefa = servidor.executar({"op": "obter", "id": tarefa_id})["tarefa"]
+    assert (tarefa["titulo"], tarefa["descricao"], tarefa["lembrete"], tarefa["prazo"]) == ("Relatório anual", "Mensal", "10:00", "20/10/2030")
+
+
+@pytest.mark.parametrize("requisicao", [
+    {"op": "inexistente"},
+    {"op": ["criar"]},
+    {"titulo": "sem operação"},
+    {"op": "criar"},
+    {"op": "criar", "titulo": 5},
+    {"op": "criar", "titulo": "x", "descricao": ["lista"]},
+    {"op": "criar", "titulo": "x", "lembrete": 10},
+    {"op": "criar", "titulo": "x", "prazo": "32/13/2030"},
+    {"op": "obter", "id": "0"},
+    {"op": "obter", "id": True},
+    {"op": "obter", "id": 99},
+    {"op": "editar", "id": 0, "titulo": {"a": 1}},
+    {"op": "consultar", "busca": 5},
+    {"op": "ordenar", "filtro": "Cor"},
+    {"op": "lote", "operacoes": "criar"}
+])
+def test_requisicao_invalida_e_respondida_com_erro(servidor, requisicao):
+    criar(servidor, "existente")
+    quantidade = len(servidor.organizador.tarefas_por_id)
+
+    resposta = servidor.executar(requisicao)
+
+    assert resposta["ok"] is False
+    assert resposta["erro"]
+    assert len(servidor.organizador.tarefas_por_id) == quantidade
+
+
+def test_requisicao_que_nao_e_objeto(servidor):
+    assert servidor.executar("criar")["ok"] is False
+
+
+def test_titulo_duplicado(servidor):
+    criar(servidor, "Única")
+
+    resposta = servidor.executar({"op": "criar", "titulo": "Única"})
+
+    assert resposta["ok"] is False
+    assert len(servidor.organizador.tarefas_por_id) == 1
+
+
+def test_lote_em_transacao_desfaz_tudo_se_uma_operacao_falha(servidor):
+    resposta = servidor.executar({"op": "lote", "transacao": True, "operacoes": [
+        {"op": "criar", "titulo": "a"},
+        {"op": "criar", "titulo": "b"},
+        {"op": "obter", "id": 99}
+    ]})
+
+    assert resposta["ok"] is False
+    assert servidor.organizador.tarefas_por_id == {}
+    assert servidor.executar({"op": "consultar", "busca": "a"})["total"] == 0
+
+
+@pytest.mark.parametrize("operacao", ["desfazer", "refazer"])
+def test_lote_em_transacao_recusa_desfazer_e_refazer(servidor, operacao):
+    criar(servidor, "x")
+
+    resposta = servidor.executar({"op": "lote", "transacao": True, "operacoes": [
+        {"op": "criar", "titulo": "y"},
+        {"op": operacao},
+        {"op": "excluir", "id": 999}
+    ]})
+
+    assert resposta["ok"] is False
+    assert [tarefa.base.titulo for tarefa in servidor.organizador.tarefas] == ["x"]
+    assert (len(servidor.organizador.comandos), len(servidor.organizador.desfeitos)) == (1, 0)
+
+
+def test_consultar_informa_o_total_da_busca(servidor):
+    for numero in range(30):
+        criar(servidor, f"comum {numero}")
+
+    assert servidor.executar({"op": "concluir", "id": 3})["ok"]
+
+    resposta = servidor.executar({"op": "consultar", "busca": "comum", "inicio": 5, "limite": 3})
+    assert resposta["total"] == 30
+    assert [tarefa["id"] for tarefa in resposta["tarefas"]] == [24, 23, 22]
+
+    resposta = servidor.executar({"op": "consultar", "busca": "comum", "concluida": True})
+    assert resposta["total"] == 1
+    assert [tarefa["id"] for tarefa in resposta["tarefas"]] == [3]
+
+
+def test_consultar_depois_de_um_lote_com_exclusao(servidor):
+    tarefa_id = criar(servidor, "alfa")
+
+    resposta = servidor.executar({"op": "lote", "transacao": True, "operacoes": [
+        {"op": "excluir", "id": tarefa_id},
+        {"op": "criar", "titulo": "zeta"}
+    ]})
+    assert resposta["ok"], resposta
+
+    resposta = servidor.executar({"op": "consultar", "busca": "alfa"})
+    assert resposta == {"total": 0, "tarefas": [], "ok": True}
+
+
+def test_consultar_na_ordem_de_um_filtro_sem_alterar_o_organizador(servidor):
+    for titulo in ["gama", "Alfa", "beta", "delta"]:
+        criar(servidor, titulo)
+
+    resposta = servidor.executar({"op": "consultar", "ordem": "Título", "inicio": 1, "limite": 2})
+
+    assert resposta["total"] == 4
+    assert [tarefa["titulo"] for tarefa in resposta["tarefas"]] == ["beta", "delta"]
+    assert servidor.organizador.ordem is None
+
+
+def test_protocolo_por_socket_unix(servidor, tmp_path):
+    caminho = str(tmp_path / "servidor.sock")
+
+    async def conversar():
+        tarefa = asyncio.ensure_future(servidor.servir(caminho_unix=caminho))
+
+        while not servidor.servidores:
+            await asyncio.sleep(0.01)
+
+        cliente = await ClienteTarefas.conectar(caminho_unix=caminho)
+
+        try:
+            respostas = await cliente.requisitar_varias([
+                {"op": "criar", "titulo": "a", "ref": 1},
+                [{"op": "criar", "titulo": "b"}, {"op": "obter", "id": 99}],
+                {"op": "consultar", "busca": "b"}
+            ])
+
+            cliente.escritor.write(b"{invalido\n")
+            invalido = json.loads(await cliente.leitor.readline())
+        finally:
+            await cliente.fechar()
+
+            for aberto in servidor.servidores:
+                aberto.close()
+
+            tarefa.cancel()
+
+        return respostas, invalido
+
+    (criada, lote, consulta), invalido = asyncio.run(conversar())
+
+    assert criada == {"id": 0, "ok": True, "ref": 1}
+    assert [resultado["ok"] for resultado in lote["resultados"]] == [True, False]
+    assert consulta["total"] == 1
+    assert invalido["ok"] is False